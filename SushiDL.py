@@ -13,14 +13,17 @@ Fonctionnalités principales :
 import os
 import re
 import argparse
+import importlib
 import html
 import json
 import csv
 import math
+import itertools
 import base64
 import zlib
 import hashlib
 import shutil
+import struct
 import threading
 import time
 import datetime
@@ -29,22 +32,111 @@ import sys
 import unicodedata
 import webbrowser
 import xml.etree.ElementTree as ET
-from dataclasses import dataclass, field
+import atexit
+import heapq
 from pathlib import Path
 from urllib.parse import parse_qsl, unquote, urlencode, urljoin, urlparse, urlunparse
 
-import tkinter as tk
-from tkinter import filedialog, messagebox, ttk
-
-import customtkinter as ctk
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from bs4 import BeautifulSoup
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
 from io import BytesIO
-from PIL import Image, ImageDraw, ImageFont, ImageOps, ImageSequence, ImageTk
-from curl_cffi import requests
+from collections import deque
+from functools import lru_cache
+from PIL import Image, ImageDraw, ImageFont, ImageOps, ImageSequence
 from zipfile import ZipFile
 
 
+class _LazyModule:
+    """Module importé au premier accès d'attribut.
+
+    Les modes `--cli`, `--self-test` et `--diagnostic` ne chargent ainsi ni
+    Tk/CustomTkinter (indisponibles sans affichage) ni les dépendances réseau
+    tant qu'ils n'en ont pas besoin.
+    """
+
+    __slots__ = ("_name", "_module")
+
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    def _load(self):
+        module = self._module
+        if module is None:
+            module = importlib.import_module(self._name)
+            self._module = module
+        return module
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __repr__(self):
+        state = "chargé" if self._module is not None else "différé"
+        return f"<module {self._name!r} ({state})>"
+
+
+tk = _LazyModule("tkinter")
+tkfont = _LazyModule("tkinter.font")
+ttk = _LazyModule("tkinter.ttk")
+filedialog = _LazyModule("tkinter.filedialog")
+messagebox = _LazyModule("tkinter.messagebox")
+ctk = _LazyModule("customtkinter")
+ImageTk = _LazyModule("PIL.ImageTk")
+bs4 = _LazyModule("bs4")
+requests = _LazyModule("curl_cffi.requests")
+
+from engine.api import Engine
+from engine.errors import (
+    DownloadCancelled,
+    SushiDLError,
+    AuthError,
+    ParseError,
+    ImageDownloadError,
+    get_status_code_from_exception,
+    classify_download_failure,
+    recommend_action_for_failure,
+    should_offer_cookie_refresh,
+    is_reader_cloudflare_challenge,
+    is_manual_cloudflare_fallback,
+)
+from engine.http import _get_http_session, _http_get, _http_post
+from engine.labels import clear_label_caches, normalize_chapter_label_preserve_title, normalize_tome_label
+from engine.models import DownloadOptions, MangaAnalysis
+from engine.parsers import (
+    _parse_madara_ajax_chapter_page,
+    build_scanmanga_image_urls,
+    extract_embedded_json,
+    is_ortega_premium_chapter_locked,
+    parse_lr,
+    parse_ortega_initial_data,
+)
+from engine.sites import (
+    COOKIE_DOMAINS,
+    SITE_ADAPTERS,
+    SiteAdapter,
+    build_catalogue_url_regex,
+    get_catalogue_slug_from_url,
+    get_site_adapter_from_url,
+    get_site_catalogue_family,
+    get_site_reader,
+    register_site_adapter,
+    normalize_image_url,
+    normalize_hostname,
+    get_supported_site_from_host,
+    get_supported_site_from_url,
+    get_site_root_url,
+    get_cookie_domain_from_url,
+    get_site_domain_key,
+    is_valid_catalogue_url,
+    extract_supported_catalogue_url,
+)
+from engine.text import repair_mojibake_text
+
+if __name__ == "__main__":
+    # Exécuté comme script : le moteur (`engine.api`) doit retrouver ce module
+    # sous son nom d'import plutôt que d'en charger une seconde copie.
+    sys.modules.setdefault("SushiDL", sys.modules[__name__])
+
+
 def configure_console_io():
     """Configure la sortie console pour limiter les problèmes d'encodage."""
     if os.name == "nt":
@@ -67,104 +159,6 @@ def configure_console_io():
 configure_console_io()
 
 
-def repair_mojibake_text(text):
-    """
-    Tente de reparer un texte mojibake courant (UTF-8 lu en latin-1/cp1252).
-    Applique plusieurs passes pour couvrir les doubles/triples decodages.
-    """
-    value = str(text or "")
-    if not value:
-        return value
-
-    suspicious_markers = (
-        "\u00C3",
-        "\u00C2",
-        "\u00E2\u20AC",
-        "\u00F0\u0178",
-        "\u00EF\u00BB\u00BF",
-    )
-    current = value
-    for _ in range(4):
-        if not any(marker in current for marker in suspicious_markers):
-            break
-        fixed = None
-        for codec in ("latin-1", "cp1252"):
-            try:
-                candidate = current.encode(codec, errors="strict").decode("utf-8", errors="strict")
-            except Exception:
-                continue
-            if candidate and candidate != current:
-                fixed = candidate
-                break
-        if not fixed:
-            break
-        current = fixed
-    return current
-
-
-class DownloadCancelled(Exception):
-    """Erreur levée lorsqu'une annulation utilisateur est demandée."""
-
-
-class SushiDLError(Exception):
-    """Erreur de base contrôlée par SushiDL."""
-
-
-class AuthError(SushiDLError):
-    """Erreur liée à l'authentification ou à une protection serveur."""
-
-
-class ParseError(SushiDLError):
-    """Erreur liée au parsing d'une page source."""
-
-
-class ArchiveError(SushiDLError):
-    """Erreur liée à la création ou validation d'une archive."""
-
-
-class ImageDownloadError(Exception):
-    """Erreur de téléchargement enrichie avec type et code HTTP."""
-
-    def __init__(self, message, status_code=None, kind="retryable", phase="direct"):
-        super().__init__(message)
-        self.status_code = status_code
-        self.kind = kind
-        self.phase = phase
-
-
-@dataclass(frozen=True)
-class MangaAnalysis:
-    """Résultat structuré d'une analyse catalogue."""
-
-    title: str = ""
-    pairs: list[tuple[str, str]] = field(default_factory=list)
-    volume_metadata: dict = field(default_factory=dict)
-    series_metadata: dict = field(default_factory=dict)
-    html_content: str = ""
-
-
-def get_status_code_from_exception(exc):
-    """Extrait un code HTTP depuis une exception réseau si disponible."""
-    status_code = getattr(exc, "status_code", None)
-    if status_code is None:
-        response = getattr(exc, "response", None)
-        status_code = getattr(response, "status_code", None)
-    return status_code
-
-
-def classify_download_failure(status_code=None, message=""):
-    """Classe les échecs de téléchargement pour piloter la stratégie de retry."""
-    if status_code in (404, 410):
-        return "missing"
-    if status_code in (401, 403, 429, 500, 502, 503, 504):
-        return "blocked_or_retryable"
-
-    lower = (message or "").lower()
-    if any(marker in lower for marker in ("cloudflare", "just a moment", "attention required", "captcha")):
-        return "blocked_or_retryable"
-    return "retryable"
-
-
 def format_duration_short(seconds):
     """Formate une duree lisible courte (mm:ss ou hh:mm:ss)."""
     if seconds is None:
@@ -177,80 +171,6 @@ def format_duration_short(seconds):
     return f"{m:02d}:{s:02d}"
 
 
-def recommend_action_for_failure(status_code=None, reason=""):
-    """Suggère une action utilisateur adaptée à une cause d'échec."""
-    lower = (reason or "").lower()
-    normalized = "".join(
-        ch for ch in unicodedata.normalize("NFKD", lower) if unicodedata.category(ch) != "Mn"
-    )
-    if "echec de creation cbz" in normalized or "archive_cbz" in normalized or "zip" in normalized:
-        return "Vérifier l'espace disque, les droits d'écriture et le nom du fichier, puis relancer."
-    if "dossier de tome introuvable" in normalized or "erreur creation dossier" in normalized:
-        return "Vérifier le dossier de destination (chemin/droits), puis relancer."
-    if "aucune image telechargee" in normalized:
-        return "Vérifier l'URL, le cookie cf_clearance et le User-Agent, puis relancer l'analyse."
-    if "recuperation images impossible" in normalized:
-        return "Vérifier l'accès au chapitre (URL/cookie/User-Agent), puis relancer."
-    if "tome non finalise" in normalized or "retry non finalise" in normalized:
-        return "Corriger d'abord la cause technique indiquée, puis relancer."
-    if status_code in (401, 403) or "cloudflare" in normalized or "forbidden" in normalized:
-        return "Protection Cloudflare détectée : chapitre arrêté pour cette session. Relancer plus tard après validation normale de l'accès."
-    if status_code == 429:
-        return "Limiter la cadence; attendre avant de relancer."
-    if status_code in (500, 502, 503, 504):
-        return "Erreur serveur temporaire; relancer plus tard."
-    if status_code in (404, 410) or "not found" in normalized:
-        return "Page absente côté serveur; ignorer cette page."
-    if "timeout" in normalized or "dns" in normalized or "connexion" in normalized or "connection" in normalized:
-        return "Vérifier la connexion réseau et relancer."
-    return "Relancer le tome; si l'échec persiste, vérifier cookie et User-Agent."
-
-
-def should_offer_cookie_refresh(status_code=None, reason=""):
-    """Indique si l'échec justifie de demander un renouvellement de cookie."""
-    lower = (reason or "").lower()
-    normalized = "".join(
-        ch for ch in unicodedata.normalize("NFKD", lower) if unicodedata.category(ch) != "Mn"
-    )
-    if status_code in (401, 403):
-        return True
-    markers = (
-        "http error 401",
-        "http error 403",
-        "forbidden",
-        "acces refuse",
-        "cloudflare",
-        "just a moment",
-        "challenge",
-        "cookie",
-        "unauthorized",
-        "validation chrome",
-        "lecteur crunchyscan",
-        "lecteur scan-hentai",
-        "lecteur crunchy",
-    )
-    return any(marker in normalized for marker in markers)
-
-
-def is_reader_cloudflare_challenge(reason=""):
-    """Distingue un challenge lecteur confirmé d'un simple refus d'accès/cookie."""
-    normalized = "".join(
-        ch for ch in unicodedata.normalize("NFKD", (reason or "").lower())
-        if unicodedata.category(ch) != "Mn"
-    )
-    markers = (
-        "detection cloudflare dans le lecteur",
-        "cloudflare detecte dans le lecteur",
-        "formulaire turnstile remplace les images",
-    )
-    return any(marker in normalized for marker in markers)
-
-
-def is_manual_cloudflare_fallback(reason=""):
-    """Compatibilité : challenge lecteur confirmé, sans redemande de cookie."""
-    return is_reader_cloudflare_challenge(reason)
-
-
 def interruptible_sleep(cancel_event, duration):
     """Attend `duration` secondes, interrompu si annulation demandée."""
     if duration <= 0:
@@ -261,295 +181,6 @@ def interruptible_sleep(cancel_event, duration):
     return cancel_event.wait(duration)
 
 
-def normalize_chapter_label_preserve_title(label):
-    """Normalise un label chapitre en conservant son titre après deux-points."""
-    cleaned = repair_mojibake_text((label or "").strip())
-    if not cleaned:
-        return ""
-    cleaned = re.sub(r"\s+", " ", cleaned).strip(" -–—|:")
-    match = re.match(
-        r"(?i)^(?:ep|episode|chapitre|chapter|chap)\s*[-._:# ]*(extra(?:\s*[-._ ]*\s*\d+)?|[0-9]+(?:[-.,][0-9]+)*(?:\s*[A-Za-z])?)\b\s*(?::\s*(.+))?$",
-        cleaned,
-    )
-    if not match:
-        return ""
-    raw_number = re.sub(r"\s+", " ", match.group(1).strip())
-    if raw_number.lower().startswith("extra"):
-        number = re.sub(r"(?i)^extra\s*[-._ ]*\s*(\d+)$", r"Extra \1", raw_number).strip()
-    else:
-        number = raw_number.replace(",", ".").strip()
-    suffix = (match.group(2) or "").strip()
-    chapter_label = f"Chap {number}".strip()
-    return f"{chapter_label} : {suffix}" if suffix else chapter_label
-
-
-def normalize_tome_label(label):
-    """Normalise les labels en standardisant épisode/chapitre/tome et en retirant les titres redondants."""
-    cleaned = repair_mojibake_text((label or "").strip())
-    if not cleaned:
-        return ""
-    cleaned = re.sub(r"\s+", " ", cleaned).strip(" -–—|:")
-    # Certains catalogues CrunchyScan/Scan-Hentai préfixent les volumes d'un point.
-    cleaned = re.sub(r"^[._]+\s*", "", cleaned)
-
-    number_pattern = r"([0-9]+(?:[.,][0-9]+)?(?:\s*[A-Za-z])?)"
-
-    tome_composite_match = re.match(
-        rf"(?i)^(?:tome|volume)\s*[-._:# ]*{number_pattern}(?:\s*\([^)]*\))?\s*[-–—:]\s*(.+)$",
-        cleaned,
-    )
-    if tome_composite_match:
-        tome_number = tome_composite_match.group(1).replace(",", ".").strip()
-        child_raw = tome_composite_match.group(2).strip()
-        child_label = normalize_chapter_label_preserve_title(child_raw) or normalize_tome_label(child_raw)
-        return f"Tome {tome_number} - {child_label or tome_composite_match.group(2).strip()}".strip()
-
-    chapter_match = re.match(
-        rf"(?i)^(?:ep|episode|chapitre|chapter)\s*[-._:# ]*\s*{number_pattern}\b",
-        cleaned,
-    )
-    if chapter_match:
-        return f"Chapitre {chapter_match.group(1).replace(',', '.')}".strip()
-
-    tome_match = re.match(
-        rf"(?i)^(?:tome|volume)\s*[-._:# ]*\s*{number_pattern}\b",
-        cleaned,
-    )
-    if tome_match:
-        return f"Tome {tome_match.group(1).replace(',', '.')}".strip()
-
-    return re.sub(r"(?i)\bvolume\b", "Tome", cleaned)
-
-
-def normalize_image_url(url):
-    """Normalise les URLs d'images (https forcé, schéma manquant géré)."""
-    raw = (url or "").strip()
-    if not raw:
-        return ""
-    if raw.startswith("//"):
-        return f"https:{raw}"
-    try:
-        parsed = urlparse(raw)
-        if parsed.scheme == "http" and (parsed.hostname or "").lower() in {"127.0.0.1", "localhost"}:
-            return raw
-    except Exception:
-        pass
-    return raw.replace("http://", "https://")
-
-
-def normalize_hostname(host):
-    """Normalise un hostname en minuscule sans préfixe www."""
-    value = (host or "").strip().lower()
-    if value.startswith("www."):
-        value = value[4:]
-    return value
-
-
-def get_supported_site_from_host(host):
-    """Retourne le site supporté correspondant au host (ou chaîne vide)."""
-    value = normalize_hostname(host)
-    if not value:
-        return ""
-    if value == "sushiscan.fr" or value.endswith(".sushiscan.fr"):
-        return "sushiscan.fr"
-    if value == "sushiscan.net" or value.endswith(".sushiscan.net"):
-        return "sushiscan.net"
-    if value == "mangas-origines.fr" or value.endswith(".mangas-origines.fr"):
-        return "mangas-origines.fr"
-    if value == "hentai-origines.fr" or value.endswith(".hentai-origines.fr"):
-        return "hentai-origines.fr"
-    if value == "toonfr.com" or value.endswith(".toonfr.com"):
-        return "toonfr.com"
-    if value == "ortegascans.fr" or value.endswith(".ortegascans.fr"):
-        return "ortegascans.fr"
-    if value == "hentaizone.xyz" or value.endswith(".hentaizone.xyz"):
-        return "hentaizone.xyz"
-    if value == "scan-manga.com" or value.endswith(".scan-manga.com"):
-        return "scan-manga.com"
-    if value == "crunchyscan.fr" or value.endswith(".crunchyscan.fr"):
-        return "crunchyscan.fr"
-    if value == "scan-hentai.net" or value.endswith(".scan-hentai.net"):
-        return "scan-hentai.net"
-    return ""
-
-
-def get_supported_site_from_url(url):
-    """Retourne le site supporté correspondant à une URL (ou chaîne vide)."""
-    try:
-        host = (urlparse(url).hostname or "").strip().lower()
-    except Exception:
-        host = ""
-    return get_supported_site_from_host(host)
-
-
-def get_site_root_url(url):
-    """Retourne l'URL racine d'un site à partir d'une URL complète."""
-    try:
-        parsed = urlparse(url)
-        host = normalize_hostname(parsed.hostname)
-    except Exception:
-        return ""
-    if not host:
-        return ""
-    scheme = (parsed.scheme or "https").lower()
-    return f"{scheme}://{host}/"
-
-
-def get_sushiscan_domain_from_host(host):
-    """Retourne 'fr' ou 'net' pour un host SushiScan (racine ou sous-domaine)."""
-    site = get_supported_site_from_host(host)
-    if site == "sushiscan.fr":
-        return "fr"
-    if site == "sushiscan.net":
-        return "net"
-    return ""
-
-
-def get_sushiscan_domain_from_url(url):
-    """Retourne 'fr' ou 'net' depuis une URL SushiScan (racine ou sous-domaine)."""
-    return get_sushiscan_domain_from_host((urlparse(url).hostname or "").strip().lower() if url else "")
-
-
-def get_cookie_domain_from_host(host):
-    """Retourne le domaine cookie interne: fr/net/origines (ou chaîne vide)."""
-    site = get_supported_site_from_host(host)
-    mapping = {
-        "sushiscan.fr": "fr",
-        "sushiscan.net": "net",
-        "mangas-origines.fr": "origines",
-        "hentai-origines.fr": "hentai",
-        "toonfr.com": "toonfr",
-        "ortegascans.fr": "ortega",
-        "hentaizone.xyz": "hentaizone",
-        "scan-manga.com": "scanmanga",
-        "crunchyscan.fr": "crunchyscan",
-        "scan-hentai.net": "scanhentai",
-    }
-    return mapping.get(site, "")
-
-
-def get_cookie_domain_from_url(url):
-    """Retourne le domaine cookie interne depuis une URL supportée."""
-    return get_cookie_domain_from_host((urlparse(url).hostname or "").strip().lower() if url else "")
-
-
-def get_site_domain_key(url):
-    """Retourne la clé de domaine interne utilisée par les parseurs et téléchargements."""
-    site = get_supported_site_from_url(url)
-    mapping = {
-        "sushiscan.fr": "fr",
-        "sushiscan.net": "net",
-        "mangas-origines.fr": "origines",
-        "hentai-origines.fr": "hentai",
-        "toonfr.com": "toonfr",
-        "ortegascans.fr": "ortega",
-        "hentaizone.xyz": "hentaizone",
-        "scan-manga.com": "scanmanga",
-        "crunchyscan.fr": "crunchyscan",
-        "scan-hentai.net": "scanhentai",
-    }
-    return mapping.get(site) or normalize_hostname(urlparse(url).hostname) or "-"
-
-
-def is_valid_catalogue_url(url):
-    """Valide une URL d'œuvre supportée avec slash final optionnel."""
-    value = (url or "").strip()
-    if not value:
-        return False
-    try:
-        parsed = urlparse(value)
-    except Exception:
-        return False
-    if parsed.scheme.lower() != "https":
-        return False
-
-    site = get_supported_site_from_host(parsed.hostname)
-    if not site:
-        return False
-
-    path = (parsed.path or "").strip()
-    if site in ("sushiscan.fr", "sushiscan.net"):
-        match = re.match(r"^/catalogue/([^/?#]+)/?$", path, flags=re.IGNORECASE)
-    elif site == "mangas-origines.fr":
-        match = re.match(r"^/oeuvre/([^/?#]+)/?$", path, flags=re.IGNORECASE)
-    elif site == "hentai-origines.fr":
-        match = re.match(r"^/manga/([^/?#]+)/?$", path, flags=re.IGNORECASE)
-    elif site == "toonfr.com":
-        match = re.match(r"^/webtoon/([^/?#]+)/?$", path, flags=re.IGNORECASE)
-    elif site == "ortegascans.fr":
-        match = re.match(r"^/serie/([^/?#]+)/?$", path, flags=re.IGNORECASE)
-    elif site == "hentaizone.xyz":
-        match = re.match(r"^/manga/([^/?#]+)/?$", path, flags=re.IGNORECASE)
-    elif site == "scan-manga.com":
-        match = re.match(r"^/\d+(?:-\d+)?/([^/?#]+)\.html$", path, flags=re.IGNORECASE)
-    elif site in ("crunchyscan.fr", "scan-hentai.net"):
-        match = re.match(r"^/lecture-en-ligne/([^/?#]+)/?$", path, flags=re.IGNORECASE)
-    else:
-        return False
-
-    if not match:
-        return False
-    return is_valid_catalogue_slug(match.group(1))
-
-
-def is_valid_catalogue_slug(slug):
-    """Valide un segment de slug, y compris les caractères percent-encodés."""
-    value = (slug or "").strip()
-    if not value:
-        return False
-    if any(ord(ch) < 32 or ord(ch) == 127 or ch.isspace() for ch in value):
-        return False
-    if any(ch in value for ch in "/\\?#"):
-        return False
-    if re.search(r"%(?![0-9a-fA-F]{2})", value):
-        return False
-
-    decoded = unquote(value)
-    if any(ord(ch) < 32 or ord(ch) == 127 or ch.isspace() for ch in decoded):
-        return False
-    return not any(ch in decoded for ch in "/\\?#")
-
-
-def extract_supported_catalogue_url(text):
-    """Extrait la première URL catalogue supportée depuis un collage bruité."""
-    value = repair_mojibake_text(text or "")
-    if not value:
-        return ""
-
-    candidates = []
-    if len(value) <= 2048 and is_valid_catalogue_url(value.strip()):
-        candidates.append(value.strip())
-    candidates.extend(re.findall(r"https?://[^\s<>'\"\\)\]]+", value, flags=re.IGNORECASE))
-
-    for candidate in candidates:
-        cleaned = repair_mojibake_text(candidate).strip()
-        cleaned = cleaned.rstrip(".,;:)]}\"'")
-        if is_valid_catalogue_url(cleaned):
-            return cleaned
-    return ""
-
-
-_HTTP_THREAD_LOCAL = threading.local()
-
-
-def _get_http_session():
-    """Retourne une session HTTP par thread pour reutiliser les connexions."""
-    session = getattr(_HTTP_THREAD_LOCAL, "session", None)
-    if session is None:
-        session = requests.Session()
-        _HTTP_THREAD_LOCAL.session = session
-    return session
-
-
-def _http_get(url, headers=None, timeout=10):
-    """Requete GET avec session keep-alive et fallback direct."""
-    session = _get_http_session()
-    try:
-        return session.get(url, headers=headers, impersonate="chrome", timeout=timeout)
-    except Exception:
-        return requests.get(url, headers=headers, impersonate="chrome", timeout=timeout)
-
-
 def robust_download_image(img_url, headers, max_try=4, delay=2, cancel_event=None):
     """
     Télécharge une image de manière robuste avec plusieurs tentatives.
@@ -745,53 +376,193 @@ def _reader_blob_stage_dir(link):
 
 
 def _reader_blob_stage_file(link, page_index):
+    """Chemin d'une page au format historique (un fichier par page), lu en repli."""
     return _reader_blob_stage_dir(link) / f"{int(page_index):04d}.bin"
 
 
+def _reader_blob_page_url(key, page_index):
+    return f"{READER_BLOB_PAGE_URL_PREFIX}{key}/{int(page_index)}.jpg"
+
+
+def _parse_reader_blob_page_url(url):
+    """Retourne (clé chapitre, numéro de page) d'une URL blob lecteur, ou (None, 0)."""
+    if not is_reader_blob_page_url(url):
+        return None, 0
+    parsed = urlparse(url)
+    key = (parsed.netloc or "").strip()
+    page_name = (parsed.path or "").strip("/").rsplit("/", 1)[-1]
+    try:
+        page_index = int(page_name.rsplit(".", 1)[0])
+    except (TypeError, ValueError):
+        return None, 0
+    if not re.fullmatch(r"[0-9a-f]{24}", key) or page_index <= 0:
+        return None, 0
+    return key, page_index
+
+
+def _load_reader_blob_index_state(key):
+    """Index {page: (offset, longueur, sha1)} et table {sha1: (offset, longueur)} d'un checkpoint.
+
+    À appeler sous le verrou du pack (_reader_blob_pack_lock); mis en cache par taille de fichier
+    d'index. Un enregistrement tronqué (arrêt pendant l'écriture) ou pointant
+    au-delà de la fin du pack (pack non persisté avant l'index) est ignoré;
+    pour une page réécrite, le dernier gagne.
+    """
+    chapter_dir = READER_BLOB_STAGE_PATH / key
+    index_path = chapter_dir / READER_BLOB_INDEX_NAME
+    try:
+        size = index_path.stat().st_size
+    except OSError:
+        READER_BLOB_INDEX_CACHE.pop(key, None)
+        return {}, {}
+    cached = READER_BLOB_INDEX_CACHE.get(key)
+    if cached is not None and cached[0] == size:
+        return cached[1], cached[2]
+    entries = {}
+    digests = {}
+    try:
+        data = index_path.read_bytes()
+        pack_size = (chapter_dir / READER_BLOB_PACK_NAME).stat().st_size
+    except OSError:
+        return {}, {}
+    usable = len(data) - len(data) % READER_BLOB_INDEX_RECORD.size
+    for page_index, offset, length, digest in READER_BLOB_INDEX_RECORD.iter_unpack(data[:usable]):
+        if offset + length > pack_size:
+            continue
+        entries[page_index] = (offset, length, digest)
+        digests.setdefault(digest, (offset, length))
+    READER_BLOB_INDEX_CACHE[key] = (size, entries, digests)
+    return entries, digests
+
+
+def _load_reader_blob_index(key):
+    """Index {page: (offset, longueur, sha1)} d'un checkpoint (sous le verrou du pack)."""
+    return _load_reader_blob_index_state(key)[0]
+
+
+def _reader_blob_pack_lock(key):
+    """Verrou propre au pack d'un chapitre : les sessions lecteur parallèles ne s'attendent pas."""
+    with READER_BLOB_STAGE_LOCK:
+        lock = READER_BLOB_PACK_LOCKS.get(key)
+        if lock is None:
+            lock = READER_BLOB_PACK_LOCKS[key] = threading.Lock()
+        return lock
+
+
 def write_reader_blob_stage(link, page_index, raw):
-    path = _reader_blob_stage_file(link, page_index)
-    path.parent.mkdir(parents=True, exist_ok=True)
-    tmp_path = path.with_suffix(".part")
-    with open(tmp_path, "wb") as handle:
-        handle.write(raw)
-    os.replace(tmp_path, path)
-    return str(path)
+    """Ajoute une page au checkpoint du chapitre et retourne son URL blob lecteur.
+
+    Les pages sont concaténées dans un pack unique; une page identique à une
+    page déjà stockée (pages de remplissage) ne réécrit que l'entrée d'index.
+    Rien n'est synchronisé ici : sync_reader_blob_stage le fait une fois le
+    chapitre extrait, et le chargement de l'index écarte les entrées orphelines.
+    """
+    key = _reader_blob_stage_key(link)
+    page_index = int(page_index)
+    digest = hashlib.sha1(raw).digest()
+    chapter_dir = READER_BLOB_STAGE_PATH / key
+    with _reader_blob_pack_lock(key):
+        chapter_dir.mkdir(parents=True, exist_ok=True)
+        entries, digests = _load_reader_blob_index_state(key)
+        current = entries.get(page_index)
+        if current is not None and current[2] == digest:
+            return _reader_blob_page_url(key, page_index)
+        duplicate = digests.get(digest)
+        if duplicate is not None:
+            offset, length = duplicate
+        else:
+            with open(chapter_dir / READER_BLOB_PACK_NAME, "ab") as handle:
+                offset = handle.seek(0, os.SEEK_END)
+                handle.write(raw)
+            length = len(raw)
+            digests[digest] = (offset, length)
+        record = READER_BLOB_INDEX_RECORD.pack(page_index, offset, length, digest)
+        with open(chapter_dir / READER_BLOB_INDEX_NAME, "ab") as handle:
+            handle.write(record)
+            index_size = handle.tell()
+        entries[page_index] = (offset, length, digest)
+        READER_BLOB_INDEX_CACHE[key] = (index_size, entries, digests)
+    return _reader_blob_page_url(key, page_index)
+
+
+def sync_reader_blob_stage(urls):
+    """Force sur disque les packs puis les index des chapitres de `urls` (fin d'extraction)."""
+    keys = {_parse_reader_blob_page_url(url)[0] for url in (urls or [])} - {None}
+    for key in keys:
+        chapter_dir = READER_BLOB_STAGE_PATH / key
+        with _reader_blob_pack_lock(key):
+            for name in (READER_BLOB_PACK_NAME, READER_BLOB_INDEX_NAME):
+                try:
+                    with open(chapter_dir / name, "ab") as handle:
+                        os.fsync(handle.fileno())
+                except OSError:
+                    pass
 
 
-def get_reader_blob_stage_paths(link, limit):
-    paths = []
+def get_reader_blob_stage_pages(link, limit):
+    """URLs des pages déjà extraites d'un chapitre, de la première jusqu'au premier trou."""
+    key = _reader_blob_stage_key(link)
+    with _reader_blob_pack_lock(key):
+        entries = dict(_load_reader_blob_index(key))
+    pages = []
     for page_index in range(1, int(limit or 0) + 1):
+        entry = entries.get(page_index)
+        if entry is not None and entry[1] > 128:
+            pages.append(_reader_blob_page_url(key, page_index))
+            continue
         path = _reader_blob_stage_file(link, page_index)
         try:
             if path.exists() and path.stat().st_size > 128:
-                paths.append(str(path))
+                pages.append(_reader_blob_page_url(key, page_index))
                 continue
         except OSError:
             pass
         break
-    return paths
+    return pages
+
+
+def is_reader_blob_page_staged(url):
+    """Indique sans lire les octets si une page blob lecteur est disponible localement."""
+    key, page_index = _parse_reader_blob_page_url(url)
+    if key is None:
+        return False
+    with _reader_blob_pack_lock(key):
+        if page_index in _load_reader_blob_index(key):
+            return True
+    return (READER_BLOB_STAGE_PATH / key / f"{page_index:04d}.bin").exists()
 
 
 def get_reader_blob_stage_bytes(url):
-    if not is_reader_blob_page_url(url):
-        return None
-    parsed = urlparse(url)
-    key = (parsed.netloc or "").strip()
-    page_name = (parsed.path or "").strip("/").rsplit("/", 1)[-1]
-    try:
-        page_index = int(page_name.rsplit(".", 1)[0])
-    except (TypeError, ValueError):
-        return None
-    if not re.fullmatch(r"[0-9a-f]{24}", key) or page_index <= 0:
+    key, page_index = _parse_reader_blob_page_url(url)
+    if key is None:
         return None
-    path = (READER_BLOB_STAGE_PATH / key / f"{page_index:04d}.bin").resolve()
+    chapter_dir = READER_BLOB_STAGE_PATH / key
+    with _reader_blob_pack_lock(key):
+        entry = _load_reader_blob_index(key).get(page_index)
     try:
+        if entry is not None:
+            offset, length, digest = entry
+            with open(chapter_dir / READER_BLOB_PACK_NAME, "rb") as handle:
+                handle.seek(offset)
+                raw = handle.read(length)
+            # Un pack non synchronisé avant un arrêt peut contenir des zéros.
+            return raw if len(raw) == length and hashlib.sha1(raw).digest() == digest else None
+        path = (chapter_dir / f"{page_index:04d}.bin").resolve()
         path.relative_to(READER_BLOB_STAGE_PATH.resolve())
         return path.read_bytes() if path.exists() else None
     except (OSError, ValueError):
         return None
 
 
+def forget_reader_blob_stage(key=None):
+    """Oublie l'index en mémoire d'un checkpoint supprimé (ou de tous)."""
+    with READER_BLOB_STAGE_LOCK:
+        if key is None:
+            READER_BLOB_INDEX_CACHE.clear()
+        else:
+            READER_BLOB_INDEX_CACHE.pop(key, None)
+
+
 def clear_reader_blob_stage_for_urls(urls):
     keys = {urlparse(url).netloc for url in (urls or []) if is_reader_blob_page_url(url)}
     for key in keys:
@@ -800,30 +571,40 @@ def clear_reader_blob_stage_for_urls(urls):
                 remove_tree_safely(READER_BLOB_STAGE_PATH / key, expected_parent=READER_BLOB_STAGE_PATH)
             except Exception:
                 pass
+            forget_reader_blob_stage(key)
 
 
 def get_reader_blob_stage_stats(max_age_seconds=None):
-    """Retourne le nombre et la taille des checkpoints lecteur locaux."""
+    """Retourne le nombre et la taille des checkpoints lecteur locaux.
+
+    Un checkpoint packé ne compte que deux fichiers : le nombre de pages se
+    déduit de la taille de l'index, sans parcourir les pages.
+    """
     stats = {"chapters": 0, "files": 0, "bytes": 0, "stale_chapters": []}
     if not READER_BLOB_STAGE_PATH.exists():
         return stats
     now = time.time()
     try:
-        for child in READER_BLOB_STAGE_PATH.iterdir():
+        for child in os.scandir(READER_BLOB_STAGE_PATH):
             if not child.is_dir() or not re.fullmatch(r"[0-9a-f]{24}", child.name):
                 continue
             stats["chapters"] += 1
             try:
-                if max_age_seconds and now - child.stat().st_mtime >= float(max_age_seconds):
-                    stats["stale_chapters"].append(child)
+                last_write = child.stat().st_mtime
+                for item in os.scandir(child.path):
+                    item_stat = item.stat()
+                    last_write = max(last_write, item_stat.st_mtime)
+                    if item.name == READER_BLOB_INDEX_NAME:
+                        stats["files"] += item_stat.st_size // READER_BLOB_INDEX_RECORD.size
+                    elif item.name == READER_BLOB_PACK_NAME:
+                        stats["bytes"] += item_stat.st_size
+                    elif item.name.endswith(".bin"):
+                        stats["files"] += 1
+                        stats["bytes"] += item_stat.st_size
             except OSError:
                 continue
-            for item in child.glob("*.bin"):
-                try:
-                    stats["files"] += 1
-                    stats["bytes"] += item.stat().st_size
-                except OSError:
-                    pass
+            if max_age_seconds and now - last_write >= float(max_age_seconds):
+                stats["stale_chapters"].append(Path(child.path))
     except OSError:
         pass
     return stats
@@ -839,6 +620,7 @@ def cleanup_reader_blob_stages(max_age_seconds=172800):
             removed += 1
         except Exception:
             pass
+        forget_reader_blob_stage(path.name)
     return removed, stats
 
 
@@ -860,7 +642,7 @@ def load_volume_resume_images(output_root, title, volume_label, source_url):
         if normalize_image_url(data.get("source_url") or "") != normalize_image_url(source_url or ""):
             return []
         images = [str(url).strip() for url in data.get("images") or [] if str(url).strip()]
-        if any(is_reader_blob_page_url(url) and not get_reader_blob_stage_bytes(url) for url in images):
+        if any(is_reader_blob_page_url(url) and not is_reader_blob_page_staged(url) for url in images):
             return []
         return [] if not images or any(is_text_page_url(url) for url in images) else images
     except (OSError, ValueError, TypeError, json.JSONDecodeError):
@@ -911,41 +693,107 @@ def _text_page_cache_key(source_url, title, paragraphs):
     return hashlib.sha1(payload.encode("utf-8", errors="replace")).hexdigest()[:20]
 
 
-def store_text_page_bytes(key, page_bytes):
+def _text_page_path(key, page_number):
+    return TEXT_PAGE_SPILL_PATH / key / f"{int(page_number):04d}.jpg"
+
+
+def _parse_text_page_url(url):
+    if not is_text_page_url(url):
+        return None
+    parsed = urlparse(url)
+    key = (parsed.netloc or "").strip()
+    if not re.fullmatch(r"[0-9a-f]{20}", key):
+        return None
+    page_name = (parsed.path or "").strip("/").rsplit("/", 1)[-1]
+    try:
+        page_number = int(page_name.rsplit(".", 1)[0])
+    except (TypeError, ValueError):
+        return None
+    return (key, page_number) if page_number > 0 else None
+
+
+def write_text_page(key, page_number, page_image):
+    """Encode une page texte rendue en JPEG directement dans le dossier de débord."""
+    path = _text_page_path(key, page_number)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary_path = path.with_name(f"{path.name}.part-{threading.get_ident()}")
+    try:
+        page_image.save(temporary_path, "JPEG", quality=92, optimize=True)
+        os.replace(temporary_path, path)
+    finally:
+        try:
+            if temporary_path.exists():
+                temporary_path.unlink()
+        except OSError:
+            pass
+    return path
+
+
+def _prune_text_page_spill(active_keys):
+    """Supprime les pages texte d'une session précédente restées sur disque."""
+    if not TEXT_PAGE_SPILL_PATH.exists():
+        return
+    cutoff = time.time() - TEXT_PAGE_SPILL_MAX_AGE_SECONDS
+    for child in os.scandir(TEXT_PAGE_SPILL_PATH):
+        try:
+            if child.name in active_keys or not child.is_dir() or child.stat().st_mtime >= cutoff:
+                continue
+            remove_tree_safely(child.path, expected_parent=TEXT_PAGE_SPILL_PATH)
+        except (OSError, ValueError):
+            continue
+
+
+def register_text_pages(key, page_count):
+    """Référence les pages d'un chapitre déjà écrites sur disque (le cache ne garde que leur nombre)."""
+    global TEXT_PAGE_SPILL_PRUNED
     safe_key = (key or "").strip()
     if not safe_key:
         return
+    evicted = []
     with TEXT_PAGE_CACHE_LOCK:
-        TEXT_PAGE_CACHE[safe_key] = list(page_bytes or [])
+        # Même clé = même contenu : un aperçu limité ne masque pas un rendu complet.
+        TEXT_PAGE_CACHE[safe_key] = max(int(page_count or 0), TEXT_PAGE_CACHE.get(safe_key, 0))
         if safe_key in TEXT_PAGE_CACHE_ORDER:
             TEXT_PAGE_CACHE_ORDER.remove(safe_key)
         TEXT_PAGE_CACHE_ORDER.append(safe_key)
         while len(TEXT_PAGE_CACHE_ORDER) > TEXT_PAGE_CACHE_MAX_ITEMS:
             old_key = TEXT_PAGE_CACHE_ORDER.pop(0)
             TEXT_PAGE_CACHE.pop(old_key, None)
+            evicted.append(old_key)
+        prune = not TEXT_PAGE_SPILL_PRUNED
+        TEXT_PAGE_SPILL_PRUNED = True
+        active_keys = set(TEXT_PAGE_CACHE)
+    for old_key in evicted:
+        try:
+            remove_tree_safely(TEXT_PAGE_SPILL_PATH / old_key, expected_parent=TEXT_PAGE_SPILL_PATH)
+        except (OSError, ValueError):
+            pass
+    if prune:
+        _prune_text_page_spill(active_keys)
 
 
-def get_text_page_bytes(url):
-    if not is_text_page_url(url):
-        return None
-    parsed = urlparse(url)
-    key = (parsed.netloc or "").strip()
-    page_name = (parsed.path or "").strip("/").rsplit("/", 1)[-1]
-    page_number_text = page_name.rsplit(".", 1)[0]
-    try:
-        page_index = int(page_number_text) - 1
-    except (TypeError, ValueError):
+def get_text_page_path(url):
+    """Chemin disque d'une page texte rendue, ou None si elle n'existe plus."""
+    parsed = _parse_text_page_url(url)
+    if parsed is None:
         return None
+    key, page_number = parsed
     with TEXT_PAGE_CACHE_LOCK:
-        pages = TEXT_PAGE_CACHE.get(key)
-        if pages is None:
-            return None
         if key in TEXT_PAGE_CACHE_ORDER:
             TEXT_PAGE_CACHE_ORDER.remove(key)
-        TEXT_PAGE_CACHE_ORDER.append(key)
-        if 0 <= page_index < len(pages):
-            return pages[page_index]
-    return None
+            TEXT_PAGE_CACHE_ORDER.append(key)
+    path = _text_page_path(key, page_number)
+    return path if path.is_file() else None
+
+
+def get_text_page_bytes(url):
+    path = get_text_page_path(url)
+    if path is None:
+        return None
+    try:
+        return path.read_bytes()
+    except OSError:
+        return None
 
 
 def _image_url_cache_key(link, max_images=None):
@@ -1019,10 +867,11 @@ def should_reduce_threads_for_failures(failures):
     return False
 
 
-def download_image_to_file(img_url, filename, headers, max_try=4, delay=2, cancel_event=None):
+def download_image_to_file(img_url, filename, headers, max_try=4, delay=2, cancel_event=None, stats=None):
     """
     Telecharge une image vers un fichier .part puis renomme atomiquement.
     Evite de conserver les images completes en memoire pendant les gros lots.
+    Si `stats` est un dict, il reçoit le nombre de tentatives et d'octets reçus.
     """
     normalized_url = normalize_image_url(img_url)
     tmp_filename = f"{filename}.part-{threading.get_ident()}"
@@ -1031,6 +880,8 @@ def download_image_to_file(img_url, filename, headers, max_try=4, delay=2, cance
     for attempt in range(1, max_try + 1):
         if cancel_event is not None and cancel_event.is_set():
             raise DownloadCancelled("Téléchargement annulé.")
+        if stats is not None:
+            stats["attempts"] = attempt
         try:
             os.makedirs(os.path.dirname(filename), exist_ok=True)
             session = _get_http_session()
@@ -1126,6 +977,8 @@ def download_image_to_file(img_url, filename, headers, max_try=4, delay=2, cance
                 )
 
             os.replace(tmp_filename, filename)
+            if stats is not None:
+                stats["bytes"] = bytes_written
             return filename
 
         except DownloadCancelled:
@@ -1186,8 +1039,8 @@ def download_image_to_file(img_url, filename, headers, max_try=4, delay=2, cance
 
 # Expressions régulières et constantes globales
 APP_NAME = "SushiDL"
-APP_VERSION = "11.18.32"
-REGEX_URL = r"^https://(?:sushiscan\.(?:fr|net)/catalogue|mangas-origines\.fr/oeuvre|hentai-origines\.fr/manga|toonfr\.com/webtoon|ortegascans\.fr/serie|hentaizone\.xyz/manga|crunchyscan\.fr/lecture-en-ligne|scan-hentai\.net/lecture-en-ligne)/[^/?#\s]+/?$|^https://www\.scan-manga\.com/\d+(?:-\d+)?/[^/?#\s]+\.html$"  # Formats d'URL valides
+APP_VERSION = "11.19.0"
+REGEX_URL = build_catalogue_url_regex()  # Formats d'URL valides (un motif par site enregistré)
 ROOT_FOLDER = "DL SushiScan"  # Dossier racine pour les téléchargements
 DEFAULT_DOWNLOAD_THREADS = 3
 MIN_FREE_DISK_BYTES = 256 * 1024 * 1024
@@ -1195,11 +1048,14 @@ MIN_DOWNLOAD_THREADS = 1
 MAX_DOWNLOAD_THREADS = 8
 THREADS = DEFAULT_DOWNLOAD_THREADS  # Compatibilite interne historique.
 UI_CALL_TIMEOUT_SECONDS = 15  # Timeout max pour un appel synchrone vers le thread UI
+HEADLESS_IMPORT_BUDGET_SECONDS = 1.5  # Budget d'import sans GUI verifie par --self-test
 UI_QUEUE_BATCH_LIMIT = 90
 UI_QUEUE_TIME_BUDGET_SECONDS = 0.009
 VOLUME_RENDER_BATCH_SIZE = 36  # Rendu progressif des gros listings pour eviter les timeouts UI
 GUI_LOG_FLUSH_INTERVAL_MS = 70
 GUI_LOG_FLUSH_MAX_BATCH = 120
+GUI_LOG_RING_CAPACITY = 20000  # Entrées du journal GUI gardées en mémoire; l'historique complet va dans RUNTIME_LOG_PATH
+GUI_LOG_SEARCH_DEBOUNCE_MS = 180
 VOLUME_COMPACT_MODE_THRESHOLD = 180  # Au-dela, bascule vers un rendu compact plus rapide
 VOLUME_FAST_WIDGET_THRESHOLD = 2400  # Fallback ultime pour des catalogues exceptionnellement grands
 VOLUME_GROUP_HEADER_MAX_ITEMS = 220  # Au-dela, garde une grille canvas simple sans en-tetes de groupe.
@@ -1230,20 +1086,19 @@ CRUNCHY_LARGE_CHAPTER_PRELOAD_WINDOW = 8
 CRUNCHY_DEFAULT_PRELOAD_WINDOW = 6
 CRUNCHY_BLOB_FINAL_FETCH_TIMEOUT_MS = 6000
 CRUNCHY_BLOB_EVALUATION_TIMEOUT_MS = 15000
+CRUNCHY_BLOB_DOWNLOAD_TIMEOUT_MS = 8000
+CRUNCHY_READER_BATCH_INITIAL = 4  # Images déjà décodées extraites par aller-retour Playwright
+CRUNCHY_READER_BATCH_MAX = 16
+CRUNCHY_READER_BATCH_FAST_SECONDS = 0.35
+CRUNCHY_BINARY_CAPTURE_MAX_FAILURES = 3  # Échecs consécutifs avant retour au transfert base64 pour la session
 CRUNCHY_READER_MAX_CONTEXT_ATTEMPTS = 4
 CRUNCHY_READER_CONTEXT_RECYCLE_CHAPTERS = 3
-COOKIE_DOMAINS = (
-    "fr",
-    "net",
-    "origines",
-    "hentai",
-    "toonfr",
-    "ortega",
-    "hentaizone",
-    "scanmanga",
-    "crunchyscan",
-    "scanhentai",
-)
+CRUNCHY_READER_SESSIONS_DEFAULT = 2  # Chapitres extraits en parallèle par site (surchargeable via fragile_sites)
+CRUNCHY_READER_POOL_MAX = 4
+CRUNCHY_READER_PREFETCH_TTL_SECONDS = 600  # Durée de vie d'un chapitre préchargé jamais réclamé
+SCANMANGA_BROWSER_POOL_SIZE = 2  # Contextes Playwright Scan-Manga par défaut (surchargeable via fragile_sites)
+SCANMANGA_BROWSER_POOL_MAX = 4
+SCANMANGA_BROWSER_WORKER_MAX_FAILURES = 2  # Échecs consécutifs avant redémarrage du navigateur d'un worker
 COVER_RATIO_WIDTH = 2
 COVER_RATIO_HEIGHT = 3
 COVER_TARGET_HEIGHT = 150
@@ -1252,15 +1107,26 @@ APP_ICON_PATH = BASE_DIR / "assets" / "sushidl.ico"
 COOKIE_CACHE_PATH = BASE_DIR / "cookie_cache.json"  # Fichier de cache pour les cookies
 CONFIG_PATH = BASE_DIR / "config.json"  # Configuration globale de l'application
 ANALYSIS_CACHE_PATH = BASE_DIR / "analysis_cache.json"
-CATALOG_STATE_PATH = BASE_DIR / "catalog_state.json"
+CATALOG_STATE_PATH = BASE_DIR / "catalog_state.json"  # Ancien fichier unique, migré vers un dossier par catalogue
 WATCHLIST_PATH = BASE_DIR / "watchlist.json"
 DOWNLOAD_QUEUE_STATE_PATH = BASE_DIR / "download_queue.json"
 ANALYSIS_CACHE_LOCK = threading.Lock()
 ANALYSIS_CACHE_MEMORY = None
 ANALYSIS_CACHE_SCHEMA_VERSION = 6
+COOKIE_PROBE_CACHE_PATH = BASE_DIR / "cookie_probe_cache.json"
+COOKIE_PROBE_CACHE_LOCK = threading.Lock()
+COOKIE_PROBE_CACHE_MEMORY = None
+COOKIE_PROBE_TIMEOUT_SECONDS = 6
+COOKIE_PROBE_MAX_WORKERS = 5
+MADARA_AJAX_MAX_WORKERS = 4
+MADARA_AJAX_EXECUTOR_LOCK = threading.Lock()
+MADARA_AJAX_EXECUTOR = None
 CATALOG_STATE_LOCK = threading.Lock()
 CATALOG_STATE_MEMORY = None
 CATALOG_STATE_SCHEMA_VERSION = 1
+CATALOG_CHANGES_MAX_BYTES = 4 * 1024 * 1024
+CATALOG_CHANGES_COMPACT_TARGET_BYTES = 2 * 1024 * 1024  # Taille visée après compactage
+CATALOG_CHANGES_RETENTION_DAYS = 365
 WATCHLIST_LOCK = threading.Lock()
 WATCHLIST_MEMORY = None
 WATCHLIST_SCHEMA_VERSION = 1
@@ -1269,18 +1135,56 @@ IMAGE_URL_CACHE_ORDER = []
 IMAGE_URL_CACHE_LOCK = threading.Lock()
 TEXT_PAGE_URL_PREFIX = "sushidl-textpage://"
 READER_BLOB_PAGE_URL_PREFIX = "sushidl-readerblob://"
-TEXT_PAGE_CACHE = {}
+CATALOGUE_DOCUMENT_CACHE = {}  # HTML catalogue -> CatalogueDocument
+CATALOGUE_DOCUMENT_CACHE_LOCK = threading.Lock()
+CATALOGUE_DOCUMENT_CACHE_MAX_ITEMS = 4
+CATALOGUE_DOCUMENT_CACHE_ORDER = []
+TEXT_PAGE_CACHE = {}  # clé chapitre -> nombre de pages écrites dans TEXT_PAGE_SPILL_PATH
 TEXT_PAGE_CACHE_LOCK = threading.Lock()
 TEXT_PAGE_CACHE_MAX_ITEMS = 128
 TEXT_PAGE_CACHE_ORDER = []
+TEXT_PAGE_SPILL_PATH = BASE_DIR / ".sushidl_text_pages"
+TEXT_PAGE_SPILL_MAX_AGE_SECONDS = 86400
+TEXT_PAGE_SPILL_PRUNED = False
+TEXT_PAGE_ENCODE_WORKERS = 2
+NOVEL_IMAGE_PREFETCH_WORKERS = 4
+NOVEL_IMAGE_PREFETCH_WINDOW = 6  # Illustrations téléchargées/décodées d'avance, au plus
+TEXT_FONT_DIRS = (
+    Path(r"C:\Windows\Fonts"),
+    Path.home() / "AppData" / "Local" / "Microsoft" / "Windows" / "Fonts",
+    Path("/usr/share/fonts"),
+    Path("/usr/local/share/fonts"),
+    Path.home() / ".local" / "share" / "fonts",
+    Path.home() / ".fonts",
+    Path("/Library/Fonts"),
+    Path("/System/Library/Fonts"),
+)
+TEXT_FONT_CACHE = {}  # (chemin, taille) -> police chargée, ou False si illisible
+TEXT_FONT_CACHE_LOCK = threading.Lock()
+TEXT_FONT_FILE_INDEX = None  # nom de fichier en minuscules -> chemin, rempli au premier rendu
+TEXT_LENGTH_CACHE_MAX_CHARS = 48  # Au-delà (lignes entières), la largeur est mesurée sans cache
 SCANMANGA_BROWSER_LOCK = threading.Lock()
-SCANMANGA_BROWSER_THREAD = None
-SCANMANGA_BROWSER_TASKS = None
+SCANMANGA_BROWSER_WORKERS = []
+SCANMANGA_DECODE_ALPHABET = "0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ+/"
+SCANMANGA_DECODE_CACHE = {}
+SCANMANGA_DECODE_CACHE_LOCK = threading.Lock()
+SCANMANGA_DECODE_CACHE_MAX_ITEMS = 64
+SCANMANGA_DECODE_CACHE_ORDER = []
 CRUNCHY_BROWSER_LOCK = threading.Lock()
-CRUNCHY_BROWSER_THREAD = None
-CRUNCHY_BROWSER_TASKS = None
+CRUNCHY_BROWSER_WORKERS = []
+CRUNCHY_READER_TASKS = {}
 CRUNCHY_BROWSER_PROFILE_PATH = BASE_DIR / ".sushidl_crunchy_browser"
+CRUNCHY_BROWSER_STORAGE_STATE_PATH = BASE_DIR / ".sushidl_crunchy_storage.json"
 READER_BLOB_STAGE_PATH = BASE_DIR / ".sushidl_reader_blobs"
+RUNTIME_LOG_PATH = BASE_DIR / "logs" / "sushidl_runtime.jsonl"
+RUNTIME_LOG_MAX_BYTES = 8 * 1024 * 1024
+RUNTIME_LOG_BACKUP_COUNT = 5
+READER_BLOB_STAGE_LOCK = threading.Lock()
+READER_BLOB_PACK_NAME = "pages.pack"
+READER_BLOB_INDEX_NAME = "pages.idx"
+READER_BLOB_INDEX_RECORD = struct.Struct("<IQI20s")  # page, offset, longueur, sha1
+READER_BLOB_INDEX_CACHE = {}
+READER_BLOB_PACK_LOCKS = {}  # clé chapitre -> verrou du pack et de son index
 SCANMANGA_IMAGE_HOSTS = {
     "cdn.scan-manga.com",
     "data.scan-manga.com",
@@ -1296,14 +1200,9 @@ DIRECT_USER_AGENT_DEFAULT = DEFAULT_USER_AGENT
 DEFAULT_APP_CONFIG = {
     "auth_mode": "manual",
     "analysis_cache_ttl_seconds": 21600,
-    "fragile_sites": {
-        "toonfr": {"enabled": True, "max_threads": 1, "delay_between_volumes": 0.4},
-        "ortega": {"enabled": True, "max_threads": 1, "delay_between_volumes": 0.4},
-        "hentaizone": {"enabled": True, "max_threads": 2, "delay_between_volumes": 0.25},
-        "scanmanga": {"enabled": True, "max_threads": 1, "delay_between_volumes": 0.5},
-        "crunchyscan": {"enabled": True, "max_threads": 1, "delay_between_volumes": 0.4},
-        "scanhentai": {"enabled": True, "max_threads": 1, "delay_between_volumes": 0.4},
-    },
+    "cookie_probe_cache_ttl_seconds": 900,
+    "runtime_log_file": True,
+    "fragile_sites": {adapter.domain: dict(adapter.fragile) for adapter in SITE_ADAPTERS.values() if adapter.fragile},
     "manual_links": {
         "cookie_fr": "https://sushiscan.fr",
         "cookie_net": "https://sushiscan.net",
@@ -1494,12 +1393,23 @@ def load_app_config():
         return dict(DEFAULT_APP_CONFIG)
 
 
-APP_CONFIG = load_app_config()
+APP_CONFIG = None
+APP_CONFIG_LOCK = threading.Lock()
+
+
+def get_app_config():
+    """Retourne la configuration, chargée (et complétée sur disque) au premier usage."""
+    global APP_CONFIG
+    if APP_CONFIG is None:
+        with APP_CONFIG_LOCK:
+            if APP_CONFIG is None:
+                APP_CONFIG = load_app_config()
+    return APP_CONFIG
 
 
 def get_analysis_cache_ttl_seconds():
     try:
-        return max(0, int((APP_CONFIG or {}).get("analysis_cache_ttl_seconds", 21600)))
+        return max(0, int((get_app_config() or {}).get("analysis_cache_ttl_seconds", 21600)))
     except (TypeError, ValueError):
         return 21600
 
@@ -1527,7 +1437,12 @@ def _analysis_cache_key(url, ua):
     return hashlib.sha256(f"{(url or '').strip()}|{(ua or '').strip()}".encode("utf-8", errors="ignore")).hexdigest()
 
 
-def get_cached_analysis(url, ua):
+def get_cached_analysis(url, ua, allow_stale=False):
+    """Retourne l'analyse en cache de `url`, ou None.
+
+    Avec `allow_stale`, une entrée expirée est aussi retournée (`stale`
+    vrai) : ses validateurs servent alors à une actualisation conditionnelle.
+    """
     ttl = get_analysis_cache_ttl_seconds()
     if ttl <= 0:
         return None
@@ -1545,7 +1460,7 @@ def get_cached_analysis(url, ua):
         age = time.time() - float(entry.get("timestamp") or 0)
     except (TypeError, ValueError):
         return None
-    if age < 0 or age > ttl:
+    if age < 0 or (age > ttl and not allow_stale):
         return None
     pairs = entry.get("pairs")
     if not isinstance(pairs, list):
@@ -1556,12 +1471,26 @@ def get_cached_analysis(url, ua):
         "volume_metadata": entry.get("volume_metadata") if isinstance(entry.get("volume_metadata"), dict) else {},
         "series_metadata": entry.get("series_metadata") if isinstance(entry.get("series_metadata"), dict) else {},
         "html_content": entry.get("html_content") or "",
+        "etag": str(entry.get("etag") or ""),
+        "last_modified": str(entry.get("last_modified") or ""),
+        "content_hash": str(entry.get("content_hash") or ""),
         "age_seconds": age,
+        "stale": age > ttl,
     }
 
 
-def store_cached_analysis(url, ua, title, pairs, volume_metadata=None, series_metadata=None, html_content=""):
+def store_cached_analysis(
+    url,
+    ua,
+    title,
+    pairs,
+    volume_metadata=None,
+    series_metadata=None,
+    html_content="",
+    validators=None,
+):
     global ANALYSIS_CACHE_MEMORY
+    validators = validators if isinstance(validators, dict) else {}
     cache = _read_analysis_cache()
     cache[_analysis_cache_key(url, ua)] = {
         "schema_version": ANALYSIS_CACHE_SCHEMA_VERSION,
@@ -1572,6 +1501,9 @@ def store_cached_analysis(url, ua, title, pairs, volume_metadata=None, series_me
         "volume_metadata": volume_metadata or {},
         "series_metadata": series_metadata or {},
         "html_content": html_content or "",
+        "etag": str(validators.get("etag") or ""),
+        "last_modified": str(validators.get("last_modified") or ""),
+        "content_hash": str(validators.get("content_hash") or ""),
     }
     if len(cache) > 80:
         ordered = sorted(cache.items(), key=lambda item: float((item[1] or {}).get("timestamp") or 0), reverse=True)
@@ -1581,49 +1513,253 @@ def store_cached_analysis(url, ua, title, pairs, volume_metadata=None, series_me
         _write_json_file(ANALYSIS_CACHE_PATH, cache)
 
 
+def get_cookie_probe_cache_ttl_seconds():
+    try:
+        return max(0, int((get_app_config() or {}).get("cookie_probe_cache_ttl_seconds", 900)))
+    except (TypeError, ValueError):
+        return 900
+
+
+def _cookie_probe_cache_key(domain, cookie, ua, probe_url=""):
+    """Empreinte du couple cookie + User-Agent : le cookie lui-même n'est jamais écrit."""
+    raw = f"{domain}|{(probe_url or '').strip()}|{(cookie or '').strip()}|{(ua or '').strip()}"
+    return hashlib.sha256(raw.encode("utf-8", errors="ignore")).hexdigest()
+
+
+def _load_cookie_probe_cache_locked():
+    """Charge le cache des tests cookie en mémoire (appelant sous COOKIE_PROBE_CACHE_LOCK)."""
+    global COOKIE_PROBE_CACHE_MEMORY
+    if COOKIE_PROBE_CACHE_MEMORY is None:
+        data = {}
+        if COOKIE_PROBE_CACHE_PATH.exists():
+            try:
+                with COOKIE_PROBE_CACHE_PATH.open("r", encoding="utf-8-sig") as handle:
+                    data = json.load(handle)
+            except Exception as exc:
+                runtime_log(f"Cache des tests cookie illisible: {exc}", level="debug")
+        COOKIE_PROBE_CACHE_MEMORY = data if isinstance(data, dict) else {}
+    return COOKIE_PROBE_CACHE_MEMORY
+
+
+def get_cached_cookie_probe(domain, cookie, ua, probe_url=""):
+    """Retourne le dernier résultat de test encore frais pour ce cookie et cet User-Agent."""
+    ttl = get_cookie_probe_cache_ttl_seconds()
+    if ttl <= 0:
+        return None
+    with COOKIE_PROBE_CACHE_LOCK:
+        entry = _load_cookie_probe_cache_locked().get(_cookie_probe_cache_key(domain, cookie, ua, probe_url))
+    if not isinstance(entry, dict):
+        return None
+    try:
+        age = time.time() - float(entry.get("timestamp") or 0)
+    except (TypeError, ValueError):
+        return None
+    if age < 0 or age > ttl:
+        return None
+    return {
+        "cookie_valid": bool(entry.get("cookie_valid")),
+        "challenge_state": entry.get("challenge_state") or "unknown",
+        "http_status": entry.get("http_status"),
+        "age_seconds": age,
+    }
+
+
+def store_cookie_probe_result(domain, cookie, ua, status, probe_url=""):
+    """Mémorise un test concluant; une erreur réseau (sans statut HTTP) n'est pas retenue."""
+    global COOKIE_PROBE_CACHE_MEMORY
+    if not isinstance(status, dict) or not status.get("http_status"):
+        return
+    now = time.time()
+    ttl = get_cookie_probe_cache_ttl_seconds()
+    with COOKIE_PROBE_CACHE_LOCK:
+        cache = {
+            key: entry
+            for key, entry in _load_cookie_probe_cache_locked().items()
+            if isinstance(entry, dict) and now - float(entry.get("timestamp") or 0) <= ttl
+        }
+        cache[_cookie_probe_cache_key(domain, cookie, ua, probe_url)] = {
+            "domain": domain,
+            "timestamp": now,
+            "cookie_valid": bool(status.get("cookie_valid")),
+            "challenge_state": status.get("challenge_state") or "unknown",
+            "http_status": status.get("http_status"),
+        }
+        COOKIE_PROBE_CACHE_MEMORY = cache
+        _write_json_file(COOKIE_PROBE_CACHE_PATH, cache)
+
+
 def _catalog_state_key(url):
     safe_url = normalize_image_url((url or "").strip())
     return safe_url.rstrip("/")
 
 
-def _read_catalog_state():
+def _catalog_state_dir():
+    """Dossier des états catalogue : un fichier par catalogue + journal des changements."""
+    return CATALOG_STATE_PATH.with_suffix("")
+
+
+def _catalog_changes_path():
+    return _catalog_state_dir() / "changes.jsonl"
+
+
+def _catalog_record_path(key):
+    return _catalog_state_dir() / f"{hashlib.sha1(key.encode('utf-8')).hexdigest()[:20]}.json"
+
+
+def _migrate_legacy_catalog_state():
+    """Éclate l'ancien `catalog_state.json` en un fichier par catalogue (une seule fois)."""
+    if not CATALOG_STATE_PATH.exists():
+        return
+    try:
+        with CATALOG_STATE_PATH.open("r", encoding="utf-8-sig") as handle:
+            data = json.load(handle)
+        catalogues = data.get("catalogues") if isinstance(data, dict) else None
+        if isinstance(catalogues, dict) and int(data.get("schema_version") or 0) == CATALOG_STATE_SCHEMA_VERSION:
+            for key, record in catalogues.items():
+                if isinstance(record, dict) and not _catalog_record_path(key).exists():
+                    _write_json_file(_catalog_record_path(key), record)
+        os.replace(CATALOG_STATE_PATH, CATALOG_STATE_PATH.with_name(f"{CATALOG_STATE_PATH.name}.migrated"))
+    except Exception as exc:
+        runtime_log(f"Migration état catalogue impossible: {exc}", level="debug")
+
+
+def _read_catalog_record(key):
+    """Retourne l'état mémorisé d'un catalogue (dict vide si inconnu). Appelant sous CATALOG_STATE_LOCK."""
     global CATALOG_STATE_MEMORY
-    with CATALOG_STATE_LOCK:
-        if CATALOG_STATE_MEMORY is not None:
-            return dict(CATALOG_STATE_MEMORY)
-        if not CATALOG_STATE_PATH.exists():
-            CATALOG_STATE_MEMORY = {"schema_version": CATALOG_STATE_SCHEMA_VERSION, "catalogues": {}}
-            return dict(CATALOG_STATE_MEMORY)
+    if CATALOG_STATE_MEMORY is None:
+        _migrate_legacy_catalog_state()
+        CATALOG_STATE_MEMORY = {}
+    if key in CATALOG_STATE_MEMORY:
+        return CATALOG_STATE_MEMORY[key]
+    record = {}
+    path = _catalog_record_path(key)
+    if path.exists():
         try:
-            with CATALOG_STATE_PATH.open("r", encoding="utf-8-sig") as handle:
+            with path.open("r", encoding="utf-8-sig") as handle:
                 data = json.load(handle)
-            if not isinstance(data, dict):
-                data = {}
-            if int(data.get("schema_version") or 0) != CATALOG_STATE_SCHEMA_VERSION:
-                data = {"schema_version": CATALOG_STATE_SCHEMA_VERSION, "catalogues": {}}
-            data.setdefault("catalogues", {})
-            if not isinstance(data.get("catalogues"), dict):
-                data["catalogues"] = {}
-            CATALOG_STATE_MEMORY = data
-            return dict(CATALOG_STATE_MEMORY)
+            if isinstance(data, dict) and int(data.get("schema_version") or 0) == CATALOG_STATE_SCHEMA_VERSION:
+                record = data
         except Exception as exc:
             runtime_log(f"Etat catalogue illisible: {exc}", level="debug")
-            CATALOG_STATE_MEMORY = {"schema_version": CATALOG_STATE_SCHEMA_VERSION, "catalogues": {}}
-            return dict(CATALOG_STATE_MEMORY)
+    CATALOG_STATE_MEMORY[key] = record
+    return record
 
 
-def _write_catalog_state(data):
-    global CATALOG_STATE_MEMORY
-    safe_data = data if isinstance(data, dict) else {}
-    safe_data["schema_version"] = CATALOG_STATE_SCHEMA_VERSION
-    safe_data.setdefault("catalogues", {})
+def get_catalog_record(url):
+    key = _catalog_state_key(url)
+    if not key:
+        return {}
     with CATALOG_STATE_LOCK:
-        CATALOG_STATE_MEMORY = dict(safe_data)
-        _write_json_file(CATALOG_STATE_PATH, safe_data)
+        return dict(_read_catalog_record(key))
+
+
+def _append_catalog_changes(record, new_items, removed_items, timestamp):
+    """Ajoute les nouveautés/retraits d'un catalogue au journal (append-only). Appelant sous verrou."""
+    path = _catalog_changes_path()
+    line = json.dumps(
+        {
+            "ts": timestamp,
+            "url": record.get("url") or "",
+            "title": record.get("title") or "",
+            "domain": record.get("domain") or "",
+            "new": new_items,
+            "removed": removed_items,
+        },
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a", encoding="utf-8") as handle:
+        handle.write(line + "\n")
+        size = handle.tell()
+    if size > CATALOG_CHANGES_MAX_BYTES:
+        _compact_catalog_changes(path)
+
+
+def _compact_catalog_changes(path):
+    """Retire du journal les changements plus vieux que la rétention.
+
+    Si cela ne suffit pas, les plus anciens sont aussi retirés jusqu'à
+    CATALOG_CHANGES_COMPACT_TARGET_BYTES : l'écart avec le seuil de
+    déclenchement évite de réécrire tout le journal à chaque ajout.
+    """
+    cutoff = datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(days=CATALOG_CHANGES_RETENTION_DAYS)
+    kept = []
+    kept_bytes = 0
+    try:
+        with open(path, "r", encoding="utf-8") as handle:
+            for line in handle:
+                try:
+                    if datetime.datetime.fromisoformat(json.loads(line)["ts"]) >= cutoff:
+                        kept.append(line)
+                        kept_bytes += len(line.encode("utf-8"))
+                except (ValueError, KeyError, TypeError):
+                    continue
+        first_kept = 0
+        while kept_bytes > CATALOG_CHANGES_COMPACT_TARGET_BYTES and first_kept < len(kept):
+            kept_bytes -= len(kept[first_kept].encode("utf-8"))
+            first_kept += 1
+        kept = kept[first_kept:]
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as handle:
+            handle.writelines(kept)
+        os.replace(tmp_path, path)
+    except OSError as exc:
+        runtime_log(f"Compactage du journal catalogue impossible: {exc}", level="debug")
+
+
+def get_catalog_changes(days=7, url="", domain=""):
+    """Nouveautés et retraits enregistrés sur la période, du plus récent au plus ancien.
+
+    Chaque entrée : ts, url, title, domain, change ("new"/"removed"), label, item_url.
+    """
+    since = datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(days=max(0.0, float(days or 0)))
+    safe_url = _catalog_state_key(url) if url else ""
+    safe_domain = (domain or "").strip().lower()
+    changes = []
+    with CATALOG_STATE_LOCK:
+        path = _catalog_changes_path()
+        if not path.exists():
+            return []
+        try:
+            with open(path, "r", encoding="utf-8") as handle:
+                lines = handle.readlines()
+        except OSError:
+            return []
+    for line in lines:
+        try:
+            event = json.loads(line)
+            if datetime.datetime.fromisoformat(event["ts"]) < since:
+                continue
+        except (ValueError, KeyError, TypeError):
+            continue
+        if safe_url and event.get("url") != safe_url:
+            continue
+        if safe_domain and (event.get("domain") or "").lower() != safe_domain:
+            continue
+        for change in ("new", "removed"):
+            for item in event.get(change) or []:
+                changes.append(
+                    {
+                        "ts": event["ts"],
+                        "url": event.get("url") or "",
+                        "title": event.get("title") or "",
+                        "domain": event.get("domain") or "",
+                        "change": change,
+                        "label": item.get("label") or "",
+                        "item_url": item.get("url") or "",
+                    }
+                )
+    changes.sort(key=lambda change: change["ts"], reverse=True)
+    return changes
 
 
 def update_catalog_state(url, title, pairs, domain="", volume_metadata=None):
-    """Memorise l'etat d'un catalogue et retourne le delta depuis la derniere analyse."""
+    """Memorise l'etat d'un catalogue et retourne le delta depuis la derniere analyse.
+
+    Seul le fichier du catalogue concerné est réécrit; les nouveautés et
+    retraits sont ajoutés au journal des changements.
+    """
     key = _catalog_state_key(url)
     if not key:
         return {}
@@ -1633,32 +1769,34 @@ def update_catalog_state(url, title, pairs, domain="", volume_metadata=None):
         if not safe_link:
             continue
         current_items[safe_link] = normalize_tome_label(label) or safe_link
-    state = _read_catalog_state()
-    catalogues = state.setdefault("catalogues", {})
-    previous = catalogues.get(key) if isinstance(catalogues.get(key), dict) else {}
-    previous_items = previous.get("known_items") if isinstance(previous.get("known_items"), dict) else {}
-    first_seen = not bool(previous_items)
-    new_urls = [link for link in current_items if link not in previous_items]
-    removed_urls = [link for link in previous_items if link not in current_items]
-    now_iso = datetime.datetime.now(datetime.timezone.utc).isoformat()
-    new_items = [{"label": current_items[link], "url": link} for link in new_urls]
-    removed_items = [{"label": previous_items.get(link, link), "url": link} for link in removed_urls]
-    catalogues[key] = {
-        "schema_version": CATALOG_STATE_SCHEMA_VERSION,
-        "url": key,
-        "title": normalize_metadata_text(title) or previous.get("title") or "",
-        "domain": (domain or get_cookie_domain_from_url(key) or "").strip(),
-        "last_checked_at": now_iso,
-        "last_count": len(current_items),
-        "known_items": current_items,
-        "last_new_items": new_items if not first_seen else [],
-        "last_removed_items": removed_items if not first_seen else [],
-        "volume_metadata": volume_metadata if isinstance(volume_metadata, dict) else {},
-    }
-    _write_catalog_state(state)
+    with CATALOG_STATE_LOCK:
+        previous = _read_catalog_record(key)
+        previous_items = previous.get("known_items") if isinstance(previous.get("known_items"), dict) else {}
+        first_seen = not bool(previous_items)
+        new_urls = [link for link in current_items if link not in previous_items]
+        removed_urls = [link for link in previous_items if link not in current_items]
+        now_iso = datetime.datetime.now(datetime.timezone.utc).isoformat()
+        new_items = [{"label": current_items[link], "url": link} for link in new_urls]
+        removed_items = [{"label": previous_items.get(link, link), "url": link} for link in removed_urls]
+        record = {
+            "schema_version": CATALOG_STATE_SCHEMA_VERSION,
+            "url": key,
+            "title": normalize_metadata_text(title) or previous.get("title") or "",
+            "domain": (domain or get_cookie_domain_from_url(key) or "").strip(),
+            "last_checked_at": now_iso,
+            "last_count": len(current_items),
+            "known_items": current_items,
+            "last_new_items": new_items if not first_seen else [],
+            "last_removed_items": removed_items if not first_seen else [],
+            "volume_metadata": volume_metadata if isinstance(volume_metadata, dict) else {},
+        }
+        _write_json_file(_catalog_record_path(key), record)
+        CATALOG_STATE_MEMORY[key] = record
+        if not first_seen and (new_items or removed_items):
+            _append_catalog_changes(record, new_items, removed_items, now_iso)
     return {
         "url": key,
-        "title": catalogues[key]["title"],
+        "title": record["title"],
         "first_seen": first_seen,
         "previous_count": len(previous_items) if previous_items else int(previous.get("last_count") or 0),
         "current_count": len(current_items),
@@ -1783,8 +1921,6 @@ def remove_watchlist_url(url):
 
 def get_watchlist_entries_with_state():
     data = _read_watchlist()
-    state = _read_catalog_state()
-    catalogues = state.get("catalogues") if isinstance(state.get("catalogues"), dict) else {}
     entries = []
     for item in data.get("items", []) or []:
         if not isinstance(item, dict):
@@ -1792,7 +1928,7 @@ def get_watchlist_entries_with_state():
         safe_url = _catalog_state_key(item.get("url"))
         if not safe_url:
             continue
-        known = catalogues.get(safe_url) if isinstance(catalogues.get(safe_url), dict) else {}
+        known = get_catalog_record(safe_url)
         new_items = known.get("last_new_items") if isinstance(known.get("last_new_items"), list) else []
         removed_items = known.get("last_removed_items") if isinstance(known.get("last_removed_items"), list) else []
         entries.append(
@@ -1815,7 +1951,7 @@ def get_watchlist_entries_with_state():
 
 
 def get_fragile_site_settings(domain):
-    fragile = (APP_CONFIG or {}).get("fragile_sites", {})
+    fragile = (get_app_config() or {}).get("fragile_sites", {})
     if not isinstance(fragile, dict):
         return {}
     settings = fragile.get(domain) or {}
@@ -1824,7 +1960,8 @@ def get_fragile_site_settings(domain):
 
 def get_manual_link(config_key, default_value):
     """Retourne un lien manuel depuis config.json (ou valeur par defaut)."""
-    links = APP_CONFIG.get("manual_links", {}) if isinstance(APP_CONFIG, dict) else {}
+    app_config = get_app_config()
+    links = app_config.get("manual_links", {}) if isinstance(app_config, dict) else {}
     if not isinstance(links, dict):
         return default_value
     raw = (links.get(config_key) or "").strip()
@@ -1850,6 +1987,33 @@ def strip_console_unsafe_chars(text):
     return value.encode("ascii", errors="ignore").decode("ascii", errors="ignore")
 
 
+def wrap_log_line(text, max_width, measure):
+    """Découpe une ligne du journal au mot près pour tenir dans `max_width`.
+
+    `measure` donne la largeur d'un texte (police Tk ou `len`); un mot plus
+    large que la zone est coupé au caractère, comme `wrap="word"` d'un Text.
+    """
+    lines = []
+    for paragraph in str(text or "").split("\n"):
+        current = ""
+        for word in paragraph.split(" "):
+            candidate = f"{current} {word}" if current else word
+            if measure(candidate) <= max_width:
+                current = candidate
+                continue
+            if current:
+                lines.append(current)
+            current = word
+            while len(current) > 1 and measure(current) > max_width:
+                cut = len(current) - 1
+                while cut > 1 and measure(current[:cut]) > max_width:
+                    cut -= 1
+                lines.append(current[:cut])
+                current = current[cut:]
+        lines.append(current)
+    return lines
+
+
 def normalize_log_level(level):
     """Normalise un niveau de log supporté."""
     candidate = (level or "info").strip().lower()
@@ -1935,9 +2099,226 @@ def runtime_log(message, level="info", context=None):
     if app is not None and hasattr(app, "log"):
         app.log(text, level=level, context=context)
         return
+    record_runtime_log(text, level=level, context=context)
     emit_console_log(text, level=level, context=context)
 
 
+class LogRingBuffer:
+    """Journal borné en mémoire, indexé par niveau.
+
+    Au-delà de `capacity`, les entrées les plus anciennes sont évincées. Chaque
+    entrée reçoit un numéro `seq` croissant et une copie minuscule de son texte
+    (`_search`) : filtrer par niveau ne parcourt que l'index du niveau, et la
+    recherche ne compare que des chaînes déjà normalisées.
+    """
+
+    def __init__(self, capacity):
+        self.capacity = max(1, int(capacity))
+        self._entries = deque()
+        self._by_level = {}
+        self._next_seq = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def append(self, entry):
+        level = normalize_log_level(entry.get("level"))
+        entry["level"] = level
+        entry["_search"] = str(entry.get("message") or "").lower()
+        with self._lock:
+            entry["seq"] = self._next_seq
+            self._next_seq += 1
+            self._entries.append(entry)
+            self._by_level.setdefault(level, deque()).append(entry)
+            while len(self._entries) > self.capacity:
+                evicted = self._entries.popleft()
+                bucket = self._by_level.get(evicted["level"])
+                if bucket and bucket[0] is evicted:
+                    bucket.popleft()
+        return entry
+
+    def oldest_seq(self):
+        with self._lock:
+            return self._entries[0]["seq"] if self._entries else self._next_seq
+
+    def select(self, levels=None, needle=""):
+        """Entrées des niveaux demandés (toutes si None) contenant `needle`, dans l'ordre."""
+        with self._lock:
+            if levels is None:
+                candidates = list(self._entries)
+            else:
+                buckets = [list(self._by_level.get(level) or ()) for level in levels]
+                buckets = [bucket for bucket in buckets if bucket]
+                if len(buckets) == 1:
+                    candidates = buckets[0]
+                else:
+                    candidates = list(heapq.merge(*buckets, key=lambda entry: entry["seq"]))
+        safe_needle = (needle or "").strip().lower()
+        if safe_needle:
+            candidates = [entry for entry in candidates if safe_needle in entry["_search"]]
+        return candidates
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._by_level.clear()
+
+
+class RotatingLogWriter:
+    """Écrit des lignes dans un fichier à rotation par taille, depuis un thread dédié.
+
+    `write` se contente d'empiler la ligne : l'appelant (thread UI ou worker de
+    téléchargement) ne paie jamais l'I/O disque. Si la file est pleine, la
+    ligne est comptée dans `dropped` au lieu de bloquer. Avec `formatter`, les
+    éléments empilés sont mis en forme par le thread d'écriture.
+    """
+
+    def __init__(self, path, max_bytes, backup_count, queue_size=20000, formatter=None):
+        self.path = Path(path)
+        self.max_bytes = max(1024, int(max_bytes))
+        self.backup_count = max(0, int(backup_count))
+        self.formatter = formatter
+        self.dropped = 0
+        self._queue = queue.Queue(maxsize=max(1, int(queue_size)))
+        self._thread = None
+        self._start_lock = threading.Lock()
+
+    def write(self, line):
+        self._ensure_started()
+        try:
+            self._queue.put_nowait(line if self.formatter is not None else str(line))
+        except queue.Full:
+            self.dropped += 1
+
+    def flush(self, timeout=2.0):
+        """Attend que les lignes déjà empilées soient écrites; retourne False au-delà du délai."""
+        if self._thread is None:
+            return True
+        done = threading.Event()
+        try:
+            self._queue.put(done, timeout=timeout)
+        except queue.Full:
+            return False
+        return done.wait(timeout)
+
+    def _ensure_started(self):
+        if self._thread is not None:
+            return
+        with self._start_lock:
+            if self._thread is None:
+                thread = threading.Thread(target=self._run, name=f"log-writer:{self.path.name}", daemon=True)
+                thread.start()
+                self._thread = thread
+                atexit.register(self.flush)
+
+    def _open(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        return open(self.path, "a", encoding="utf-8")
+
+    def _rotate(self, handle):
+        handle.close()
+        if self.backup_count <= 0:
+            self.path.unlink(missing_ok=True)
+            return self._open()
+        for index in range(self.backup_count - 1, 0, -1):
+            source = self.path.with_name(f"{self.path.name}.{index}")
+            if source.exists():
+                os.replace(source, self.path.with_name(f"{self.path.name}.{index + 1}"))
+        if self.path.exists():
+            os.replace(self.path, self.path.with_name(f"{self.path.name}.1"))
+        return self._open()
+
+    def _run(self):
+        handle = None
+        while True:
+            item = self._queue.get()
+            batch = [item]
+            while len(batch) < 500:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                if handle is None:
+                    handle = self._open()
+                for item in batch:
+                    if isinstance(item, threading.Event):
+                        handle.flush()
+                        item.set()
+                        continue
+                    if self.formatter is not None:
+                        try:
+                            item = self.formatter(item)
+                        except Exception:
+                            continue
+                    data = item if item.endswith("\n") else item + "\n"
+                    if handle.tell() + len(data.encode("utf-8")) > self.max_bytes and handle.tell() > 0:
+                        handle = self._rotate(handle)
+                    handle.write(data)
+                handle.flush()
+            except OSError:
+                for item in batch:
+                    if isinstance(item, threading.Event):
+                        item.set()
+                try:
+                    if handle is not None:
+                        handle.close()
+                except OSError:
+                    pass
+                handle = None
+
+
+def _json_log_value(value):
+    if value is None or isinstance(value, (bool, int, float)):
+        return value
+    if isinstance(value, dict):
+        return {str(key): _json_log_value(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple, set)):
+        return [_json_log_value(item) for item in value]
+    return redact_sensitive_text(str(value))
+
+
+def format_runtime_log_record(record):
+    """Sérialise un enregistrement runtime en ligne JSON, secrets masqués (thread d'écriture)."""
+    payload = {
+        "ts": record["ts"],
+        "level": record["level"],
+        "message": redact_sensitive_text(record["message"]),
+        "thread": record["thread"],
+    }
+    context = record.get("context")
+    if context:
+        payload["context"] = _json_log_value(context)
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+
+
+RUNTIME_LOG_WRITER = RotatingLogWriter(
+    RUNTIME_LOG_PATH,
+    RUNTIME_LOG_MAX_BYTES,
+    RUNTIME_LOG_BACKUP_COUNT,
+    formatter=format_runtime_log_record,
+)
+
+
+def record_runtime_log(message, level="info", context=None):
+    """Ajoute un enregistrement au journal JSON runtime, sans I/O dans le thread appelant.
+
+    Tous les niveaux sont conservés, y compris `debug` masqué dans l'interface.
+    """
+    if not (get_app_config() or {}).get("runtime_log_file", True):
+        return
+    RUNTIME_LOG_WRITER.write(
+        {
+            "ts": datetime.datetime.now().isoformat(timespec="milliseconds"),
+            "level": normalize_log_level(level),
+            "message": str(message or ""),
+            "thread": threading.current_thread().name,
+            "context": dict(context) if isinstance(context, dict) else context,
+        }
+    )
+
+
 def is_cloudflare_challenge_page(content):
     """Détecte une page de challenge Cloudflare."""
     text = (content or "").lower()
@@ -1957,6 +2338,14 @@ def sanitize_folder_name(name):
     return re.sub(r'[<>:"/\\|?*\n\r]', "_", name).strip()
 
 
+def is_volume_archive_present(output_root, title, volume_label):
+    """Indique si le CBZ d'un tome/chapitre existe déjà (et n'est pas un fichier vide)."""
+    clean_title = sanitize_folder_name(title)
+    clean_tome = sanitize_folder_name(normalize_tome_label(volume_label))
+    cbz_path = os.path.join(output_root, clean_title, f"{clean_title} - {clean_tome}.cbz")
+    return os.path.isfile(cbz_path) and os.path.getsize(cbz_path) > 10_000
+
+
 def sanitize_cookie_value(value):
     """Nettoie une valeur de cookie pour éviter l'injection d'en-têtes HTTP."""
     raw = str(value or "").strip()
@@ -2163,23 +2552,22 @@ def dispose_scanmanga_browser_state(state):
 
 
 def close_scanmanga_browser_state():
-    """Demande l'arrêt de la session navigateur Scan-Manga réutilisée."""
-    global SCANMANGA_BROWSER_THREAD, SCANMANGA_BROWSER_TASKS
+    """Demande l'arrêt de toutes les sessions navigateur Scan-Manga du pool."""
     with SCANMANGA_BROWSER_LOCK:
-        tasks = SCANMANGA_BROWSER_TASKS
-        thread = SCANMANGA_BROWSER_THREAD
-        SCANMANGA_BROWSER_TASKS = None
-        SCANMANGA_BROWSER_THREAD = None
-    if tasks is not None:
-        try:
-            tasks.put({"action": "stop"})
-        except Exception:
-            pass
-    if thread is not None and thread.is_alive() and thread is not threading.current_thread():
+        workers = list(SCANMANGA_BROWSER_WORKERS)
+        SCANMANGA_BROWSER_WORKERS.clear()
+    for worker in workers:
         try:
-            thread.join(timeout=5)
+            worker["tasks"].put({"action": "stop"})
         except Exception:
             pass
+    for worker in workers:
+        thread = worker.get("thread")
+        if thread is not None and thread.is_alive() and thread is not threading.current_thread():
+            try:
+                thread.join(timeout=5)
+            except Exception:
+                pass
 
 
 def reset_scanmanga_browser_context(state):
@@ -2421,9 +2809,39 @@ def fetch_scanmanga_image_in_browser_state(state, img_url, referer_url, ua, canc
     )
 
 
-def scanmanga_browser_worker_loop(tasks):
-    """Thread propriétaire de Playwright pour Scan-Manga."""
+def get_scanmanga_browser_pool_size():
+    """Nombre de contextes navigateur Scan-Manga autorisés en parallèle."""
+    settings = get_fragile_site_settings("scanmanga")
+    try:
+        size = int(settings.get("browser_contexts", SCANMANGA_BROWSER_POOL_SIZE))
+    except (TypeError, ValueError):
+        size = SCANMANGA_BROWSER_POOL_SIZE
+    return max(1, min(SCANMANGA_BROWSER_POOL_MAX, size))
+
+
+def is_scanmanga_browser_context_failure(result):
+    """Indique si une réponse image trahit un contexte navigateur grillé.
+
+    Seuls un refus (403/429), une erreur serveur ou une page de challenge
+    comptent : une 404 ou un autre statut ne justifie pas de recycler le contexte.
+    """
+    status = int((result or {}).get("status") or 0)
+    if status in (0, 403, 429) or status >= 500:
+        return True
+    if "html" not in str((result or {}).get("contentType") or "").lower():
+        return False
+    try:
+        text = base64.b64decode((result or {}).get("body") or "").decode("utf-8", errors="ignore")
+    except (ValueError, TypeError):
+        return False
+    return bool(text.strip()) and is_cloudflare_challenge_page(text)
+
+
+def scanmanga_browser_worker_loop(worker):
+    """Thread propriétaire d'un navigateur Playwright du pool Scan-Manga."""
+    tasks = worker["tasks"]
     state = new_scanmanga_browser_state()
+    failures = 0
     try:
         while True:
             task = tasks.get()
@@ -2439,38 +2857,83 @@ def scanmanga_browser_worker_loop(tasks):
                     task.get("referer") or "",
                     task.get("ua") or DEFAULT_USER_AGENT,
                 )
+                failures = failures + 1 if is_scanmanga_browser_context_failure(result) else 0
                 if response is not None:
                     response.put({"ok": True, "result": result})
             except Exception as exc:
+                failures += 1
                 if response is not None:
                     response.put({"ok": False, "error": exc})
+            finally:
+                with SCANMANGA_BROWSER_LOCK:
+                    worker["pending"] = max(0, worker["pending"] - 1)
+                    worker["referer"] = state.get("referer") or ""
+            if failures >= SCANMANGA_BROWSER_WORKER_MAX_FAILURES:
+                runtime_log(
+                    f"Playwright Scan-Manga: contexte #{worker['slot']} recyclé après {failures} échecs consécutifs.",
+                    level="warning",
+                    context={"action": "playwright_recycle", "domain": "scanmanga"},
+                )
+                dispose_scanmanga_browser_state(state)
+                state = new_scanmanga_browser_state()
+                failures = 0
+                with SCANMANGA_BROWSER_LOCK:
+                    worker["referer"] = ""
     finally:
         dispose_scanmanga_browser_state(state)
 
 
-def get_scanmanga_browser_tasks():
-    """Démarre au besoin l'unique thread navigateur Scan-Manga."""
-    global SCANMANGA_BROWSER_THREAD, SCANMANGA_BROWSER_TASKS
+def start_scanmanga_browser_worker(slot):
+    """Crée un worker navigateur Scan-Manga (appelé sous SCANMANGA_BROWSER_LOCK)."""
+    worker = {"slot": slot, "tasks": queue.Queue(), "pending": 0, "referer": "", "thread": None}
+    worker["thread"] = threading.Thread(
+        target=scanmanga_browser_worker_loop,
+        args=(worker,),
+        daemon=True,
+        name=f"scanmanga-browser-{slot}",
+    )
+    worker["thread"].start()
+    return worker
+
+
+def acquire_scanmanga_browser_worker(referer_key=""):
+    """Choisit le worker du pool qui traitera la prochaine image.
+
+    Un worker libre ayant déjà chargé le même lecteur est prioritaire (pas de
+    rechargement de page), puis le moins chargé. Un nouveau navigateur n'est
+    lancé que si tous les workers existants sont occupés.
+    """
+    pool_size = get_scanmanga_browser_pool_size()
     with SCANMANGA_BROWSER_LOCK:
-        if SCANMANGA_BROWSER_THREAD is not None and SCANMANGA_BROWSER_THREAD.is_alive() and SCANMANGA_BROWSER_TASKS is not None:
-            return SCANMANGA_BROWSER_TASKS
-        SCANMANGA_BROWSER_TASKS = queue.Queue()
-        SCANMANGA_BROWSER_THREAD = threading.Thread(
-            target=scanmanga_browser_worker_loop,
-            args=(SCANMANGA_BROWSER_TASKS,),
-            daemon=True,
-            name="scanmanga-browser",
-        )
-        SCANMANGA_BROWSER_THREAD.start()
-        return SCANMANGA_BROWSER_TASKS
+        SCANMANGA_BROWSER_WORKERS[:] = [
+            worker for worker in SCANMANGA_BROWSER_WORKERS if worker["thread"] is not None and worker["thread"].is_alive()
+        ]
+        workers = SCANMANGA_BROWSER_WORKERS
+        idle = [worker for worker in workers if worker["pending"] == 0]
+        chosen = next((worker for worker in idle if referer_key and worker["referer"] == referer_key), None)
+        if chosen is None and idle:
+            chosen = idle[0]
+        if chosen is None and len(workers) < pool_size:
+            used_slots = {worker["slot"] for worker in workers}
+            slot = next(index for index in range(1, pool_size + 1) if index not in used_slots)
+            chosen = start_scanmanga_browser_worker(slot)
+            workers.append(chosen)
+        if chosen is None:
+            chosen = min(
+                workers,
+                key=lambda worker: (worker["pending"], 0 if referer_key and worker["referer"] == referer_key else 1),
+            )
+        chosen["pending"] += 1
+        return chosen
 
 
 def fetch_scanmanga_image_with_browser(img_url, referer_url, ua, cancel_event=None):
-    """Récupère une image via l'unique session navigateur Scan-Manga."""
+    """Récupère une image via le pool de sessions navigateur Scan-Manga."""
     if cancel_event is not None and cancel_event.is_set():
         raise DownloadCancelled("Téléchargement annulé.")
     response = queue.Queue(maxsize=1)
-    get_scanmanga_browser_tasks().put(
+    referer_key = (referer_url or "https://www.scan-manga.com/").strip().split("#", 1)[0]
+    acquire_scanmanga_browser_worker(referer_key)["tasks"].put(
         {
             "action": "fetch",
             "url": normalize_image_url(img_url),
@@ -2568,13 +3031,15 @@ def download_preview_image_with_browser(img_url, referer_url, ua, cancel_event=N
         return image.convert("RGB")
 
 
-def new_crunchy_browser_state():
+def new_crunchy_browser_state(persistent=True):
     return {
         "playwright": None, "browser": None, "context": None, "page": None,
-        "ua": "", "site": "", "persistent": True,
+        "ua": "", "site": "", "persistent": bool(persistent),
         "partial_blobs": {}, "partial_blob_order": [],
         "reader_preload_by_link": {}, "reader_preload_by_site": {},
         "completed_reader_chapters": 0,
+        "reader_binary_capture": True, "reader_binary_failures": 0,
+        "reader_batch_by_site": {},
     }
 
 
@@ -2633,25 +3098,43 @@ def get_crunchy_browser_page(state, url, ua=""):
                 state["context"].close()
             except Exception:
                 pass
-        CRUNCHY_BROWSER_PROFILE_PATH.mkdir(parents=True, exist_ok=True)
         chromium = state["playwright"].chromium
-        launch_options = {
-            "headless": True,
+        context_options = {
             "user_agent": safe_ua,
             "locale": "fr-FR",
             "viewport": {"width": 1200, "height": 900},
+            "accept_downloads": True,
         }
-        try:
-            state["context"] = chromium.launch_persistent_context(
-                str(CRUNCHY_BROWSER_PROFILE_PATH),
-                channel="chrome",
-                **launch_options,
-            )
-        except Exception:
-            state["context"] = chromium.launch_persistent_context(
-                str(CRUNCHY_BROWSER_PROFILE_PATH),
-                **launch_options,
-            )
+        if state.get("persistent", True):
+            CRUNCHY_BROWSER_PROFILE_PATH.mkdir(parents=True, exist_ok=True)
+            try:
+                state["context"] = chromium.launch_persistent_context(
+                    str(CRUNCHY_BROWSER_PROFILE_PATH),
+                    channel="chrome",
+                    headless=True,
+                    **context_options,
+                )
+            except Exception:
+                state["context"] = chromium.launch_persistent_context(
+                    str(CRUNCHY_BROWSER_PROFILE_PATH),
+                    headless=True,
+                    **context_options,
+                )
+        else:
+            # Le profil persistant est verrouillé par le premier worker : les
+            # suivants repartent de ses cookies/localStorage exportés.
+            if state.get("browser") is None:
+                try:
+                    state["browser"] = chromium.launch(channel="chrome", headless=True)
+                except Exception:
+                    state["browser"] = chromium.launch(headless=True)
+            if CRUNCHY_BROWSER_STORAGE_STATE_PATH.exists():
+                context_options["storage_state"] = str(CRUNCHY_BROWSER_STORAGE_STATE_PATH)
+            try:
+                state["context"] = state["browser"].new_context(**context_options)
+            except Exception:
+                context_options.pop("storage_state", None)
+                state["context"] = state["browser"].new_context(**context_options)
         state["page"] = None
         state["ua"] = safe_ua
         state["site"] = site
@@ -2737,6 +3220,199 @@ def get_crunchy_challenge_state(page):
     )
 
 
+def save_reader_blob_download(download, link, page_index):
+    """Ajoute un téléchargement Playwright au checkpoint lecteur après validation.
+
+    Retourne l'URL blob lecteur de la page, ou None si le blob est invalide.
+    """
+    tmp_path = _reader_blob_stage_file(link, page_index).with_suffix(".part")
+    tmp_path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        download.save_as(str(tmp_path))
+        raw = tmp_path.read_bytes()
+        if len(raw) <= 128 or _is_html_payload_start(raw[:1024]):
+            raise ValueError("blob vide ou HTML")
+        validate_image_file(tmp_path)
+        return write_reader_blob_stage(link, page_index, raw)
+    except Exception:
+        return None
+    finally:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+        try:
+            download.delete()
+        except Exception:
+            pass
+
+
+def stage_reader_blob_payload(link, page_index, body):
+    """Ajoute une page reçue en base64 au checkpoint lecteur après validation.
+
+    Même contrôle que save_reader_blob_download : retourne None si le blob
+    est vide, HTML ou illisible par PIL.
+    """
+    try:
+        raw = base64.b64decode(body or "")
+        if len(raw) <= 128 or _is_html_payload_start(raw[:1024]):
+            return None
+        validate_image_file(BytesIO(raw))
+    except Exception:
+        return None
+    return write_reader_blob_stage(link, page_index, raw)
+
+
+def stage_reader_blob_download(page, link, page_index, blob_url):
+    """Écrit un blob lecteur dans le checkpoint via le flux de téléchargement Playwright.
+
+    Les octets arrivent en binaire côté Python, sans conversion base64 dans la
+    page. Retourne l'URL de la page stockée, ou None si le blob n'est pas une image.
+    """
+    try:
+        with page.expect_download(timeout=CRUNCHY_BLOB_DOWNLOAD_TIMEOUT_MS) as download_info:
+            page.evaluate(
+                """
+                (src) => {
+                    const link = document.createElement('a');
+                    link.href = src;
+                    link.download = 'page.bin';
+                    link.style.display = 'none';
+                    document.body.appendChild(link);
+                    link.click();
+                    link.remove();
+                }
+                """,
+                blob_url,
+            )
+        download = download_info.value
+    except Exception:
+        return None
+    return save_reader_blob_download(download, link, page_index)
+
+
+def note_reader_binary_capture_failure(state, site):
+    """Désactive la capture binaire pour la session après des échecs répétés."""
+    failures = int(state.get("reader_binary_failures") or 0) + 1
+    state["reader_binary_failures"] = failures
+    if failures >= CRUNCHY_BINARY_CAPTURE_MAX_FAILURES and state.get("reader_binary_capture", True):
+        state["reader_binary_capture"] = False
+        runtime_log(
+            f"Playwright {site}: capture binaire des blobs indisponible, retour au transfert base64.",
+            level="warning",
+            context={"action": "playwright_blob_binary", "domain": site},
+        )
+
+
+def extract_ready_reader_blobs(page, state, link, start, count, preload_window):
+    """Extrait en un aller-retour les images consécutives déjà décodées à partir de `start`.
+
+    La fenêtre suivante est préchargée dans le même appel, pendant que Python
+    enregistre le lot courant. Retourne les chemins écrits, dans l'ordre, et
+    s'arrête à la première image non prête ou invalide.
+    """
+    binary_capture = bool(state.get("reader_binary_capture", True))
+    downloads = []
+    on_download = downloads.append
+    if binary_capture:
+        page.on("download", on_download)
+    try:
+        ready = page.evaluate(
+            """
+            async ({start, count, preloadWindow, binaryCapture}) => {
+                const images = Array.from(document.querySelectorAll('img.imageView, img[data-img]'));
+                const ready = [];
+                for (let i = start; i < Math.min(images.length, start + count); i++) {
+                    const img = images[i];
+                    const src = img.currentSrc || img.getAttribute('src') || '';
+                    if (!src.startsWith('blob:') || !img.complete || !img.naturalWidth) break;
+                    ready.push({index: i, src});
+                }
+                const upcoming = images.slice(start + ready.length, start + ready.length + preloadWindow);
+                for (const image of upcoming) {
+                    image.scrollIntoView({block: 'center', inline: 'nearest', behavior: 'auto'});
+                }
+                if (upcoming.length) window.dispatchEvent(new Event('scroll'));
+                if (binaryCapture) {
+                    for (const item of ready) {
+                        const anchor = document.createElement('a');
+                        anchor.href = item.src;
+                        anchor.download = `${item.index + 1}.bin`;
+                        anchor.style.display = 'none';
+                        document.body.appendChild(anchor);
+                        anchor.click();
+                        anchor.remove();
+                    }
+                    return ready.map(item => ({index: item.index}));
+                }
+                const bytesToBase64 = (bytes) => {
+                    let binary = '';
+                    const chunkSize = 0x8000;
+                    for (let j = 0; j < bytes.length; j += chunkSize) {
+                        binary += String.fromCharCode(...bytes.subarray(j, j + chunkSize));
+                    }
+                    return btoa(binary);
+                };
+                const looksLikeImage = (bytes, contentType) => {
+                    if ((contentType || '').toLowerCase().includes('image/')) return true;
+                    return (bytes[0] === 0xff && bytes[1] === 0xd8) ||
+                        (bytes[0] === 0x89 && bytes[1] === 0x50 && bytes[2] === 0x4e && bytes[3] === 0x47) ||
+                        (bytes[0] === 0x52 && bytes[1] === 0x49 && bytes[2] === 0x46 && bytes[3] === 0x46) ||
+                        (bytes[0] === 0x47 && bytes[1] === 0x49 && bytes[2] === 0x46);
+                };
+                const payloads = [];
+                for (const item of ready) {
+                    try {
+                        const response = await fetch(item.src);
+                        const bytes = new Uint8Array(await response.arrayBuffer());
+                        const contentType = response.headers.get('content-type') || '';
+                        if (!response.ok || bytes.byteLength <= 128 || !looksLikeImage(bytes, contentType)) break;
+                        payloads.push({index: item.index, body: bytesToBase64(bytes)});
+                    } catch (error) {
+                        break;
+                    }
+                }
+                return payloads;
+            }
+            """,
+            {"start": start, "count": count, "preloadWindow": preload_window, "binaryCapture": binary_capture},
+        ) or []
+        if binary_capture and ready:
+            deadline = time.monotonic() + CRUNCHY_BLOB_DOWNLOAD_TIMEOUT_MS / 1000
+            while len(downloads) < len(ready) and time.monotonic() < deadline:
+                page.wait_for_timeout(40)
+    finally:
+        if binary_capture:
+            page.remove_listener("download", on_download)
+    by_index = {}
+    for download in downloads:
+        try:
+            by_index[int(str(download.suggested_filename).split(".", 1)[0]) - 1] = download
+        except (TypeError, ValueError):
+            continue
+    staged = []
+    for item in ready:
+        index = int(item.get("index", -1))
+        if index != start + len(staged):
+            break
+        if binary_capture:
+            download = by_index.pop(index, None)
+            page_url = save_reader_blob_download(download, link, index + 1) if download is not None else None
+        else:
+            page_url = stage_reader_blob_payload(link, index + 1, item.get("body"))
+        if page_url is None:
+            break
+        staged.append(page_url)
+    for download in by_index.values():
+        try:
+            download.delete()
+        except Exception:
+            pass
+    if binary_capture and ready and not staged:
+        note_reader_binary_capture_failure(state, get_site_domain_key(link))
+    return staged
+
+
 def _fetch_crunchy_reader_blobs_once(state, link, cookie, ua, max_images=None, cancel_event=None, progress_callback=None):
     """Récupère les images blob du lecteur CrunchyScan/Scan-Hentai depuis une session navigateur unique."""
     chapter_url = normalize_image_url(link)
@@ -2915,7 +3591,7 @@ def _fetch_crunchy_reader_blobs_once(state, link, cookie, ua, max_images=None, c
     )
     partial_blobs = state.setdefault("partial_blobs", {})
     partial_order = state.setdefault("partial_blob_order", [])
-    cached_blobs = get_reader_blob_stage_paths(chapter_url, limit)
+    cached_blobs = get_reader_blob_stage_pages(chapter_url, limit)
     if not cached_blobs:
         cached_blobs = list(partial_blobs.get(chapter_url) or [])[:limit]
     blobs = cached_blobs
@@ -2935,9 +3611,40 @@ def _fetch_crunchy_reader_blobs_once(state, link, cookie, ua, max_images=None, c
             expired_url = partial_order.pop(0)
             partial_blobs.pop(expired_url, None)
 
-    for index in range(len(blobs), limit):
+    batch_sizes = state.setdefault("reader_batch_by_site", {})
+    while len(blobs) < limit:
+        index = len(blobs)
         if cancel_event is not None and cancel_event.is_set():
             raise DownloadCancelled("Téléchargement annulé.")
+        batch_size = int(batch_sizes.get(site) or CRUNCHY_READER_BATCH_INITIAL)
+        if batch_size >= 2:
+            batch_started_at = time.perf_counter()
+            requested = min(batch_size, limit - index)
+            staged_batch = extract_ready_reader_blobs(page, state, chapter_url, index, requested, preload_window)
+            if staged_batch:
+                blobs.extend(staged_batch)
+                remember_partial_blobs()
+                progress_interval = 15 if limit >= 120 else 10
+                if len(blobs) // progress_interval != index // progress_interval or len(blobs) == limit:
+                    runtime_log(
+                        f"Playwright {site}: récupération image {len(blobs)}/{limit} (lot de {len(staged_batch)}).",
+                        level="info",
+                        context={"action": "playwright_progress", "domain": site},
+                    )
+                if callable(progress_callback):
+                    try:
+                        progress_callback(len(blobs), limit)
+                    except Exception:
+                        pass
+                per_image = (time.perf_counter() - batch_started_at) / len(staged_batch)
+                # Lot complet et rapide : on élargit; lot partiel : on se cale sur ce
+                # que le lecteur a réellement décodé d'avance.
+                if len(staged_batch) == requested and per_image <= CRUNCHY_READER_BATCH_FAST_SECONDS:
+                    batch_sizes[site] = min(CRUNCHY_READER_BATCH_MAX, batch_size * 2)
+                elif len(staged_batch) < requested:
+                    batch_sizes[site] = max(2, len(staged_batch))
+                continue
+            batch_sizes[site] = batch_size // 2
         # Les gros chapitres génèrent beaucoup de retours Playwright: le statut UI
         # est déjà cadencé, les logs peuvent donc être plus espacés.
         progress_interval = 15 if limit >= 120 else 10
@@ -2948,209 +3655,204 @@ def _fetch_crunchy_reader_blobs_once(state, link, cookie, ua, max_images=None, c
                 context={"action": "playwright_progress", "domain": site},
             )
         image_started_at = time.perf_counter()
-        payload = page.evaluate(
-            """
-            async ({index, preloadWindow, finalFetchTimeout, evaluationTimeout}) => {
-                let targetedRefreshes = 0;
-                const sourceKind = (src) => {
-                    if (!src) return 'vide';
-                    if (src.startsWith('blob:')) return 'blob';
-                    if (src.startsWith('data:')) return 'data';
-                    if (/^https?:/i.test(src)) return 'http';
-                    return 'autre';
-                };
-                const snapshotImage = () => {
-                    const allImages = Array.from(document.querySelectorAll('img.imageView, img[data-img]'));
-                    const target = allImages[index];
-                    const src = target ? (target.currentSrc || target.getAttribute('src') || '') : '';
-                    const rect = target ? target.getBoundingClientRect() : null;
-                    return {
-                        index: index + 1,
-                        total: allImages.length,
-                        source: sourceKind(src),
-                        complete: Boolean(target && target.complete),
-                        width: target ? Number(target.naturalWidth || 0) : 0,
-                        height: target ? Number(target.naturalHeight || 0) : 0,
-                        visible: Boolean(rect && rect.bottom > 0 && rect.top < window.innerHeight),
-                        blobCount: allImages.filter(image => (image.currentSrc || image.getAttribute('src') || '').startsWith('blob:')).length,
-                        scrollY: Math.round(window.scrollY || 0),
-                        refreshes: targetedRefreshes,
+        staged_url = None
+        for binary_capture in ((True, False) if state.get("reader_binary_capture", True) else (False,)):
+            payload = page.evaluate(
+                """
+                async ({index, preloadWindow, finalFetchTimeout, evaluationTimeout, binaryCapture}) => {
+                    let targetedRefreshes = 0;
+                    const sourceKind = (src) => {
+                        if (!src) return 'vide';
+                        if (src.startsWith('blob:')) return 'blob';
+                        if (src.startsWith('data:')) return 'data';
+                        if (/^https?:/i.test(src)) return 'http';
+                        return 'autre';
                     };
-                };
-                const deadline = new Promise(resolve => setTimeout(
-                    () => resolve({ok: false, error: 'délai lecteur dépassé', diagnostic: snapshotImage()}),
-                    evaluationTimeout,
-                ));
-                const extract = (async () => {
-                const sleep = (ms) => new Promise(resolve => setTimeout(resolve, ms));
-                const bytesToBase64 = (bytes) => {
-                    let binary = '';
-                    const chunkSize = 0x8000;
-                    for (let j = 0; j < bytes.length; j += chunkSize) {
-                        binary += String.fromCharCode(...bytes.subarray(j, j + chunkSize));
-                    }
-                    return btoa(binary);
-                };
-                const looksLikeImage = (bytes, contentType) => {
-                    if ((contentType || '').toLowerCase().includes('image/')) return true;
-                    return (bytes[0] === 0xff && bytes[1] === 0xd8) ||
-                        (bytes[0] === 0x89 && bytes[1] === 0x50 && bytes[2] === 0x4e && bytes[3] === 0x47) ||
-                        (bytes[0] === 0x52 && bytes[1] === 0x49 && bytes[2] === 0x46 && bytes[3] === 0x46) ||
-                        (bytes[0] === 0x47 && bytes[1] === 0x49 && bytes[2] === 0x46);
-                };
-                const imageToJpegBase64 = async (img) => {
-                    for (let i = 0; i < 32; i++) {
-                        if (img.complete && img.naturalWidth && img.naturalHeight) break;
-                        await sleep(100);
-                    }
-                    const width = img.naturalWidth;
-                    const height = img.naturalHeight;
-                    if (!width || !height) return {ok: false, error: 'image non chargée'};
-                    const canvas = document.createElement('canvas');
-                    canvas.width = width;
-                    canvas.height = height;
-                    const ctx = canvas.getContext('2d');
-                    ctx.drawImage(img, 0, 0, width, height);
-                    const dataUrl = canvas.toDataURL('image/jpeg', 0.92);
-                    const commaIndex = dataUrl.indexOf(',');
-                    if (commaIndex < 0) return {ok: false, error: 'canvas invalide'};
-                    return {ok: true, body: dataUrl.slice(commaIndex + 1), contentType: 'image/jpeg'};
-                };
-                const images = Array.from(document.querySelectorAll('img.imageView, img[data-img]'));
-                const img = images[index];
-                if (!img) return {ok: false, error: 'image introuvable', diagnostic: snapshotImage()};
-                const reviveZeroDimensionBlob = async () => {
-                    const originalSrc = img.getAttribute('src') || '';
-                    if (!originalSrc.startsWith('blob:') || img.naturalWidth || img.naturalHeight) return false;
-                    img.loading = 'eager';
-                    img.decoding = 'sync';
-                    for (let pass = 0; pass < 2; pass++) {
-                        const rect = img.getBoundingClientRect();
-                        const targetY = Math.max(0, window.scrollY + rect.top - (window.innerHeight * 0.35));
-                        window.scrollTo(0, Math.max(0, targetY - (window.innerHeight * 1.4)));
-                        window.dispatchEvent(new Event('scroll'));
-                        await sleep(180);
-                        window.scrollTo(0, targetY);
-                        img.scrollIntoView({block: 'center', inline: 'nearest', behavior: 'auto'});
-                        window.dispatchEvent(new Event('scroll'));
-                        await sleep(260);
-                        if (img.naturalWidth && img.naturalHeight) return true;
-                    }
-                    // Rejoue le même blob dans l'élément après un vrai changement d'attribut.
-                    // Certains lecteurs ne relancent le décodage qu'à cette condition.
-                    targetedRefreshes += 1;
-                    img.removeAttribute('src');
-                    await sleep(70);
-                    img.setAttribute('src', originalSrc);
-                    try {
-                        await Promise.race([
-                            img.decode().catch(() => false),
-                            sleep(1200),
-                        ]);
-                    } catch (error) {
-                        // Le chemin normal de récupération reste disponible ci-dessous.
-                    }
-                    return Boolean(img.naturalWidth && img.naturalHeight);
-                };
-
-                // Le lecteur ne déchiffre les images lazy qu'une fois visibles. Une fenêtre
-                // légèrement plus large garde les très longs chapitres en mouvement sans
-                // demander toutes les pages d'un coup.
-                for (const upcoming of images.slice(index, index + preloadWindow)) {
-                    upcoming.scrollIntoView({block: 'center', inline: 'nearest', behavior: 'auto'});
-                }
-                window.dispatchEvent(new Event('scroll'));
-                await sleep(35);
-                img.scrollIntoView({block: 'center', inline: 'nearest', behavior: 'auto'});
-                await reviveZeroDimensionBlob();
-                for (let round = 0; round < 2; round++) {
-                    for (let i = 0; i < 20; i++) {
-                        const src = img.currentSrc || img.getAttribute('src') || '';
-                        if (src.startsWith('blob:')) {
-                            try {
-                                const controller = new AbortController();
-                                const timeout = setTimeout(() => controller.abort(), 5000);
-                                const response = await fetch(src, {signal: controller.signal});
-                                clearTimeout(timeout);
-                                const buffer = await response.arrayBuffer();
-                                const bytes = new Uint8Array(buffer);
-                                const contentType = response.headers.get('content-type') || '';
-                                if (response.ok && bytes.byteLength > 128 && looksLikeImage(bytes, contentType)) {
-                                    return {ok: true, body: bytesToBase64(bytes), contentType};
-                                }
-                            } catch (error) {
-                                // Le canvas ci-dessous peut lire un blob affiché même si fetch(blob:)
-                                // est refusé par le contexte de la page.
+                    const snapshotImage = () => {
+                        const allImages = Array.from(document.querySelectorAll('img.imageView, img[data-img]'));
+                        const target = allImages[index];
+                        const src = target ? (target.currentSrc || target.getAttribute('src') || '') : '';
+                        const rect = target ? target.getBoundingClientRect() : null;
+                        return {
+                            index: index + 1,
+                            total: allImages.length,
+                            source: sourceKind(src),
+                            complete: Boolean(target && target.complete),
+                            width: target ? Number(target.naturalWidth || 0) : 0,
+                            height: target ? Number(target.naturalHeight || 0) : 0,
+                            visible: Boolean(rect && rect.bottom > 0 && rect.top < window.innerHeight),
+                            blobCount: allImages.filter(image => (image.currentSrc || image.getAttribute('src') || '').startsWith('blob:')).length,
+                            scrollY: Math.round(window.scrollY || 0),
+                            refreshes: targetedRefreshes,
+                        };
+                    };
+                    const deadline = new Promise(resolve => setTimeout(
+                        () => resolve({ok: false, error: 'délai lecteur dépassé', diagnostic: snapshotImage()}),
+                        evaluationTimeout,
+                    ));
+                    const extract = (async () => {
+                    const sleep = (ms) => new Promise(resolve => setTimeout(resolve, ms));
+                    const bytesToBase64 = (bytes) => {
+                        let binary = '';
+                        const chunkSize = 0x8000;
+                        for (let j = 0; j < bytes.length; j += chunkSize) {
+                            binary += String.fromCharCode(...bytes.subarray(j, j + chunkSize));
+                        }
+                        return btoa(binary);
+                    };
+                    const looksLikeImage = (bytes, contentType) => {
+                        if ((contentType || '').toLowerCase().includes('image/')) return true;
+                        return (bytes[0] === 0xff && bytes[1] === 0xd8) ||
+                            (bytes[0] === 0x89 && bytes[1] === 0x50 && bytes[2] === 0x4e && bytes[3] === 0x47) ||
+                            (bytes[0] === 0x52 && bytes[1] === 0x49 && bytes[2] === 0x46 && bytes[3] === 0x46) ||
+                            (bytes[0] === 0x47 && bytes[1] === 0x49 && bytes[2] === 0x46);
+                    };
+                    // En capture binaire, Python lit le blob via le flux de téléchargement
+                    // Playwright : aucun base64 n'est construit côté page.
+                    const readBlob = async (src, timeoutMs) => {
+                        if (binaryCapture) return {ok: true, blobUrl: src};
+                        try {
+                            const controller = new AbortController();
+                            const timeout = setTimeout(() => controller.abort(), timeoutMs);
+                            const response = await fetch(src, {signal: controller.signal});
+                            clearTimeout(timeout);
+                            const bytes = new Uint8Array(await response.arrayBuffer());
+                            const contentType = response.headers.get('content-type') || '';
+                            if (response.ok && bytes.byteLength > 128 && looksLikeImage(bytes, contentType)) {
+                                return {ok: true, body: bytesToBase64(bytes), contentType};
                             }
-                            const canvasPayload = await imageToJpegBase64(img);
-                            if (canvasPayload.ok) return canvasPayload;
+                        } catch (error) {
+                            // L'appelant bascule sur le canvas.
                         }
-                        await sleep(75);
-                    }
-                    await sleep(120);
-                }
-                // Certains chapitres ne créent le blob qu'après plusieurs changements
-                // réels de viewport. Ce chemin lent ne s'exécute qu'après l'échec du
-                // chemin rapide ci-dessus, avant de réinitialiser tout le lecteur.
-                for (let recoveryRound = 0; recoveryRound < 3; recoveryRound++) {
-                    const recoveryImages = images.slice(Math.max(0, index - 1), Math.min(images.length, index + 6));
-                    for (const upcoming of recoveryImages) {
+                        return null;
+                    };
+                    const imageToJpegBase64 = async (img) => {
+                        for (let i = 0; i < 32; i++) {
+                            if (img.complete && img.naturalWidth && img.naturalHeight) break;
+                            await sleep(100);
+                        }
+                        const width = img.naturalWidth;
+                        const height = img.naturalHeight;
+                        if (!width || !height) return {ok: false, error: 'image non chargée'};
+                        const canvas = document.createElement('canvas');
+                        canvas.width = width;
+                        canvas.height = height;
+                        const ctx = canvas.getContext('2d');
+                        ctx.drawImage(img, 0, 0, width, height);
+                        const dataUrl = canvas.toDataURL('image/jpeg', 0.92);
+                        const commaIndex = dataUrl.indexOf(',');
+                        if (commaIndex < 0) return {ok: false, error: 'canvas invalide'};
+                        return {ok: true, body: dataUrl.slice(commaIndex + 1), contentType: 'image/jpeg'};
+                    };
+                    const images = Array.from(document.querySelectorAll('img.imageView, img[data-img]'));
+                    const img = images[index];
+                    if (!img) return {ok: false, error: 'image introuvable', diagnostic: snapshotImage()};
+                    const reviveZeroDimensionBlob = async () => {
+                        const originalSrc = img.getAttribute('src') || '';
+                        if (!originalSrc.startsWith('blob:') || img.naturalWidth || img.naturalHeight) return false;
+                        img.loading = 'eager';
+                        img.decoding = 'sync';
+                        for (let pass = 0; pass < 2; pass++) {
+                            const rect = img.getBoundingClientRect();
+                            const targetY = Math.max(0, window.scrollY + rect.top - (window.innerHeight * 0.35));
+                            window.scrollTo(0, Math.max(0, targetY - (window.innerHeight * 1.4)));
+                            window.dispatchEvent(new Event('scroll'));
+                            await sleep(180);
+                            window.scrollTo(0, targetY);
+                            img.scrollIntoView({block: 'center', inline: 'nearest', behavior: 'auto'});
+                            window.dispatchEvent(new Event('scroll'));
+                            await sleep(260);
+                            if (img.naturalWidth && img.naturalHeight) return true;
+                        }
+                        // Rejoue le même blob dans l'élément après un vrai changement d'attribut.
+                        // Certains lecteurs ne relancent le décodage qu'à cette condition.
+                        targetedRefreshes += 1;
+                        img.removeAttribute('src');
+                        await sleep(70);
+                        img.setAttribute('src', originalSrc);
+                        try {
+                            await Promise.race([
+                                img.decode().catch(() => false),
+                                sleep(1200),
+                            ]);
+                        } catch (error) {
+                            // Le chemin normal de récupération reste disponible ci-dessous.
+                        }
+                        return Boolean(img.naturalWidth && img.naturalHeight);
+                    };
+
+                    // Le lecteur ne déchiffre les images lazy qu'une fois visibles. Une fenêtre
+                    // légèrement plus large garde les très longs chapitres en mouvement sans
+                    // demander toutes les pages d'un coup.
+                    for (const upcoming of images.slice(index, index + preloadWindow)) {
                         upcoming.scrollIntoView({block: 'center', inline: 'nearest', behavior: 'auto'});
-                        window.dispatchEvent(new Event('scroll'));
-                        await sleep(150);
                     }
-                    img.scrollIntoView({block: 'center', inline: 'nearest', behavior: 'auto'});
-                    window.scrollBy(0, recoveryRound % 2 === 0 ? 2 : -2);
                     window.dispatchEvent(new Event('scroll'));
-                    await sleep(400 + recoveryRound * 250);
-                    const recoveredSrc = img.currentSrc || img.getAttribute('src') || '';
-                    if (!recoveredSrc.startsWith('blob:')) continue;
-                    try {
-                        const controller = new AbortController();
-                        const timeout = setTimeout(() => controller.abort(), 8000);
-                        const response = await fetch(recoveredSrc, {signal: controller.signal});
-                        clearTimeout(timeout);
-                        const bytes = new Uint8Array(await response.arrayBuffer());
-                        const contentType = response.headers.get('content-type') || '';
-                        if (response.ok && bytes.byteLength > 128 && looksLikeImage(bytes, contentType)) {
-                            return {ok: true, body: bytesToBase64(bytes), contentType};
+                    await sleep(35);
+                    img.scrollIntoView({block: 'center', inline: 'nearest', behavior: 'auto'});
+                    await reviveZeroDimensionBlob();
+                    for (let round = 0; round < 2; round++) {
+                        for (let i = 0; i < 20; i++) {
+                            const src = img.currentSrc || img.getAttribute('src') || '';
+                            if (src.startsWith('blob:')) {
+                                const blobPayload = await readBlob(src, 5000);
+                                if (blobPayload) return blobPayload;
+                                // Le canvas ci-dessous peut lire un blob affiché même si fetch(blob:)
+                                // est refusé par le contexte de la page.
+                                const canvasPayload = await imageToJpegBase64(img);
+                                if (canvasPayload.ok) return canvasPayload;
+                            }
+                            await sleep(75);
                         }
-                    } catch (error) {
-                        // Essai canvas ci-dessous.
+                        await sleep(120);
                     }
-                    const canvasPayload = await imageToJpegBase64(img);
-                    if (canvasPayload.ok) return canvasPayload;
-                }
-                const finalSrc = img.currentSrc || img.getAttribute('src') || '';
-                if (finalSrc.startsWith('blob:')) {
-                    const src = img.getAttribute('src') || '';
-                    try {
-                        const controller = new AbortController();
-                        const timeout = setTimeout(() => controller.abort(), finalFetchTimeout);
-                        const response = await fetch(src, {signal: controller.signal});
-                        clearTimeout(timeout);
-                        const bytes = new Uint8Array(await response.arrayBuffer());
-                        const contentType = response.headers.get('content-type') || '';
-                        if (response.ok && bytes.byteLength > 128 && looksLikeImage(bytes, contentType)) {
-                            return {ok: true, body: bytesToBase64(bytes), contentType};
+                    // Certains chapitres ne créent le blob qu'après plusieurs changements
+                    // réels de viewport. Ce chemin lent ne s'exécute qu'après l'échec du
+                    // chemin rapide ci-dessus, avant de réinitialiser tout le lecteur.
+                    for (let recoveryRound = 0; recoveryRound < 3; recoveryRound++) {
+                        const recoveryImages = images.slice(Math.max(0, index - 1), Math.min(images.length, index + 6));
+                        for (const upcoming of recoveryImages) {
+                            upcoming.scrollIntoView({block: 'center', inline: 'nearest', behavior: 'auto'});
+                            window.dispatchEvent(new Event('scroll'));
+                            await sleep(150);
                         }
-                    } catch (error) {
-                        // Tentative canvas finale ci-dessous.
+                        img.scrollIntoView({block: 'center', inline: 'nearest', behavior: 'auto'});
+                        window.scrollBy(0, recoveryRound % 2 === 0 ? 2 : -2);
+                        window.dispatchEvent(new Event('scroll'));
+                        await sleep(400 + recoveryRound * 250);
+                        const recoveredSrc = img.currentSrc || img.getAttribute('src') || '';
+                        if (!recoveredSrc.startsWith('blob:')) continue;
+                        const recoveredPayload = await readBlob(recoveredSrc, 8000);
+                        if (recoveredPayload) return recoveredPayload;
+                        const canvasPayload = await imageToJpegBase64(img);
+                        if (canvasPayload.ok) return canvasPayload;
+                    }
+                    const finalSrc = img.currentSrc || img.getAttribute('src') || '';
+                    if (finalSrc.startsWith('blob:')) {
+                        const finalPayload = await readBlob(img.getAttribute('src') || '', finalFetchTimeout);
+                        if (finalPayload) return finalPayload;
+                        return await imageToJpegBase64(img);
                     }
-                    return await imageToJpegBase64(img);
+                    return {ok: false, error: 'blob non chargé', diagnostic: snapshotImage()};
+                    })();
+                    return await Promise.race([extract, deadline]);
                 }
-                return {ok: false, error: 'blob non chargé', diagnostic: snapshotImage()};
-                })();
-                return await Promise.race([extract, deadline]);
-            }
-            """,
-            {
-                "index": index,
-                "preloadWindow": preload_window,
-                "finalFetchTimeout": CRUNCHY_BLOB_FINAL_FETCH_TIMEOUT_MS,
-                "evaluationTimeout": CRUNCHY_BLOB_EVALUATION_TIMEOUT_MS,
-            },
-        )
+                """,
+                {
+                    "index": index,
+                    "preloadWindow": preload_window,
+                    "finalFetchTimeout": CRUNCHY_BLOB_FINAL_FETCH_TIMEOUT_MS,
+                    "evaluationTimeout": CRUNCHY_BLOB_EVALUATION_TIMEOUT_MS,
+                    "binaryCapture": binary_capture,
+                },
+            )
+            if binary_capture and isinstance(payload, dict) and payload.get("blobUrl"):
+                staged_url = stage_reader_blob_download(page, chapter_url, index + 1, payload["blobUrl"])
+                if staged_url is None:
+                    note_reader_binary_capture_failure(state, site)
+                    continue
+                state["reader_binary_failures"] = 0
+            break
         if not payload or not payload.get("ok"):
             reader_errors = "; ".join(state.get("reader_errors") or [])
             error_suffix = f" | erreur lecteur={reader_errors}" if reader_errors else ""
@@ -3179,10 +3881,12 @@ def _fetch_crunchy_reader_blobs_once(state, link, cookie, ua, max_images=None, c
                 kind="blocked_or_retryable",
                 phase="browser",
             )
-        raw = base64.b64decode(payload.get("body") or "")
-        if not raw or _is_html_payload_start(raw):
-            raise ImageDownloadError("Lecteur navigateur: payload invalide", kind="invalid_image", phase="browser")
-        blobs.append(write_reader_blob_stage(chapter_url, index + 1, raw))
+        if staged_url is None:
+            raw = base64.b64decode(payload.get("body") or "")
+            if not raw or _is_html_payload_start(raw):
+                raise ImageDownloadError("Lecteur navigateur: payload invalide", kind="invalid_image", phase="browser")
+            staged_url = write_reader_blob_stage(chapter_url, index + 1, raw)
+        blobs.append(staged_url)
         remember_partial_blobs()
         if callable(progress_callback):
             try:
@@ -3190,6 +3894,8 @@ def _fetch_crunchy_reader_blobs_once(state, link, cookie, ua, max_images=None, c
             except Exception:
                 pass
         image_elapsed = time.perf_counter() - image_started_at
+        if batch_size < 2 and image_elapsed < 1.0:
+            batch_sizes[site] = 2
         if image_elapsed >= 1.0:
             runtime_log(
                 f"Playwright {site}: image {index + 1}/{limit} extraite en {image_elapsed:.2f}s.",
@@ -3231,6 +3937,7 @@ def fetch_crunchy_reader_blobs_in_state(state, link, cookie, ua, max_images=None
                 cancel_event=cancel_event,
                 progress_callback=progress_callback,
             )
+            sync_reader_blob_stage(result)
             if attempt > 1:
                 runtime_log(
                     f"Playwright {get_site_domain_key(link)}: contexte isolé après reprise du chapitre.",
@@ -3275,70 +3982,195 @@ def fetch_crunchy_reader_blobs_in_state(state, link, cookie, ua, max_images=None
     raise last_error or ParseError("Lecteur CrunchyScan/Scan-Hentai indisponible.")
 
 
-def crunchy_browser_worker_loop(tasks):
-    state = new_crunchy_browser_state()
-    try:
-        while True:
-            task = tasks.get()
-            if not isinstance(task, dict):
-                continue
-            if task.get("action") == "stop":
-                break
-            response = task.get("response")
-            try:
-                result = fetch_crunchy_reader_blobs_in_state(
-                    state,
-                    task.get("link") or "",
-                    task.get("cookie") or "",
-                    task.get("ua") or DEFAULT_USER_AGENT,
-                    max_images=task.get("max_images"),
-                    cancel_event=task.get("cancel_event"),
-                    progress_callback=(
-                        lambda done, total, q=task.get("progress"): q.put_nowait((done, total))
-                        if q is not None else None
-                    ),
-                )
-                if response is not None:
-                    response.put({"ok": True, "result": result})
-            except Exception as exc:
-                if response is not None:
-                    response.put({"ok": False, "error": exc})
-    finally:
-        dispose_crunchy_browser_state(state)
+def export_crunchy_storage_state(state, min_interval=60.0):
+    """Exporte cookies et localStorage du profil persistant pour les autres workers lecteur."""
+    context = state.get("context")
+    now = time.monotonic()
+    if context is None or now - float(state.get("storage_exported_at") or 0.0) < min_interval:
+        return
+    try:
+        _write_json_file(CRUNCHY_BROWSER_STORAGE_STATE_PATH, context.storage_state())
+        state["storage_exported_at"] = now
+    except Exception:
+        pass
+
+
+def crunchy_browser_worker_loop(worker):
+    """Thread propriétaire d'une session lecteur CrunchyScan/Scan-Hentai du pool."""
+    state = new_crunchy_browser_state(persistent=worker["slot"] == 1)
+    try:
+        while True:
+            task = worker["tasks"].get()
+            if not isinstance(task, dict):
+                continue
+            if task.get("action") == "stop":
+                break
+            try:
+                task["result"] = fetch_crunchy_reader_blobs_in_state(
+                    state,
+                    task.get("link") or "",
+                    task.get("cookie") or "",
+                    task.get("ua") or DEFAULT_USER_AGENT,
+                    max_images=task.get("max_images"),
+                    cancel_event=task.get("cancel_event"),
+                    progress_callback=lambda done, total, q=task["progress"]: q.put_nowait((done, total)),
+                )
+                if state.get("persistent"):
+                    export_crunchy_storage_state(state)
+            except Exception as exc:
+                task["error"] = exc
+            finally:
+                with CRUNCHY_BROWSER_LOCK:
+                    worker["pending"] = max(0, worker["pending"] - 1)
+                    # Un préchargement réussi reste disponible jusqu'à sa réclamation.
+                    if task.get("error") is not None or task.get("claimed"):
+                        if CRUNCHY_READER_TASKS.get(task["key"]) is task:
+                            CRUNCHY_READER_TASKS.pop(task["key"], None)
+                task["done"].set()
+    finally:
+        dispose_crunchy_browser_state(state)
+
+
+def close_crunchy_browser_state():
+    """Demande l'arrêt de toutes les sessions lecteur du pool."""
+    with CRUNCHY_BROWSER_LOCK:
+        workers = list(CRUNCHY_BROWSER_WORKERS)
+        CRUNCHY_BROWSER_WORKERS.clear()
+    for worker in workers:
+        try:
+            worker["tasks"].put({"action": "stop"})
+        except Exception:
+            pass
+    for worker in workers:
+        thread = worker.get("thread")
+        if thread is not None and thread.is_alive() and thread is not threading.current_thread():
+            try:
+                thread.join(timeout=5)
+            except Exception:
+                pass
+
+
+def get_crunchy_reader_session_cap(site):
+    """Nombre de chapitres d'un même site extraits en parallèle."""
+    settings = get_fragile_site_settings(site)
+    try:
+        cap = int(settings.get("reader_sessions", CRUNCHY_READER_SESSIONS_DEFAULT))
+    except (TypeError, ValueError):
+        cap = CRUNCHY_READER_SESSIONS_DEFAULT
+    return max(1, min(CRUNCHY_READER_POOL_MAX, cap))
+
+
+def _acquire_crunchy_reader_worker(site):
+    """Choisit le worker lecteur d'un chapitre (appelé sous CRUNCHY_BROWSER_LOCK).
+
+    Au-delà du plafond du site, le chapitre attend derrière le worker de ce
+    site le moins chargé. Le slot 1 garde le profil persistant.
+    """
+    CRUNCHY_BROWSER_WORKERS[:] = [
+        worker for worker in CRUNCHY_BROWSER_WORKERS if worker["thread"] is not None and worker["thread"].is_alive()
+    ]
+    workers = CRUNCHY_BROWSER_WORKERS
+    busy_for_site = [worker for worker in workers if worker["pending"] and worker["site"] == site]
+    chosen = None
+    if len(busy_for_site) < get_crunchy_reader_session_cap(site):
+        idle = [worker for worker in workers if not worker["pending"]]
+        chosen = next((worker for worker in idle if worker["site"] == site), None) or (idle[0] if idle else None)
+        if chosen is None and len(workers) < CRUNCHY_READER_POOL_MAX:
+            used_slots = {worker["slot"] for worker in workers}
+            slot = next(index for index in range(1, CRUNCHY_READER_POOL_MAX + 1) if index not in used_slots)
+            chosen = {"slot": slot, "tasks": queue.Queue(), "pending": 0, "site": "", "thread": None}
+            chosen["thread"] = threading.Thread(
+                target=crunchy_browser_worker_loop,
+                args=(chosen,),
+                daemon=True,
+                name=f"crunchy-reader-browser-{slot}",
+            )
+            chosen["thread"].start()
+            workers.append(chosen)
+    if chosen is None:
+        chosen = min(busy_for_site or workers, key=lambda worker: worker["pending"])
+    chosen["pending"] += 1
+    chosen["site"] = site
+    return chosen
+
+
+def _expire_crunchy_reader_tasks(max_age_seconds=None):
+    """Oublie les préchargements jamais réclamés (appelé sous CRUNCHY_BROWSER_LOCK).
+
+    Sans `max_age_seconds`, tous les préchargements non réclamés sont oubliés,
+    y compris ceux en cours : leur worker termine sans les republier.
+    """
+    now = time.monotonic()
+    for key, task in list(CRUNCHY_READER_TASKS.items()):
+        if task.get("claimed"):
+            continue
+        if max_age_seconds is None or (task["done"].is_set() and now - task["created_at"] > max_age_seconds):
+            CRUNCHY_READER_TASKS.pop(key, None)
+
+
+def discard_crunchy_reader_prefetch():
+    """Libère les chapitres préchargés restés sans réclamation en fin de session."""
+    with CRUNCHY_BROWSER_LOCK:
+        _expire_crunchy_reader_tasks()
+
+
+def submit_crunchy_reader_task(link, cookie, ua, max_images=None, cancel_event=None, claim=True):
+    """Planifie l'extraction d'un chapitre, ou réutilise celle déjà en cours/préchargée."""
+    key = (normalize_image_url(link), max_images)
+    with CRUNCHY_BROWSER_LOCK:
+        _expire_crunchy_reader_tasks(CRUNCHY_READER_PREFETCH_TTL_SECONDS)
+        task = CRUNCHY_READER_TASKS.get(key)
+        if task is not None and task["done"].is_set() and (
+            task.get("error") is not None or not all(is_reader_blob_page_staged(url) for url in task.get("result") or [])
+        ):
+            CRUNCHY_READER_TASKS.pop(key, None)
+            task = None
+        if task is None:
+            task = {
+                "action": "fetch_reader",
+                "key": key,
+                "link": link,
+                "cookie": cookie,
+                "ua": ua,
+                "max_images": max_images,
+                "cancel_event": cancel_event,
+                "progress": queue.Queue(),
+                "done": threading.Event(),
+                "result": None,
+                "error": None,
+                "claimed": False,
+                "created_at": time.monotonic(),
+            }
+            CRUNCHY_READER_TASKS[key] = task
+            _acquire_crunchy_reader_worker(get_site_domain_key(link))["tasks"].put(task)
+        if claim:
+            task["claimed"] = True
+            if task["done"].is_set():
+                CRUNCHY_READER_TASKS.pop(key, None)
+        return task
 
 
-def get_crunchy_browser_tasks():
-    global CRUNCHY_BROWSER_THREAD, CRUNCHY_BROWSER_TASKS
-    with CRUNCHY_BROWSER_LOCK:
-        if CRUNCHY_BROWSER_THREAD is not None and CRUNCHY_BROWSER_THREAD.is_alive() and CRUNCHY_BROWSER_TASKS is not None:
-            return CRUNCHY_BROWSER_TASKS
-        CRUNCHY_BROWSER_TASKS = queue.Queue()
-        CRUNCHY_BROWSER_THREAD = threading.Thread(
-            target=crunchy_browser_worker_loop,
-            args=(CRUNCHY_BROWSER_TASKS,),
-            daemon=True,
-            name="crunchy-reader-browser",
-        )
-        CRUNCHY_BROWSER_THREAD.start()
-        return CRUNCHY_BROWSER_TASKS
+def prefetch_crunchy_reader_chapters(links, cookie, ua, cancel_event=None, current_link=""):
+    """Lance l'extraction lecteur des prochains chapitres sur les sessions libres du pool.
+
+    `current_link` est planifié en premier pour qu'il garde la session au
+    profil persistant; l'appel `fetch_crunchy_reader_images` suivant le réclame.
+    """
+    links = [link for link in (links or []) if get_site_reader(get_site_domain_key(link)) == "browser"]
+    if not links:
+        return 0
+    if current_link:
+        submit_crunchy_reader_task(current_link, cookie, ua, cancel_event=cancel_event, claim=False)
+    lookahead = get_crunchy_reader_session_cap(get_site_domain_key(links[0])) - 1
+    for link in links[:lookahead]:
+        submit_crunchy_reader_task(link, cookie, ua, cancel_event=cancel_event, claim=False)
+    return min(len(links), max(0, lookahead))
 
 
 def fetch_crunchy_reader_images(link, cookie, ua, max_images=None, emit_logs=True, cancel_event=None, progress_callback=None):
     """Expose les blobs lecteur comme URLs temporaires pour le pipeline existant."""
-    response = queue.Queue(maxsize=1)
-    progress = queue.Queue()
-    get_crunchy_browser_tasks().put(
-        {
-            "action": "fetch_reader",
-            "link": link,
-            "cookie": cookie,
-            "ua": ua,
-            "max_images": max_images,
-            "response": response,
-            "progress": progress,
-            "cancel_event": cancel_event,
-        }
-    )
+    task = submit_crunchy_reader_task(link, cookie, ua, max_images=max_images, cancel_event=cancel_event)
+    progress = task["progress"]
     while True:
         if cancel_event is not None and cancel_event.is_set():
             raise DownloadCancelled("Téléchargement annulé.")
@@ -3349,19 +4181,17 @@ def fetch_crunchy_reader_images(link, cookie, ua, max_images=None, emit_logs=Tru
                     progress_callback(done, total)
             except queue.Empty:
                 break
-        try:
-            payload = response.get(timeout=0.2)
+        if task["done"].wait(0.2):
             break
-        except queue.Empty:
-            continue
-    if not payload.get("ok"):
-        error = payload.get("error")
+    with CRUNCHY_BROWSER_LOCK:
+        if CRUNCHY_READER_TASKS.get(task["key"]) is task:
+            CRUNCHY_READER_TASKS.pop(task["key"], None)
+    error = task.get("error")
+    if error is not None:
         if isinstance(error, Exception):
             raise error
         raise ParseError(str(error or "Lecteur navigateur indisponible."))
-    staged_pages = payload.get("result") or []
-    key = _reader_blob_stage_key(link)
-    urls = [f"{READER_BLOB_PAGE_URL_PREFIX}{key}/{idx + 1}.jpg" for idx in range(len(staged_pages))]
+    urls = list(task.get("result") or [])
     if emit_logs:
         runtime_log(
             f"{len(urls)} image(s) récupérée(s) via lecteur navigateur.",
@@ -3371,12 +4201,15 @@ def fetch_crunchy_reader_images(link, cookie, ua, max_images=None, emit_logs=Tru
     return urls
 
 
-def make_request(url, cookie, ua):
+def make_request(url, cookie, ua, timeout=None, extra_headers=None):
     """Effectue une requête HTTP avec les cookies et l'user-agent appropriés."""
     if get_supported_site_from_url(url) == "scan-manga.com":
-        return _http_get(url, headers=build_scanmanga_navigation_headers(url, cookie, ua), timeout=20)
+        headers = build_scanmanga_navigation_headers(url, cookie, ua)
+        headers.update(extra_headers or {})
+        return _http_get(url, headers=headers, timeout=timeout or 20)
     headers = build_request_headers(url, cookie, ua)
-    return _http_get(url, headers=headers, timeout=10)
+    headers.update(extra_headers or {})
+    return _http_get(url, headers=headers, timeout=timeout or 10)
 
 
 def detect_local_user_agent():
@@ -3425,27 +4258,6 @@ def detect_local_user_agent():
     return DEFAULT_USER_AGENT, "fallback"
 
 
-def parse_lr(text, left, right, recursive, unescape=True):
-    """
-    Parse le texte entre deux délimiteurs (left et right)
-    
-    Args:
-        text (str): Texte à parser
-        left (str): Délimiteur gauche
-        right (str): Délimiteur droit
-        recursive (bool): Récupère toutes les occurrences si True
-        unescape (bool): Décode les entités HTML si True
-    
-    Returns:
-        str/list: Résultat du parsing selon le mode
-    """
-    pattern = re.escape(left) + "(.*?)" + re.escape(right)
-    matches = re.findall(pattern, text)
-    if unescape:
-        matches = [html.unescape(match) for match in matches]
-    return matches if recursive else matches[0] if matches else None
-
-
 def test_cookie_validity(domain, cookie, ua, probe_url=None):
     """
     Vérifie si un cookie cf_clearance est encore valide
@@ -3464,9 +4276,9 @@ def test_cookie_validity(domain, cookie, ua, probe_url=None):
     return bool(status.get("cookie_valid", False))
 
 
-def evaluate_cookie_and_challenge(domain, cookie, ua, probe_url=None):
+def evaluate_cookie_and_challenge(domain, cookie, ua, probe_url=None, timeout=None):
     """
-    Evalue l'etat cookie + challenge Cloudflare.
+    Evalue l'etat cookie + challenge Cloudflare (`timeout` en secondes, optionnel).
     Retourne:
       - cookie_valid: bool
       - challenge_state: "present" | "absent" | "unknown"
@@ -3501,7 +4313,7 @@ def evaluate_cookie_and_challenge(domain, cookie, ua, probe_url=None):
             test_url = probe_urls.get(domain, test_url)
 
     try:
-        r = make_request(test_url, cookie or "", ua)
+        r = make_request(test_url, cookie or "", ua, timeout=timeout)
         status_code = int(getattr(r, "status_code", 0) or 0)
         result["http_status"] = status_code or None
         text = (getattr(r, "text", "") or "").lower()
@@ -3680,10 +4492,17 @@ def archive_cbz(folder_path, title, volume, remove_source=True, expected_image_c
 COMICINFO_IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".webp", ".avif")
 
 
+COMIC_NUMBER_RE = re.compile(r"(\d+(?:[.,]\d+)?)")
+
+
 def extract_comic_number(label):
     """Extrait le premier numero exploitable depuis un libelle de tome/chapitre."""
-    value = repair_mojibake_text(label or "")
-    match = re.search(r"(\d+(?:[.,]\d+)?)", value)
+    return _extract_comic_number(label or "")
+
+
+@lru_cache(maxsize=4096)
+def _extract_comic_number(label):
+    match = COMIC_NUMBER_RE.search(repair_mojibake_text(label))
     return match.group(1).replace(",", ".") if match else ""
 
 
@@ -3954,7 +4773,7 @@ def write_chapter_cover_page(folder_path, cover_url, cookie, ua, referer_url=Non
 
 def download_image(
     url, folder, cookie, ua, i, number_len, cancel_event, failed_downloads,
-    progress_callback=None, referer_url=None, webp2jpg_enabled=False
+    progress_callback=None, referer_url=None, webp2jpg_enabled=False, image_callback=None
 ):
     """
     Télécharge une image unique avec gestion d'erreurs et conversion optionnelle
@@ -3971,10 +4790,38 @@ def download_image(
         progress_callback (func): Callback de progression
         referer_url (str): URL Referer à utiliser
         webp2jpg_enabled (bool): Activer la conversion WebP/AVIF->JPG
+        image_callback (func): Reçoit un dict de mesures par image (octets, durée, tentatives)
     """
     import os
 
     normalized_url = normalize_image_url(url)
+    started_at = time.perf_counter()
+    transfer_stats = {}
+
+    def report_image(ok, path=None, kind="", status_code=None):
+        if not callable(image_callback):
+            return
+        size = 0
+        if ok and path:
+            try:
+                size = os.path.getsize(path)
+            except OSError:
+                size = 0
+        try:
+            image_callback(
+                {
+                    "index": i + 1,
+                    "url": normalized_url,
+                    "ok": bool(ok),
+                    "bytes": int(transfer_stats.get("bytes") or size),
+                    "duration": max(0.0, time.perf_counter() - started_at),
+                    "retries": max(0, int(transfer_stats.get("attempts") or 1) - 1),
+                    "kind": kind,
+                    "status_code": status_code,
+                }
+            )
+        except Exception:
+            pass
 
     def register_failure(kind, reason, status_code=None):
         failed_downloads.append(
@@ -3985,6 +4832,7 @@ def download_image(
                 "reason": str(reason),
             }
         )
+        report_image(False, kind=kind, status_code=status_code)
 
     if cancel_event.is_set():
         register_failure("cancelled", "Annulation demandée avant téléchargement.")
@@ -3995,19 +4843,28 @@ def download_image(
         page_kind = "texte" if is_text_page_url(normalized_url) else "lecteur"
         tmp_filename = f"{filename}.part-{page_kind}-{threading.get_ident()}"
         try:
-            raw = get_text_page_bytes(normalized_url) if is_text_page_url(normalized_url) else get_reader_blob_stage_bytes(normalized_url)
-            if not raw:
+            if is_text_page_url(normalized_url):
+                source_path = get_text_page_path(normalized_url)
+                raw = None
+            else:
+                source_path = None
+                raw = get_reader_blob_stage_bytes(normalized_url)
+            if source_path is None and not raw:
                 raise ImageDownloadError(
                     f"Page {page_kind} introuvable dans le cache local.",
                     kind="missing",
                     phase="text-page",
                 )
             os.makedirs(folder, exist_ok=True)
-            with open(tmp_filename, "wb") as out:
-                out.write(raw)
+            if source_path is not None:
+                shutil.copyfile(source_path, tmp_filename)
+            else:
+                with open(tmp_filename, "wb") as out:
+                    out.write(raw)
             os.replace(tmp_filename, filename)
             filename = convert_webp_avif_to_jpg(filename, enabled=webp2jpg_enabled)
             validate_image_file(filename)
+            report_image(True, filename)
             if progress_callback:
                 progress_callback(i + 1)
             return
@@ -4064,6 +4921,7 @@ def download_image(
                     filename = convert_webp_avif_to_jpg(filename, enabled=True)
                 except Exception as conv_e:
                     runtime_log(f"Erreur conversion WEBP/AVIF->JPG: {conv_e}", level="warning", context={"action": "webp2jpg"})
+            report_image(True, filename)
             if progress_callback:
                 progress_callback(i + 1)
             return
@@ -4096,6 +4954,7 @@ def download_image(
             filename,
             headers,
             cancel_event=cancel_event,
+            stats=transfer_stats,
         )
 
         # Conversion WebP/AVIF vers JPG si activée.
@@ -4105,6 +4964,7 @@ def download_image(
             except Exception as conv_e:
                 runtime_log(f"Erreur conversion WEBP/AVIF->JPG: {conv_e}", level="warning", context={"action": "webp2jpg"})
 
+        report_image(True, filename)
         # Mise à jour de la progression
         if progress_callback:
             progress_callback(i + 1)
@@ -4164,12 +5024,68 @@ def normalize_manga_title_case(title):
     return "".join(title_chars)
 
 
+class CatalogueDocument:
+    """Page catalogue parsée une seule fois et partagée par les étapes d'analyse.
+
+    La soupe et les résultats dérivés (titre, chapitres, métadonnées série,
+    couverture) sont calculés au premier besoin puis mémorisés; les
+    consommateurs ne doivent pas modifier la soupe.
+    """
+
+    def __init__(self, html_content):
+        self.html_content = str(html_content or "")
+        self._soup = None
+        self._results = {}
+        self._lock = threading.RLock()
+
+    @property
+    def soup(self):
+        if self._soup is None:
+            with self._lock:
+                if self._soup is None:
+                    self._soup = bs4.BeautifulSoup(self.html_content, "html.parser")
+        return self._soup
+
+    def memo(self, key, compute):
+        with self._lock:
+            if key in self._results:
+                return self._results[key]
+        value = compute()
+        with self._lock:
+            return self._results.setdefault(key, value)
+
+
+def get_catalogue_document(html_content):
+    """Retourne le document partagé d'un HTML catalogue, créé au premier appel.
+
+    Les derniers documents sont indexés par leur HTML : une analyse rejouée
+    depuis le cache disque, puis la couverture, réutilisent la même soupe.
+    """
+    if isinstance(html_content, CatalogueDocument):
+        return html_content
+    html_text = str(html_content or "")
+    with CATALOGUE_DOCUMENT_CACHE_LOCK:
+        document = CATALOGUE_DOCUMENT_CACHE.get(html_text)
+        if document is None:
+            document = CATALOGUE_DOCUMENT_CACHE[html_text] = CatalogueDocument(html_text)
+        elif html_text in CATALOGUE_DOCUMENT_CACHE_ORDER:
+            CATALOGUE_DOCUMENT_CACHE_ORDER.remove(html_text)
+        CATALOGUE_DOCUMENT_CACHE_ORDER.append(html_text)
+        while len(CATALOGUE_DOCUMENT_CACHE_ORDER) > CATALOGUE_DOCUMENT_CACHE_MAX_ITEMS:
+            CATALOGUE_DOCUMENT_CACHE.pop(CATALOGUE_DOCUMENT_CACHE_ORDER.pop(0), None)
+    return document
+
+
 def extract_manga_title_from_html(url, html_content):
-    """Extrait un titre de manga/œuvre depuis le HTML source."""
-    html_content = html_content or ""
-    soup = BeautifulSoup(html_content, "html.parser")
-    source_site = get_supported_site_from_url(url)
-    if source_site == "scan-manga.com":
+    """Extrait un titre de manga/œuvre depuis le HTML source (ou un `CatalogueDocument`)."""
+    document = get_catalogue_document(html_content)
+    return document.memo(("title", url or ""), lambda: _extract_manga_title(url, document))
+
+
+def _extract_manga_title(url, document):
+    html_content = document.html_content
+    soup = document.soup
+    if get_site_catalogue_family(url) == "scanmanga":
         title_tag = soup.find("title")
         if title_tag:
             title_text = normalize_metadata_text(title_tag.get_text(" ", strip=True))
@@ -4179,7 +5095,7 @@ def extract_manga_title_from_html(url, html_content):
                 title_text = title_text.split(" » ", 1)[0].strip()
             if title_text:
                 return normalize_manga_title_case(title_text)
-    if source_site in ("crunchyscan.fr", "scan-hentai.net"):
+    if get_site_catalogue_family(url) == "crunchy":
         for selector in ("h1", "meta[property='og:title']", "title"):
             node = soup.select_one(selector) if selector != "title" else soup.find("title")
             if not node:
@@ -4590,11 +5506,20 @@ def extract_crunchy_family_series_metadata(soup):
 
 def extract_series_metadata_from_html(url, html_content, title=""):
     """Extrait les metadonnees serie disponibles depuis la fiche catalogue."""
-    html_content = html_content or ""
-    soup = BeautifulSoup(html_content, "html.parser")
+    document = get_catalogue_document(html_content)
+    metadata = document.memo(
+        ("series", url or "", title or ""),
+        lambda: _extract_series_metadata(url, document, title),
+    )
+    return {**metadata, "tags": list(metadata.get("tags") or [])}
+
+
+def _extract_series_metadata(url, document, title=""):
+    html_content = document.html_content
+    soup = document.soup
     source_domain = comicinfo_source_label_from_url(url)
     metadata = {
-        "series": normalize_metadata_text(title) or extract_manga_title_from_html(url, html_content),
+        "series": normalize_metadata_text(title) or extract_manga_title_from_html(url, document),
         "web": (url or "").strip(),
         "publisher": source_domain,
         "language_iso": "fr",
@@ -4687,7 +5612,7 @@ def extract_series_metadata_from_html(url, html_content, title=""):
             if value:
                 metadata[key] = value
 
-    if get_supported_site_from_url(url) in ("crunchyscan.fr", "scan-hentai.net"):
+    if get_site_catalogue_family(url) == "crunchy":
         crunchy_metadata = extract_crunchy_family_series_metadata(soup)
         for key in ("writer", "penciller", "genre", "year", "month", "day", "status"):
             value = crunchy_metadata.get(key)
@@ -4738,87 +5663,10 @@ def extract_series_metadata_from_html(url, html_content, title=""):
     if metadata["genre"]:
         tags.extend(split_metadata_values(metadata["genre"]))
     metadata["tags"] = split_metadata_values(", ".join(tags))
-    metadata["cover_url"] = extract_cover_url_from_html(url, html_content)
+    metadata["cover_url"] = extract_cover_url_from_html(url, document)
     return metadata
 
 
-def extract_json_object_after_marker(text, marker):
-    """Extrait un objet JSON/JS équilibré juste après un marqueur donné."""
-    raw_text = str(text or "")
-    if not raw_text or not marker:
-        return ""
-    marker_index = raw_text.find(marker)
-    if marker_index < 0:
-        return ""
-    start_index = raw_text.find("{", marker_index + len(marker))
-    if start_index < 0:
-        return ""
-
-    depth = 0
-    escaped = False
-    for index in range(start_index, len(raw_text)):
-        char = raw_text[index]
-        if escaped:
-            escaped = False
-            continue
-        if char == "\\":
-            escaped = True
-            continue
-        if char == "{":
-            depth += 1
-        elif char == "}":
-            depth -= 1
-            if depth == 0:
-                return raw_text[start_index : index + 1]
-    return ""
-
-
-def parse_ortega_initial_data(html_content):
-    """Décode initialData embarqué dans le flux Next.js OrtegaScans."""
-    raw_text = str(html_content or "")
-    if not raw_text:
-        return {}
-
-    candidates = (
-        ('initialData\\":', True),
-        ('"initialData":', False),
-    )
-    for marker, escaped in candidates:
-        raw_object = extract_json_object_after_marker(raw_text, marker)
-        if not raw_object:
-            continue
-        decoded_object = raw_object
-        if escaped:
-            decoded_object = decoded_object.replace('\\"', '"')
-        decoded_object = decoded_object.replace("\\/", "/")
-        try:
-            parsed = json.loads(decoded_object)
-        except Exception:
-            continue
-        if isinstance(parsed, dict) and isinstance(parsed.get("manga"), dict):
-            return parsed
-    return {}
-
-
-def is_ortega_premium_chapter_locked(chapter):
-    """Retourne True si le chapitre Ortega est réellement verrouillé premium."""
-    if not bool((chapter or {}).get("isPremium")):
-        return False
-    premium_until = str((chapter or {}).get("premiumUntil") or "").strip()
-    if premium_until.startswith("$D"):
-        premium_until = premium_until[2:]
-    if not premium_until:
-        return True
-    try:
-        expiry = datetime.datetime.fromisoformat(premium_until.replace("Z", "+00:00"))
-    except Exception:
-        return True
-    if expiry.tzinfo is None:
-        expiry = expiry.replace(tzinfo=datetime.timezone.utc)
-    now_utc = datetime.datetime.now(datetime.timezone.utc)
-    return expiry > now_utc
-
-
 def parse_ortega_chapters_from_html(url, soup, source_slug, html_content=""):
     """Extrait les chapitres OrtegaScans et leur statut premium."""
     pairs = []
@@ -4997,16 +5845,56 @@ def parse_scanmanga_chapters_from_html(url, soup, html_content=""):
     return pairs, metadata
 
 
-def _scanmanga_base_convert_to_int(value, base_chars):
+def _scanmanga_decode_cache_key(kind, text, *extra):
+    digest = hashlib.sha1((text or "").encode("utf-8", errors="replace")).hexdigest()
+    return (kind, digest) + extra
+
+
+def _get_scanmanga_decoded(key):
+    with SCANMANGA_DECODE_CACHE_LOCK:
+        return SCANMANGA_DECODE_CACHE.get(key)
+
+
+def _store_scanmanga_decoded(key, value):
+    with SCANMANGA_DECODE_CACHE_LOCK:
+        SCANMANGA_DECODE_CACHE[key] = value
+        if key in SCANMANGA_DECODE_CACHE_ORDER:
+            SCANMANGA_DECODE_CACHE_ORDER.remove(key)
+        SCANMANGA_DECODE_CACHE_ORDER.append(key)
+        while len(SCANMANGA_DECODE_CACHE_ORDER) > SCANMANGA_DECODE_CACHE_MAX_ITEMS:
+            old_key = SCANMANGA_DECODE_CACHE_ORDER.pop(0)
+            SCANMANGA_DECODE_CACHE.pop(old_key, None)
+
+
+def _scanmanga_base_convert_to_int(value, base_chars, digit_values=None):
+    # Un caractère hors alphabet compte pour 0 mais occupe sa position,
+    # comme le `indexOf` ignoré du script d'origine.
+    if digit_values is None:
+        digit_values = {char: idx for idx, char in enumerate(base_chars)}
+    radix = len(base_chars)
     total = 0
-    for idx, char in enumerate(reversed(value or "")):
-        char_value = base_chars.find(char)
-        if char_value < 0:
-            continue
-        total += char_value * (len(base_chars) ** idx)
+    for char in value or "":
+        total = total * radix + digit_values.get(char, 0)
     return total
 
 
+def _build_scanmanga_token_table(q, chars):
+    """Table de traduction équivalente aux `replace` successifs de q[i] -> str(i).
+
+    Chaque `replace` d'un caractère unique agit caractère par caractère :
+    l'image finale d'un caractère suffit donc à décoder tout un jeton.
+    """
+    table = {}
+    for char in chars:
+        image = char
+        for replacement_index, replacement_char in enumerate(q):
+            if replacement_char in image:
+                image = image.replace(replacement_char, str(replacement_index))
+        if image != char:
+            table[ord(char)] = image
+    return table
+
+
 def decode_scanmanga_eval_script(script):
     """Decode l'obfuscateur simple utilisé autour de sml/sme/DataAPI."""
     match = re.search(
@@ -5022,32 +5910,43 @@ def decode_scanmanga_eval_script(script):
         base = int(base)
     except ValueError:
         return ""
-    alphabet = "0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ+/"
-    base_chars = alphabet[:base]
+    base_chars = SCANMANGA_DECODE_ALPHABET[:base]
     separator = q[base] if len(q) > base else ""
     if not separator:
         return ""
 
+    cache_key = _scanmanga_decode_cache_key("eval", match.group(0))
+    cached = _get_scanmanga_decoded(cache_key)
+    if cached is not None:
+        return cached
+
+    table = _build_scanmanga_token_table(q, set(payload) - {separator})
+    digit_values = {char: idx for idx, char in enumerate(base_chars)}
+    # int(jeton, base) n'est sûr que si l'alphabet est celui de Python (0-9a-z)
+    # et que le jeton n'utilise que ses chiffres.
+    native_base = 2 <= base <= 36
     decoded = []
-    index = 0
-    while index < len(payload):
-        chunk = []
-        while index < len(payload) and payload[index] != separator:
-            chunk.append(payload[index])
-            index += 1
-        index += 1
-        token = "".join(chunk)
+    for token in payload.split(separator):
         if not token:
             continue
-        for replacement_index, replacement_char in enumerate(q):
-            token = token.replace(replacement_char, str(replacement_index))
-        decoded.append(chr(_scanmanga_base_convert_to_int(token, base_chars) - offset))
-    return "".join(decoded)
+        token = token.translate(table)
+        if native_base and token.isascii() and not token.strip(base_chars):
+            value = int(token, base)
+        else:
+            value = _scanmanga_base_convert_to_int(token, base_chars, digit_values)
+        decoded.append(chr(value - offset))
+    result = "".join(decoded)
+    _store_scanmanga_decoded(cache_key, result)
+    return result
 
 
 def extract_scanmanga_reader_vars(html_content):
     """Extrait idc/idm/sml/sme depuis une page lecteur Scan-Manga."""
     html_content = html_content or ""
+    cache_key = _scanmanga_decode_cache_key("vars", html_content)
+    cached = _get_scanmanga_decoded(cache_key)
+    if cached is not None:
+        return dict(cached)
     idc_match = re.search(r"const\s+idc\s*=\s*(\d+)\s*;", html_content)
     idm_match = re.search(r"const\s+idm\s*=\s*(\d+)\s*;", html_content)
     sml_match = re.search(r"var\s+sml\s*=\s*['\"]([^'\"]+)['\"]\s*;", html_content)
@@ -5067,12 +5966,14 @@ def extract_scanmanga_reader_vars(html_content):
 
     if not idc_match or not sml_match or not sme_match:
         raise ParseError("Variables lecteur Scan-Manga introuvables (idc/sml/sme).")
-    return {
+    reader_vars = {
         "idc": int(idc_match.group(1)),
         "idm": int(idm_match.group(1)) if idm_match else 0,
         "sml": sml_match.group(1),
         "sme": sme_match.group(1),
     }
+    _store_scanmanga_decoded(cache_key, dict(reader_vars))
+    return reader_vars
 
 
 def decode_scanmanga_data_api(payload, chapter_id):
@@ -5080,50 +5981,23 @@ def decode_scanmanga_data_api(payload, chapter_id):
     raw_text = (payload or "").strip()
     if not raw_text:
         raise ParseError("Réponse Scan-Manga vide.")
-    raw = base64.b64decode(raw_text + "=" * (-len(raw_text) % 4))
-    inflated = zlib.decompress(raw).decode("utf-8")
-    suffix = format(int(chapter_id), "x")
-    if inflated.endswith(suffix):
-        inflated = inflated[: -len(suffix)]
-    reversed_payload = inflated[::-1]
-    decoded = base64.b64decode(reversed_payload + "=" * (-len(reversed_payload) % 4)).decode("utf-8")
+    cache_key = _scanmanga_decode_cache_key("data", raw_text, int(chapter_id))
+    decoded = _get_scanmanga_decoded(cache_key)
+    if decoded is None:
+        raw = base64.b64decode(raw_text + "=" * (-len(raw_text) % 4))
+        inflated = zlib.decompress(raw).decode("utf-8")
+        suffix = format(int(chapter_id), "x")
+        if inflated.endswith(suffix):
+            inflated = inflated[: -len(suffix)]
+        reversed_payload = inflated[::-1]
+        decoded = base64.b64decode(reversed_payload + "=" * (-len(reversed_payload) % 4)).decode("utf-8")
+        _store_scanmanga_decoded(cache_key, decoded)
     return json.loads(decoded)
 
 
-def build_scanmanga_image_urls(data):
-    """Transforme le JSON lecteur Scan-Manga en URLs d'images réelles."""
-    if not isinstance(data, dict):
-        return []
-    host = (data.get("dN") or "").strip()
-    serie = (data.get("s") or "").strip("/")
-    volume = str(data.get("v") or "").strip("/")
-    chapter = str(data.get("c") or "").strip("/")
-    pages = data.get("p") or {}
-    if not host or not serie or not volume or not chapter or not isinstance(pages, dict):
-        return []
-
-    def page_sort_key(item):
-        key, _value = item
-        try:
-            return int(key)
-        except (TypeError, ValueError):
-            return str(key)
-
-    images = []
-    for _page, page_data in sorted(pages.items(), key=page_sort_key):
-        if not isinstance(page_data, dict):
-            continue
-        filename = (page_data.get("f") or "").strip()
-        ext = (page_data.get("e") or "").strip().lstrip(".")
-        if not filename or not ext:
-            continue
-        images.append(f"https://{host}/{serie}/{volume}/{chapter}/{filename}.{ext}")
-    return images
-
-
 def extract_scanmanga_novel_chapter(html_content):
     """Extrait un chapitre texte Scan-Manga (Novel) depuis le lecteur HTML."""
-    soup = BeautifulSoup(html_content or "", "html.parser")
+    soup = bs4.BeautifulSoup(html_content or "", "html.parser")
     article = soup.select_one("article.aLN")
     content_node = soup.select_one(".ln_c_content")
     if not article or not content_node:
@@ -5227,40 +6101,87 @@ def extract_scanmanga_novel_chapter(html_content):
     return title or "Chapitre texte", blocks
 
 
-def _load_text_render_font(size, bold=False):
-    font_candidates = [
-        r"C:\Windows\Fonts\DejaVuSerif-Bold.ttf" if bold else r"C:\Windows\Fonts\DejaVuSerif.ttf",
-        r"C:\Windows\Fonts\NotoSerif-Bold.ttf" if bold else r"C:\Windows\Fonts\NotoSerif-Regular.ttf",
-        r"C:\Windows\Fonts\georgiab.ttf" if bold else r"C:\Windows\Fonts\georgia.ttf",
-        r"C:\Windows\Fonts\cambria.ttc",
-        r"C:\Windows\Fonts\timesbd.ttf" if bold else r"C:\Windows\Fonts\times.ttf",
-        r"C:\Windows\Fonts\seguisym.ttf",
-        r"C:\Windows\Fonts\ARIALUNI.ttf",
-        r"C:\Windows\Fonts\arialbd.ttf" if bold else r"C:\Windows\Fonts\arial.ttf",
-    ]
-    for font_path in font_candidates:
+def _text_font_file_index():
+    """Indexe une seule fois les polices installées (Windows, Linux, macOS)."""
+    global TEXT_FONT_FILE_INDEX
+    with TEXT_FONT_CACHE_LOCK:
+        if TEXT_FONT_FILE_INDEX is not None:
+            return TEXT_FONT_FILE_INDEX
+        index = {}
+        for font_dir in TEXT_FONT_DIRS:
+            try:
+                if not font_dir.is_dir():
+                    continue
+            except OSError:
+                continue
+            for root, _dirs, files in os.walk(font_dir):
+                for name in files:
+                    if name.lower().endswith((".ttf", ".ttc", ".otf")):
+                        index.setdefault(name.lower(), os.path.join(root, name))
+        TEXT_FONT_FILE_INDEX = index
+        return index
+
+
+def _load_truetype_font(font_path, size):
+    key = (font_path, int(size))
+    with TEXT_FONT_CACHE_LOCK:
+        font = TEXT_FONT_CACHE.get(key)
+    if font is None:
         try:
-            if font_path and os.path.exists(font_path):
-                return ImageFont.truetype(font_path, size=size)
+            font = ImageFont.truetype(font_path, size=size)
         except Exception:
+            font = False
+        with TEXT_FONT_CACHE_LOCK:
+            font = TEXT_FONT_CACHE.setdefault(key, font)
+    return font or None
+
+
+def _load_text_font(font_names, size):
+    index = _text_font_file_index()
+    for font_name in font_names:
+        font_path = index.get(font_name.lower())
+        if not font_path:
             continue
-    return ImageFont.load_default()
+        font = _load_truetype_font(font_path, size)
+        if font is not None:
+            return font
+    key = ("", 0)
+    with TEXT_FONT_CACHE_LOCK:
+        font = TEXT_FONT_CACHE.get(key)
+        if font is None:
+            font = TEXT_FONT_CACHE[key] = ImageFont.load_default()
+    return font
+
+
+def _load_text_render_font(size, bold=False):
+    return _load_text_font(
+        [
+            "DejaVuSerif-Bold.ttf" if bold else "DejaVuSerif.ttf",
+            "NotoSerif-Bold.ttf" if bold else "NotoSerif-Regular.ttf",
+            "georgiab.ttf" if bold else "georgia.ttf",
+            "cambria.ttc",
+            "timesbd.ttf" if bold else "times.ttf",
+            "seguisym.ttf",
+            "ARIALUNI.ttf",
+            "arialbd.ttf" if bold else "arial.ttf",
+            "LiberationSerif-Bold.ttf" if bold else "LiberationSerif-Regular.ttf",
+        ],
+        size,
+    )
 
 
 def _load_text_symbol_font(size):
-    font_candidates = [
-        r"C:\Windows\Fonts\seguisym.ttf",
-        r"C:\Windows\Fonts\SegoeIcons.ttf",
-        r"C:\Windows\Fonts\ARIALUNI.ttf",
-        r"C:\Windows\Fonts\DejaVuSans.ttf",
-    ]
-    for font_path in font_candidates:
-        try:
-            if font_path and os.path.exists(font_path):
-                return ImageFont.truetype(font_path, size=size)
-        except Exception:
-            continue
-    return ImageFont.load_default()
+    return _load_text_font(
+        [
+            "seguisym.ttf",
+            "SegoeIcons.ttf",
+            "ARIALUNI.ttf",
+            "DejaVuSans.ttf",
+            "NotoSansSymbols2-Regular.ttf",
+            "Symbola.ttf",
+        ],
+        size,
+    )
 
 
 def _font_size(font):
@@ -5299,19 +6220,30 @@ def _split_font_runs(text, font):
     return runs
 
 
-def _text_bbox(draw, text, font):
+def _font_text_length(font, text):
+    """Largeur d'avance d'un texte, crénage compris; mots et espaces sont mémorisés par police."""
+    if len(text) <= TEXT_LENGTH_CACHE_MAX_CHARS:
+        return _cached_font_text_length(font, text)
+    return _measure_font_text_length(font, text)
+
+
+@lru_cache(maxsize=16384)
+def _cached_font_text_length(font, text):
+    return _measure_font_text_length(font, text)
+
+
+def _measure_font_text_length(font, text):
     try:
-        return draw.textbbox((0, 0), text, font=font)
+        return float(font.getlength(text))
     except Exception:
-        width, height = draw.textsize(text, font=font)
-        return (0, 0, width, height)
+        bbox = font.getbbox(text)
+        return float(max(0, bbox[2] - bbox[0]))
 
 
 def _text_width(draw, text, font):
-    total = 0
+    total = 0.0
     for run_text, run_font in _split_font_runs(text, font):
-        bbox = _text_bbox(draw, run_text, run_font)
-        total += max(0, bbox[2] - bbox[0])
+        total += _font_text_length(run_font, run_text)
     return total
 
 
@@ -5319,35 +6251,44 @@ def _draw_text_with_fallback(draw, xy, text, fill, font):
     x, y = xy
     for run_text, run_font in _split_font_runs(text, font):
         draw.text((x, y), run_text, fill=fill, font=run_font)
-        x += _text_width(draw, run_text, run_font)
+        x += _font_text_length(run_font, run_text)
 
 
 def _wrap_text_for_width(draw, text, font, max_width):
+    """Découpe un paragraphe en lignes; chaque mot n'est mesuré qu'une fois."""
     words = str(text or "").split()
     if not words:
         return [""]
+    space_width = _text_width(draw, " ", font)
     lines = []
-    current = ""
+    current = []
+    current_width = 0.0
     for word in words:
-        candidate = f"{current} {word}".strip()
-        if not current or _text_width(draw, candidate, font) <= max_width:
-            current = candidate
+        word_width = _text_width(draw, word, font)
+        if not current or current_width + space_width + word_width <= max_width:
+            current_width = word_width if not current else current_width + space_width + word_width
+            current.append(word)
             continue
-        lines.append(current)
-        if _text_width(draw, word, font) <= max_width:
-            current = word
+        lines.append(" ".join(current))
+        if word_width <= max_width:
+            current = [word]
+            current_width = word_width
             continue
         chunk = ""
+        chunk_width = 0.0
         for char in word:
-            candidate_chunk = f"{chunk}{char}"
-            if not chunk or _text_width(draw, candidate_chunk, font) <= max_width:
-                chunk = candidate_chunk
+            char_width = _text_width(draw, char, font)
+            if not chunk or chunk_width + char_width <= max_width:
+                chunk += char
+                chunk_width += char_width
             else:
                 lines.append(chunk)
                 chunk = char
-        current = chunk
+                chunk_width = char_width
+        current = [chunk]
+        current_width = chunk_width
     if current:
-        lines.append(current)
+        lines.append(" ".join(current))
     return lines
 
 
@@ -5431,8 +6372,21 @@ def _fit_image_to_page(image, max_width, max_height):
     return image.resize(target_size, Image.Resampling.LANCZOS)
 
 
-def render_scanmanga_novel_pages(title, paragraphs, source_url="", cookie="", ua="", max_pages=None):
-    """Rend un chapitre Novel Scan-Manga en pages JPG utilisables par le pipeline CBZ."""
+def render_scanmanga_novel_pages(
+    title,
+    paragraphs,
+    source_url="",
+    cookie="",
+    ua="",
+    max_pages=None,
+    encode_workers=None,
+):
+    """Rend un chapitre Novel Scan-Manga en pages JPG utilisables par le pipeline CBZ.
+
+    Chaque page est encodée dès qu'elle est remplie et écrite dans
+    `TEXT_PAGE_SPILL_PATH` (encodage JPEG en parallèle sur `encode_workers`
+    threads) : seul le nombre de pages reste en mémoire.
+    """
     clean_title = normalize_metadata_text(title or "Chapitre texte")
     clean_blocks = []
     for block in paragraphs or []:
@@ -5479,7 +6433,25 @@ def render_scanmanga_novel_pages(title, paragraphs, source_url="", cookie="", ua
     paragraph_gap = 24
     centered_paragraph_gap = 34
     image_gap = 34
-    page_bytes = []
+    key = _text_page_cache_key(source_url, clean_title, clean_blocks)
+    try:
+        worker_count = max(1, int(encode_workers or TEXT_PAGE_ENCODE_WORKERS))
+    except (TypeError, ValueError):
+        worker_count = TEXT_PAGE_ENCODE_WORKERS
+    encoder = ThreadPoolExecutor(max_workers=worker_count) if worker_count > 1 else None
+    pending_writes = deque()
+    saved_pages = 0
+    usable_bottom = height - 110
+    # Les illustrations sont téléchargées et redimensionnées en parallèle,
+    # dans l'ordre de mise en page, sur une fenêtre glissante bornée.
+    image_sources = [block["src"] for block in clean_blocks if block["kind"] == "image"]
+    image_loader = (
+        ThreadPoolExecutor(max_workers=min(NOVEL_IMAGE_PREFETCH_WORKERS, len(image_sources)))
+        if image_sources
+        else None
+    )
+    image_queue = deque()
+    next_image_index = 0
     page = None
     draw = None
     y = 0
@@ -5491,7 +6463,22 @@ def render_scanmanga_novel_pages(title, paragraphs, source_url="", cookie="", ua
         page_limit = 0
 
     def page_limit_reached():
-        return bool(page_limit and len(page_bytes) >= page_limit)
+        return bool(page_limit and saved_pages >= page_limit)
+
+    def load_fitted_image(src):
+        source_image = _load_scanmanga_novel_image(src, source_url, cookie, ua)
+        return _fit_image_to_page(source_image, max_text_width, usable_bottom - margin_y)
+
+    def schedule_images():
+        nonlocal next_image_index
+        while next_image_index < len(image_sources) and len(image_queue) < NOVEL_IMAGE_PREFETCH_WINDOW:
+            image_queue.append(image_loader.submit(load_fitted_image, image_sources[next_image_index]))
+            next_image_index += 1
+
+    def next_fitted_image():
+        future = image_queue.popleft()
+        schedule_images()
+        return future.result()
 
     def new_page():
         nonlocal page, draw, y, page_number, page_has_body
@@ -5509,97 +6496,111 @@ def render_scanmanga_novel_pages(title, paragraphs, source_url="", cookie="", ua
             y += 48
 
     def save_page():
+        nonlocal saved_pages
         if page is None or page_limit_reached():
             return
         footer = f"{page_number}"
         footer_width = _text_width(draw, footer, footer_font)
         _draw_text_with_fallback(draw, ((width - footer_width) / 2, height - 62), footer, fill=(110, 110, 110), font=footer_font)
-        buffer = BytesIO()
-        page.save(buffer, "JPEG", quality=92, optimize=True)
-        page_bytes.append(buffer.getvalue())
+        saved_pages += 1
+        if encoder is None:
+            write_text_page(key, page_number, page)
+            return
+        # Au plus deux pages en attente par thread : la mémoire reste bornée.
+        while len(pending_writes) >= worker_count * 2:
+            pending_writes.popleft().result()
+        pending_writes.append(encoder.submit(write_text_page, key, page_number, page))
 
-    new_page()
-    usable_bottom = height - 110
-    for block in clean_blocks:
-        if page_limit_reached():
-            break
-        if block["kind"] == "spacer":
-            spacer_height = block["height"]
-            if y + spacer_height > usable_bottom and page_has_body:
-                save_page()
-                if page_limit_reached():
-                    break
-                new_page()
-            y += spacer_height
-            continue
-        if block["kind"] == "image":
-            try:
-                source_image = _load_scanmanga_novel_image(block["src"], source_url, cookie, ua)
-                fitted = _fit_image_to_page(source_image, max_text_width, usable_bottom - margin_y)
-                if fitted is None:
+    try:
+        if image_loader is not None:
+            schedule_images()
+        new_page()
+        for block in clean_blocks:
+            if page_limit_reached():
+                break
+            if block["kind"] == "spacer":
+                spacer_height = block["height"]
+                if y + spacer_height > usable_bottom and page_has_body:
+                    save_page()
+                    if page_limit_reached():
+                        break
+                    new_page()
+                y += spacer_height
+                continue
+            if block["kind"] == "image":
+                try:
+                    fitted = next_fitted_image()
+                    if fitted is None:
+                        continue
+                except Exception as exc:
+                    runtime_log(
+                        f"Image Novel Scan-Manga ignorée: {exc}",
+                        level="warning",
+                        context={"action": "novel_image", "url": block.get("src", "")},
+                    )
                     continue
-            except Exception as exc:
-                runtime_log(
-                    f"Image Novel Scan-Manga ignorée: {exc}",
-                    level="warning",
-                    context={"action": "novel_image", "url": block.get("src", "")},
-                )
+                image_width, image_height = fitted.size
+                if y + image_height + image_gap > usable_bottom and page_has_body:
+                    save_page()
+                    if page_limit_reached():
+                        break
+                    new_page()
+                if image_height > usable_bottom - margin_y:
+                    fitted = _fit_image_to_page(fitted, max_text_width, usable_bottom - margin_y)
+                    image_width, image_height = fitted.size
+                align = block["align"]
+                if align == "left" and block.get("explicit_align"):
+                    x = margin_x
+                elif align == "right" and block.get("explicit_align"):
+                    x = max(margin_x, width - margin_x - image_width)
+                else:
+                    x = max(margin_x, int((width - image_width) / 2))
+                page.paste(fitted, (int(x), int(y)))
+                y += image_height + image_gap
+                page_has_body = True
                 continue
-            image_width, image_height = fitted.size
-            if y + image_height + image_gap > usable_bottom and page_has_body:
+            paragraph = block["text"]
+            align = block["align"]
+            lines = _wrap_text_for_width(draw, paragraph, body_font, max_text_width)
+            block_gap = centered_paragraph_gap if align == "center" else paragraph_gap
+            needed = max(1, len(lines)) * line_height + block_gap
+            if y + needed > usable_bottom and page_has_body:
                 save_page()
                 if page_limit_reached():
                     break
                 new_page()
-            if image_height > usable_bottom - margin_y:
-                fitted = _fit_image_to_page(fitted, max_text_width, usable_bottom - margin_y)
-                image_width, image_height = fitted.size
-            align = block["align"]
-            if align == "left" and block.get("explicit_align"):
-                x = margin_x
-            elif align == "right" and block.get("explicit_align"):
-                x = max(margin_x, width - margin_x - image_width)
-            else:
-                x = max(margin_x, int((width - image_width) / 2))
-            page.paste(fitted, (int(x), int(y)))
-            y += image_height + image_gap
-            page_has_body = True
-            continue
-        paragraph = block["text"]
-        align = block["align"]
-        lines = _wrap_text_for_width(draw, paragraph, body_font, max_text_width)
-        block_gap = centered_paragraph_gap if align == "center" else paragraph_gap
-        needed = max(1, len(lines)) * line_height + block_gap
-        if y + needed > usable_bottom and page_has_body:
-            save_page()
+            for line in lines:
+                if y + line_height > usable_bottom and page_has_body:
+                    save_page()
+                    if page_limit_reached():
+                        break
+                    new_page()
+                line_width = _text_width(draw, line, body_font)
+                if align == "center":
+                    x = max(margin_x, (width - line_width) / 2)
+                elif align == "right":
+                    x = max(margin_x, width - margin_x - line_width)
+                else:
+                    x = margin_x
+                _draw_text_with_fallback(draw, (x, y), line, fill=text_color, font=body_font)
+                y += line_height
+                page_has_body = True
             if page_limit_reached():
                 break
-            new_page()
-        for line in lines:
-            if y + line_height > usable_bottom and page_has_body:
-                save_page()
-                if page_limit_reached():
-                    break
-                new_page()
-            line_width = _text_width(draw, line, body_font)
-            if align == "center":
-                x = max(margin_x, (width - line_width) / 2)
-            elif align == "right":
-                x = max(margin_x, width - margin_x - line_width)
-            else:
-                x = margin_x
-            _draw_text_with_fallback(draw, (x, y), line, fill=text_color, font=body_font)
-            y += line_height
-            page_has_body = True
-        if page_limit_reached():
-            break
-        y += block_gap
-    if not page_limit_reached():
-        save_page()
+            y += block_gap
+        if not page_limit_reached():
+            save_page()
+        while pending_writes:
+            pending_writes.popleft().result()
+    finally:
+        if image_loader is not None:
+            # Un aperçu limité n'attend pas les illustrations déjà lancées.
+            image_loader.shutdown(wait=False, cancel_futures=True)
+        if encoder is not None:
+            encoder.shutdown(wait=True, cancel_futures=True)
 
-    key = _text_page_cache_key(source_url, clean_title, clean_blocks)
-    store_text_page_bytes(key, page_bytes)
-    return [f"{TEXT_PAGE_URL_PREFIX}{key}/{idx + 1}.jpg" for idx in range(len(page_bytes))]
+    register_text_pages(key, saved_pages)
+    return [f"{TEXT_PAGE_URL_PREFIX}{key}/{idx + 1}.jpg" for idx in range(saved_pages)]
 
 
 def request_scanmanga_reader_api(api_url, chapter_url, reader_vars, api_body, ua):
@@ -5713,127 +6714,126 @@ def fetch_scanmanga_images(link, cookie, ua, max_images=None, emit_logs=True, ca
     if cancel_event is not None and cancel_event.is_set():
         raise DownloadCancelled("Téléchargement annulé.")
 
-    data = decode_scanmanga_data_api(api_response.text or "", reader_vars["idc"])
-    images = build_scanmanga_image_urls(data)
-    if max_images:
-        images = images[:max_images]
+    data = decode_scanmanga_data_api(api_response.text or "", reader_vars["idc"])
+    images = build_scanmanga_image_urls(data)
+    if max_images:
+        images = images[:max_images]
+    if emit_logs:
+        runtime_log(
+            f"{len(images)} image(s) Scan-Manga détectée(s) via API lecteur.",
+            level="info",
+            context={"action": "extract_images", "domain": "scanmanga"},
+        )
+    return images
+
+
+def parse_manga_data_from_html(url, html_content, emit_logs=True):
+    """
+    Parse le HTML du catalogue (ou un `CatalogueDocument`) et retourne
+    (title, pairs, volume_metadata).
+    """
+    document = get_catalogue_document(html_content)
+    # emit_logs fait partie de la clé : un premier appel silencieux ne doit
+    # pas priver de ses journaux un appel ultérieur qui les demande.
+    title, pairs, volume_metadata = document.memo(
+        ("chapters", url or "", bool(emit_logs)),
+        lambda: _parse_manga_data_from_document(url, document, emit_logs),
+    )
+    return title, list(pairs), dict(volume_metadata)
+
+
+def _parse_crunchy_family_catalogue(url, document, source_slug, emit_logs=True):
+    pairs, volume_metadata = parse_crunchy_family_chapters_from_html(url, document.soup, document.html_content)
+    unique_pairs = [
+        pair
+        for _index, pair in sorted(enumerate(pairs), key=crunchy_family_chapter_sort_key)
+    ]
+    ordered_metadata = {
+        link: volume_metadata.get(link, {})
+        for _label, link in unique_pairs
+        if link
+    }
+    if not unique_pairs:
+        raise ParseError("Aucun chapitre CrunchyScan/Scan-Hentai détecté (page protégée ou structure modifiée).")
+    if emit_logs:
+        runtime_log(
+            f"{len(unique_pairs)} chapitre(s) {comicinfo_source_label_from_url(url)} détecté(s)",
+            level="info",
+            context={"action": "parse_catalogue", "domain": get_cookie_domain_from_url(url)},
+        )
+    return unique_pairs, ordered_metadata
+
+
+def _parse_scanmanga_catalogue(url, document, source_slug, emit_logs=True):
+    pairs, volume_metadata = parse_scanmanga_chapters_from_html(url, document.soup, document.html_content)
+    unique_pairs = list(reversed(pairs))
+    ordered_metadata = {
+        link: volume_metadata.get(link, {})
+        for _label, link in unique_pairs
+        if link
+    }
+    if not unique_pairs:
+        raise ParseError("Aucun chapitre Scan-Manga détecté (page protégée ou structure modifiée).")
+    if emit_logs:
+        runtime_log(
+            f"{len(unique_pairs)} chapitre(s) Scan-Manga détecté(s)",
+            level="info",
+            context={"action": "parse_catalogue", "domain": "scanmanga"},
+        )
+    return unique_pairs, ordered_metadata
+
+
+def _parse_ortega_catalogue(url, document, source_slug, emit_logs=True):
+    if not source_slug:
+        return None
+    pairs, volume_metadata = parse_ortega_chapters_from_html(url, document.soup, source_slug, document.html_content)
+    unique_pairs = list(reversed(pairs))
+    ordered_metadata = {
+        link: volume_metadata.get(link, {})
+        for _label, link in unique_pairs
+        if link
+    }
+    if not unique_pairs:
+        raise Exception("Aucun tome/chapitre détecté (page protégée ou structure modifiée).")
     if emit_logs:
+        premium_count = sum(1 for meta in ordered_metadata.values() if bool(meta.get("premium")))
+        suffix = f", dont {premium_count} premium" if premium_count else ""
         runtime_log(
-            f"{len(images)} image(s) Scan-Manga détectée(s) via API lecteur.",
+            f"{len(unique_pairs)} tomes/chapitres détectés{suffix}",
             level="info",
-            context={"action": "extract_images", "domain": "scanmanga"},
+            context={"action": "parse_catalogue"},
         )
-    return images
+    return unique_pairs, ordered_metadata
 
 
-def parse_manga_data_from_html(url, html_content, emit_logs=True):
-    """
-    Parse le HTML du catalogue et retourne (title, pairs).
-    """
-    html_content = html_content or ""
+# Parseurs dédiés par famille catalogue (`SiteAdapter.catalogue`) ; les autres
+# familles passent par l'extraction HTML générique. Un parseur peut retourner
+# None pour laisser la main à cette extraction.
+CATALOGUE_FAMILY_PARSERS = {
+    "crunchy": _parse_crunchy_family_catalogue,
+    "scanmanga": _parse_scanmanga_catalogue,
+    "ortega": _parse_ortega_catalogue,
+}
 
-    soup = BeautifulSoup(html_content, "html.parser")
+
+def _parse_manga_data_from_document(url, document, emit_logs=True):
+    html_content = document.html_content
+    soup = document.soup
 
     # Extraction du titre (multi-sites)
-    title = extract_manga_title_from_html(url, html_content)
+    title = extract_manga_title_from_html(url, document)
 
-    source_site = get_supported_site_from_url(url)
+    adapter = get_site_adapter_from_url(url)
+    source_site = adapter.site if adapter is not None else ""
     source_host = normalize_hostname(urlparse(url).hostname)
-    path_value = (urlparse(url).path or "").strip()
-    source_slug = ""
-    if source_site in ("sushiscan.fr", "sushiscan.net"):
-        match_slug = re.match(r"^/catalogue/([^/?#]+)/?$", path_value, flags=re.IGNORECASE)
-        if match_slug:
-            source_slug = match_slug.group(1).strip()
-    elif source_site == "mangas-origines.fr":
-        match_slug = re.match(r"^/oeuvre/([^/?#]+)/?$", path_value, flags=re.IGNORECASE)
-        if match_slug:
-            source_slug = match_slug.group(1).strip()
-    elif source_site == "hentai-origines.fr":
-        match_slug = re.match(r"^/manga/([^/?#]+)/?$", path_value, flags=re.IGNORECASE)
-        if match_slug:
-            source_slug = match_slug.group(1).strip()
-    elif source_site == "toonfr.com":
-        match_slug = re.match(r"^/webtoon/([^/?#]+)/?$", path_value, flags=re.IGNORECASE)
-        if match_slug:
-            source_slug = match_slug.group(1).strip()
-    elif source_site == "ortegascans.fr":
-        match_slug = re.match(r"^/serie/([^/?#]+)/?$", path_value, flags=re.IGNORECASE)
-        if match_slug:
-            source_slug = match_slug.group(1).strip()
-    elif source_site == "hentaizone.xyz":
-        match_slug = re.match(r"^/manga/([^/?#]+)/?$", path_value, flags=re.IGNORECASE)
-        if match_slug:
-            source_slug = match_slug.group(1).strip()
-    elif source_site == "scan-manga.com":
-        match_slug = re.match(r"^/\d+(?:-\d+)?/([^/?#]+)\.html$", path_value, flags=re.IGNORECASE)
-        if match_slug:
-            source_slug = match_slug.group(1).strip()
-    elif source_site in ("crunchyscan.fr", "scan-hentai.net"):
-        match_slug = re.match(r"^/lecture-en-ligne/([^/?#]+)/?$", path_value, flags=re.IGNORECASE)
-        if match_slug:
-            source_slug = match_slug.group(1).strip()
+    source_slug = get_catalogue_slug_from_url(url)
     pairs = []
-    volume_metadata = {}
 
-    if source_site in ("crunchyscan.fr", "scan-hentai.net"):
-        pairs, volume_metadata = parse_crunchy_family_chapters_from_html(url, soup, html_content)
-        unique_pairs = [
-            pair
-            for _index, pair in sorted(enumerate(pairs), key=crunchy_family_chapter_sort_key)
-        ]
-        ordered_metadata = {
-            link: volume_metadata.get(link, {})
-            for _label, link in unique_pairs
-            if link
-        }
-        if not unique_pairs:
-            raise ParseError("Aucun chapitre CrunchyScan/Scan-Hentai détecté (page protégée ou structure modifiée).")
-        if emit_logs:
-            runtime_log(
-                f"{len(unique_pairs)} chapitre(s) {comicinfo_source_label_from_url(url)} détecté(s)",
-                level="info",
-                context={"action": "parse_catalogue", "domain": get_cookie_domain_from_url(url)},
-            )
-        return title, unique_pairs, ordered_metadata
-
-    if source_site == "scan-manga.com":
-        pairs, volume_metadata = parse_scanmanga_chapters_from_html(url, soup, html_content)
-        unique_pairs = list(reversed(pairs))
-        ordered_metadata = {
-            link: volume_metadata.get(link, {})
-            for _label, link in unique_pairs
-            if link
-        }
-        if not unique_pairs:
-            raise ParseError("Aucun chapitre Scan-Manga détecté (page protégée ou structure modifiée).")
-        if emit_logs:
-            runtime_log(
-                f"{len(unique_pairs)} chapitre(s) Scan-Manga détecté(s)",
-                level="info",
-                context={"action": "parse_catalogue", "domain": "scanmanga"},
-            )
-        return title, unique_pairs, ordered_metadata
-
-    if source_site == "ortegascans.fr" and source_slug:
-        pairs, volume_metadata = parse_ortega_chapters_from_html(url, soup, source_slug, html_content)
-        unique_pairs = list(reversed(pairs))
-        ordered_metadata = {
-            link: volume_metadata.get(link, {})
-            for _label, link in unique_pairs
-            if link
-        }
-        if not unique_pairs:
-            raise Exception("Aucun tome/chapitre détecté (page protégée ou structure modifiée).")
-        if emit_logs:
-            premium_count = sum(1 for meta in ordered_metadata.values() if bool(meta.get("premium")))
-            suffix = f", dont {premium_count} premium" if premium_count else ""
-            runtime_log(
-                f"{len(unique_pairs)} tomes/chapitres détectés{suffix}",
-                level="info",
-                context={"action": "parse_catalogue"},
-            )
-        return title, unique_pairs, ordered_metadata
+    family_parser = CATALOGUE_FAMILY_PARSERS.get(adapter.catalogue if adapter is not None else "")
+    if family_parser is not None:
+        parsed = family_parser(url, document, source_slug, emit_logs)
+        if parsed is not None:
+            return (title, *parsed)
 
     def is_same_site(full_link):
         link_site = get_supported_site_from_url(full_link)
@@ -5870,13 +6870,9 @@ def parse_manga_data_from_html(url, html_content, emit_logs=True):
                 pairs.append((label, full_link))
 
     # 3) Fallback regex ciblé pour les pages où la liste est injectée côté script.
-    if not pairs and source_site in ("mangas-origines.fr", "hentai-origines.fr") and source_slug:
-        if source_site == "mangas-origines.fr":
-            site_host = "mangas-origines.fr"
-            path_prefix = "oeuvre"
-        else:
-            site_host = "hentai-origines.fr"
-            path_prefix = "manga"
+    if not pairs and adapter is not None and adapter.reader == "madara" and source_slug:
+        site_host = adapter.site
+        path_prefix = adapter.path_prefix
         pattern_abs = re.compile(
             rf"https?://(?:www\.)?{re.escape(site_host)}/{path_prefix}/{re.escape(source_slug)}/(chapitre-[^\"'<>/\s]+(?:/[^\"'<>/\s]+)*)/?",
             flags=re.IGNORECASE,
@@ -5929,25 +6925,32 @@ def parse_manga_data_from_html(url, html_content, emit_logs=True):
     return title, unique_pairs, {}
 
 
+def _get_madara_ajax_executor():
+    """Pool partagé des pages AJAX Madara.
+
+    Ses threads vivent entre deux analyses et gardent donc leur session HTTP
+    (voir _get_http_session) : les connexions keep-alive sont réutilisées.
+    """
+    global MADARA_AJAX_EXECUTOR
+    with MADARA_AJAX_EXECUTOR_LOCK:
+        if MADARA_AJAX_EXECUTOR is None:
+            MADARA_AJAX_EXECUTOR = ThreadPoolExecutor(
+                max_workers=MADARA_AJAX_MAX_WORKERS,
+                thread_name_prefix="madara-ajax",
+            )
+        return MADARA_AJAX_EXECUTOR
+
+
 def fetch_mangas_origines_chapters_via_ajax(url, cookie, ua, emit_logs=True):
     """Récupère les chapitres via l'endpoint AJAX Madara (origines, hentai, toonfr)."""
-    site = get_supported_site_from_url(url)
-    if site not in ("mangas-origines.fr", "hentai-origines.fr", "toonfr.com"):
+    adapter = get_site_adapter_from_url(url)
+    if adapter is None or adapter.catalogue != "madara_ajax":
         return [], {}
 
-    parsed = urlparse(url)
+    site = adapter.site
     base_url = (url if url.endswith("/") else f"{url}/").strip()
-    if site == "mangas-origines.fr":
-        path_prefix = "oeuvre"
-    elif site == "hentai-origines.fr":
-        path_prefix = "manga"
-    else:
-        path_prefix = "webtoon"
-
-    match_slug = re.match(rf"^/{path_prefix}/([^/?#]+)/?$", parsed.path or "", flags=re.IGNORECASE)
-    if not match_slug:
-        return [], {}
-    source_slug = (match_slug.group(1) or "").strip().lower()
+    path_prefix = adapter.path_prefix
+    source_slug = get_catalogue_slug_from_url(url).lower()
     if not source_slug:
         return [], {}
 
@@ -5961,59 +6964,69 @@ def fetch_mangas_origines_chapters_via_ajax(url, cookie, ua, emit_logs=True):
         "X-Requested-With": "XMLHttpRequest",
     })
 
-    pairs = []
-    max_page = 1
-    page = 1
-    while page <= max_page:
+    log_domain = adapter.domain
+
+    def fetch_page(page):
         if site == "toonfr.com":
             endpoint = urljoin(base_url, "ajax/chapters/")
         else:
             endpoint = urljoin(base_url, f"ajax/chapters/?t={page}")
         try:
-            response = requests.post(
-                endpoint,
-                headers=headers,
-                data={},
-                impersonate="chrome",
-                timeout=15,
-            )
+            response = _http_post(endpoint, headers=headers, timeout=15)
         except Exception:
-            break
+            return None
         if int(getattr(response, "status_code", 0) or 0) != 200:
-            break
-
-        html_part = response.text or ""
-        soup = BeautifulSoup(html_part, "html.parser")
-
-        # Détecte les pages disponibles (si pagination côté site).
-        page_ids = []
-        for a in soup.select(".listing-chapters_wrap .pagination .page a[data-page]"):
-            raw_page = (a.get("data-page") or "").strip()
-            if raw_page.isdigit():
-                page_ids.append(int(raw_page))
-        if page_ids and site != "toonfr.com":
-            max_page = max(max_page, max(page_ids))
-
-        for a in soup.select("li.wp-manga-chapter a[href], .listing-chapters_wrap a[href]"):
-            href = (a.get("href") or "").strip()
-            if not href:
-                continue
-            full_link = urljoin(base_url, href)
-            if get_supported_site_from_url(full_link) != site:
-                continue
-            link_path = (urlparse(full_link).path or "").lower()
-            if f"/{path_prefix}/{source_slug}/" not in link_path:
-                continue
-            label = normalize_tome_label(a.get_text(" ", strip=True))
-            if not label:
-                chapter_slug = link_path.strip("/").split("/")[-1]
-                label = normalize_tome_label(chapter_slug.replace("-", " ").strip().title())
-            if label:
-                pairs.append((label, full_link))
+            return None
+        return _parse_madara_ajax_chapter_page(response.text or "", base_url, site, path_prefix, source_slug)
 
-        page += 1
-        if site == "toonfr.com":
+    first_page = fetch_page(1)
+    if first_page is None:
+        return [], {}
+    pairs, max_page = first_page
+    if site == "toonfr.com":
+        max_page = 1
+
+    # Page 1 donne le nombre de pages : les suivantes partent en parallele,
+    # bornees par le budget du domaine, puis sont fusionnees dans l'ordre.
+    # Une pagination tronquee peut reveler d'autres pages : on relance alors
+    # un lot sur la plage restante.
+    worker_limit = MADARA_AJAX_MAX_WORKERS
+    fragile_threads = get_fragile_site_settings(log_domain).get("max_threads")
+    if fragile_threads:
+        worker_limit = min(worker_limit, clamp_download_threads(fragile_threads))
+    next_page = 2
+    while next_page <= max_page:
+        batch = list(range(next_page, max_page + 1))
+        page_results = {}
+        executor = _get_madara_ajax_executor()
+        pending_pages = iter(batch)
+        futures = {}
+        while True:
+            for page in pending_pages:
+                futures[executor.submit(fetch_page, page)] = page
+                if len(futures) >= worker_limit:
+                    break
+            if not futures:
+                break
+            done, _running = wait(futures, return_when=FIRST_COMPLETED)
+            for future in done:
+                page = futures.pop(future)
+                try:
+                    page_results[page] = future.result()
+                except Exception:
+                    page_results[page] = None
+        # Arret a la premiere page en echec pour garder une liste contigue.
+        failed = False
+        for page in batch:
+            result = page_results.get(page)
+            if result is None:
+                failed = True
+                break
+            pairs.extend(result[0])
+            max_page = max(max_page, result[1])
+        if failed:
             break
+        next_page = batch[-1] + 1
 
     seen = set()
     unique_pairs = []
@@ -6026,11 +7039,6 @@ def fetch_mangas_origines_chapters_via_ajax(url, cookie, ua, emit_logs=True):
     if unique_pairs:
         unique_pairs.reverse()
         if emit_logs:
-            log_domain = (
-                "origines"
-                if site == "mangas-origines.fr"
-                else "hentai" if site == "hentai-origines.fr" else "toonfr"
-            )
             runtime_log(
                 f"{len(unique_pairs)} tomes/chapitres détectés via AJAX.",
                 level="info",
@@ -6039,7 +7047,77 @@ def fetch_mangas_origines_chapters_via_ajax(url, cookie, ua, emit_logs=True):
     return unique_pairs, {}
 
 
-def fetch_manga_analysis(url, cookie, ua, progress_callback=None, emit_logs=True):
+# Liens de chapitres tels que les retient le parseur de chaque famille (ou un
+# sur-ensemble) ; les familles absentes (AJAX Madara, JSON Ortega) sont
+# toujours reparsées.
+CATALOGUE_CHAPTER_ANCHOR_PATTERNS = {
+    "html": re.compile(r'<a href="[^"]+">\s*<span class="chapternum">', re.IGNORECASE),
+    "crunchy": re.compile(r"<a\b[^>]*?\bhref\s*=\s*[\"'][^\"'>]*/read/[^\"'>]*[\"']", re.IGNORECASE),
+    "scanmanga": re.compile(r"<a\b[^>]*?\bhref\s*=\s*[\"'][^\"'>]*/lecture-en-ligne/[^\"'>]*[\"']", re.IGNORECASE),
+}
+
+
+def compute_catalogue_region_hash(url, html_content):
+    """Empreinte de la zone liste des chapitres d'une page catalogue.
+
+    La zone va du premier au dernier lien de chapitre reconnu par le parseur
+    de la famille, balises intermédiaires comprises : tout chapitre ajouté,
+    où qu'il soit dans la liste, en modifie l'empreinte. Retourne une chaîne
+    vide si la famille n'est pas couverte ou si aucun lien n'est trouvé.
+    """
+    pattern = CATALOGUE_CHAPTER_ANCHOR_PATTERNS.get(get_site_catalogue_family(url))
+    text = html_content or ""
+    if pattern is None or not text:
+        return ""
+    start = end = -1
+    for match in pattern.finditer(text):
+        if start < 0:
+            start = match.start()
+        close = text.find("</a>", match.end())
+        end = close + 4 if close >= 0 else match.end()
+    if start < 0:
+        return ""
+    return hashlib.sha256(text[start:end].encode("utf-8", errors="ignore")).hexdigest()
+
+
+def _response_header(response, name):
+    headers = getattr(response, "headers", None) or {}
+    try:
+        return str(headers.get(name) or headers.get(name.lower()) or "").strip()
+    except Exception:
+        return ""
+
+
+def analysis_from_cache_entry(entry, validators=None, html_content=None):
+    """Reconstruit un `MangaAnalysis` depuis une entrée de `get_cached_analysis`."""
+    return MangaAnalysis(
+        title=entry.get("title") or "",
+        pairs=list(entry.get("pairs") or []),
+        volume_metadata=dict(entry.get("volume_metadata") or {}),
+        series_metadata=dict(entry.get("series_metadata") or {}),
+        html_content=(entry.get("html_content") or "") if html_content is None else html_content,
+        validators=dict(
+            validators
+            or {key: entry.get(key) or "" for key in ("etag", "last_modified", "content_hash")}
+        ),
+    )
+
+
+def _revalidable_cached_analysis(url, cached_analysis):
+    """Entrée de cache utilisable pour revalider le catalogue, ou {}.
+
+    Seules les familles dont la liste des chapitres est dans la page elle-même
+    (CATALOGUE_CHAPTER_ANCHOR_PATTERNS) peuvent s'appuyer sur un 304 : pour
+    Madara AJAX ou Ortega, la liste vient d'une autre requête.
+    """
+    if not isinstance(cached_analysis, dict) or not cached_analysis.get("pairs"):
+        return {}
+    if get_site_catalogue_family(url) not in CATALOGUE_CHAPTER_ANCHOR_PATTERNS:
+        return {}
+    return cached_analysis
+
+
+def fetch_manga_analysis(url, cookie, ua, progress_callback=None, emit_logs=True, cached_analysis=None):
     """
     Récupère les données d'un manga sous forme structurée.
     
@@ -6047,13 +7125,41 @@ def fetch_manga_analysis(url, cookie, ua, progress_callback=None, emit_logs=True
         url (str): URL de la page catalogue du manga
         cookie (str): Cookie cf_clearance
         ua (str): User-Agent
+        cached_analysis (dict): entrée de `get_cached_analysis(..., allow_stale=True)`;
+            ses validateurs rendent la requête conditionnelle (304 ou liste
+            des chapitres inchangée : l'analyse en cache est réutilisée).
+            Ignorée pour les familles dont la liste vient d'une autre requête.
     
     Returns:
         MangaAnalysis: titre, chapitres, métadonnées et HTML brut
     """
     if callable(progress_callback):
         progress_callback("fetch")
-    r = make_request(url, cookie, ua)
+    cached = _revalidable_cached_analysis(url, cached_analysis)
+    conditional_headers = {}
+    if cached.get("etag"):
+        conditional_headers["If-None-Match"] = cached["etag"]
+    if cached.get("last_modified"):
+        conditional_headers["If-Modified-Since"] = cached["last_modified"]
+    if conditional_headers:
+        r = make_request(url, cookie, ua, extra_headers=conditional_headers)
+    else:
+        r = make_request(url, cookie, ua)
+    if cached and int(getattr(r, "status_code", 0) or 0) == 304:
+        if emit_logs:
+            runtime_log(
+                "Catalogue inchangé (HTTP 304) : analyse en cache réutilisée.",
+                level="info",
+                context={"action": "fetch_catalogue", "domain": get_site_domain_key(url)},
+            )
+        return analysis_from_cache_entry(
+            cached,
+            validators={
+                "etag": _response_header(r, "ETag") or cached.get("etag") or "",
+                "last_modified": _response_header(r, "Last-Modified") or cached.get("last_modified") or "",
+                "content_hash": cached.get("content_hash") or "",
+            },
+        )
     if r.status_code != 200:
         final_url = getattr(r, "url", "") or ""
         detail = f"HTTP {r.status_code}"
@@ -6069,21 +7175,34 @@ def fetch_manga_analysis(url, cookie, ua, progress_callback=None, emit_logs=True
         raise SushiDLError(f"Accès refusé ou URL invalide ({detail})")
 
     html_content = r.text or ""
+    validators = {
+        "etag": _response_header(r, "ETag"),
+        "last_modified": _response_header(r, "Last-Modified"),
+        "content_hash": compute_catalogue_region_hash(url, html_content),
+    }
+    if cached and validators["content_hash"] and validators["content_hash"] == cached.get("content_hash"):
+        if emit_logs:
+            runtime_log(
+                "Liste des chapitres inchangée : analyse en cache réutilisée sans nouveau parsing.",
+                level="info",
+                context={"action": "fetch_catalogue", "domain": get_site_domain_key(url)},
+            )
+        return analysis_from_cache_entry(cached, validators=validators, html_content=html_content)
     if callable(progress_callback):
         progress_callback("parse")
-    site = get_supported_site_from_url(url)
+    document = get_catalogue_document(html_content)
     volume_metadata = {}
-    if site in ("mangas-origines.fr", "hentai-origines.fr", "toonfr.com"):
+    if get_site_catalogue_family(url) == "madara_ajax":
         parse_error = None
         try:
             title, pairs, volume_metadata = parse_manga_data_from_html(
                 url,
-                html_content,
+                document,
                 emit_logs=False,
             )
         except Exception as exc:
             parse_error = exc
-            title = extract_manga_title_from_html(url, html_content)
+            title = extract_manga_title_from_html(url, document)
             pairs = []
             volume_metadata = {}
 
@@ -6092,7 +7211,7 @@ def fetch_manga_analysis(url, cookie, ua, progress_callback=None, emit_logs=True
             pairs = ajax_pairs
             volume_metadata = ajax_metadata
             if not title:
-                title = extract_manga_title_from_html(url, html_content)
+                title = extract_manga_title_from_html(url, document)
         elif not pairs:
             if parse_error is not None:
                 raise parse_error
@@ -6100,16 +7219,17 @@ def fetch_manga_analysis(url, cookie, ua, progress_callback=None, emit_logs=True
     else:
         title, pairs, volume_metadata = parse_manga_data_from_html(
             url,
-            html_content,
+            document,
             emit_logs=emit_logs,
         )
-    series_metadata = extract_series_metadata_from_html(url, html_content, title)
+    series_metadata = extract_series_metadata_from_html(url, document, title)
     return MangaAnalysis(
         title=title or "",
         pairs=[(str(label), str(link)) for label, link in (pairs or [])],
         volume_metadata=dict(volume_metadata or {}),
         series_metadata=dict(series_metadata or {}),
         html_content=html_content,
+        validators=validators,
     )
 
 
@@ -6138,8 +7258,7 @@ fetch_manga_data.last_series_metadata = {}
 
 def build_mangas_origines_list_url(url):
     """Construit l'URL chapitre en mode liste (?style=list) pour les sites Origines."""
-    site = get_supported_site_from_url(url)
-    if site not in ("mangas-origines.fr", "hentai-origines.fr"):
+    if get_site_reader(get_site_domain_key(url)) != "madara":
         return (url or "").strip()
 
     parsed = urlparse((url or "").strip())
@@ -6311,7 +7430,7 @@ def get_images(link, cookie, ua, retries=3, delay=2, debug_mode=False, cancel_ev
 
         def trim_edge_ads_by_resolution(entries):
             """Retire les pubs probables début/fin si leur résolution est atypiquement basse."""
-            if domain not in ("origines", "hentai") or len(entries or []) < 3:
+            if get_site_reader(domain) != "madara" or len(entries or []) < 3:
                 return entries
             safe_entries = list(entries)
             middle_entries = [entry for entry in safe_entries[1:-1] if entry.get("width") and entry.get("height")]
@@ -6351,7 +7470,7 @@ def get_images(link, cookie, ua, retries=3, delay=2, debug_mode=False, cancel_ev
                     )
             return safe_entries
 
-        if domain == "ortega":
+        if get_site_reader(domain) == "ortega":
             ortega_text = (r_text or "").replace("\\/", "/")
             api_matches = re.findall(
                 r'(?:\\?["\'])url(?:\\?["\'])\s*:\s*(?:\\?["\'])(/api/chapters/[^"\'\\]+)',
@@ -6369,7 +7488,7 @@ def get_images(link, cookie, ua, retries=3, delay=2, debug_mode=False, cancel_ev
 
         # Étape 0 — Priorité à la structure Madara (mangas-origines)
         if domain == "origines":
-            soup = BeautifulSoup(r_text, "html.parser")
+            soup = bs4.BeautifulSoup(r_text, "html.parser")
             entries = collect_madara_page_entries(soup)
             entries = dedupe_entries(entries)
             entries = trim_edge_ads_by_resolution(entries)
@@ -6379,12 +7498,11 @@ def get_images(link, cookie, ua, retries=3, delay=2, debug_mode=False, cancel_ev
                 return finalize_images(images)
 
         # Étape 1 — Extraction depuis le JSON ts_reader.run
-        json_str = parse_lr(r_text, "ts_reader.run(", ");</script>", False)
-        if json_str:
+        data = extract_embedded_json(r_text, "ts_reader.run(")
+        if data is not None:
             try:
-                data = json.loads(json_str)
                 images = [
-                    normalize_image_url(img)
+                    normalize_image_url(img.replace("&amp;", "&"))
                     for img in data["sources"][0]["images"]
                 ]
                 if images:
@@ -6396,7 +7514,7 @@ def get_images(link, cookie, ua, retries=3, delay=2, debug_mode=False, cancel_ev
                     runtime_log(f"Erreur parsing JSON images: {e}", level="warning", context={"action": "extract_images"})
 
         # Étape 2 — Fallback : balises img dans #readerarea
-        soup = BeautifulSoup(r_text, "html.parser")
+        soup = bs4.BeautifulSoup(r_text, "html.parser")
 
         # Supprimer les divs inutiles pour .fr
         if domain == "fr":
@@ -6443,8 +7561,9 @@ def get_images(link, cookie, ua, retries=3, delay=2, debug_mode=False, cancel_ev
 
     attempt_count = max(1, int(retries or 1))
     domain = get_site_domain_key(link)
+    reader = get_site_reader(domain)
 
-    if domain == "scanmanga":
+    if reader == "scanmanga":
         try:
             images = fetch_scanmanga_images(
                 link,
@@ -6467,7 +7586,7 @@ def get_images(link, cookie, ua, retries=3, delay=2, debug_mode=False, cancel_ev
                 )
             return []
 
-    if domain in ("crunchyscan", "scanhentai"):
+    if reader == "browser":
         try:
             if emit_logs:
                 runtime_log(
@@ -6505,7 +7624,7 @@ def get_images(link, cookie, ua, retries=3, delay=2, debug_mode=False, cancel_ev
             return []
 
     candidate_links = [(link or "").strip()]
-    if domain in ("origines", "hentai"):
+    if reader == "madara":
         list_url = build_mangas_origines_list_url(link)
         candidate_links = [list_url] if list_url else []
         if link and link.strip() and link.strip() not in candidate_links:
@@ -6627,6 +7746,7 @@ def download_volume(
     download_threads=None,
     archive_label=None,
     perf_callback=None,
+    image_callback=None,
 ):
     """Télécharge un volume complet avec gestion de progression et archivage."""
     if cancel_event.is_set():
@@ -6653,6 +7773,7 @@ def download_volume(
                         "stage": stage,
                         "reason": str(reason),
                         "status_code": status_code,
+                        "kind": classify_download_failure(status_code, str(reason)),
                         "action": recommend_action_for_failure(status_code, str(reason)),
                     }
                 )
@@ -6770,6 +7891,7 @@ def download_volume(
                         progress_callback=progress_callback,
                         referer_url=referer_url,
                         webp2jpg_enabled=webp2jpg_enabled,
+                        image_callback=image_callback,
                     )
                 )
 
@@ -7356,7 +8478,12 @@ def load_cookie_cache():
 
 def extract_cover_url_from_html(page_url, html_content):
     """Extrait l'URL de couverture sans effectuer de telechargement."""
-    soup = BeautifulSoup(html_content or "", "html.parser")
+    document = get_catalogue_document(html_content)
+    return document.memo(("cover", (page_url or "").strip()), lambda: _extract_cover_url(page_url, document))
+
+
+def _extract_cover_url(page_url, document):
+    soup = document.soup
     page_url = (page_url or "").strip()
     if not page_url:
         og_url = soup.find("meta", attrs={"property": "og:url"})
@@ -7612,7 +8739,7 @@ class MangaApp:
                 finally:
                     done.set()
 
-            self.ui_queue.put(wrapped)
+            self._enqueue_ui_action(wrapped)
             if not done.wait(UI_CALL_TIMEOUT_SECONDS):
                 raise TimeoutError(
                     f"run_on_ui(wait=True) timeout après {UI_CALL_TIMEOUT_SECONDS}s."
@@ -7621,26 +8748,76 @@ class MangaApp:
                 raise holder["error"]
             return holder["result"]
 
-        self.ui_queue.put(lambda: callback(*args, **kwargs))
+        self._enqueue_ui_action(lambda: callback(*args, **kwargs))
         return default
 
+    def _enqueue_ui_action(self, action):
+        self.ui_queue.put((next(self.ui_sequence), action))
+
+    def post_ui_state(self, key, callback, *args, **kwargs):
+        """
+        Publie la dernière valeur d'un état affiché (progression, tome en cours...).
+        Une mise à jour pas encore rendue est remplacée par la suivante de même
+        clé : le tick UI n'affiche que le dernier instantané, dans l'ordre des
+        actions de `run_on_ui` publiées avant lui.
+        """
+        if threading.current_thread() is threading.main_thread():
+            with self.ui_state_lock:
+                self.ui_state_pending.pop(key, None)
+            callback(*args, **kwargs)
+            return
+        with self.ui_state_lock:
+            self.ui_state_pending.pop(key, None)
+            self.ui_state_pending[key] = (next(self.ui_sequence), key, callback, args, kwargs)
+
+    def publish_download_runtime_ui(self, percent=None, done=None, total=None, tome_eta=None, global_eta=None):
+        """Version coalescée de `_set_download_runtime_ui` pour les threads de fond."""
+        if percent is not None:
+            self.post_ui_state("progress", self._set_progress_ui, percent)
+        if done is not None or total is not None:
+            self.post_ui_state("progress_detail", self._set_progress_detail_ui, done, total)
+        if tome_eta is not None or global_eta is not None:
+            self.post_ui_state("eta", self._set_eta_ui, tome_eta, global_eta)
+
+    def _run_ui_action(self, action, *args, **kwargs):
+        try:
+            action(*args, **kwargs)
+        except Exception as exc:
+            emit_console_log(f"Erreur action UI planifiée: {exc}", level="error", context={"action": "ui_queue"})
+
     def process_ui_queue(self):
         """Traite les actions UI planifiées depuis les threads de fond."""
         start = time.perf_counter()
         processed = 0
+        with self.ui_state_lock:
+            states = list(self.ui_state_pending.values())
+            self.ui_state_pending.clear()
+        state_index = 0
         try:
             for _ in range(UI_QUEUE_BATCH_LIMIT):
-                action = self.ui_queue.get_nowait()
-                try:
-                    action()
-                except Exception as exc:
-                    emit_console_log(f"Erreur action UI planifiée: {exc}", level="error", context={"action": "ui_queue"})
+                sequence, action = self.ui_queue.get_nowait()
+                while state_index < len(states) and states[state_index][0] < sequence:
+                    _seq, _key, callback, args, kwargs = states[state_index]
+                    self._run_ui_action(callback, *args, **kwargs)
+                    state_index += 1
+                self._run_ui_action(action)
                 processed += 1
                 if time.perf_counter() - start >= UI_QUEUE_TIME_BUDGET_SECONDS:
                     break
         except queue.Empty:
             pass
         finally:
+            if self.ui_queue.empty():
+                for _seq, _key, callback, args, kwargs in states[state_index:]:
+                    self._run_ui_action(callback, *args, **kwargs)
+            else:
+                # Des actions plus anciennes attendent encore : les états restent en attente
+                # derrière elles, sauf s'ils ont déjà été remplacés par une valeur plus récente.
+                with self.ui_state_lock:
+                    for entry in states[state_index:]:
+                        self.ui_state_pending.setdefault(entry[1], entry)
+                    ordered = sorted(self.ui_state_pending.values(), key=lambda entry: entry[0])
+                    self.ui_state_pending = {entry[1]: entry for entry in ordered}
             delay = 5 if processed and not self.ui_queue.empty() else 30
             self.root.after(delay, self.process_ui_queue)
 
@@ -10631,8 +11808,8 @@ class MangaApp:
         return "break"
 
     def _shortcut_focus_logs(self, _event=None):
-        if hasattr(self, "log_text"):
-            self.log_text.focus_set()
+        if hasattr(self, "log_canvas"):
+            self.log_canvas.focus_set()
         self._set_workflow_step("logs", "Consulte le journal et les erreurs.")
         return "break"
 
@@ -10710,7 +11887,7 @@ class MangaApp:
             holder["result"] = bool(result)
             done.set()
 
-        manual_cloudflare = domain in ("crunchyscan", "scanhentai") and is_manual_cloudflare_fallback(reason)
+        manual_cloudflare = get_site_reader(domain) == "browser" and is_manual_cloudflare_fallback(reason)
         domain_label = f".{domain}" if domain else "du domaine"
         title = "Détection Cloudflare" if manual_cloudflare else "Cookie à renouveler"
         subtitle = (
@@ -10797,7 +11974,7 @@ class MangaApp:
         cookie_box.pack(fill="x", padx=14, pady=(0, 12))
         cookie_box.grid_columnconfigure(0, weight=1)
 
-        crunchy_cookie_fields = domain in ("crunchyscan", "scanhentai")
+        crunchy_cookie_fields = get_site_reader(domain) == "browser"
         ctk.CTkLabel(
             cookie_box,
             text=("Cookies de session lecteur" if crunchy_cookie_fields else f"Nouveau cookie {domain_label}"),
@@ -10970,13 +12147,13 @@ class MangaApp:
 
         done = threading.Event()
         holder = {"result": False, "window": None}
-        self.ui_queue.put(
+        self._enqueue_ui_action(
             lambda: self._show_cookie_refresh_prompt(domain, volume_label, reason, done, holder, source_url=source_url)
         )
 
         while not done.wait(0.2):
             if cancel_event is not None and cancel_event.is_set():
-                self.ui_queue.put(lambda: holder.get("window") and holder["window"].destroy())
+                self._enqueue_ui_action(lambda: holder.get("window") and holder["window"].destroy())
                 return False
         return bool(holder["result"])
 
@@ -11686,6 +12863,11 @@ class MangaApp:
                 launch_probe()
 
     def _run_cookie_listing_probe(self, domains=COOKIE_DOMAINS):
+        """Teste les cookies des domaines en parallèle, avec cache court par cookie + User-Agent.
+
+        Les valeurs des champs sont lues en un seul passage sur le thread UI; les
+        badges sont ensuite rafraîchis sans attendre, au fil des réponses.
+        """
         try:
             valid_domains = tuple(d for d in (domains or ()) if d in COOKIE_DOMAINS)
             if not valid_domains:
@@ -11693,19 +12875,31 @@ class MangaApp:
             if not hasattr(self, "cookie_probe_state") or not isinstance(self.cookie_probe_state, dict):
                 self.cookie_probe_state = {domain: None for domain in COOKIE_DOMAINS}
 
+            def read_cookie_values():
+                values = {}
+                for domain in valid_domains:
+                    cookie_var = self._get_cookie_var_for_domain(domain)
+                    if cookie_var is not None:
+                        values[domain] = (cookie_var.get() or "").strip()
+                return values
+
+            cookie_values = self.run_on_ui(read_cookie_values, wait=True, default={}) or {}
             probe_urls = getattr(self, "startup_cookie_listing_probe_urls", {}) or {}
+
+            def refresh_badges():
+                self.run_on_ui(lambda: self.update_cookie_status(validate=False))
+                self.run_on_ui(self.update_runtime_status)
+
+            jobs = []
             for domain in valid_domains:
-                cookie_var = self._get_cookie_var_for_domain(domain)
-                if cookie_var is None:
+                if domain not in cookie_values:
                     continue
-                cookie_value = self.run_on_ui(cookie_var.get, wait=True, default="").strip()
+                cookie_value = cookie_values[domain]
                 previous_state = self.cookie_probe_state.get(domain)
-
                 if not cookie_value:
                     if previous_state is not False:
                         self.cookie_probe_state[domain] = False
-                        self.run_on_ui(lambda: self.update_cookie_status(validate=False))
-                        self.run_on_ui(self.update_runtime_status)
+                        refresh_badges()
                     continue
 
                 probe_url = (probe_urls.get(domain) or "").strip() or STARTUP_COOKIE_LISTING_PROBE_URLS.get(domain, "")
@@ -11715,56 +12909,64 @@ class MangaApp:
                 ua_value = self.get_request_user_agent_for_domain(domain)
                 if not ua_value:
                     self.cookie_probe_state[domain] = False
-                    self.run_on_ui(lambda: self.update_cookie_status(validate=False))
-                    self.run_on_ui(self.update_runtime_status)
+                    refresh_badges()
                     continue
 
-                probe_ok = False
-                failure_reason = ""
-                try:
-                    status = evaluate_cookie_and_challenge(
-                        domain,
-                        cookie_value,
-                        ua_value,
-                        probe_url=probe_url,
-                    )
-                    probe_ok = bool(status.get("cookie_valid", False))
-                    if not probe_ok:
-                        http_status = status.get("http_status")
-                        challenge_state = status.get("challenge_state")
-                        failure_reason = (
-                            f"HTTP {http_status} | challenge={challenge_state}"
-                            if http_status
-                            else f"challenge={challenge_state}"
-                        )
-                except Exception as probe_exc:
-                    probe_ok = False
-                    failure_reason = str(probe_exc)
+                cached = get_cached_cookie_probe(domain, cookie_value, ua_value, probe_url)
+                if cached is not None:
+                    self._apply_cookie_probe_result(domain, previous_state, cached, cached=True)
+                    refresh_badges()
+                    continue
+                jobs.append((domain, cookie_value, ua_value, probe_url, previous_state))
 
-                self.cookie_probe_state[domain] = probe_ok
-                self.run_on_ui(lambda: self.update_cookie_status(validate=False))
-                self.run_on_ui(self.update_runtime_status)
+            if not jobs:
+                return
 
-                if probe_ok:
-                    if previous_state is not True:
-                        self.log(
-                            f"Test cookie .{domain} : Reussite.",
-                            level="info",
-                        )
-                else:
-                    if previous_state is not False:
-                        self.log(
-                            f"Test cookie .{domain} : Echec.",
-                            level="warning",
-                        )
-                        if failure_reason:
-                            self.log(
-                                f"Probe .{domain} non validee: {failure_reason}",
-                                level="debug",
-                            )
+            def probe(domain, cookie_value, ua_value, probe_url):
+                status = evaluate_cookie_and_challenge(
+                    domain,
+                    cookie_value,
+                    ua_value,
+                    probe_url=probe_url,
+                    timeout=COOKIE_PROBE_TIMEOUT_SECONDS,
+                )
+                store_cookie_probe_result(domain, cookie_value, ua_value, status, probe_url)
+                return status
+
+            with ThreadPoolExecutor(max_workers=min(COOKIE_PROBE_MAX_WORKERS, len(jobs))) as executor:
+                futures = {
+                    executor.submit(probe, domain, cookie_value, ua_value, probe_url): (domain, previous_state)
+                    for domain, cookie_value, ua_value, probe_url, previous_state in jobs
+                }
+                for future in as_completed(futures):
+                    domain, previous_state = futures[future]
+                    try:
+                        status = future.result()
+                    except Exception as probe_exc:
+                        status = {"cookie_valid": False, "challenge_state": "unknown", "error": str(probe_exc)}
+                    self._apply_cookie_probe_result(domain, previous_state, status)
+                    refresh_badges()
         except Exception as exc:
             self.log(f"Probe cookie non concluant: {exc}", level="debug")
 
+    def _apply_cookie_probe_result(self, domain, previous_state, status, cached=False):
+        probe_ok = bool(status.get("cookie_valid", False))
+        self.cookie_probe_state[domain] = probe_ok
+        origin = " (cache)" if cached else ""
+        if probe_ok:
+            if previous_state is not True:
+                self.log(f"Test cookie .{domain} : Reussite{origin}.", level="info")
+            return
+        if previous_state is False:
+            return
+        self.log(f"Test cookie .{domain} : Echec{origin}.", level="warning")
+        http_status = status.get("http_status")
+        challenge_state = status.get("challenge_state")
+        failure_reason = status.get("error") or (
+            f"HTTP {http_status} | challenge={challenge_state}" if http_status else f"challenge={challenge_state}"
+        )
+        self.log(f"Probe .{domain} non validee: {failure_reason}", level="debug")
+
     def _refresh_log_option_cache(self, *_args):
         """Met en cache les options de logs pour éviter les waits UI en workers."""
         try:
@@ -11802,6 +13004,9 @@ class MangaApp:
         self.total_chapters_to_process = 0
         self.chapters_done = 0
         self.ui_queue = queue.Queue()
+        self.ui_sequence = itertools.count()
+        self.ui_state_lock = threading.Lock()
+        self.ui_state_pending = {}
         ctk.set_appearance_mode("light")
         ctk.set_default_color_theme("blue")
         self.root = ctk.CTk()
@@ -11814,9 +13019,13 @@ class MangaApp:
         self.root.minsize(940, 1040)
         self.root.maxsize(self.root.winfo_screenwidth(), 1070)
         self.root.resizable(True, True)
-        self.log_entries = []
-        self.log_lock = threading.Lock()
-        self.max_log_entries = 5000
+        self.log_entries = LogRingBuffer(GUI_LOG_RING_CAPACITY)
+        self.log_view_rows = []
+        self.log_view_top = 0
+        self.log_view_row_spans = []
+        self.log_view_selected_seq = None
+        self.log_search_text = ""
+        self.log_search_after_id = None
         self.log_ready = False
         self.gui_log_queue = queue.Queue()
         self.gui_log_flush_lock = threading.Lock()
@@ -12117,13 +13326,11 @@ class MangaApp:
             "level": normalized_level,
             "message": full_message,
         }
-        with self.log_lock:
-            self.log_entries.append(entry)
-            if len(self.log_entries) > self.max_log_entries:
-                self.log_entries = self.log_entries[-self.max_log_entries:]
+        self.log_entries.append(entry)
+        record_runtime_log(text, level=normalized_level, context=context)
 
         should_emit_debug = not (normalized_level == "debug" and not verbose_enabled)
-        if should_emit_debug and getattr(self, "log_ready", False) and hasattr(self, "log_text"):
+        if should_emit_debug and getattr(self, "log_ready", False) and hasattr(self, "log_canvas"):
             self._queue_gui_log_entry(entry)
 
         if normalized_level == "debug" and not verbose_enabled:
@@ -12166,9 +13373,20 @@ class MangaApp:
         verbose_enabled = bool(self.verbose_logs.get())
         if not verbose_enabled and level == "debug":
             return False
+        if selected != "all" and level != selected:
+            return False
+        needle = getattr(self, "log_search_text", "")
+        return not needle or needle in str(entry.get("message") or "").lower()
+
+    def _log_view_levels(self):
+        """Niveaux affichés selon le filtre : None pour tous, sinon la liste des index à lire."""
+        selected = (self.log_filter_level.get() or "all").strip().lower()
+        verbose_enabled = bool(self.verbose_logs.get())
         if selected == "all":
-            return True
-        return level == selected
+            return None if verbose_enabled else [level for level in LOG_LEVELS if level != "debug"]
+        if selected == "debug" and not verbose_enabled:
+            return []
+        return [selected]
 
     def _format_log_entry(self, entry):
         """Formate une entrée pour affichage dans le widget log."""
@@ -12259,7 +13477,7 @@ class MangaApp:
 
     def _flush_gui_log_entries(self):
         """Insère un lot de logs dans le widget journal en une seule mise à jour."""
-        if not getattr(self, "log_ready", False) or not hasattr(self, "log_text"):
+        if not getattr(self, "log_ready", False) or not hasattr(self, "log_canvas"):
             with self.gui_log_flush_lock:
                 self.gui_log_flush_scheduled = False
             return
@@ -12285,16 +13503,13 @@ class MangaApp:
                 break
 
         if drained:
-            self.log_text.configure(state="normal")
+            rows = []
             for entry in drained:
                 if not self._should_display_log_entry(entry):
                     continue
                 entry["message"] = repair_mojibake_text(entry.get("message", ""))
-                level = normalize_log_level(entry.get("level", "info"))
-                self._insert_log_line(self._format_log_entry(entry), level)
-            self.log_text.configure(state="disabled")
-            if self.log_autoscroll.get():
-                self._scroll_log_to_bottom()
+                rows.append(entry)
+            self._append_log_view_rows(rows)
 
         if not self.gui_log_queue.empty():
             self.root.after(GUI_LOG_FLUSH_INTERVAL_MS, self._flush_gui_log_entries)
@@ -12308,31 +13523,164 @@ class MangaApp:
         if has_new_entries:
             self.root.after(GUI_LOG_FLUSH_INTERVAL_MS, self._flush_gui_log_entries)
 
-    def _insert_log_line(self, text, level):
-        """Insere une ligne dans le journal sans laisser de ligne vide finale."""
-        if self.log_text.compare("end-1c", ">", "1.0"):
-            self.log_text.insert("end-1c", "\n")
-        self.log_text.insert("end-1c", text, level)
+    def _append_log_view_rows(self, rows):
+        """Ajoute des lignes à la vue journal, bornée comme le journal en mémoire."""
+        if not rows:
+            return
+        self.log_view_rows.extend(rows)
+        overflow = len(self.log_view_rows) - GUI_LOG_RING_CAPACITY
+        if overflow > 0:
+            del self.log_view_rows[:overflow]
+            self.log_view_top = max(0, self.log_view_top - overflow)
+        self._render_log_view(scroll_to_end=bool(self.log_autoscroll.get()))
+
+    def _log_view_visible_count(self):
+        canvas = getattr(self, "log_canvas", None)
+        if canvas is None:
+            return 1
+        return max(1, (int(canvas.winfo_height() or 0) - 8) // self.log_line_height)
+
+    def _log_entry_wrapped_lines(self, entry, wrap_width):
+        """Lignes affichées pour une entrée, recalculées seulement si la largeur change."""
+        cached = entry.get("_wrapped")
+        if cached is None or cached[0] != wrap_width:
+            line = entry.get("_line")
+            if line is None:
+                line = self._format_log_entry(entry)
+                entry["_line"] = line
+            cached = (wrap_width, wrap_log_line(line, wrap_width, self.log_font.measure))
+            entry["_wrapped"] = cached
+        return cached[1]
+
+    def _render_log_view(self, scroll_to_end=False):
+        """Dessine uniquement les lignes visibles du journal (vue virtualisée, retour à la ligne au mot)."""
+        canvas = getattr(self, "log_canvas", None)
+        if canvas is None:
+            return
+        rows = self.log_view_rows
+        visible = self._log_view_visible_count()
+        width = int(canvas.winfo_width() or 0)
+        wrap_width = max(40, width - 16)
+        max_top = len(rows)
+        used_lines = 0
+        while max_top > 0:
+            needed = len(self._log_entry_wrapped_lines(rows[max_top - 1], wrap_width))
+            if used_lines and used_lines + needed > visible:
+                break
+            used_lines += needed
+            max_top -= 1
+        if scroll_to_end:
+            self.log_view_top = max_top
+        self.log_view_top = max(0, min(int(self.log_view_top), max_top))
+        canvas.delete("log_line")
+        line_height = self.log_line_height
+        bottom = 4 + visible * line_height
+        spans = []
+        y = 4
+        for index in range(self.log_view_top, len(rows)):
+            if y >= bottom:
+                break
+            entry = rows[index]
+            lines = self._log_entry_wrapped_lines(entry, wrap_width)
+            height = len(lines) * line_height
+            if entry.get("seq") is not None and entry.get("seq") == self.log_view_selected_seq:
+                canvas.create_rectangle(0, y, width, y + height, fill=self.palette["card_alt"], outline="", tags="log_line")
+            canvas.create_text(
+                8,
+                y + 1,
+                anchor="nw",
+                text="\n".join(lines),
+                fill=self.log_level_colors.get(entry.get("level"), self.palette["text"]),
+                font=self.log_font,
+                tags="log_line",
+            )
+            spans.append((y, y + height, index))
+            y += height
+        self.log_view_row_spans = spans
+        if self.log_view_top == 0 and max_top == 0:
+            self.log_scrollbar.set(0.0, 1.0)
+        else:
+            self.log_scrollbar.set(self.log_view_top / len(rows), (self.log_view_top + len(spans)) / len(rows))
+
+    def _scroll_log_view(self, delta):
+        self.log_view_top += int(delta)
+        self._render_log_view()
+
+    def _on_log_scrollbar_command(self, *args):
+        if not args:
+            return
+        if args[0] == "moveto":
+            try:
+                self.log_view_top = int(float(args[1]) * len(self.log_view_rows))
+            except (TypeError, ValueError):
+                return
+            self._render_log_view()
+        elif args[0] == "scroll" and len(args) >= 3:
+            try:
+                amount = int(args[1])
+            except (TypeError, ValueError):
+                return
+            step = self._log_view_visible_count() if args[2] == "pages" else 1
+            self._scroll_log_view(amount * step)
 
-    def _scroll_log_to_bottom(self):
-        """Place la vue sur la derniere ligne utile du journal."""
+    def _on_log_mousewheel(self, event):
+        canvas = getattr(self, "log_canvas", None)
+        if canvas is None:
+            return
         try:
-            self.log_text.see("end-2c")
+            if not canvas.winfo_ismapped():
+                return
+            root_x = int(self.root.winfo_pointerx())
+            root_y = int(self.root.winfo_pointery())
+            left = int(canvas.winfo_rootx())
+            top = int(canvas.winfo_rooty())
+            if not (left <= root_x <= left + int(canvas.winfo_width()) and top <= root_y <= top + int(canvas.winfo_height())):
+                return
         except Exception:
-            self.log_text.see("end-1c")
-
-    def _append_log_entry(self, entry):
-        """Ajoute une entrée dans la vue GUI si elle passe les filtres."""
-        if not self._should_display_log_entry(entry):
             return
-        entry["message"] = repair_mojibake_text(entry.get("message", ""))
-        level = normalize_log_level(entry.get("level", "info"))
-        formatted = self._format_log_entry(entry)
-        self.log_text.configure(state="normal")
-        self._insert_log_line(formatted, level)
-        self.log_text.configure(state="disabled")
-        if self.log_autoscroll.get():
-            self._scroll_log_to_bottom()
+        delta = 0
+        if hasattr(event, "delta") and int(event.delta or 0):
+            delta = -3 if event.delta > 0 else 3
+        elif getattr(event, "num", None) == 4:
+            delta = -3
+        elif getattr(event, "num", None) == 5:
+            delta = 3
+        if delta:
+            self._scroll_log_view(delta)
+        return "break"
+
+    def _on_log_click(self, event):
+        self.log_canvas.focus_set()
+        for top, bottom, row in self.log_view_row_spans:
+            if top <= int(event.y) < bottom and row < len(self.log_view_rows):
+                self.log_view_selected_seq = self.log_view_rows[row].get("seq")
+                self._render_log_view()
+                break
+
+    def copy_selected_log_line(self, _event=None):
+        """Copie la ligne sélectionnée du journal (Ctrl+C)."""
+        selected = self.log_view_selected_seq
+        for entry in self.log_view_rows:
+            if entry.get("seq") == selected:
+                self.root.clipboard_clear()
+                self.root.clipboard_append(entry.get("_line") or self._format_log_entry(entry))
+                break
+        return "break"
+
+    def _schedule_log_search(self, _event=None):
+        if self.log_search_after_id is not None:
+            try:
+                self.root.after_cancel(self.log_search_after_id)
+            except Exception:
+                pass
+        self.log_search_after_id = self.root.after(GUI_LOG_SEARCH_DEBOUNCE_MS, self._apply_log_search)
+
+    def _apply_log_search(self):
+        self.log_search_after_id = None
+        needle = (self.log_search_entry.get() or "").strip().lower()
+        if needle != self.log_search_text:
+            self.log_search_text = needle
+            self.refresh_log_view()
 
     def refresh_log_view(self, *_args):
         """Rafraîchit le journal GUI selon les filtres actifs."""
@@ -12343,29 +13691,22 @@ class MangaApp:
             pass
         with self.gui_log_flush_lock:
             self.gui_log_flush_scheduled = False
-        with self.log_lock:
-            entries_snapshot = list(self.log_entries)
-        self.log_text.configure(state="normal")
-        self.log_text.delete("1.0", "end")
-        for entry in entries_snapshot:
-            entry["message"] = repair_mojibake_text(entry.get("message", ""))
-            if not self._should_display_log_entry(entry):
-                continue
-            level = normalize_log_level(entry.get("level", "info"))
-            self._insert_log_line(self._format_log_entry(entry), level)
-        self.log_text.configure(state="disabled")
-        if self.log_autoscroll.get():
-            self._scroll_log_to_bottom()
+        levels = self._log_view_levels()
+        self.log_view_rows = self.log_entries.select(levels, self.log_search_text) if levels != [] else []
+        self._render_log_view(scroll_to_end=bool(self.log_autoscroll.get()))
 
     def clear_log_entries(self):
-        """Efface le journal en mémoire et dans l'UI."""
-        with self.log_lock:
-            self.log_entries.clear()
+        """Efface le journal en mémoire et dans l'UI (le fichier d'historique est conservé)."""
+        self.log_entries.clear()
+        self.log_view_selected_seq = None
         self.refresh_log_view()
 
+    def _visible_log_text(self):
+        return "\n".join(entry.get("_line") or self._format_log_entry(entry) for entry in self.log_view_rows)
+
     def copy_visible_logs(self):
         """Copie le contenu visible du journal dans le presse-papiers."""
-        content = self.log_text.get("1.0", "end-1c")
+        content = self._visible_log_text()
         if not content.strip():
             self.log("Le journal est vide.", level="warning")
             return
@@ -12375,7 +13716,7 @@ class MangaApp:
 
     def export_visible_logs(self):
         """Exporte le journal visible dans un fichier texte."""
-        content = self.log_text.get("1.0", "end-1c")
+        content = self._visible_log_text()
         if not content.strip():
             self.log("Le journal est vide.", level="warning")
             return
@@ -13287,7 +14628,13 @@ class MangaApp:
             for index, job in enumerate(jobs, start=1):
                 url = job["url"]
                 try:
-                    analysis = fetch_manga_analysis(url, job.get("cookie") or "", job.get("ua") or "", emit_logs=False)
+                    analysis = fetch_manga_analysis(
+                        url,
+                        job.get("cookie") or "",
+                        job.get("ua") or "",
+                        emit_logs=False,
+                        cached_analysis=get_cached_analysis(url, job.get("ua") or "", allow_stale=True),
+                    )
                     store_cached_analysis(
                         url,
                         job.get("ua") or "",
@@ -13296,6 +14643,7 @@ class MangaApp:
                         analysis.volume_metadata,
                         analysis.series_metadata,
                         analysis.html_content,
+                        analysis.validators,
                     )
                     summary = update_catalog_state(
                         url,
@@ -13517,6 +14865,19 @@ class MangaApp:
         )
         self.log_filter_combo.pack(side="left")
         self.log_filter_combo.set("all")
+        self.log_search_entry = ctk.CTkEntry(
+            left_toolbar,
+            width=180,
+            height=compact_button_h,
+            corner_radius=6,
+            placeholder_text="Rechercher",
+            border_color=self.palette["border"],
+            fg_color=self.palette["input_bg"],
+            text_color=self.palette["text"],
+            font=body_font,
+        )
+        self.log_search_entry.pack(side="left", padx=(10, 0))
+        self.log_search_entry.bind("<KeyRelease>", self._schedule_log_search, add="+")
 
         self.log_autoscroll_checkbox = ctk.CTkCheckBox(
             log_toolbar,
@@ -13552,28 +14913,60 @@ class MangaApp:
                 font=button_font,
             ).pack(side="right", padx=(6, 0))
 
-        self.log_text = ctk.CTkTextbox(
+        log_view_shell = ctk.CTkFrame(
             log_frame,
-            height=220,
             corner_radius=6,
             border_width=1,
             border_color=self.palette["border"],
             fg_color=self.palette["log_bg"],
-            text_color=self.palette["text"],
-            scrollbar_button_color="#c5d3e2",
-            scrollbar_button_hover_color="#aebfd1",
-            font=("Consolas", 11),
-            wrap="word",
         )
-        self.log_text.grid(row=1, column=0, sticky="nsew", padx=14, pady=(0, 14))
-        self.log_text.configure(state="disabled")
-
-        self.log_text.tag_config("debug", foreground="#6b7280")
-        self.log_text.tag_config("success", foreground=self.palette["success_text"])
-        self.log_text.tag_config("info", foreground="#2f67b1")
-        self.log_text.tag_config("error", foreground=self.palette["danger_text"])
-        self.log_text.tag_config("warning", foreground="#8a6a32")
-        self.log_text.tag_config("cbz", foreground="#6d4ec7")
+        log_view_shell.grid(row=1, column=0, sticky="nsew", padx=14, pady=(0, 14))
+        self.log_font = tkfont.Font(family="Consolas", size=11)
+        self.log_line_height = int(self.log_font.metrics("linespace")) + 3
+        self.log_level_colors = {
+            "debug": "#6b7280",
+            "success": self.palette["success_text"],
+            "info": "#2f67b1",
+            "error": self.palette["danger_text"],
+            "warning": "#8a6a32",
+            "cbz": "#6d4ec7",
+        }
+        self.log_canvas = tk.Canvas(
+            log_view_shell,
+            height=220,
+            bg=self.palette["log_bg"],
+            highlightthickness=0,
+            bd=0,
+            relief="flat",
+            takefocus=1,
+        )
+        self.log_canvas.pack(side="left", fill="both", expand=True, padx=(6, 0), pady=6)
+        self.log_scrollbar = ctk.CTkScrollbar(
+            log_view_shell,
+            orientation="vertical",
+            command=self._on_log_scrollbar_command,
+            fg_color=self.palette["log_bg"],
+            button_color="#c5d3e2",
+            button_hover_color="#aebfd1",
+            width=14,
+        )
+        self.log_scrollbar.pack(side="right", fill="y", padx=(4, 6), pady=6)
+        self.log_canvas.bind("<Configure>", lambda _e: self._render_log_view(), add="+")
+        self.log_canvas.bind("<Button-1>", self._on_log_click, add="+")
+        self.log_canvas.bind("<Control-c>", self.copy_selected_log_line, add="+")
+        for sequence, delta in (("<Up>", -1), ("<Down>", 1)):
+            self.log_canvas.bind(sequence, lambda _e, d=delta: self._scroll_log_view(d), add="+")
+        for sequence, direction in (("<Prior>", -1), ("<Next>", 1)):
+            self.log_canvas.bind(
+                sequence,
+                lambda _e, d=direction: self._scroll_log_view(d * self._log_view_visible_count()),
+                add="+",
+            )
+        self.log_canvas.bind("<Home>", lambda _e: self._scroll_log_view(-len(self.log_view_rows)), add="+")
+        self.log_canvas.bind("<End>", lambda _e: self._render_log_view(scroll_to_end=True), add="+")
+        self.root.bind_all("<MouseWheel>", self._on_log_mousewheel, add="+")
+        self.root.bind_all("<Button-4>", self._on_log_mousewheel, add="+")
+        self.root.bind_all("<Button-5>", self._on_log_mousewheel, add="+")
 
         font_label = ("Segoe UI", 12)
         font_entry = ("Segoe UI", 12)
@@ -15445,8 +16838,25 @@ class MangaApp:
         domain = self.get_domain_from_url(url)
         return self.get_request_user_agent_for_domain(domain)
 
-    def get_images_with_cookie_recovery(self, link, volume_label=None, cancel_event=None):
-        """Extrait les images en proposant un renouvellement de cookie si l'accès est refusé."""
+    def upcoming_reader_links(self, pairs, output_root, title):
+        """Chapitres lecteur suivants à précharger, hors archives CBZ déjà présentes."""
+        links = []
+        for vol, link in pairs:
+            if get_site_reader(self.get_domain_from_url(link)) != "browser":
+                break
+            if is_volume_archive_present(output_root, title, vol):
+                continue
+            links.append(link)
+            if len(links) >= CRUNCHY_READER_POOL_MAX:
+                break
+        return links
+
+    def get_images_with_cookie_recovery(self, link, volume_label=None, cancel_event=None, upcoming_links=()):
+        """Extrait les images en proposant un renouvellement de cookie si l'accès est refusé.
+
+        `upcoming_links` sont les chapitres suivants du lot : sur CrunchyScan et
+        Scan-Hentai, leur lecteur est ouvert en parallèle sur les sessions libres.
+        """
         safe_link = (link or "").strip()
         safe_volume = normalize_tome_label(volume_label or "") or "Chapitre"
         domain = self.get_domain_from_url(safe_link)
@@ -15472,7 +16882,7 @@ class MangaApp:
                 return
             extraction_state.update({"done": done, "total": total, "timestamp": now})
             percent = (float(done) / float(total)) * 100.0
-            self.run_on_ui(self._set_download_runtime_ui, percent, done, total)
+            self.publish_download_runtime_ui(percent, done, total)
 
         while True:
             if cancel_event is not None and cancel_event.is_set():
@@ -15480,6 +16890,9 @@ class MangaApp:
 
             cookie = self.get_cookie(safe_link)
             ua = self.get_request_user_agent_for_url(safe_link)
+            if upcoming_links and get_site_reader(domain) == "browser":
+                prefetch_crunchy_reader_chapters(upcoming_links, cookie, ua, cancel_event=cancel_event, current_link=safe_link)
+                upcoming_links = ()
             try:
                 extraction_started_at = time.perf_counter()
                 images = get_images(
@@ -15487,7 +16900,7 @@ class MangaApp:
                     cookie,
                     ua,
                     cancel_event=cancel_event,
-                    extraction_progress=reader_extraction_progress if domain in ("crunchyscan", "scanhentai") else None,
+                    extraction_progress=reader_extraction_progress if get_site_reader(domain) == "browser" else None,
                 )
                 log_perf(self.log, "extraction images", extraction_started_at, tome=safe_volume, images=len(images))
                 self.run_on_ui(
@@ -15501,7 +16914,7 @@ class MangaApp:
                 raise
             except Exception as exc:
                 reason = str(exc)
-                if domain in ("crunchyscan", "scanhentai") and is_manual_cloudflare_fallback(reason):
+                if get_site_reader(domain) == "browser" and is_manual_cloudflare_fallback(reason):
                     self.log(
                         f"Cloudflare détecté pour {safe_volume}: arrêt sans renouvellement de cookie.",
                         level="warning",
@@ -15510,7 +16923,7 @@ class MangaApp:
                         "Cloudflare détecté dans le lecteur; chapitre arrêté sans relance de cookie."
                     )
                 cloudflare_persists = (
-                    domain in ("crunchyscan", "scanhentai")
+                    get_site_reader(domain) == "browser"
                     and is_manual_cloudflare_fallback(reason)
                     and cookie_refresh_attempted
                 )
@@ -16037,12 +17450,12 @@ class MangaApp:
                                 reason = "Espace disque insuffisant pour poursuivre la file."
                                 self.log(reason, level="error")
                                 self.add_volume_error(vol, "disk", reason, None, "Libère de l'espace disque puis relance la file.")
-                                self.run_on_ui(self._set_volume_runtime_status, link, "ERR")
+                                self.post_ui_state(("volume_status", link), self._set_volume_runtime_status, link, "ERR")
                                 source_failed = True
                                 break
                         except OSError:
                             pass
-                        self.run_on_ui(self._set_current_volume_ui, vol, link)
+                        self.post_ui_state("current_volume", self._set_current_volume_ui, vol, link)
                         self.run_on_ui(
                             update_queue_item_ui,
                             queue_index,
@@ -16060,7 +17473,7 @@ class MangaApp:
                             existing_cbz = os.path.join(output_root, clean_title, f"{clean_title} - {clean_archive_label}.cbz")
                             if os.path.isfile(existing_cbz) and os.path.getsize(existing_cbz) > 10_000:
                                 self.log(f"File: CBZ déjà existant, saut de {vol}.", level="info")
-                                self.run_on_ui(self._set_volume_runtime_status, link, "OK")
+                                self.post_ui_state(("volume_status", link), self._set_volume_runtime_status, link, "OK")
                                 self.run_on_ui(
                                     update_queue_item_ui,
                                     queue_index,
@@ -16071,18 +17484,24 @@ class MangaApp:
                                     "déjà présent",
                                 )
                                 continue
-                        self.run_on_ui(self._set_volume_runtime_status, link, "DL")
+                        self.post_ui_state(("volume_status", link), self._set_volume_runtime_status, link, "DL")
                         try:
                             cookie_item, ua_item, images = self.get_images_with_cookie_recovery(
                                 link,
                                 volume_label=vol,
                                 cancel_event=self.cancel_event,
+                                upcoming_links=self.upcoming_reader_links(
+                                    [(next_vol, next_link) for _next_index, next_vol, next_link in selected_pairs[item_index:]],
+                                    output_root,
+                                    title,
+                                ),
                             )
                         except Exception as exc:
                             reason = str(exc)
                             source_failed = True
                             self.log(f"File: échec images {vol}: {reason}", level="error")
-                            self.run_on_ui(
+                            self.post_ui_state(
+                                ("volume_status", link),
                                 self._set_volume_runtime_status,
                                 link,
                                 "CF" if is_reader_cloudflare_challenge(reason) else "ERR",
@@ -16103,7 +17522,7 @@ class MangaApp:
                             reason = "Échec récupération images."
                             source_failed = True
                             self.log(f"File: {reason} ({vol})", level="warning")
-                            self.run_on_ui(self._set_volume_runtime_status, link, "ERR")
+                            self.post_ui_state(("volume_status", link), self._set_volume_runtime_status, link, "ERR")
                             self.run_on_ui(
                                 update_queue_item_ui,
                                 queue_index,
@@ -16130,13 +17549,13 @@ class MangaApp:
                             progress_state["last_done"] = int(done or 0)
                             progress_state["last_ts"] = now
                             item_percent = (float(done or 0) / float(total_images or 1)) if total_images else 0.0
-                            self.run_on_ui(
-                                self._set_download_runtime_ui,
+                            self.publish_download_runtime_ui(
                                 ((base + item_percent) / count) * 100.0,
                                 done,
                                 total_images,
                             )
-                            self.run_on_ui(
+                            self.post_ui_state(
+                                ("queue_item", queue_index, item_index),
                                 update_queue_item_ui,
                                 queue_index,
                                 queue_total,
@@ -16191,7 +17610,7 @@ class MangaApp:
                         if result is False:
                             self.log(f"File: élément non finalisé: {vol}", level="warning")
                             source_failed = True
-                            self.run_on_ui(self._set_volume_runtime_status, link, "ERR")
+                            self.post_ui_state(("volume_status", link), self._set_volume_runtime_status, link, "ERR")
                             self.run_on_ui(
                                 update_queue_item_ui,
                                 queue_index,
@@ -16204,7 +17623,7 @@ class MangaApp:
                         elif result is None and self.cancel_event.is_set():
                             break
                         else:
-                            self.run_on_ui(self._set_volume_runtime_status, link, "OK")
+                            self.post_ui_state(("volume_status", link), self._set_volume_runtime_status, link, "OK")
                             self.run_on_ui(
                                 update_queue_item_ui,
                                 queue_index,
@@ -16232,10 +17651,11 @@ class MangaApp:
                     persist_queue_state()
                     self.log("File terminée avec des éléments à reprendre.", level="warning")
             finally:
+                discard_crunchy_reader_prefetch()
                 self.download_in_progress = False
                 self.cancel_event.clear()
                 self.run_on_ui(self._set_download_controls, False)
-                self.run_on_ui(self._set_progress_detail_ui, None, None)
+                self.post_ui_state("progress_detail", self._set_progress_detail_ui, None, None)
                 self.run_on_ui(self.root.title, f"{APP_NAME} v{APP_VERSION}")
 
         threading.Thread(target=task, daemon=True, name="download-queue").start()
@@ -16511,15 +17931,9 @@ class MangaApp:
             analysis_started_at = time.perf_counter()
             try:
                 set_analysis_step("fetch")
-                cached_analysis = get_cached_analysis(url, ua_for_url) if use_analysis_cache else None
-                if cached_analysis:
-                    analysis = MangaAnalysis(
-                        title=cached_analysis["title"],
-                        pairs=cached_analysis["pairs"],
-                        volume_metadata=dict(cached_analysis.get("volume_metadata") or {}),
-                        series_metadata=dict(cached_analysis.get("series_metadata") or {}),
-                        html_content=cached_analysis.get("html_content", ""),
-                    )
+                cached_analysis = get_cached_analysis(url, ua_for_url, allow_stale=True)
+                if cached_analysis and use_analysis_cache and not cached_analysis.get("stale"):
+                    analysis = analysis_from_cache_entry(cached_analysis)
                     self.log(
                         f"Analyse chargée depuis le cache disque ({int(cached_analysis.get('age_seconds') or 0)}s).",
                         level="info",
@@ -16530,6 +17944,8 @@ class MangaApp:
                         cookie,
                         ua_for_url,
                         progress_callback=fetch_progress_callback,
+                        # Ctrl+R force une analyse complète : aucun validateur envoyé.
+                        cached_analysis=cached_analysis if use_analysis_cache else None,
                     )
                     store_cached_analysis(
                         url,
@@ -16539,6 +17955,7 @@ class MangaApp:
                         analysis.volume_metadata,
                         analysis.series_metadata,
                         analysis.html_content,
+                        analysis.validators,
                     )
                 title = analysis.title
                 pairs = analysis.pairs
@@ -16599,7 +18016,7 @@ class MangaApp:
                             True,
                             f"{len(self.pairs)} tome(s)/chapitre(s) détecté(s)",
                         )
-                        if domain in ("crunchyscan", "scanhentai"):
+                        if get_site_reader(domain) == "browser":
                             self.log(
                                 f"Auth .{domain} validée pour le catalogue. Le lecteur /read/... peut exiger un cookie Cloudflare renouvelé depuis une page chapitre.",
                                 level="success",
@@ -17000,7 +18417,7 @@ class MangaApp:
                     return
                 remaining = max(0, total_volumes - completed_volumes)
                 if remaining == 0:
-                    self.run_on_ui(self._set_eta_ui, None, 0)
+                    self.post_ui_state("eta", self._set_eta_ui, None, 0)
                     return
                 if completed_volume_durations:
                     avg_duration = sum(completed_volume_durations) / len(completed_volume_durations)
@@ -17009,9 +18426,9 @@ class MangaApp:
                 else:
                     avg_duration = None
                 global_eta = (avg_duration * remaining) if avg_duration is not None else None
-                self.run_on_ui(self._set_eta_ui, None, global_eta)
+                self.post_ui_state("eta", self._set_eta_ui, None, global_eta)
 
-            for vol, link in selected:
+            for position, (vol, link) in enumerate(selected):
                 if self.cancel_event.is_set():
                     break
                 effective_delay = delay_between_volumes + adaptive_pause
@@ -17023,7 +18440,7 @@ class MangaApp:
                         reason = "Espace disque insuffisant pour poursuivre le téléchargement."
                         self.log(reason, level="error")
                         self.add_volume_error(vol, "disk", reason, None, "Libère de l'espace disque puis relance les erreurs.")
-                        self.run_on_ui(self._set_volume_runtime_status, link, "ERR")
+                        self.post_ui_state(("volume_status", link), self._set_volume_runtime_status, link, "ERR")
                         failed.append((vol, link))
                         halted_for_disk = True
                         break
@@ -17035,8 +18452,8 @@ class MangaApp:
                 domain = self.get_domain_from_url(link)
                 cookie = self.get_cookie(link)
                 self.run_on_ui(self.root.title, f"SushiDL - {vol}")
-                self.run_on_ui(self._set_current_volume_ui, vol, link)
-                self.run_on_ui(self._set_volume_runtime_status, link, "DL")
+                self.post_ui_state("current_volume", self._set_current_volume_ui, vol, link)
+                self.post_ui_state(("volume_status", link), self._set_volume_runtime_status, link, "DL")
 
                 if not cookie and domain in COOKIE_DOMAINS:
                     self.log(
@@ -17060,30 +18477,32 @@ class MangaApp:
                             level="info",
                             context={"domain": domain, "tome": vol, "action": "skip_existing"},
                         )
-                        self.run_on_ui(self._set_progress_detail_ui, None, None)
+                        self.post_ui_state("progress_detail", self._set_progress_detail_ui, None, None)
                         completed_volumes += 1
                         push_idle_global_eta()
                         continue
 
-                self.run_on_ui(self._set_progress_ui, 0)
+                self.post_ui_state("progress", self._set_progress_ui, 0)
 
                 try:
                     cookie, ua, images = self.get_images_with_cookie_recovery(
                         link,
                         volume_label=vol,
                         cancel_event=self.cancel_event,
+                        upcoming_links=self.upcoming_reader_links(selected[position + 1:], output_root, self.title),
                     )
                 except DownloadCancelled:
                     break
                 except Exception as exc:
                     volume_failed = True
                     reason = str(exc)
-                    self.run_on_ui(
+                    self.post_ui_state(
+                        ("volume_status", link),
                         self._set_volume_runtime_status,
                         link,
                         "CF" if is_reader_cloudflare_challenge(reason) else "ERR",
                     )
-                    self.run_on_ui(self._set_progress_detail_ui, None, None)
+                    self.post_ui_state("progress_detail", self._set_progress_detail_ui, None, None)
                     self.log(
                         f"Échec récupération images: {reason}",
                         level="warning",
@@ -17108,7 +18527,7 @@ class MangaApp:
                 )
 
                 if images:
-                    self.run_on_ui(self._set_progress_detail_ui, 0, len(images))
+                    self.post_ui_state("progress_detail", self._set_progress_detail_ui, 0, len(images))
                     progress_state = {"last_done": 0, "last_ts": 0.0, "last_ui_done": -1, "last_ui_ts": 0.0}
                     volume_error_state = {"reported": False, "stage": "", "reason": ""}
 
@@ -17139,7 +18558,7 @@ class MangaApp:
                         if should_update_ui:
                             progress_state["last_ui_done"] = done
                             progress_state["last_ui_ts"] = now
-                            self.run_on_ui(self._set_download_runtime_ui, percent, done, total_images)
+                            self.publish_download_runtime_ui(percent, done, total_images)
 
                         if (
                             done == total_images
@@ -17178,7 +18597,7 @@ class MangaApp:
                             global_eta = max(0, base_current) + (remaining_after_current * avg_volume)
                         else:
                             global_eta = None
-                        self.run_on_ui(self._set_download_runtime_ui, None, None, None, tome_eta, global_eta)
+                        self.publish_download_runtime_ui(None, None, None, tome_eta, global_eta)
 
                     self.log(
                         "Début du téléchargement.",
@@ -17216,7 +18635,7 @@ class MangaApp:
 
                     if dl_result is False:
                         volume_failed = True
-                        self.run_on_ui(self._set_volume_runtime_status, link, "ERR")
+                        self.post_ui_state(("volume_status", link), self._set_volume_runtime_status, link, "ERR")
                         self.log(
                             "Tome non finalisé.",
                             level="warning",
@@ -17235,9 +18654,9 @@ class MangaApp:
                         if should_retry:
                             failed.append((vol, link))
                     else:
-                        self.run_on_ui(self._set_volume_runtime_status, link, "OK")
-                        self.run_on_ui(self._set_current_volume_ui, vol, link, True)
-                        self.run_on_ui(self._set_progress_ui, 100)
+                        self.post_ui_state(("volume_status", link), self._set_volume_runtime_status, link, "OK")
+                        self.post_ui_state("current_volume", self._set_current_volume_ui, vol, link, True)
+                        self.post_ui_state("progress", self._set_progress_ui, 100)
                         elapsed = max(0.0, time.time() - volume_start)
                         completed_volume_durations.append(elapsed)
                         self.log(
@@ -17247,8 +18666,8 @@ class MangaApp:
                         )
                 else:
                     volume_failed = True
-                    self.run_on_ui(self._set_volume_runtime_status, link, "ERR")
-                    self.run_on_ui(self._set_progress_detail_ui, None, None)
+                    self.post_ui_state(("volume_status", link), self._set_volume_runtime_status, link, "ERR")
+                    self.post_ui_state("progress_detail", self._set_progress_detail_ui, None, None)
                     reason = "Échec récupération images."
                     self.log(
                         reason,
@@ -17275,7 +18694,7 @@ class MangaApp:
             if halted_for_disk:
                 self.log("Téléchargement suspendu: espace disque insuffisant.", level="warning")
             elif not self.cancel_event.is_set() and failed:
-                self.run_on_ui(self._set_eta_ui, None, None)
+                self.post_ui_state("eta", self._set_eta_ui, None, None)
                 self.log(
                     f"Retry des tomes échoués ({len(failed)} restants)",
                     level="warning",
@@ -17285,7 +18704,7 @@ class MangaApp:
                 for vol, link in failed:
                     if self.cancel_event.is_set():
                         break
-                    self.run_on_ui(self._set_current_volume_ui, vol, link)
+                    self.post_ui_state("current_volume", self._set_current_volume_ui, vol, link)
                     try:
                         cookie, ua, images = self.get_images_with_cookie_recovery(
                             link,
@@ -17382,16 +18801,17 @@ class MangaApp:
 
             if self.cancel_event.is_set():
                 self.log("Téléchargement annulé !", level="warning")
-                self.run_on_ui(self._set_progress_ui, 0)
+                self.post_ui_state("progress", self._set_progress_ui, 0)
                 self.run_on_ui(self._set_workflow_step, "logs", "Téléchargement annulé. Consulte le journal.")
             else:
                 self.log("Tous les tomes ont été traités.", level="success")
                 self.log(f"Résumé performance: {self.summarize_perf_records()}", level="info")
                 self.run_on_ui(self._set_workflow_step, "logs", "Traitement terminé. Vérifie le journal final.")
 
+            discard_crunchy_reader_prefetch()
             self.cancel_event.clear()
             self.run_on_ui(self._set_download_controls, False)
-            self.run_on_ui(self._set_eta_ui, None, None)
+            self.post_ui_state("eta", self._set_eta_ui, None, None)
             self.run_on_ui(self.root.title, f"{APP_NAME} v{APP_VERSION}")
 
         threading.Thread(target=task, daemon=True).start()
@@ -17425,7 +18845,7 @@ class MangaApp:
             "Les cookies, le profil navigateur et les téléchargements CBZ ne seront pas modifiés.",
         ):
             return
-        global ANALYSIS_CACHE_MEMORY, CATALOG_STATE_MEMORY, WATCHLIST_MEMORY
+        global ANALYSIS_CACHE_MEMORY, COOKIE_PROBE_CACHE_MEMORY, CATALOG_STATE_MEMORY, WATCHLIST_MEMORY
         removed = []
         try:
             with ANALYSIS_CACHE_LOCK:
@@ -17435,13 +18855,24 @@ class MangaApp:
                     removed.append("analyses")
         except OSError as exc:
             self.log(f"Impossible de supprimer le cache d'analyse : {exc}", level="warning")
+        try:
+            with COOKIE_PROBE_CACHE_LOCK:
+                COOKIE_PROBE_CACHE_MEMORY = {}
+                if COOKIE_PROBE_CACHE_PATH.exists():
+                    COOKIE_PROBE_CACHE_PATH.unlink()
+                    removed.append("tests cookie")
+        except OSError as exc:
+            self.log(f"Impossible de supprimer le cache des tests cookie : {exc}", level="warning")
         for cache_path, memory_name, label in (
             (CATALOG_STATE_PATH, "catalog", "état des analyses"),
             (WATCHLIST_PATH, "watch", "suivi"),
         ):
             try:
                 if memory_name == "catalog":
-                    CATALOG_STATE_MEMORY = None
+                    with CATALOG_STATE_LOCK:
+                        CATALOG_STATE_MEMORY = None
+                        if _catalog_state_dir().exists():
+                            remove_tree_safely(_catalog_state_dir(), expected_parent=BASE_DIR)
                 else:
                     WATCHLIST_MEMORY = None
                 if cache_path.exists():
@@ -17452,9 +18883,18 @@ class MangaApp:
         with IMAGE_URL_CACHE_LOCK:
             IMAGE_URL_CACHE.clear()
             IMAGE_URL_CACHE_ORDER.clear()
+        with CATALOGUE_DOCUMENT_CACHE_LOCK:
+            CATALOGUE_DOCUMENT_CACHE.clear()
+            CATALOGUE_DOCUMENT_CACHE_ORDER.clear()
         with TEXT_PAGE_CACHE_LOCK:
             TEXT_PAGE_CACHE.clear()
             TEXT_PAGE_CACHE_ORDER.clear()
+        try:
+            if TEXT_PAGE_SPILL_PATH.exists():
+                remove_tree_safely(TEXT_PAGE_SPILL_PATH, expected_parent=BASE_DIR)
+                removed.append("pages texte")
+        except Exception as exc:
+            self.log(f"Impossible de supprimer les pages texte rendues : {exc}", level="warning")
         self.preview_cache.clear()
         self.preview_cache_order.clear()
         self.catalog_state_summary = {}
@@ -17462,6 +18902,7 @@ class MangaApp:
         try:
             if READER_BLOB_STAGE_PATH.exists():
                 remove_tree_safely(READER_BLOB_STAGE_PATH, expected_parent=BASE_DIR)
+                forget_reader_blob_stage()
                 removed.append("reprises lecteur")
         except Exception as exc:
             self.log(f"Impossible de supprimer les reprises lecteur : {exc}", level="warning")
@@ -17553,53 +18994,17 @@ class SushiCliBackend:
             download_threads=clamp_download_threads(getattr(state, "download_threads", DEFAULT_DOWNLOAD_THREADS)),
         )
 
-    def test_cookie(self, domain, cookie, ua):
-        safe_domain = (domain or "").strip().lower()
-        safe_cookie = (cookie or "").strip()
-        safe_ua = (ua or DEFAULT_USER_AGENT).strip()
-        if not safe_cookie:
-            return False
-
-        if safe_domain in ("fr", "net", "toonfr", "ortega", "hentaizone", "scanmanga", "crunchyscan", "scanhentai"):
-            return test_cookie_validity(
-                safe_domain,
-                safe_cookie,
-                safe_ua,
-                probe_url=STARTUP_COOKIE_LISTING_PROBE_URLS.get(safe_domain),
-            )
+    def _engine(self, cookies=None, ua=""):
+        return Engine(cookies=cookies, user_agent=(ua or DEFAULT_USER_AGENT).strip())
 
-        if safe_domain in ("origines", "hentai"):
-            try:
-                probe_url = STARTUP_COOKIE_LISTING_PROBE_URLS.get(safe_domain)
-                response = make_request(probe_url, safe_cookie, safe_ua)
-                return int(getattr(response, "status_code", 0) or 0) == 200
-            except Exception:
-                return False
-        return None
+    def test_cookie(self, domain, cookie, ua):
+        return self._engine(ua=ua).test_cookie(domain, cookie or "")
 
     def analyze_url(self, url, cookies, ua):
-        safe_url = (url or "").strip()
-        domain = get_cookie_domain_from_url(safe_url)
-        if domain not in COOKIE_DOMAINS:
-            raise ValueError("URL non supportee.")
-        cookie = (cookies.get(domain) or "").strip()
-        safe_ua = (ua or DEFAULT_USER_AGENT).strip()
-        analysis = fetch_manga_analysis(
-            safe_url,
-            cookie,
-            safe_ua,
-            emit_logs=False,
-        )
-        update_catalog_state(
-            safe_url,
-            analysis.title,
-            analysis.pairs,
-            domain=domain,
-            volume_metadata=analysis.volume_metadata,
-        )
+        analysis = self._engine(cookies, ua).analyze(url)
         return (
             analysis.title,
-            domain,
+            Engine.classify_url(url),
             analysis.pairs,
             dict(analysis.volume_metadata or {}),
             dict(analysis.series_metadata or {}),
@@ -17609,12 +19014,17 @@ class SushiCliBackend:
         return get_cookie_domain_from_url((url or "").strip())
 
     def get_images_for_download(self, url, cookie, ua, cancel_event=None):
-        return get_images(
-            (url or "").strip(),
-            (cookie or "").strip(),
-            (ua or DEFAULT_USER_AGENT).strip(),
+        return self._engine(ua=ua).get_images(url, cookie=cookie or "", cancel_event=cancel_event)
+
+    def is_volume_archived(self, title, label, output_dir):
+        return is_volume_archive_present(output_dir, title, label)
+
+    def prefetch_images(self, urls, cookie, ua, cancel_event=None, current_url=""):
+        return self._engine(ua=ua).prefetch_images(
+            urls,
+            cookie=cookie or "",
             cancel_event=cancel_event,
-            emit_logs=False,
+            current_url=current_url,
         )
 
     def download_selected_volume(
@@ -17638,35 +19048,66 @@ class SushiCliBackend:
         total_count=None,
         series_metadata=None,
         volume_metadata=None,
+        image_callback=None,
     ):
-        return download_volume(
-            item.label,
-            list(image_urls or []),
-            title,
-            (cookie or "").strip(),
-            (ua or DEFAULT_USER_AGENT).strip(),
-            logger,
-            cancel_event,
+        options = DownloadOptions(
             cbz_enabled=bool(cbz_enabled),
-            update_progress=update_progress,
-            webp2jpg_enabled=bool(webp2jpg_enabled),
             comicinfo_enabled=bool(comicinfo_enabled),
             chapter_cover_enabled=bool(chapter_cover_enabled),
-            referer_url=(item.url or "").strip(),
+            webp2jpg_enabled=bool(webp2jpg_enabled),
             smart_resume_enabled=bool(smart_resume_enabled),
+            download_threads=download_threads,
+        )
+        return self._engine(ua=ua).download(
+            item.label,
+            item.url,
+            image_urls,
+            title,
+            output_dir,
+            cancel_event,
+            cookie=cookie or "",
+            options=options,
+            logger=logger,
+            update_progress=update_progress,
             error_callback=error_callback,
-            output_root=output_dir,
-            prompt_cookie_retry=False,
+            image_callback=image_callback,
             total_count=total_count,
             series_metadata=series_metadata,
-            cover_url=(series_metadata or {}).get("cover_url", "") if isinstance(series_metadata, dict) else "",
-            download_threads=download_threads,
-            archive_label=get_archive_label_for_link(item.label, item.url, volume_metadata or {}),
+            volume_metadata=volume_metadata,
         )
 
-
 def run_self_test():
-    """Exécute des tests rapides sans réseau pour valider les fonctions critiques."""
+    """Exécute des tests rapides sans réseau pour valider les fonctions critiques.
+
+    Le journal runtime (qui reçoit aussi le journal GUI) et config.json sont
+    redirigés vers un dossier temporaire : les tests ne modifient ni `logs/` ni la configuration
+    de l'utilisateur (une copie de celle-ci est utilisée).
+    """
+    import tempfile
+
+    global RUNTIME_LOG_WRITER, CONFIG_PATH, APP_CONFIG
+    saved_writer = RUNTIME_LOG_WRITER
+    saved_config = (CONFIG_PATH, APP_CONFIG)
+    with tempfile.TemporaryDirectory() as log_tmp:
+        test_config_path = Path(log_tmp) / CONFIG_PATH.name
+        if CONFIG_PATH.exists():
+            shutil.copyfile(CONFIG_PATH, test_config_path)
+        CONFIG_PATH, APP_CONFIG = test_config_path, None
+        RUNTIME_LOG_WRITER = RotatingLogWriter(
+            Path(log_tmp) / RUNTIME_LOG_PATH.name,
+            RUNTIME_LOG_MAX_BYTES,
+            RUNTIME_LOG_BACKUP_COUNT,
+            formatter=format_runtime_log_record,
+        )
+        try:
+            return _run_self_test_checks()
+        finally:
+            test_writer, RUNTIME_LOG_WRITER = RUNTIME_LOG_WRITER, saved_writer
+            CONFIG_PATH, APP_CONFIG = saved_config
+            test_writer.flush()
+
+
+def _run_self_test_checks():
     import tempfile
 
     checks = []
@@ -17697,8 +19138,88 @@ def run_self_test():
     check("domain scan-hentai", get_cookie_domain_from_url("https://scan-hentai.net/lecture-en-ligne/even-a-hopeless-romantic-wants-to-be-loved") == "scanhentai")
     check("url scan-manga chapitre refusee", not is_valid_catalogue_url("https://www.scan-manga.com/lecture-en-ligne/Death-Penalty-Chapitre-56-FR_545712.html"))
     check("domain key", get_site_domain_key("https://ortegascans.fr/serie/moby-dick") == "ortega")
+    ortega_initial = {"manga": {"title": 'Moby "Dick"\\', "chapters": [{"number": 1, "url": "/serie/moby-dick/1"}]}}
+    ortega_rsc = json.dumps(json.dumps({"initialData": ortega_initial}))
+    check(
+        "json embarque flux RSC echappe",
+        parse_ortega_initial_data(f"<script>self.__next_f.push([1,{ortega_rsc}])</script>") == ortega_initial,
+    )
+    check(
+        "json embarque ignore une occurrence invalide",
+        extract_embedded_json('a = {bad}; ts_reader.run({"sources": [{"images": ["x.jpg"]}]});', "ts_reader.run(")
+        == {"sources": [{"images": ["x.jpg"]}]}
+        and extract_embedded_json('run({oops}); run({"ok": 1})', "run(") == {"ok": 1},
+    )
     check("url percent invalide refuse", not is_valid_catalogue_url("https://hentai-origines.fr/manga/bad%zz/"))
     check("url slash encode refuse", not is_valid_catalogue_url("https://hentai-origines.fr/manga/bad%2fslug/"))
+    from engine.labels import _normalize_tome_label
+    from engine.sites import _is_valid_catalogue_url
+
+    bench_labels = [f"Chapitre {n}.{n % 3}" if n % 2 else f"Tome {n % 80} - Chap {n}: Titre {n}" for n in range(3000)]
+    bench_urls = [f"https://sushiscan.net/catalogue/serie-{n}/" for n in range(3000)]
+    clear_label_caches()
+    _is_valid_catalogue_url.cache_clear()
+    started_at = time.perf_counter()
+    cold_labels = [normalize_tome_label(label) for label in bench_labels]
+    cold_urls = [is_valid_catalogue_url(url) for url in bench_urls]
+    cold_seconds = time.perf_counter() - started_at
+    cold_label_info = _normalize_tome_label.cache_info()
+    cold_url_info = _is_valid_catalogue_url.cache_info()
+    started_at = time.perf_counter()
+    for _ in range(10):
+        warm_labels = [normalize_tome_label(label) for label in bench_labels]
+        warm_urls = [is_valid_catalogue_url(url) for url in bench_urls]
+    warm_seconds = (time.perf_counter() - started_at) / 10
+    warm_label_info = _normalize_tome_label.cache_info()
+    warm_url_info = _is_valid_catalogue_url.cache_info()
+    check(
+        f"libelles et urls memorises ({cold_seconds * 1000:.1f} ms -> {warm_seconds * 1000:.1f} ms par passe)",
+        warm_labels == cold_labels
+        and warm_urls == cold_urls == [True] * len(bench_urls)
+        and cold_labels[1] == "Chapitre 1.1"
+        and cold_labels[2] == "Tome 2 - Chap 2 : Titre 2"
+        and warm_label_info.misses == cold_label_info.misses
+        and warm_label_info.hits - cold_label_info.hits == 10 * len(bench_labels)
+        and warm_url_info.misses == cold_url_info.misses == len(bench_urls)
+        and warm_url_info.hits - cold_url_info.hits == 10 * len(bench_urls),
+    )
+    clear_label_caches()
+    original_toonfr = SITE_ADAPTERS["toonfr"]
+    try:
+        register_site_adapter(
+            SiteAdapter(
+                "toonfr.com",
+                "toonfr",
+                "webtoon",
+                hosts=("toonfr-miroir.test",),
+                catalogue=original_toonfr.catalogue,
+                fragile=original_toonfr.fragile,
+            )
+        )
+        mirror_url = "https://www.toonfr-miroir.test/webtoon/ma-brute/"
+        check(
+            "site miroir reconnu",
+            is_valid_catalogue_url(mirror_url)
+            and get_cookie_domain_from_url(mirror_url) == "toonfr"
+            and get_catalogue_slug_from_url(mirror_url) == "ma-brute"
+            and get_site_catalogue_family(mirror_url) == "madara_ajax"
+            and re.match(build_catalogue_url_regex(), mirror_url) is not None,
+        )
+        check(
+            "adaptateur site immuable et hachable",
+            hash(SITE_ADAPTERS["toonfr"]) == hash(SITE_ADAPTERS["toonfr"])
+            and SITE_ADAPTERS["toonfr"].fragile == original_toonfr.fragile
+            and dict(original_toonfr.fragile).get("max_threads") == 1,
+        )
+    finally:
+        register_site_adapter(original_toonfr)
+    check(
+        "site miroir retire",
+        not is_valid_catalogue_url("https://toonfr-miroir.test/webtoon/ma-brute/")
+        and get_cookie_domain_from_url("https://cdn.sushiscan.fr/catalogue/x/") == "fr"
+        and get_cookie_domain_from_url("https://notsushiscan.fr/catalogue/x/") == ""
+        and re.match(REGEX_URL, "https://www.scan-manga.com/16363/Death-Penalty.html") is not None,
+    )
     check(
         "extraction collage url",
         extract_supported_catalogue_url("x https://hentai-origines.fr/manga/test-%e2%99%a5/ y")
@@ -17801,7 +19322,10 @@ def run_self_test():
         )
 
     global ANALYSIS_CACHE_PATH, ANALYSIS_CACHE_MEMORY, CATALOG_STATE_PATH, CATALOG_STATE_MEMORY, WATCHLIST_PATH, WATCHLIST_MEMORY, DOWNLOAD_QUEUE_STATE_PATH
+    global COOKIE_PROBE_CACHE_PATH, COOKIE_PROBE_CACHE_MEMORY, TEXT_PAGE_SPILL_PATH
     old_cache_path = ANALYSIS_CACHE_PATH
+    old_cookie_probe_path = COOKIE_PROBE_CACHE_PATH
+    old_cookie_probe_memory = COOKIE_PROBE_CACHE_MEMORY
     old_cache_memory = ANALYSIS_CACHE_MEMORY
     old_catalog_state_path = CATALOG_STATE_PATH
     old_catalog_state_memory = CATALOG_STATE_MEMORY
@@ -17813,7 +19337,9 @@ def run_self_test():
         CATALOG_STATE_PATH = Path(tmp) / "catalog_state.json"
         WATCHLIST_PATH = Path(tmp) / "watchlist.json"
         DOWNLOAD_QUEUE_STATE_PATH = Path(tmp) / "download_queue.json"
+        COOKIE_PROBE_CACHE_PATH = Path(tmp) / "cookie_probe_cache.json"
         ANALYSIS_CACHE_MEMORY = None
+        COOKIE_PROBE_CACHE_MEMORY = None
         CATALOG_STATE_MEMORY = None
         WATCHLIST_MEMORY = None
         store_cached_analysis(
@@ -17839,6 +19365,17 @@ def run_self_test():
             }
         }
         check("cache analyse ancien schema ignore", get_cached_analysis("https://sushiscan.net/catalogue/stale/", "UA") is None)
+        store_cookie_probe_result("net", "cf=1", "UA", {"cookie_valid": True, "challenge_state": "absent", "http_status": 200})
+        store_cookie_probe_result("fr", "cf=2", "UA", {"cookie_valid": False, "challenge_state": "unknown", "http_status": None})
+        COOKIE_PROBE_CACHE_MEMORY = None
+        cached_probe = get_cached_cookie_probe("net", "cf=1", "UA")
+        check(
+            "cache test cookie par cookie + UA",
+            bool(cached_probe and cached_probe["cookie_valid"])
+            and get_cached_cookie_probe("net", "cf=1", "UA2") is None
+            and "cf=1" not in COOKIE_PROBE_CACHE_PATH.read_text(encoding="utf-8"),
+        )
+        check("cache test cookie ignore erreur reseau", get_cached_cookie_probe("fr", "cf=2", "UA") is None)
         first_state = update_catalog_state(
             "https://sushiscan.net/catalogue/test/",
             "Titre",
@@ -17863,6 +19400,50 @@ def run_self_test():
             domain="net",
         )
         check("etat catalogue nouveaute", bool(third_state.get("new_count") == 1 and third_state.get("new_items", [{}])[0].get("label") == "Chapitre 2"))
+        recent_changes = get_catalog_changes(days=7)
+        check(
+            "journal catalogue nouveautes recentes",
+            [(change["change"], change["label"]) for change in recent_changes] == [("new", "Chapitre 2")]
+            and len(list(_catalog_state_dir().glob("*.json"))) == 1,
+        )
+        compact_path = Path(tmp) / "changes_compact.jsonl"
+        compact_ts = datetime.datetime.now(datetime.timezone.utc).isoformat()
+        compact_path.write_text(
+            "".join(json.dumps({"ts": compact_ts, "label": f"Chapitre {index}"}) + "\n" for index in range(100)),
+            encoding="utf-8",
+        )
+        saved_compact_target = CATALOG_CHANGES_COMPACT_TARGET_BYTES
+        try:
+            globals()["CATALOG_CHANGES_COMPACT_TARGET_BYTES"] = compact_path.stat().st_size // 4
+            _compact_catalog_changes(compact_path)
+            compact_lines = compact_path.read_text(encoding="utf-8").splitlines()
+            check(
+                "journal catalogue compacte sous la cible",
+                compact_path.stat().st_size <= CATALOG_CHANGES_COMPACT_TARGET_BYTES
+                and bool(compact_lines)
+                and json.loads(compact_lines[-1])["label"] == "Chapitre 99",
+            )
+        finally:
+            globals()["CATALOG_CHANGES_COMPACT_TARGET_BYTES"] = saved_compact_target
+        legacy_url = "https://sushiscan.net/catalogue/ancien/"
+        _write_json_file(
+            CATALOG_STATE_PATH,
+            {
+                "schema_version": CATALOG_STATE_SCHEMA_VERSION,
+                "catalogues": {
+                    _catalog_state_key(legacy_url): {
+                        "schema_version": CATALOG_STATE_SCHEMA_VERSION,
+                        "title": "Ancien",
+                        "known_items": {"https://sushiscan.net/ancien/1/": "Chapitre 1"},
+                    }
+                },
+            },
+        )
+        CATALOG_STATE_MEMORY = None
+        check(
+            "etat catalogue migration ancien fichier",
+            get_catalog_record(legacy_url).get("title") == "Ancien" and not CATALOG_STATE_PATH.exists(),
+        )
         check("watchlist ajout url", add_or_update_watchlist_url("https://sushiscan.net/catalogue/test/", "Titre", enabled=True))
         watch_entries = get_watchlist_entries_with_state()
         check("watchlist etat enrichi", bool(watch_entries and watch_entries[0].get("last_count") == 2 and watch_entries[0].get("last_new_count") == 1))
@@ -17888,6 +19469,8 @@ def run_self_test():
     WATCHLIST_PATH = old_watchlist_path
     WATCHLIST_MEMORY = old_watchlist_memory
     DOWNLOAD_QUEUE_STATE_PATH = old_download_queue_state_path
+    COOKIE_PROBE_CACHE_PATH = old_cookie_probe_path
+    COOKIE_PROBE_CACHE_MEMORY = old_cookie_probe_memory
 
     class FakeResponse:
         status_code = 200
@@ -17918,6 +19501,57 @@ def run_self_test():
         globals()["parse_manga_data_from_html"] = old_parse
         globals()["extract_series_metadata_from_html"] = old_meta
 
+    def fake_madara_page(page, last_visible):
+        pagination = "".join(
+            f'<span class="page"><a data-page="{number}">{number}</a></span>'
+            for number in range(1, last_visible + 1)
+        )
+        return (
+            f'<div class="listing-chapters_wrap"><div class="pagination">{pagination}</div><ul>'
+            f'<li class="wp-manga-chapter"><a href="https://mangas-origines.fr/oeuvre/test/chapitre-{20 - 2 * page}/">Chapitre {20 - 2 * page}</a></li>'
+            f'<li class="wp-manga-chapter"><a href="https://mangas-origines.fr/oeuvre/test/chapitre-{19 - 2 * page}/">Chapitre {19 - 2 * page}</a></li>'
+            "</ul></div>"
+        )
+
+    class FakeMadaraResponse:
+        status_code = 200
+
+        def __init__(self, text):
+            self.text = text
+
+    madara_calls = []
+    madara_threads = []
+    madara_lock = threading.Lock()
+
+    def fake_http_post(url, headers=None, data=None, timeout=15):
+        page = int(url.rsplit("=", 1)[-1])
+        with madara_lock:
+            madara_calls.append(page)
+            madara_threads.append(threading.current_thread())
+        time.sleep(0.05 if page > 1 else 0)
+        # La pagination de la page 1 est tronquee a 3 : la page 3 revele la 5.
+        return FakeMadaraResponse(fake_madara_page(page, 5 if page >= 3 else 3))
+
+    old_http_post = globals()["_http_post"]
+    try:
+        globals()["_http_post"] = fake_http_post
+        madara_pairs, _ = fetch_mangas_origines_chapters_via_ajax(
+            "https://mangas-origines.fr/oeuvre/test/", "", "", emit_logs=False
+        )
+        madara_calls_first = list(madara_calls)
+        madara_threads.clear()
+        fetch_mangas_origines_chapters_via_ajax("https://mangas-origines.fr/oeuvre/test/", "", "", emit_logs=False)
+        second_pool_threads = {thread for thread in madara_threads if thread is not threading.current_thread()}
+    finally:
+        globals()["_http_post"] = old_http_post
+    madara_numbers = [int(link.rstrip("/").rsplit("-", 1)[-1]) for _label, link in madara_pairs]
+    check("madara ajax pages paralleles toutes lues", sorted(madara_calls_first) == [1, 2, 3, 4, 5])
+    check(
+        "madara ajax pool reutilise entre analyses",
+        bool(second_pool_threads) and second_pool_threads <= set(_get_madara_ajax_executor()._threads),
+    )
+    check("madara ajax fusion dans l'ordre des pages", madara_numbers == list(range(9, 19)))
+
     scanmanga_html = """
     <div class="volume_manga"><div class="titre_volume_manga"><h3>Volume 2</h3></div>
       <div class="chapitre_nom"><a href="https://www.scan-manga.com/lecture-en-ligne/Test-Chapitre-Extra-FR_102.html">Chapitre Extra</a> : Bonus 2</div>
@@ -17929,7 +19563,7 @@ def run_self_test():
     """
     scanmanga_pairs, scanmanga_meta = parse_scanmanga_chapters_from_html(
         "https://www.scan-manga.com/1/Test.html",
-        BeautifulSoup(scanmanga_html, "html.parser"),
+        bs4.BeautifulSoup(scanmanga_html, "html.parser"),
         scanmanga_html,
     )
     scanmanga_labels = [label for label, _link in scanmanga_pairs]
@@ -17948,6 +19582,25 @@ def run_self_test():
         "scan-manga archive label complet",
         scanmanga_meta.get(first_extra_url, {}).get("archive_label") == "Tome 2 - Chap Extra : Bonus 2",
     )
+    scanmanga_q = "XYZWVUTSRQP"
+    scanmanga_tokens = ["".join(scanmanga_q[int(digit)] for digit in str(ord(char) + 5)) for char in "var sml='ab';var sme='cd';"]
+    scanmanga_script = (
+        'eval(function(h,u,n,t,e,r){return r}("'
+        + "P".join(scanmanga_tokens)
+        + f'P",12,"{scanmanga_q}",5,10,31))'
+    )
+    scanmanga_page = f"<script>const idc = 42;</script><script>{scanmanga_script}</script>"
+    check("scan-manga eval decode", decode_scanmanga_eval_script(scanmanga_script) == "var sml='ab';var sme='cd';")
+    scanmanga_vars = extract_scanmanga_reader_vars(scanmanga_page)
+    scanmanga_vars["sml"] = "modifie"
+    check(
+        "scan-manga variables lecteur en cache",
+        extract_scanmanga_reader_vars(scanmanga_page) == {"idc": 42, "idm": 0, "sml": "ab", "sme": "cd"},
+    )
+    scanmanga_inner = base64.b64encode(b'{"p": {"1": {"f": "01", "e": "jpg"}}}').decode("ascii")[::-1] + format(42, "x")
+    scanmanga_api = base64.b64encode(zlib.compress(scanmanga_inner.encode("utf-8"))).decode("ascii")
+    decode_scanmanga_data_api(scanmanga_api, 42)["p"].clear()
+    check("scan-manga DataAPI en cache", decode_scanmanga_data_api(scanmanga_api, 42) == {"p": {"1": {"f": "01", "e": "jpg"}}})
     dummy_app = object.__new__(MangaApp)
     check("scan-manga groupe webtoon", dummy_app._volume_group_label_from_text("Webtoon 1 - Chap 12") == "Webtoon 1")
     check("scan-manga compact webtoon", dummy_app._compact_display_label("Webtoon 1 - Chap 12") == "W1 C12")
@@ -17967,7 +19620,7 @@ def run_self_test():
     """
     crunchy_pairs, crunchy_meta = parse_crunchy_family_chapters_from_html(
         "https://crunchyscan.fr/lecture-en-ligne/shadows-house",
-        BeautifulSoup(crunchy_html, "html.parser"),
+        bs4.BeautifulSoup(crunchy_html, "html.parser"),
         crunchy_html,
     )
     check("crunchyscan parser chapitres", [label for label, _ in crunchy_pairs] == ["Chapitre 228", "Chapitre 227"])
@@ -17996,6 +19649,138 @@ def run_self_test():
         emit_logs=False,
     )
     check("crunchyscan tri naturel", [label for label, _ in crunchy_sorted_pairs] == ["Chapitre 227", "Chapitre 228"])
+
+    class FakeCatalogueResponse:
+        status_code = 200
+        url = "https://crunchyscan.fr/lecture-en-ligne/shadows-house"
+        text = crunchy_html + "<!-- document partage -->"
+
+    soup_builds = []
+    real_bs4 = bs4._load()
+    real_soup_class = real_bs4.BeautifulSoup
+    old_make = globals()["make_request"]
+    try:
+        globals()["make_request"] = lambda url, cookie, ua: FakeCatalogueResponse()
+
+        class CountingSoup(real_soup_class):
+            def __init__(self, *args, **kwargs):
+                soup_builds.append(1)
+                super().__init__(*args, **kwargs)
+
+        real_bs4.BeautifulSoup = CountingSoup
+        shared_analysis = fetch_manga_analysis(FakeCatalogueResponse.url, "", "", emit_logs=False)
+        shared_cover = extract_cover_url_from_html(FakeCatalogueResponse.url, shared_analysis.html_content)
+        shared_replay = parse_manga_data_from_html(FakeCatalogueResponse.url, shared_analysis.html_content, emit_logs=False)
+    finally:
+        real_bs4.BeautifulSoup = real_soup_class
+        globals()["make_request"] = old_make
+    check(
+        "catalogue parse une seule fois",
+        len(soup_builds) == 1
+        and shared_cover == shared_analysis.series_metadata.get("cover_url")
+        and shared_replay[1] == list(shared_analysis.pairs),
+    )
+    parse_log_messages = []
+    old_runtime_log = globals()["runtime_log"]
+    try:
+        globals()["runtime_log"] = lambda message, *args, **kwargs: parse_log_messages.append(message)
+        parse_manga_data_from_html(FakeCatalogueResponse.url, shared_analysis.html_content, emit_logs=True)
+    finally:
+        globals()["runtime_log"] = old_runtime_log
+    check("catalogue memo respecte emit_logs", bool(parse_log_messages))
+
+    class FakeConditionalResponse:
+        def __init__(self, status_code, text="", headers=None):
+            self.status_code = status_code
+            self.url = FakeCatalogueResponse.url
+            self.text = text
+            self.headers = headers or {}
+
+    conditional_requests = []
+    conditional_responses = []
+    soup_builds.clear()
+
+    def fake_conditional_request(url, cookie, ua, timeout=None, extra_headers=None):
+        conditional_requests.append(dict(extra_headers or {}))
+        return conditional_responses.pop(0)
+
+    new_chapter_html = crunchy_html.replace(
+        '<a class="chapterName chapter-link" title="Lire Chapitre 228"',
+        '<a class="chapterName chapter-link" title="Lire Chapitre 229" href="/lecture-en-ligne/shadows-house/read/chapitre-229">Chapitre 229</a>\n'
+        '      <a class="chapterName chapter-link" title="Lire Chapitre 228"',
+    )
+    try:
+        globals()["make_request"] = fake_conditional_request
+
+        class CountingConditionalSoup(real_soup_class):
+            def __init__(self, *args, **kwargs):
+                soup_builds.append(1)
+                super().__init__(*args, **kwargs)
+
+        real_bs4.BeautifulSoup = CountingConditionalSoup
+        conditional_responses.append(FakeConditionalResponse(200, crunchy_html, {"ETag": '"v1"', "Last-Modified": "Mon, 19 Oct 2026 08:00:00 GMT"}))
+        first_analysis = fetch_manga_analysis(FakeCatalogueResponse.url, "", "", emit_logs=False)
+        cache_entry = {
+            "title": first_analysis.title,
+            "pairs": list(first_analysis.pairs),
+            "volume_metadata": first_analysis.volume_metadata,
+            "series_metadata": first_analysis.series_metadata,
+            "html_content": first_analysis.html_content,
+            **first_analysis.validators,
+        }
+        parses_after_first = len(soup_builds)
+        conditional_responses.append(FakeConditionalResponse(304))
+        not_modified = fetch_manga_analysis(FakeCatalogueResponse.url, "", "", emit_logs=False, cached_analysis=cache_entry)
+        conditional_responses.append(FakeConditionalResponse(200, crunchy_html.replace("</body>", "<script>nonce=42</script></body>")))
+        same_region = fetch_manga_analysis(FakeCatalogueResponse.url, "", "", emit_logs=False, cached_analysis=cache_entry)
+        parses_after_reuse = len(soup_builds)
+        conditional_responses.append(FakeConditionalResponse(200, new_chapter_html))
+        changed_region = fetch_manga_analysis(FakeCatalogueResponse.url, "", "", emit_logs=False, cached_analysis=cache_entry)
+    finally:
+        real_bs4.BeautifulSoup = real_soup_class
+        globals()["make_request"] = old_make
+    check(
+        "catalogue 304 et liste inchangee sans reparsing",
+        bool(first_analysis.validators.get("content_hash"))
+        and conditional_requests[0] == {}
+        and conditional_requests[1] == {"If-None-Match": '"v1"', "If-Modified-Since": "Mon, 19 Oct 2026 08:00:00 GMT"}
+        and not_modified.pairs == first_analysis.pairs
+        and not_modified.validators.get("etag") == '"v1"'
+        and same_region.pairs == first_analysis.pairs
+        and "nonce=42" in same_region.html_content
+        and parses_after_reuse == parses_after_first,
+    )
+    check(
+        "catalogue ajax sans revalidation 304",
+        _revalidable_cached_analysis("https://mangas-origines.fr/oeuvre/test/", cache_entry) == {}
+        and _revalidable_cached_analysis("https://ortegascans.fr/serie/moby-dick", cache_entry) == {}
+        and _revalidable_cached_analysis(FakeCatalogueResponse.url, cache_entry) is cache_entry,
+    )
+    sushi_list_url = "https://sushiscan.net/catalogue/serie-test/"
+    sushi_list_html = (
+        '<div id="chapterlist"><ul>'
+        '<li><a href="https://sushiscan.net/serie-test-volume-2/"><span class="chapternum">Volume 2</span></a></li>'
+        '<li><a href="https://sushiscan.net/serie-test-volume-1/"><span class="chapternum">Volume 1</span></a></li>'
+        "</ul></div>"
+    )
+    sushi_new_html = sushi_list_html.replace(
+        "<ul>",
+        '<ul><li><a href="https://sushiscan.net/tome-3-special/"><span class="chapternum">Volume 3</span></a></li>',
+    )
+    check(
+        "empreinte liste chapitres sans slug",
+        bool(compute_catalogue_region_hash(sushi_list_url, sushi_list_html))
+        and compute_catalogue_region_hash(sushi_list_url, sushi_list_html)
+        == compute_catalogue_region_hash(sushi_list_url, "<p>pub</p>" + sushi_list_html)
+        and compute_catalogue_region_hash(sushi_list_url, sushi_list_html)
+        != compute_catalogue_region_hash(sushi_list_url, sushi_new_html)
+        and compute_catalogue_region_hash("https://mangas-origines.fr/oeuvre/x/", sushi_list_html) == "",
+    )
+    check(
+        "catalogue liste modifiee reparsee",
+        len(changed_region.pairs) == len(first_analysis.pairs) + 1
+        and changed_region.validators.get("content_hash") != cache_entry["content_hash"],
+    )
     crunchy_volume_pairs = [
         (".Tome 14", "https://crunchyscan.fr/lecture-en-ligne/test/read/volume-14"),
         (".Tome 2", "https://crunchyscan.fr/lecture-en-ligne/test/read/volume-2"),
@@ -18018,7 +19803,7 @@ def run_self_test():
     """
     hentai_pairs, hentai_meta = parse_crunchy_family_chapters_from_html(
         "https://scan-hentai.net/lecture-en-ligne/lies-are-planned",
-        BeautifulSoup(hentai_html, "html.parser"),
+        bs4.BeautifulSoup(hentai_html, "html.parser"),
         hentai_html,
     )
     check("scan-hentai parser chapitres", bool(hentai_pairs and hentai_pairs[0][0] == "Chapitre 4"))
@@ -18045,6 +19830,9 @@ def run_self_test():
     """
     novel_chapter = extract_scanmanga_novel_chapter(scanmanga_novel_html)
     check("scan-manga novel detecte", bool(novel_chapter and len(novel_chapter[1]) == 3))
+    old_text_page_spill_path = TEXT_PAGE_SPILL_PATH
+    text_page_tmp = tempfile.TemporaryDirectory()
+    TEXT_PAGE_SPILL_PATH = Path(text_page_tmp.name) / "text_pages"
     novel_urls = render_scanmanga_novel_pages(
         novel_chapter[0],
         novel_chapter[1],
@@ -18052,6 +19840,21 @@ def run_self_test():
     ) if novel_chapter else []
     first_novel_page = get_text_page_bytes(novel_urls[0]) if novel_urls else None
     check("scan-manga novel page jpg", bool(first_novel_page and first_novel_page[:2] == b"\xff\xd8"))
+    wrap_font = _load_text_render_font(30)
+    wrap_draw = ImageDraw.Draw(Image.new("RGB", (8, 8)))
+    wrap_words = ("Une phrase ★ assez longue pour tenir sur plusieurs lignes " * 30).split() + ["x" * 120]
+    wrap_lines = _wrap_text_for_width(wrap_draw, " ".join(wrap_words), wrap_font, 600)
+    check("police texte memorisee", wrap_font is _load_text_render_font(30))
+    kerning_word = "AVATAR"
+    check(
+        "largeur mot avec crenage",
+        _text_width(wrap_draw, kerning_word, wrap_font) == float(wrap_font.getlength(kerning_word)),
+    )
+    check(
+        "retour ligne incremental",
+        " ".join(wrap_lines).split() == wrap_words[:-1] + [line for line in wrap_lines if set(line) == {"x"}]
+        and all(_text_width(wrap_draw, line, wrap_font) <= 600 for line in wrap_lines[1:]),
+    )
     scanmanga_center_html = """
     <article class="aLN">
       <h2 class="ln_c_title">Titre</h2>
@@ -18096,6 +19899,444 @@ def run_self_test():
         max_pages=1,
     )
     check("scan-manga novel preview limite", len(limited_urls) == 1 and bool(get_text_page_bytes(limited_urls[0])))
+    long_blocks = [{"kind": "text", "text": "Paragraphe de roman léger. " * 120, "align": "left"}] * 6
+    streamed_urls = render_scanmanga_novel_pages("Titre long", long_blocks, "local-stream", encode_workers=3)
+    streamed_pages = [get_text_page_bytes(url) for url in streamed_urls]
+    sequential_urls = render_scanmanga_novel_pages("Titre long", long_blocks, "local-stream", encode_workers=1)
+    check(
+        "scan-manga novel pages ecrites sur disque",
+        len(streamed_urls) > 3
+        and all(get_text_page_path(url) and get_text_page_path(url).parent.parent == TEXT_PAGE_SPILL_PATH for url in streamed_urls)
+        and all(isinstance(count, int) for count in TEXT_PAGE_CACHE.values()),
+    )
+    check(
+        "scan-manga novel encodage parallele identique",
+        sequential_urls == streamed_urls and [get_text_page_bytes(url) for url in sequential_urls] == streamed_pages,
+    )
+    illustration_calls = []
+    illustration_load = {"active": 0, "peak": 0}
+    illustration_lock = threading.Lock()
+
+    def fake_novel_image(src, source_url="", cookie="", ua=""):
+        with illustration_lock:
+            illustration_calls.append(src)
+            illustration_load["active"] += 1
+            illustration_load["peak"] = max(illustration_load["peak"], illustration_load["active"])
+        try:
+            time.sleep(0.1)
+            if src.endswith("/casse.png"):
+                raise ValueError("image illisible")
+            shade = int(src.rsplit("/", 1)[-1].split(".")[0])
+            return Image.new("RGB", (300, 200), (shade * 20, 0, 0))
+        finally:
+            with illustration_lock:
+                illustration_load["active"] -= 1
+
+    old_novel_image_loader = globals()["_load_scanmanga_novel_image"]
+    globals()["_load_scanmanga_novel_image"] = fake_novel_image
+    try:
+        illustrated_blocks = [{"kind": "text", "text": "Intro illustree. " * 10, "align": "left"}]
+        for shade in range(8):
+            illustrated_blocks.append({"kind": "image", "src": f"https://example.test/{shade}.png", "align": "center"})
+        illustrated_blocks.append({"kind": "image", "src": "https://example.test/casse.png", "align": "center"})
+        illustrated_urls = render_scanmanga_novel_pages(
+            "Titre illustre", illustrated_blocks, "https://www.scan-manga.com/lecture-en-ligne/Test-FR_1.html"
+        )
+    finally:
+        globals()["_load_scanmanga_novel_image"] = old_novel_image_loader
+    check(
+        f"scan-manga novel illustrations en parallele ({illustration_load['peak']} simultanees)",
+        bool(illustrated_urls)
+        and len(illustration_calls) == 9
+        and 2 <= illustration_load["peak"] <= NOVEL_IMAGE_PREFETCH_WORKERS,
+    )
+    check("scan-manga novel url forgee refusee", get_text_page_path(f"{TEXT_PAGE_URL_PREFIX}..%2F/1.jpg") is None)
+    TEXT_PAGE_SPILL_PATH = old_text_page_spill_path
+    with TEXT_PAGE_CACHE_LOCK:
+        TEXT_PAGE_CACHE.clear()
+        TEXT_PAGE_CACHE_ORDER.clear()
+    text_page_tmp.cleanup()
+
+    import subprocess
+
+    fake_thread = threading.current_thread()
+    with SCANMANGA_BROWSER_LOCK:
+        saved_scanmanga_workers = list(SCANMANGA_BROWSER_WORKERS)
+        SCANMANGA_BROWSER_WORKERS[:] = [
+            {"slot": 1, "tasks": None, "pending": 0, "referer": "lecteur-a", "thread": fake_thread},
+            {"slot": 2, "tasks": None, "pending": 0, "referer": "lecteur-b", "thread": fake_thread},
+        ]
+    try:
+        first_worker = acquire_scanmanga_browser_worker("lecteur-b")
+        second_worker = acquire_scanmanga_browser_worker("lecteur-b")
+        check("pool scan-manga affinite lecteur", first_worker["slot"] == 2)
+        check("pool scan-manga repartition charge", second_worker["slot"] == 1)
+    finally:
+        with SCANMANGA_BROWSER_LOCK:
+            SCANMANGA_BROWSER_WORKERS[:] = saved_scanmanga_workers
+    check("pool scan-manga taille bornee", 1 <= get_scanmanga_browser_pool_size() <= SCANMANGA_BROWSER_POOL_MAX)
+    legacy_scanmanga_cfg = _merge_config(
+        DEFAULT_APP_CONFIG, {"fragile_sites": {"scanmanga": {"enabled": True, "max_threads": 1}}}
+    )["fragile_sites"]["scanmanga"]
+    check(
+        "config scan-manga plafond utilisateur conserve",
+        legacy_scanmanga_cfg["max_threads"] == 1
+        and legacy_scanmanga_cfg["browser_contexts"] == DEFAULT_APP_CONFIG["fragile_sites"]["scanmanga"]["browser_contexts"],
+    )
+    check(
+        "pool scan-manga echecs contexte",
+        is_scanmanga_browser_context_failure({"status": 429})
+        and is_scanmanga_browser_context_failure({"status": 503})
+        and not is_scanmanga_browser_context_failure({"status": 404, "contentType": "text/html", "body": ""})
+        and is_scanmanga_browser_context_failure(
+            {"status": 200, "contentType": "text/html", "body": base64.b64encode(b"<title>Just a moment...</title>").decode("ascii")}
+        ),
+    )
+    check("pool lecteur crunchy plafond borne", 1 <= get_crunchy_reader_session_cap("crunchyscan") <= CRUNCHY_READER_POOL_MAX)
+    check("prefetch lecteur ignore les autres sites", prefetch_crunchy_reader_chapters(["https://sushiscan.net/x/"], "", "") == 0)
+    stale_prefetch = {"claimed": False, "done": threading.Event(), "created_at": time.monotonic() - CRUNCHY_READER_PREFETCH_TTL_SECONDS - 1}
+    stale_prefetch["done"].set()
+    fresh_prefetch = {"claimed": False, "done": threading.Event(), "created_at": time.monotonic()}
+    claimed_prefetch = {"claimed": True, "done": threading.Event(), "created_at": 0.0}
+    with CRUNCHY_BROWSER_LOCK:
+        saved_reader_tasks = dict(CRUNCHY_READER_TASKS)
+        CRUNCHY_READER_TASKS.clear()
+        CRUNCHY_READER_TASKS.update({"stale": stale_prefetch, "fresh": fresh_prefetch, "claimed": claimed_prefetch})
+        _expire_crunchy_reader_tasks(CRUNCHY_READER_PREFETCH_TTL_SECONDS)
+        expired_keys = sorted(CRUNCHY_READER_TASKS)
+    discard_crunchy_reader_prefetch()
+    with CRUNCHY_BROWSER_LOCK:
+        discarded_keys = sorted(CRUNCHY_READER_TASKS)
+        CRUNCHY_READER_TASKS.clear()
+        CRUNCHY_READER_TASKS.update(saved_reader_tasks)
+    check("prefetch lecteur expire les non reclames", expired_keys == ["claimed", "fresh"] and discarded_keys == ["claimed"])
+    ring = LogRingBuffer(4)
+    for ring_index in range(6):
+        ring.append({"level": ("info", "error")[ring_index % 2], "message": f"Ligne {ring_index}"})
+    check(
+        "journal circulaire borne et indexe",
+        len(ring) == 4
+        and [entry["message"] for entry in ring.select(["error"])] == ["Ligne 3", "Ligne 5"]
+        and [entry["seq"] for entry in ring.select(["info", "error"], "ligne")] == [2, 3, 4, 5],
+    )
+    check(
+        "journal retour a la ligne au mot",
+        wrap_log_line("12:00:00 [INFO] Tome 12 telecharge", 15, len) == ["12:00:00 [INFO]", "Tome 12", "telecharge"]
+        and wrap_log_line("x" * 25, 10, len) == ["x" * 10, "x" * 10, "x" * 5],
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        rotating_writer = RotatingLogWriter(Path(tmp) / "journal.log", 1024, 2)
+        for line_index in range(100):
+            rotating_writer.write(f"ligne {line_index:03d} " + "x" * 40)
+        check(
+            "journal fichier rotation par taille",
+            rotating_writer.flush()
+            and sorted(path.name for path in Path(tmp).iterdir()) == ["journal.log", "journal.log.1", "journal.log.2"]
+            and (Path(tmp) / "journal.log").read_text(encoding="utf-8").rstrip().endswith("x" * 40)
+            and (Path(tmp) / "journal.log").stat().st_size <= 1024,
+        )
+        json_writer = RotatingLogWriter(Path(tmp) / "runtime.jsonl", 4096, 1, formatter=format_runtime_log_record)
+        json_writer.write(
+            {
+                "ts": "2026-01-01T00:00:00.000",
+                "level": "error",
+                "message": "Echec cf_clearance=secret",
+                "thread": "worker-1",
+                "context": {"domain": "net", "status_code": 403, "headers": "Cookie: a=b"},
+            }
+        )
+        json_writer.flush()
+        runtime_record = json.loads((Path(tmp) / "runtime.jsonl").read_text(encoding="utf-8").splitlines()[-1])
+        check(
+            "journal runtime JSON contexte et secrets masques",
+            runtime_record["context"]["status_code"] == 403
+            and "secret" not in runtime_record["message"]
+            and "a=b" not in runtime_record["context"]["headers"],
+        )
+
+    class FakeRoot:
+        def after(self, _delay, _callback):
+            return None
+
+    ui_probe = MangaApp.__new__(MangaApp)
+    ui_probe.root = FakeRoot()
+    ui_probe.ui_queue = queue.Queue()
+    ui_probe.ui_sequence = itertools.count()
+    ui_probe.ui_state_lock = threading.Lock()
+    ui_probe.ui_state_pending = {}
+    rendered = []
+
+    def publish_ui_burst():
+        for percent in range(100):
+            ui_probe.post_ui_state("progress", rendered.append, percent)
+            ui_probe.post_ui_state("detail", rendered.append, f"{percent}/99")
+        ui_probe.run_on_ui(rendered.append, "reset")
+        ui_probe.post_ui_state("progress", rendered.append, 0)
+
+    burst_thread = threading.Thread(target=publish_ui_burst)
+    burst_thread.start()
+    burst_thread.join()
+    ui_probe.process_ui_queue()
+    check("bus UI coalesce les etats successifs", rendered == ["99/99", "reset", 0])
+    stage_link = f"https://crunchyscan.fr/lecture-en-ligne/self-test/chapitre-{os.getpid()}-{time.time_ns()}"
+    stage_page = b"\xff\xd8\xff" + bytes(range(256)) * 2
+    stage_urls = []
+    try:
+        stage_urls = [write_reader_blob_stage(stage_link, page, stage_page) for page in (1, 2)]
+        stage_dir = _reader_blob_stage_dir(stage_link)
+        check(
+            "checkpoint lecteur pack dedoublonne",
+            (stage_dir / READER_BLOB_PACK_NAME).stat().st_size == len(stage_page)
+            and get_reader_blob_stage_bytes(stage_urls[1]) == stage_page,
+        )
+        forget_reader_blob_stage()
+        check("checkpoint lecteur reprise depuis index", get_reader_blob_stage_pages(stage_link, 5) == stage_urls)
+        with open(stage_dir / READER_BLOB_INDEX_NAME, "ab") as handle:
+            handle.write(READER_BLOB_INDEX_RECORD.pack(3, len(stage_page), 512, b"\0" * 20))
+        forget_reader_blob_stage()
+        check("checkpoint lecteur ignore entree hors pack", get_reader_blob_stage_pages(stage_link, 5) == stage_urls)
+        sync_reader_blob_stage(stage_urls)
+        stage_key = _reader_blob_stage_key(stage_link)
+        with _reader_blob_pack_lock(stage_key):
+            other_pack_free = _reader_blob_pack_lock(_reader_blob_stage_key(f"{stage_link}-autre")).acquire(blocking=False)
+        if other_pack_free:
+            _reader_blob_pack_lock(_reader_blob_stage_key(f"{stage_link}-autre")).release()
+        check("checkpoint lecteur verrou par chapitre", other_pack_free and _reader_blob_pack_lock(stage_key) is _reader_blob_pack_lock(stage_key))
+        png_buffer = BytesIO()
+        Image.frombytes("RGB", (32, 32), os.urandom(32 * 32 * 3)).save(png_buffer, format="PNG")
+        stage_urls.append(stage_reader_blob_payload(stage_link, 3, base64.b64encode(png_buffer.getvalue()).decode("ascii")))
+        check(
+            "checkpoint lecteur valide les pages base64",
+            stage_urls[-1] is not None
+            and stage_reader_blob_payload(stage_link, 4, base64.b64encode(b"\x89PNG" + b"\0" * 256).decode("ascii")) is None,
+        )
+
+        class FakeBlobDownload:
+            def __init__(self, payload):
+                self.payload = payload
+                self.deleted = False
+
+            def save_as(self, path):
+                Path(path).write_bytes(self.payload)
+
+            def delete(self):
+                self.deleted = True
+
+        binary_buffer = BytesIO()
+        Image.frombytes("RGB", (24, 24), os.urandom(24 * 24 * 3)).save(binary_buffer, format="PNG")
+        binary_download = FakeBlobDownload(binary_buffer.getvalue())
+        html_download = FakeBlobDownload(b"<!DOCTYPE html><html>" + b" " * 256 + b"</html>")
+        stage_urls.append(save_reader_blob_download(binary_download, stage_link, 5))
+        check(
+            "checkpoint lecteur capture binaire aller-retour",
+            stage_urls[-1] is not None
+            and get_reader_blob_stage_bytes(stage_urls[-1]) == binary_buffer.getvalue()
+            and save_reader_blob_download(html_download, stage_link, 6) is None
+            and binary_download.deleted
+            and html_download.deleted
+            and not list(stage_dir.glob("*.part")),
+        )
+    finally:
+        clear_reader_blob_stage_for_urls(stage_urls)
+
+    from cli.events import EventBus, ImageEvent
+
+    lossless_bus = EventBus()
+    lossless_received = []
+    lossless_subscription = lossless_bus.subscribe(maxsize=10)
+    lossless_bus.add_listener(lossless_received.append)
+    for image_index in range(500):
+        lossless_bus.publish(ImageEvent(volume="T1", index=image_index, url="", ok=True))
+    lossless_bus.remove_listener(lossless_received.append)
+    lossless_bus.publish(ImageEvent(volume="T1", index=500, url="", ok=True))
+    lossless_subscription.close()
+    check(
+        "bus evenements ecouteur sans perte",
+        [event.index for event in lossless_received] == list(range(500)) and lossless_subscription.dropped == 491,
+    )
+    from cli.download import CliDownloadController
+    from cli.events import ErrorEvent, LogEvent
+    from cli.state import CliDownloadError, CliState
+
+    error_controller = CliDownloadController(None, CliState(cookies={}, user_agent=""), "")
+    error_subscription = error_controller.subscribe(maxsize=3, replay=False)
+    error_controller._add_error(CliDownloadError(tome="T1", stage="get_images", reason="HTTP 403"))
+    for log_index in range(10):
+        error_controller.events.publish(LogEvent(f"ligne {log_index}"))
+    error_subscription.close()
+    check(
+        "tui erreurs lues depuis le controleur",
+        not any(isinstance(event, ErrorEvent) for event in error_subscription.drain())
+        and [error.tome for error in error_controller.errors()] == ["T1"],
+    )
+    from cli.events import ProgressEvent, apply_event, progress_event_from_status
+    from cli.state import CliDownloadStatus
+
+    bounded_bus = EventBus()
+    bounded_subscription = bounded_bus.subscribe(maxsize=3)
+    for log_index in range(5):
+        bounded_bus.publish(LogEvent(f"ligne {log_index}"))
+    for percent in (10.0, 20.0, 30.0):
+        bounded_bus.publish(progress_event_from_status(CliDownloadStatus(global_percent=percent)))
+    bounded_events = bounded_subscription.drain()
+    bounded_subscription.close()
+    check(
+        "bus evenements borne ecarte les plus anciens et fusionne la progression",
+        [getattr(event, "message", None) for event in bounded_events] == ["ligne 3", "ligne 4", None]
+        and bounded_events[-1].global_percent == 30.0
+        and bounded_subscription.dropped == 3,
+    )
+    replay_controller = CliDownloadController(None, CliState(cookies={}, user_agent=""), "")
+    replay_controller._append_log("Preparation")
+    replay_controller._add_error(CliDownloadError(tome="T2", stage="download", reason="HTTP 500"))
+    replay_subscription = replay_controller.subscribe()
+    replayed_status = CliDownloadStatus()
+    replayed_events = replay_subscription.drain()
+    replay_subscription.close()
+    for event in replayed_events:
+        apply_event(replayed_status, event)
+    check(
+        "bus evenements rejoue l'etat au nouvel abonne",
+        [type(event) for event in replayed_events] == [ProgressEvent, LogEvent, ErrorEvent]
+        and replayed_status.logs == ["Preparation"]
+        and [error.tome for error in replayed_status.errors] == ["T2"],
+    )
+
+    from io import StringIO
+
+    from cli.events import JsonLinesReporter
+
+    class StreamProbeBackend:
+        def resolve_domain(self, _url):
+            return "net"
+
+        def analyze_url(self, url, _cookies, _user_agent):
+            return "Titre", "net", [("Tome 1", f"{url}tome-1/")], {}, {}
+
+        def get_images_for_download(self, _url, _cookie, _ua, cancel_event=None):
+            return [f"https://example.test/{image_index}.jpg" for image_index in range(3000)]
+
+        def download_selected_volume(self, image_urls, image_callback, error_callback, **_kwargs):
+            for image_index, image_url in enumerate(image_urls):
+                image_callback({"index": image_index, "url": image_url, "ok": image_index != 7, "bytes": 10})
+            error_callback({"stage": "download", "reason": "HTTP 404", "status_code": 404, "kind": "http"})
+            return True
+
+    stream_buffer = StringIO()
+    stream_code = _run_batch_cli_urls(
+        argparse.Namespace(selection_range="all", dry_run=False, download=True),
+        ["https://sushiscan.net/catalogue/flux/"],
+        StreamProbeBackend(),
+        CliState(cookies={}, user_agent=""),
+        tempfile.gettempdir(),
+        StringIO(),
+        JsonLinesReporter(stream_buffer),
+    )
+    stream_records = [json.loads(line) for line in stream_buffer.getvalue().splitlines()]
+    stream_kinds = [record["event"] for record in stream_records]
+    check(
+        "flux jsonl complet, filtre et bilan",
+        stream_code == 1
+        and stream_kinds.count("image") == 3000
+        and [record["index"] for record in stream_records if record["event"] == "image" and not record["ok"]] == [7]
+        and [record["phase"] for record in stream_records if record["event"] == "catalogue"]
+        == ["analysis_start", "analysis_done", "download_start", "download_done"]
+        and [record["phase"] for record in stream_records if record["event"] == "volume"] == ["start", "done"]
+        and [record.get("status_code") for record in stream_records if record["event"] == "error"] == [404]
+        and not {"log", "progress"} & set(stream_kinds)
+        and stream_records[-1]["event"] == "summary"
+        and stream_records[-1]["errors"] == 1,
+    )
+
+    from cli.actions import apply_text_filter
+    from cli.state import CliItem
+
+    filter_state = CliState(cookies={}, user_agent="")
+    filter_state.detected_items = [
+        CliItem(index=item_index + 1, label=f"Chapitre {item_index}", url=f"https://example.test/{item_index}/")
+        for item_index in range(200)
+    ]
+    apply_text_filter(filter_state, "chapitre 1")
+    broad_matches = len(filter_state.filtered_indices)
+    filter_state.search_labels[5] = "chapitre 15 ecarte par le premier filtre"
+    apply_text_filter(filter_state, "chapitre 15")
+    check(
+        "tui filtre affine sur les lignes visibles",
+        broad_matches == 111 and filter_state.filtered_indices == [15] + list(range(150, 160)),
+    )
+
+    async def probe_virtual_chapter_list():
+        from rich.text import Text
+        from textual.app import App
+        from cli.widgets import VirtualChapterList
+
+        rendered_rows = []
+
+        def render_row(row):
+            rendered_rows.append(row)
+            return Text(f"Chapitre {row}")
+
+        class VirtualListProbe(App):
+            def compose(self):
+                yield VirtualChapterList(render_row)
+
+        probe_app = VirtualListProbe()
+        async with probe_app.run_test(size=(40, 10)) as pilot:
+            chapter_list = probe_app.query_one(VirtualChapterList)
+            chapter_list.set_row_count(100000)
+            await pilot.pause()
+            first_rows = sorted(set(rendered_rows))
+            rendered_rows.clear()
+            chapter_list.index = 50000
+            await pilot.pause()
+            return first_rows, sorted(set(rendered_rows))
+
+    try:
+        import asyncio
+
+        first_window, scrolled_window = asyncio.run(probe_virtual_chapter_list())
+    except Exception as exc:
+        checks.append(("tui liste virtualisee", False, f"{type(exc).__name__}: {exc}"))
+    else:
+        check(
+            "tui liste virtualisee ne rend que les lignes visibles",
+            first_window == list(range(10)) and scrolled_window == list(range(49991, 50001)),
+        )
+    check("engine url scan-manga", Engine.classify_url("https://www.scan-manga.com/16363/Death-Penalty.html") == "scanmanga")
+    check("engine url non supportee", Engine.classify_url("https://example.com/manga/x/") == "")
+    check("engine pipeline sans double import", Engine().core is sys.modules[__name__])
+
+    import_probe = (
+        "import sys, time\n"
+        "import engine, engine.http, engine.parsers\n"
+        "engine_alone = 'SushiDL' not in sys.modules and 'curl_cffi' not in sys.modules\n"
+        "started = time.perf_counter()\n"
+        "import SushiDL\n"
+        "elapsed = time.perf_counter() - started\n"
+        "heavy = [name for name in ('tkinter', 'customtkinter', 'playwright') if name in sys.modules]\n"
+        "print(f'{elapsed:.4f} {int(engine_alone)} {\",\".join(heavy)}')\n"
+    )
+    try:
+        probe = subprocess.run(
+            [sys.executable, "-c", import_probe],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            capture_output=True,
+            text=True,
+            timeout=60,
+        )
+        probe_fields = (probe.stdout.strip().splitlines() or [""])[-1].split(" ", 2)
+        import_seconds = float(probe_fields[0])
+        engine_alone = probe_fields[1] == "1"
+        heavy_modules = probe_fields[2] if len(probe_fields) > 2 else ""
+    except Exception as exc:
+        checks.append(("import headless mesure", False, f"{type(exc).__name__}: {exc}"))
+    else:
+        check("import engine sans pipeline complet", engine_alone)
+        check("import headless sans tk/customtkinter/playwright", not heavy_modules)
+        check(
+            f"import headless {import_seconds * 1000:.0f} ms <= {HEADLESS_IMPORT_BUDGET_SECONDS * 1000:.0f} ms",
+            import_seconds <= HEADLESS_IMPORT_BUDGET_SECONDS,
+        )
 
     failed = [(name, detail) for name, ok, detail in checks if not ok]
     for name, ok, detail in checks:
@@ -18208,6 +20449,17 @@ def run_batch_cli(argv, backend=None):
     parser.add_argument("--threads", type=int, default=None, help="Nombre de telechargements paralleles (1-8).")
     parser.add_argument("--self-test", action="store_true", help="Execute les tests internes sans reseau.")
     parser.add_argument("--diagnostic", action="store_true", help="Affiche un diagnostic JSON sans secrets.")
+    parser.add_argument(
+        "--progress-format",
+        choices=("text", "jsonl"),
+        default="text",
+        help="Format de progression: text (defaut) ou jsonl (evenements image/volume/catalogue/erreur).",
+    )
+    parser.add_argument(
+        "--progress-file",
+        default="",
+        help="Fichier recevant le flux jsonl (defaut: sortie standard, le texte passe alors sur stderr).",
+    )
     args = parser.parse_args([arg for arg in argv if arg != "--cli"])
 
     if args.self_test:
@@ -18228,9 +20480,8 @@ def run_batch_cli(argv, backend=None):
         parser.print_help()
         return 2
 
-    from cli.actions import apply_range_selection, load_state
-    from cli.download import CliDownloadController
-    from cli.state import CliItem
+    from cli.actions import load_state
+    from cli.events import JsonLinesReporter
 
     backend = backend or SushiCliBackend()
     state = load_state(backend)
@@ -18244,9 +20495,41 @@ def run_batch_cli(argv, backend=None):
     output_dir = os.path.abspath(args.output or ROOT_FOLDER)
     os.makedirs(output_dir, exist_ok=True)
 
+    text_out = sys.stdout
+    reporter = None
+    progress_handle = None
+    if args.progress_format == "jsonl":
+        progress_path = (args.progress_file or "").strip()
+        if progress_path and progress_path != "-":
+            try:
+                progress_handle = open(progress_path, "a", encoding="utf-8")
+            except OSError as exc:
+                print(f"Erreur ouverture fichier progression: {exc}")
+                return 2
+            reporter = JsonLinesReporter(progress_handle)
+        else:
+            reporter = JsonLinesReporter(sys.stdout)
+            text_out = sys.stderr
+
+    try:
+        return _run_batch_cli_urls(args, urls, backend, state, output_dir, text_out, reporter)
+    finally:
+        if progress_handle is not None:
+            progress_handle.close()
+
+
+def _run_batch_cli_urls(args, urls, backend, state, output_dir, text_out, reporter):
+    from cli.actions import apply_range_selection
+    from cli.download import CliDownloadController
+    from cli.events import CatalogueEvent, ProgressEvent, StreamSummaryEvent
+    from cli.state import CliItem
+
     exit_code = 0
     for url_index, url in enumerate(urls, start=1):
-        print(f"\n[{url_index}/{len(urls)}] Analyse: {url}")
+        print(f"\n[{url_index}/{len(urls)}] Analyse: {url}", file=text_out)
+        analysis_started_at = time.perf_counter()
+        if reporter:
+            reporter.write(CatalogueEvent(phase="analysis_start", url=url, domain=backend.resolve_domain(url)))
         try:
             title, domain, pairs, metadata, series_metadata = backend.analyze_url(
                 url,
@@ -18254,7 +20537,17 @@ def run_batch_cli(argv, backend=None):
                 state.user_agent,
             )
         except Exception as exc:
-            print(f"Echec analyse: {exc}")
+            print(f"Echec analyse: {exc}", file=text_out)
+            if reporter:
+                reporter.write(
+                    CatalogueEvent(
+                        phase="analysis_failed",
+                        url=url,
+                        domain=backend.resolve_domain(url),
+                        duration=time.perf_counter() - analysis_started_at,
+                        reason=str(exc),
+                    )
+                )
             exit_code = 1
             continue
 
@@ -18283,47 +20576,85 @@ def run_batch_cli(argv, backend=None):
             }
 
         premium_count = sum(1 for item in state.detected_items if item.premium)
-        print(f"Titre: {title}")
-        print(f"Domaine: {domain}")
-        print(f"Elements detectes: {len(state.detected_items)} | selectionnes: {len(state.selected_urls)} | premium ignores: {premium_count}")
+        if reporter:
+            reporter.write(
+                CatalogueEvent(
+                    phase="analysis_done",
+                    url=url,
+                    title=title,
+                    domain=domain,
+                    items=len(state.detected_items),
+                    selected=len(state.selected_urls),
+                    duration=time.perf_counter() - analysis_started_at,
+                )
+            )
+        print(f"Titre: {title}", file=text_out)
+        print(f"Domaine: {domain}", file=text_out)
+        print(f"Elements detectes: {len(state.detected_items)} | selectionnes: {len(state.selected_urls)} | premium ignores: {premium_count}", file=text_out)
         if args.dry_run or not args.download:
             preview = [item for item in state.detected_items if item.url in state.selected_urls][:20]
             for item in preview:
-                print(f"  - {item.index}. {item.label}")
+                print(f"  - {item.index}. {item.label}", file=text_out)
             if len(state.selected_urls) > len(preview):
-                print(f"  ... {len(state.selected_urls) - len(preview)} autre(s)")
+                print(f"  ... {len(state.selected_urls) - len(preview)} autre(s)", file=text_out)
             continue
 
         controller = CliDownloadController(backend, state, output_dir)
+        # Le flux jsonl est lu par d'autres programmes : il est écrit par un
+        # écouteur synchrone, sans file bornée. L'abonnement ne sert qu'à la
+        # ligne de progression texte, où seul le dernier état compte.
+        subscription = controller.subscribe(replay=False)
+        if reporter:
+            controller.add_listener(reporter.write)
         controller.start()
         last_line = ""
-        while True:
-            snapshot = controller.snapshot()
-            line = (
-                f"{snapshot.global_percent:5.1f}% | "
-                f"{snapshot.completed_volumes}/{snapshot.total_volumes} | "
-                f"{snapshot.current_volume} | "
-                f"{snapshot.current_images_done}/{snapshot.current_images_total} images | "
-                f"ETA {snapshot.eta_global}"
-            )
-            if line != last_line:
-                print(line)
-                last_line = line
-            if not snapshot.active:
-                break
-            time.sleep(0.8)
+        last_print_at = 0.0
+        final = None
+        try:
+            while True:
+                event = subscription.get(timeout=1.0)
+                if event is None:
+                    if controller._thread and not controller._thread.is_alive():
+                        break
+                    continue
+                if not isinstance(event, ProgressEvent):
+                    continue
+                final = event
+                line = (
+                    f"{event.global_percent:5.1f}% | "
+                    f"{event.completed_volumes}/{event.total_volumes} | "
+                    f"{event.current_volume} | "
+                    f"{event.current_images_done}/{event.current_images_total} images | "
+                    f"ETA {event.eta_global}"
+                )
+                now = time.monotonic()
+                if line != last_line and (event.finished or now - last_print_at >= 0.8):
+                    print(line, file=text_out)
+                    last_line = line
+                    last_print_at = now
+                if event.finished:
+                    break
+        finally:
+            subscription.close()
         if controller._thread:
-            controller._thread.join(timeout=1)
-        final = controller.snapshot()
-        print(final.status_message)
-        if final.errors:
+            controller._thread.join()
+        if reporter:
+            controller.remove_listener(reporter.write)
+        # Les erreurs viennent de l'etat du controleur, pas des evenements recus :
+        # la file de l'abonnement est bornee et peut en avoir ecarte.
+        final_status = controller.snapshot()
+        errors = final_status.errors
+        if reporter:
+            reporter.write(StreamSummaryEvent(url=url, errors=len(errors)))
+        print(final.status_message if final else final_status.status_message, file=text_out)
+        if errors:
             exit_code = 1
-            print(f"Erreurs: {len(final.errors)}")
-            for err in final.errors[:20]:
+            print(f"Erreurs: {len(errors)}", file=text_out)
+            for err in errors[:20]:
                 http = f" HTTP {err.status_code}" if err.status_code else ""
-                print(f"  - {err.tome} [{err.stage}{http}] {err.reason}")
-            if len(final.errors) > 20:
-                print(f"  ... {len(final.errors) - 20} autre(s)")
+                print(f"  - {err.tome} [{err.stage}{http}] {err.reason}", file=text_out)
+            if len(errors) > 20:
+                print(f"  ... {len(errors) - 20} autre(s)", file=text_out)
     return exit_code
 
 
@@ -72,6 +72,8 @@ def analyze_current_url(backend: CliBackend, state: CliState) -> None:
         for idx, (label, item_url) in enumerate(pairs)
     ]
     state.filtered_indices = list(range(len(state.detected_items)))
+    state.filter_text = ""
+    state.search_labels = [item.label.lower() for item in state.detected_items]
     state.selected_urls = {item.url for item in state.detected_items}
     premium_count = sum(1 for item in state.detected_items if item.premium)
     suffix = f", dont {premium_count} premium" if premium_count else ""
@@ -80,24 +82,34 @@ def analyze_current_url(backend: CliBackend, state: CliState) -> None:
 
 def apply_text_filter(state: CliState, text: str) -> None:
     needle = (text or "").strip().lower()
+    if len(state.search_labels) != len(state.detected_items):
+        state.search_labels = [item.label.lower() for item in state.detected_items]
+        state.filter_text = ""
+        state.filtered_indices = list(range(len(state.detected_items)))
+    previous = state.filter_text
+    state.filter_text = needle
     if not needle:
         state.filtered_indices = list(range(len(state.detected_items)))
         return
-    visible = []
-    for idx, item in enumerate(state.detected_items):
-        if needle in item.label.lower():
-            visible.append(idx)
-    state.filtered_indices = visible
+    labels = state.search_labels
+    if previous and needle.startswith(previous):
+        # Filtre affine : on ne rescanne que les lignes encore visibles.
+        candidates = state.filtered_indices
+    else:
+        candidates = range(len(labels))
+    state.filtered_indices = [idx for idx in candidates if needle in labels[idx]]
 
 
-def toggle_item_selection(state: CliState, visible_index: int) -> None:
+def toggle_item_selection(state: CliState, visible_index: int) -> int | None:
     if visible_index < 0 or visible_index >= len(state.filtered_indices):
-        return
-    item = state.detected_items[state.filtered_indices[visible_index]]
+        return None
+    item_index = state.filtered_indices[visible_index]
+    item = state.detected_items[item_index]
     if item.url in state.selected_urls:
         state.selected_urls.remove(item.url)
     else:
         state.selected_urls.add(item.url)
+    return item_index
 
 
 def select_all(state: CliState) -> None:
@@ -234,7 +234,7 @@ class SushiTerminalApp(App):
 
     def action_request_quit(self) -> None:
         controller = self.download_controller
-        if controller and controller.snapshot().active:
+        if controller and controller.is_active:
             def confirm_active(result: str | None) -> None:
                 if result == "confirm":
                     controller.cancel()
@@ -4,6 +4,17 @@ import threading
 import time
 from dataclasses import replace
 
+from .events import (
+    MAX_STATUS_LOGS,
+    CatalogueEvent,
+    ErrorEvent,
+    EventBus,
+    EventSubscription,
+    ImageEvent,
+    LogEvent,
+    VolumeEvent,
+    progress_event_from_status,
+)
 from .state import CliDownloadError, CliDownloadStatus, CliState
 
 
@@ -27,6 +38,7 @@ class CliDownloadController:
         self._thread: threading.Thread | None = None
         self._lock = threading.Lock()
         self._start_time = 0.0
+        self.events = EventBus()
 
     def start(self) -> None:
         with self._lock:
@@ -43,16 +55,19 @@ class CliDownloadController:
                 current_images_done=0,
                 current_images_total=0,
                 global_percent=0.0,
-                logs=["Préparation du téléchargement..."],
+                logs=[],
                 errors=[],
                 status_message="Preparation...",
                 eta_volume="--:--",
                 eta_global="--:--",
                 elapsed="00:00",
             )
+            self._append_log("Préparation du téléchargement...")
+            self._publish_progress()
         self._start_time = time.time()
         if premium_skipped:
-            self.state.download_status.logs.append(f"{len(premium_skipped)} élément(s) premium ignoré(s).")
+            with self._lock:
+                self._append_log(f"{len(premium_skipped)} élément(s) premium ignoré(s).")
         self._thread = threading.Thread(target=self._run, daemon=True)
         self._thread.start()
 
@@ -61,6 +76,29 @@ class CliDownloadController:
         with self._lock:
             self._append_log("Annulation demandee...")
             self.state.download_status.status_message = "Annulation demandee..."
+            self._publish_progress()
+
+    @property
+    def is_active(self) -> bool:
+        return self.state.download_status.active
+
+    def subscribe(self, maxsize: int = 2000, replay: bool = True) -> EventSubscription:
+        """Abonne un consommateur; avec ``replay``, l'etat courant est rejoue en premier."""
+        with self._lock:
+            initial = []
+            if replay:
+                status = self.state.download_status
+                initial.append(progress_event_from_status(status))
+                initial.extend(LogEvent(message) for message in status.logs)
+                initial.extend(ErrorEvent(error) for error in status.errors)
+            return self.events.subscribe(maxsize=maxsize, initial_events=initial)
+
+    def add_listener(self, callback) -> None:
+        """Appelle ``callback`` pour chaque evenement, sur le thread qui le publie, sans perte."""
+        self.events.add_listener(callback)
+
+    def remove_listener(self, callback) -> None:
+        self.events.remove_listener(callback)
 
     def snapshot(self) -> CliDownloadStatus:
         with self._lock:
@@ -84,13 +122,27 @@ class CliDownloadController:
                 elapsed=status.elapsed,
             )
 
+    def errors(self) -> list[CliDownloadError]:
+        """Copie de la liste d'erreurs : contrairement aux abonnements bornes, elle ne perd rien."""
+        with self._lock:
+            return list(self.state.download_status.errors)
+
     def _append_log(self, message: str) -> None:
         if not message:
             return
+        message = str(message).strip()
         logs = self.state.download_status.logs
-        logs.append(str(message).strip())
-        if len(logs) > 12:
-            del logs[:-12]
+        logs.append(message)
+        if len(logs) > MAX_STATUS_LOGS:
+            del logs[:-MAX_STATUS_LOGS]
+        self.events.publish(LogEvent(message))
+
+    def _add_error(self, error: CliDownloadError) -> None:
+        self.state.download_status.errors.append(error)
+        self.events.publish(ErrorEvent(error))
+
+    def _publish_progress(self) -> None:
+        self.events.publish(progress_event_from_status(self.state.download_status))
 
     def _refresh_eta(self, completed: int, total: int, done_images: int, total_images: int) -> None:
         elapsed = max(0.0, time.time() - self._start_time)
@@ -130,12 +182,27 @@ class CliDownloadController:
                 status.finished = True
                 status.status_message = "Aucun element selectionne."
                 self._append_log("Aucun element selectionne.")
+                self._publish_progress()
             return
 
         for skipped in premium_skipped:
             with self._lock:
                 self._append_log(f"Ignoré premium: {skipped.label}")
 
+        run_started_at = time.perf_counter()
+        run_totals = {"bytes": 0, "failed": 0}
+        with self._lock:
+            self.events.publish(
+                CatalogueEvent(
+                    phase="download_start",
+                    url=self.state.current_url,
+                    title=title,
+                    domain=self.state.current_domain,
+                    items=len(self.state.detected_items),
+                    selected=len(selected_items),
+                )
+            )
+
         for index, item in enumerate(selected_items, start=1):
             if self.cancel_event.is_set():
                 break
@@ -149,20 +216,63 @@ class CliDownloadController:
                 self._append_log(f"Preparation: {item.label}")
                 status.global_percent = ((index - 1) / max(1, len(selected_items))) * 100.0
                 self._refresh_eta(index - 1, len(selected_items), 0, 0)
+                self._publish_progress()
+            volume_started_at = time.perf_counter()
+            volume_stats = {"ok": 0, "failed": 0, "bytes": 0, "retries": 0}
+
+            def finish_volume(result: str, images_total: int = 0) -> None:
+                if result != "ok":
+                    run_totals["failed"] += 1
+                run_totals["bytes"] += volume_stats["bytes"]
+                self.events.publish(
+                    VolumeEvent(
+                        phase="done",
+                        volume=item.label,
+                        url=item.url,
+                        position=index,
+                        total=len(selected_items),
+                        images_total=images_total,
+                        images_ok=volume_stats["ok"],
+                        images_failed=volume_stats["failed"],
+                        bytes=volume_stats["bytes"],
+                        retries=volume_stats["retries"],
+                        duration=time.perf_counter() - volume_started_at,
+                        result=result,
+                    )
+                )
 
+            prefetch_images = getattr(self.backend, "prefetch_images", None)
+            if callable(prefetch_images):
+                is_volume_archived = getattr(self.backend, "is_volume_archived", None)
+                try:
+                    prefetch_images(
+                        [
+                            next_item.url
+                            for next_item in selected_items[index:]
+                            if not (callable(is_volume_archived) and is_volume_archived(title, next_item.label, self.output_dir))
+                        ],
+                        cookie,
+                        ua,
+                        cancel_event=self.cancel_event,
+                        current_url=item.url,
+                    )
+                except Exception:
+                    pass
             try:
                 image_urls = self.backend.get_images_for_download(item.url, cookie, ua, cancel_event=self.cancel_event)
             except Exception as exc:
                 with self._lock:
-                    status.errors.append(
+                    self._add_error(
                         CliDownloadError(
                             tome=item.label,
                             stage="get_images",
                             reason=str(exc),
+                            status_code=getattr(exc, "status_code", None),
                             action="Verifier le cookie, le User-Agent ou l'URL.",
                         )
                     )
                     self._append_log(f"Echec analyse images: {item.label}")
+                    finish_volume("failed")
                 continue
 
             if self.cancel_event.is_set():
@@ -170,7 +280,7 @@ class CliDownloadController:
 
             if not image_urls:
                 with self._lock:
-                    status.errors.append(
+                    self._add_error(
                         CliDownloadError(
                             tome=item.label,
                             stage="get_images",
@@ -179,8 +289,21 @@ class CliDownloadController:
                         )
                     )
                     self._append_log(f"Aucune image: {item.label}")
+                    finish_volume("failed")
                 continue
 
+            with self._lock:
+                self.events.publish(
+                    VolumeEvent(
+                        phase="start",
+                        volume=item.label,
+                        url=item.url,
+                        position=index,
+                        total=len(selected_items),
+                        images_total=len(image_urls),
+                    )
+                )
+
             def logger(message, level="info"):
                 if not message:
                     return
@@ -197,16 +320,39 @@ class CliDownloadController:
                     status.global_percent = ((index - 1) + current_fraction) / max(1, len(selected_items)) * 100.0
                     status.status_message = f"Téléchargement {item.label}"
                     self._refresh_eta(index - 1, len(selected_items), int(done or 0), int(total_images or 0))
+                    self._publish_progress()
 
             def error_callback(payload):
                 with self._lock:
-                    status.errors.append(
+                    self._add_error(
                         CliDownloadError(
                             tome=(payload or {}).get("tome") or item.label,
                             stage=(payload or {}).get("stage") or "download",
                             reason=(payload or {}).get("reason") or "Erreur inconnue",
                             status_code=(payload or {}).get("status_code"),
                             action=(payload or {}).get("action") or "",
+                            kind=(payload or {}).get("kind") or "",
+                        )
+                    )
+
+            def image_callback(payload):
+                payload = payload or {}
+                with self._lock:
+                    ok = bool(payload.get("ok"))
+                    volume_stats["ok" if ok else "failed"] += 1
+                    volume_stats["bytes"] += int(payload.get("bytes") or 0)
+                    volume_stats["retries"] += int(payload.get("retries") or 0)
+                    self.events.publish(
+                        ImageEvent(
+                            volume=item.label,
+                            index=int(payload.get("index") or 0),
+                            url=payload.get("url") or "",
+                            ok=ok,
+                            bytes=int(payload.get("bytes") or 0),
+                            duration=float(payload.get("duration") or 0.0),
+                            retries=int(payload.get("retries") or 0),
+                            kind=payload.get("kind") or "",
+                            status_code=payload.get("status_code"),
                         )
                     )
 
@@ -230,20 +376,25 @@ class CliDownloadController:
                 total_count=len(self.state.detected_items),
                 series_metadata=self.state.series_metadata,
                 volume_metadata=getattr(self.state, "volume_metadata", {}),
+                image_callback=image_callback,
             )
 
             with self._lock:
                 if result:
                     status.completed_volumes += 1
                     self._append_log(f"Termine: {item.label}")
+                    finish_volume("ok", len(image_urls))
                 elif self.cancel_event.is_set():
                     self._append_log(f"Annule: {item.label}")
+                    finish_volume("cancelled", len(image_urls))
                 else:
                     self._append_log(f"Echec: {item.label}")
+                    finish_volume("failed", len(image_urls))
                 status.current_images_done = 0
                 status.current_images_total = 0
                 status.global_percent = (status.completed_volumes / max(1, len(selected_items))) * 100.0
                 self._refresh_eta(status.completed_volumes, len(selected_items), 0, 0)
+                self._publish_progress()
 
         with self._lock:
             status.active = False
@@ -264,3 +415,20 @@ class CliDownloadController:
             else:
                 status.status_message = "Téléchargement terminé."
                 self._append_log("Téléchargement terminé.")
+            self.events.publish(
+                CatalogueEvent(
+                    phase="download_done",
+                    url=self.state.current_url,
+                    title=title,
+                    domain=self.state.current_domain,
+                    items=len(self.state.detected_items),
+                    selected=len(selected_items),
+                    volumes_ok=status.completed_volumes,
+                    volumes_failed=run_totals["failed"],
+                    errors=len(status.errors),
+                    bytes=run_totals["bytes"],
+                    duration=time.perf_counter() - run_started_at,
+                    reason="cancelled" if status.cancelled else "",
+                )
+            )
+            self._publish_progress()
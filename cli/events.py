@@ -0,0 +1,285 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+from collections import deque
+from dataclasses import asdict, dataclass, field
+
+from .state import CliDownloadError, CliDownloadStatus
+
+MAX_STATUS_LOGS = 12
+
+
+@dataclass(slots=True)
+class ProgressEvent:
+    active: bool
+    finished: bool
+    cancelled: bool
+    output_dir: str
+    total_volumes: int
+    completed_volumes: int
+    current_volume: str
+    current_images_done: int
+    current_images_total: int
+    global_percent: float
+    status_message: str
+    eta_volume: str
+    eta_global: str
+    elapsed: str
+    ts: float = field(default_factory=time.time)
+
+
+@dataclass(slots=True)
+class LogEvent:
+    message: str
+    level: str = "info"
+    ts: float = field(default_factory=time.time)
+
+
+@dataclass(slots=True)
+class ErrorEvent:
+    error: CliDownloadError
+    ts: float = field(default_factory=time.time)
+
+
+@dataclass(slots=True)
+class ImageEvent:
+    volume: str
+    index: int
+    url: str
+    ok: bool
+    bytes: int = 0
+    duration: float = 0.0
+    retries: int = 0
+    kind: str = ""
+    status_code: int | None = None
+    ts: float = field(default_factory=time.time)
+
+
+@dataclass(slots=True)
+class VolumeEvent:
+    phase: str
+    volume: str
+    url: str
+    position: int
+    total: int
+    images_total: int = 0
+    images_ok: int = 0
+    images_failed: int = 0
+    bytes: int = 0
+    retries: int = 0
+    duration: float = 0.0
+    result: str = ""
+    ts: float = field(default_factory=time.time)
+
+
+@dataclass(slots=True)
+class CatalogueEvent:
+    phase: str
+    url: str
+    title: str = ""
+    domain: str = ""
+    items: int = 0
+    selected: int = 0
+    volumes_ok: int = 0
+    volumes_failed: int = 0
+    errors: int = 0
+    bytes: int = 0
+    duration: float = 0.0
+    reason: str = ""
+    ts: float = field(default_factory=time.time)
+
+
+@dataclass(slots=True)
+class StreamSummaryEvent:
+    """Bilan d'un flux d'evenements : nombre d'erreurs du catalogue telecharge."""
+
+    url: str
+    errors: int = 0
+    ts: float = field(default_factory=time.time)
+
+
+EVENT_NAMES = {
+    ProgressEvent: "progress",
+    LogEvent: "log",
+    ErrorEvent: "error",
+    ImageEvent: "image",
+    VolumeEvent: "volume",
+    CatalogueEvent: "catalogue",
+    StreamSummaryEvent: "summary",
+}
+
+
+def event_to_dict(event) -> dict:
+    if isinstance(event, ErrorEvent):
+        payload = asdict(event.error)
+        payload["kind"] = payload.get("kind") or payload.get("stage") or "unknown"
+        payload["ts"] = event.ts
+    else:
+        payload = asdict(event)
+    if "duration" in payload:
+        payload["duration"] = round(float(payload["duration"]), 4)
+    return {"event": EVENT_NAMES.get(type(event), type(event).__name__), **payload}
+
+
+class JsonLinesReporter:
+    """Ecrit les evenements machine (une ligne JSON par evenement)."""
+
+    DEFAULT_EVENTS = frozenset({"image", "volume", "catalogue", "error", "summary"})
+
+    def __init__(self, stream, events=DEFAULT_EVENTS):
+        self.stream = stream
+        self.events = frozenset(events)
+        self._lock = threading.Lock()
+
+    def write(self, event) -> None:
+        payload = event_to_dict(event)
+        if payload["event"] not in self.events:
+            return
+        line = json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+        with self._lock:
+            self.stream.write(line + "\n")
+            self.stream.flush()
+
+
+def progress_event_from_status(status: CliDownloadStatus) -> ProgressEvent:
+    return ProgressEvent(
+        active=status.active,
+        finished=status.finished,
+        cancelled=status.cancelled,
+        output_dir=status.output_dir,
+        total_volumes=status.total_volumes,
+        completed_volumes=status.completed_volumes,
+        current_volume=status.current_volume,
+        current_images_done=status.current_images_done,
+        current_images_total=status.current_images_total,
+        global_percent=status.global_percent,
+        status_message=status.status_message,
+        eta_volume=status.eta_volume,
+        eta_global=status.eta_global,
+        elapsed=status.elapsed,
+    )
+
+
+def apply_event(status: CliDownloadStatus, event) -> None:
+    """Applique un evenement sur une vue locale de l'etat du telechargement."""
+    if isinstance(event, ProgressEvent):
+        status.active = event.active
+        status.finished = event.finished
+        status.cancelled = event.cancelled
+        status.output_dir = event.output_dir
+        status.total_volumes = event.total_volumes
+        status.completed_volumes = event.completed_volumes
+        status.current_volume = event.current_volume
+        status.current_images_done = event.current_images_done
+        status.current_images_total = event.current_images_total
+        status.global_percent = event.global_percent
+        status.status_message = event.status_message
+        status.eta_volume = event.eta_volume
+        status.eta_global = event.eta_global
+        status.elapsed = event.elapsed
+    elif isinstance(event, LogEvent):
+        status.logs.append(event.message)
+        if len(status.logs) > MAX_STATUS_LOGS:
+            del status.logs[:-MAX_STATUS_LOGS]
+    elif isinstance(event, ErrorEvent):
+        status.errors.append(event.error)
+
+
+class EventSubscription:
+    """File bornee propre a un abonne.
+
+    Les evenements de progression consecutifs sont fusionnes : seul le plus
+    recent est conserve. Au-dela de ``maxsize``, les evenements les plus
+    anciens sont ecartes et comptes dans ``dropped``.
+    """
+
+    def __init__(self, bus: "EventBus", maxsize: int = 2000):
+        self._bus = bus
+        self._events: deque = deque()
+        self._cond = threading.Condition()
+        self._maxsize = max(1, int(maxsize))
+        self.dropped = 0
+        self.closed = False
+
+    def push(self, event) -> None:
+        with self._cond:
+            if self.closed:
+                return
+            if isinstance(event, ProgressEvent) and self._events and isinstance(self._events[-1], ProgressEvent):
+                self._events[-1] = event
+            else:
+                self._events.append(event)
+                if len(self._events) > self._maxsize:
+                    self._events.popleft()
+                    self.dropped += 1
+            self._cond.notify_all()
+
+    def get(self, timeout: float | None = None):
+        """Attend le prochain evenement; retourne ``None`` en cas de delai ou de fermeture."""
+        with self._cond:
+            if not self._events and not self.closed:
+                self._cond.wait(timeout)
+            if self._events:
+                return self._events.popleft()
+            return None
+
+    def drain(self) -> list:
+        with self._cond:
+            events = list(self._events)
+            self._events.clear()
+            return events
+
+    def close(self) -> None:
+        self._bus.unsubscribe(self)
+        with self._cond:
+            self.closed = True
+            self._cond.notify_all()
+
+
+class EventBus:
+    """Diffuse les evenements aux abonnes (files bornees) et aux ecouteurs.
+
+    Les ecouteurs sont appeles sur le thread qui publie : rien n'est ecarte,
+    au prix de ralentir le producteur si l'ecouteur est lent.
+    """
+
+    def __init__(self):
+        self._subscribers: list[EventSubscription] = []
+        self._listeners: list = []
+        self._lock = threading.Lock()
+
+    def subscribe(self, maxsize: int = 2000, initial_events=None) -> EventSubscription:
+        subscription = EventSubscription(self, maxsize=maxsize)
+        for event in initial_events or ():
+            subscription.push(event)
+        with self._lock:
+            self._subscribers.append(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: EventSubscription) -> None:
+        with self._lock:
+            if subscription in self._subscribers:
+                self._subscribers.remove(subscription)
+
+    def add_listener(self, callback) -> None:
+        with self._lock:
+            self._listeners.append(callback)
+
+    def remove_listener(self, callback) -> None:
+        with self._lock:
+            if callback in self._listeners:
+                self._listeners.remove(callback)
+
+    def publish(self, event) -> None:
+        with self._lock:
+            subscribers = tuple(self._subscribers)
+            listeners = tuple(self._listeners)
+        for subscription in subscribers:
+            subscription.push(event)
+        for callback in listeners:
+            try:
+                callback(event)
+            except Exception:
+                pass
@@ -5,7 +5,9 @@ from textual.containers import Horizontal, Vertical
 from textual.screen import Screen
 from textual.widgets import Button, Label, ProgressBar, Static
 
+from .events import apply_event
 from .modals import ConfirmModal, HelpModal, MessageModal
+from .state import CliDownloadStatus
 
 
 class DownloadScreen(Screen):
@@ -46,22 +48,60 @@ class DownloadScreen(Screen):
 
     def on_mount(self) -> None:
         self._completion_announced = False
-        self.set_interval(0.2, self.refresh_from_controller)
+        self._subscription = None
+        self._subscribed_controller = None
+        self._view_status = CliDownloadStatus()
+        self.set_interval(0.2, self._pump_events)
         self.refresh_from_controller()
 
     def on_show(self) -> None:
         self.refresh_from_controller()
-        controller = getattr(self.app, "download_controller", None)
-        status = controller.snapshot() if controller else self.app.cli_state.download_status
+        status = self._current_status()
         target = "#cancel-download" if status.active else "#back"
         self.query_one(target, Button).focus()
 
     def on_resize(self, _event=None) -> None:
         self.apply_terminal_mode()
 
-    def refresh_from_controller(self) -> None:
+    def _sync_subscription(self) -> bool:
         controller = getattr(self.app, "download_controller", None)
-        status = controller.snapshot() if controller else self.app.cli_state.download_status
+        if controller is self._subscribed_controller:
+            return False
+        if self._subscription is not None:
+            self._subscription.close()
+        self._subscribed_controller = controller
+        self._subscription = controller.subscribe() if controller else None
+        self._view_status = CliDownloadStatus()
+        return True
+
+    def _drain_events(self) -> bool:
+        changed = self._sync_subscription()
+        if self._subscription is None:
+            return changed
+        events = self._subscription.drain()
+        for event in events:
+            apply_event(self._view_status, event)
+        # Une rafale de progression peut evincer des ErrorEvent de la file
+        # bornee : les erreurs sont relues depuis le controleur.
+        errors = self._subscribed_controller.errors()
+        errors_changed = len(errors) != len(self._view_status.errors)
+        self._view_status.errors = errors
+        return changed or bool(events) or errors_changed
+
+    def _current_status(self) -> CliDownloadStatus:
+        if self._subscribed_controller is None:
+            return self.app.cli_state.download_status
+        return self._view_status
+
+    def _pump_events(self) -> None:
+        if self._drain_events():
+            self._render_status(self._current_status())
+
+    def refresh_from_controller(self) -> None:
+        self._drain_events()
+        self._render_status(self._current_status())
+
+    def _render_status(self, status: CliDownloadStatus) -> None:
         self.query_one("#dl-title", Label).update(f"Titre : {self.app.cli_state.current_title or '--'}")
         self.query_one("#dl-selection", Label).update(
             f"Sélection : {status.completed_volumes}/{max(0, status.total_volumes)} terminés"
@@ -153,7 +193,7 @@ class DownloadScreen(Screen):
 
     def action_go_back(self) -> None:
         controller = getattr(self.app, "download_controller", None)
-        if controller and controller.snapshot().active:
+        if controller and controller.is_active:
             return
         self.app.pop_screen()
 
@@ -4,11 +4,12 @@ from rich.text import Text
 from textual.app import ComposeResult
 from textual.containers import Horizontal, Vertical
 from textual.screen import Screen
-from textual.widgets import Button, Input, Label, ListItem, ListView, Static
+from textual.widgets import Button, Input, Label, Static
 
 from .actions import analyze_current_url, apply_range_selection, apply_text_filter, deselect_all, invert_selection, select_all, toggle_item_selection
 from .download import CliDownloadController
 from .modals import HelpModal, MessageModal, TextPromptModal
+from .widgets import VirtualChapterList
 
 
 class WorkflowScreen(Screen):
@@ -61,7 +62,7 @@ class WorkflowScreen(Screen):
                 with Horizontal(classes="button-row", id="workflow-compact-actions"):
                     yield Button("Télécharger", id="download-compact", variant="success")
                     yield Button("Retour", id="back-compact")
-                self.selection_list = ListView(id="workflow-list")
+                self.selection_list = VirtualChapterList(self._render_visible_row, id="workflow-list")
                 yield self.selection_list
             with Horizontal(classes="button-row", id="workflow-actions-row"):
                 yield Button("Télécharger", id="download", variant="success")
@@ -84,24 +85,34 @@ class WorkflowScreen(Screen):
 
     def refresh_from_state(self) -> None:
         state = self.app.cli_state
-        previous_index = getattr(self.selection_list, "index", None)
         self.query_one("#workflow-url", Input).value = state.current_url
         self.query_one("#workflow-title", Label).update(f"Titre : {state.current_title or '--'}")
         self.query_one("#workflow-domain", Label).update(f"Domaine : {state.current_domain or '--'}")
+        self._refresh_list_rows()
+        self.apply_terminal_mode()
+
+    def _refresh_summary_labels(self) -> None:
+        state = self.app.cli_state
         self.query_one("#workflow-selection", Label).update(f"Sélection : {state.selection_summary}")
         self.query_one("#workflow-visible", Label).update(f"Visibles : {len(state.filtered_indices)} / {len(state.detected_items)}")
         self.query_one("#workflow-status", Label).update(state.status_message)
+        self._refresh_current_item_label()
 
-        self.selection_list.clear()
-        index_width = max(2, len(str(max(1, len(state.detected_items)))))
-        for item_idx in state.filtered_indices:
-            item = state.detected_items[item_idx]
-            self.selection_list.append(ListItem(Label(self._build_item_text(item, index_width))))
+    def _refresh_list_rows(self) -> None:
+        state = self.app.cli_state
+        previous_index = self.selection_list.index
+        self._index_width = max(2, len(str(max(1, len(state.detected_items)))))
+        self.selection_list.set_row_count(len(state.filtered_indices))
         if state.filtered_indices:
-            safe_index = 0 if previous_index is None else max(0, min(int(previous_index), len(state.filtered_indices) - 1))
-            self.selection_list.index = safe_index
-        self._refresh_current_item_label()
-        self.apply_terminal_mode()
+            self.selection_list.index = 0 if previous_index is None else previous_index
+        self._refresh_summary_labels()
+
+    def _render_visible_row(self, visible_index: int) -> Text:
+        state = self.app.cli_state
+        if visible_index < 0 or visible_index >= len(state.filtered_indices):
+            return Text()
+        item = state.detected_items[state.filtered_indices[visible_index]]
+        return self._build_item_text(item, getattr(self, "_index_width", 2))
 
     def _build_item_text(self, item, index_width: int) -> Text:
         is_selected = item.url in self.app.cli_state.selected_urls
@@ -227,8 +238,11 @@ class WorkflowScreen(Screen):
             return
         if item_index not in self.app.cli_state.filtered_indices:
             return
-        toggle_item_selection(self.app.cli_state, getattr(self.selection_list, "index", 0))
-        self.refresh_from_state()
+        visible_index = self.selection_list.index or 0
+        if toggle_item_selection(self.app.cli_state, visible_index) is None:
+            return
+        self.selection_list.refresh_row(visible_index)
+        self._refresh_summary_labels()
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         if event.button.id == "analyze":
@@ -255,9 +269,9 @@ class WorkflowScreen(Screen):
             self.app.cli_state.current_url = event.value.strip()
         elif event.input.id == "workflow-filter":
             apply_text_filter(self.app.cli_state, event.value)
-            self.refresh_from_state()
+            self._refresh_list_rows()
 
-    def on_list_view_selected(self, event: ListView.Selected) -> None:
+    def on_virtual_chapter_list_selected(self, event: VirtualChapterList.Selected) -> None:
         if event.list_view is not self.selection_list:
             return
         event.stop()
@@ -283,22 +297,22 @@ class WorkflowScreen(Screen):
 
     def action_select_all(self) -> None:
         select_all(self.app.cli_state)
-        self.refresh_from_state()
+        self._refresh_list_rows()
 
     def action_select_none(self) -> None:
         deselect_all(self.app.cli_state)
-        self.refresh_from_state()
+        self._refresh_list_rows()
 
     def action_invert(self) -> None:
         invert_selection(self.app.cli_state)
-        self.refresh_from_state()
+        self._refresh_list_rows()
 
     def action_select_range(self) -> None:
         def apply_value(value: str | None) -> None:
             if value is None:
                 return
             apply_range_selection(self.app.cli_state, value)
-            self.refresh_from_state()
+            self._refresh_list_rows()
 
         self.app.push_screen(TextPromptModal("Selection par plage", placeholder="1-20,50+,100-120"), apply_value)
 
@@ -307,7 +321,7 @@ class WorkflowScreen(Screen):
             self.app.push_screen(MessageModal("Téléchargement", "Aucun élément sélectionné."))
             return
         controller = getattr(self.app, "download_controller", None)
-        if controller and controller.snapshot().active:
+        if controller and controller.is_active:
             self.app.push_screen("download")
             return
 
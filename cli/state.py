@@ -18,6 +18,7 @@ class CliDownloadError:
     reason: str
     status_code: int | None = None
     action: str = ""
+    kind: str = ""
 
 
 @dataclass(slots=True)
@@ -58,6 +59,8 @@ class CliState:
     volume_metadata: dict[str, object] = field(default_factory=dict)
     detected_items: list[CliItem] = field(default_factory=list)
     filtered_indices: list[int] = field(default_factory=list)
+    filter_text: str = ""
+    search_labels: list[str] = field(default_factory=list)
     selected_urls: set[str] = field(default_factory=set)
     cookie_status: dict[str, str] = field(default_factory=dict)
     status_message: str = "Pret."
@@ -71,6 +74,8 @@ class CliState:
         self.volume_metadata = {}
         self.detected_items = []
         self.filtered_indices = []
+        self.filter_text = ""
+        self.search_labels = []
         self.selected_urls.clear()
 
     @property
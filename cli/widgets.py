@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+from typing import Callable
+
+from rich.text import Text
+from textual.binding import Binding
+from textual.events import Click
+from textual.geometry import Region, Size
+from textual.message import Message
+from textual.scroll_view import ScrollView
+from textual.strip import Strip
+
+
+class VirtualChapterList(ScrollView, can_focus=True):
+    """Liste virtualisée : seules les lignes visibles sont rendues."""
+
+    BINDINGS = [
+        Binding("enter", "select_cursor", "Basculer", show=False),
+        Binding("up", "cursor_up", "Monter", show=False),
+        Binding("down", "cursor_down", "Descendre", show=False),
+        Binding("pageup", "page_up", "Page prec.", show=False),
+        Binding("pagedown", "page_down", "Page suiv.", show=False),
+        Binding("home", "first", "Debut", show=False),
+        Binding("end", "last", "Fin", show=False),
+    ]
+
+    COMPONENT_CLASSES = {"virtual-chapter-list--cursor"}
+
+    DEFAULT_CSS = """
+    VirtualChapterList > .virtual-chapter-list--cursor {
+        background: $boost;
+    }
+    VirtualChapterList:focus > .virtual-chapter-list--cursor {
+        background: $accent 40%;
+        text-style: bold;
+    }
+    """
+
+    class Selected(Message):
+        def __init__(self, list_view: "VirtualChapterList", index: int) -> None:
+            super().__init__()
+            self.list_view = list_view
+            self.index = index
+
+        @property
+        def control(self) -> "VirtualChapterList":
+            return self.list_view
+
+    def __init__(self, row_renderer: Callable[[int], Text] | None = None, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self._row_renderer = row_renderer
+        self._row_count = 0
+        self._index: int | None = None
+        self._row_cache: dict[int, Text] = {}
+
+    @property
+    def row_count(self) -> int:
+        return self._row_count
+
+    @property
+    def index(self) -> int | None:
+        return self._index
+
+    @index.setter
+    def index(self, value: int | None) -> None:
+        if self._row_count <= 0 or value is None:
+            new_index = None
+        else:
+            new_index = max(0, min(int(value), self._row_count - 1))
+        previous = self._index
+        self._index = new_index
+        if previous != new_index:
+            self._refresh_row(previous)
+            self._refresh_row(new_index)
+        if new_index is not None:
+            self._scroll_row_into_view(new_index)
+
+    def set_row_renderer(self, row_renderer: Callable[[int], Text]) -> None:
+        self._row_renderer = row_renderer
+        self._row_cache.clear()
+        self.refresh()
+
+    def set_row_count(self, row_count: int) -> None:
+        """Redimensionne la liste sans matérialiser les lignes."""
+        self._row_count = max(0, int(row_count))
+        self._row_cache.clear()
+        self.virtual_size = Size(self.size.width, self._row_count)
+        if self._row_count <= 0:
+            self._index = None
+        elif self._index is not None and self._index >= self._row_count:
+            self._index = self._row_count - 1
+        self.refresh()
+
+    def refresh_row(self, row: int | None) -> None:
+        """Invalide et repeint une seule ligne, par exemple après une bascule."""
+        if row is None:
+            return
+        self._row_cache.pop(row, None)
+        self._refresh_row(row)
+
+    def _refresh_row(self, row: int | None) -> None:
+        if row is None:
+            return
+        screen_y = row - int(self.scroll_offset.y)
+        if 0 <= screen_y < self.size.height:
+            self.refresh(Region(0, screen_y, self.size.width, 1))
+
+    def _scroll_row_into_view(self, row: int) -> None:
+        height = max(1, self.size.height)
+        top = int(self.scroll_offset.y)
+        if row < top:
+            self.scroll_to(y=row, animate=False)
+        elif row >= top + height:
+            self.scroll_to(y=row - height + 1, animate=False)
+
+    def _row_text(self, row: int) -> Text:
+        cached = self._row_cache.get(row)
+        if cached is not None:
+            return cached
+        text = self._row_renderer(row) if self._row_renderer else Text()
+        self._row_cache[row] = text
+        if len(self._row_cache) > max(256, self.size.height * 4):
+            self._row_cache.pop(next(iter(self._row_cache)))
+        return text
+
+    def render_line(self, y: int) -> Strip:
+        width = self.size.width
+        row = int(self.scroll_offset.y) + y
+        if row < 0 or row >= self._row_count:
+            return Strip.blank(width, self.rich_style)
+        text = self._row_text(row).copy()
+        text.truncate(width, overflow="ellipsis")
+        base_style = self.rich_style
+        if row == self._index:
+            base_style = base_style + self.get_component_rich_style("virtual-chapter-list--cursor")
+        segments = list(text.render(self.app.console, end=""))
+        return Strip(segments).adjust_cell_length(width, base_style).apply_style(base_style)
+
+    def on_resize(self, _event=None) -> None:
+        self.virtual_size = Size(self.size.width, self._row_count)
+
+    def on_click(self, event: Click) -> None:
+        row = int(self.scroll_offset.y) + event.y
+        if 0 <= row < self._row_count:
+            self.index = row
+            self.post_message(self.Selected(self, row))
+
+    def action_select_cursor(self) -> None:
+        if self._index is not None:
+            self.post_message(self.Selected(self, self._index))
+
+    def action_cursor_up(self) -> None:
+        if self._row_count:
+            self.index = (self._index or 0) - 1
+
+    def action_cursor_down(self) -> None:
+        if self._row_count:
+            self.index = 0 if self._index is None else self._index + 1
+
+    def action_page_up(self) -> None:
+        if self._row_count:
+            self.index = (self._index or 0) - max(1, self.size.height - 1)
+
+    def action_page_down(self) -> None:
+        if self._row_count:
+            self.index = (self._index or 0) + max(1, self.size.height - 1)
+
+    def action_first(self) -> None:
+        if self._row_count:
+            self.index = 0
+
+    def action_last(self) -> None:
+        if self._row_count:
+            self.index = self._row_count - 1
@@ -0,0 +1,30 @@
+"""Moteur de SushiDL utilisable sans interface (analyse, extraction, téléchargement).
+
+Les modules `text`, `labels`, `sites`, `errors`, `models` et `parsers` sont
+purs ; `http` n'importe `curl_cffi` qu'à la première requête. Tous
+s'importent sans dépendance réseau. `Engine` charge le pipeline complet au
+premier appel qui en a besoin.
+"""
+
+from .api import Engine
+from .errors import (
+    ArchiveError,
+    AuthError,
+    DownloadCancelled,
+    ImageDownloadError,
+    ParseError,
+    SushiDLError,
+)
+from .models import DownloadOptions, MangaAnalysis
+
+__all__ = [
+    "ArchiveError",
+    "AuthError",
+    "DownloadCancelled",
+    "DownloadOptions",
+    "Engine",
+    "ImageDownloadError",
+    "MangaAnalysis",
+    "ParseError",
+    "SushiDLError",
+]
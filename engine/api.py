@@ -0,0 +1,212 @@
+"""Façade stable du moteur SushiDL.
+
+`Engine` regroupe les opérations dont ont besoin les interfaces (GUI, TUI,
+mode batch) ou un script tiers : classer une URL, analyser un catalogue,
+extraire les images d'un volume, le télécharger et tester un cookie.
+
+Le pipeline réseau réside encore dans `SushiDL.py` ; il n'est importé qu'au
+premier appel qui en a besoin, de sorte que `import engine` reste léger.
+
+Sont déjà dans le paquet : les utilitaires purs (`text`, `labels`, `sites`,
+`errors`, `models`), les sessions HTTP (`http`) et les parseurs sans réseau
+(`parsers` : JSON embarqué, initialData Ortega, pages AJAX Madara, URLs du
+lecteur Scan-Manga). Restent dans `SushiDL.py` : parseurs catalogue complets
+(ils journalisent et lisent les caches), extraction d'images (lecteurs HTTP,
+Madara, Scan-Manga, navigateur), téléchargement/CBZ/ComicInfo, caches
+disque et sondes cookies. D'ici là, `analyze`, `get_images`, `download` et
+`test_cookie` chargent tout `SushiDL.py` (environ 0,5 s et 7 Mo, contre
+0,1 s et 1 Mo pour `import engine` seul).
+"""
+
+from __future__ import annotations
+
+import importlib
+import sys
+import threading
+
+from .models import DownloadOptions
+from .sites import COOKIE_DOMAINS, get_cookie_domain_from_url, get_site_adapter, is_valid_catalogue_url
+
+DEFAULT_CORE_MODULE = "SushiDL"
+
+
+class Engine:
+    """Point d'entrée programmatique du moteur.
+
+    Les cookies sont indexés par clé de domaine (`fr`, `net`, `scanmanga`...)
+    comme dans le cache de configuration. Chaque méthode accepte un cookie
+    explicite qui prime sur celui de l'instance.
+    """
+
+    def __init__(self, cookies=None, user_agent="", core_module=DEFAULT_CORE_MODULE):
+        self.cookies = dict(cookies or {})
+        self.user_agent = (user_agent or "").strip()
+        self._core_module_name = core_module
+        self._core = None
+        self._core_lock = threading.Lock()
+
+    @property
+    def core(self):
+        """Module du pipeline complet, importé au premier accès."""
+        core = self._core
+        if core is None:
+            with self._core_lock:
+                core = self._core
+                if core is None:
+                    core = sys.modules.get(self._core_module_name) or importlib.import_module(self._core_module_name)
+                    self._core = core
+        return core
+
+    @staticmethod
+    def classify_url(url):
+        """Retourne la clé de domaine d'une URL supportée, sinon une chaîne vide."""
+        domain = get_cookie_domain_from_url((url or "").strip())
+        return domain if domain in COOKIE_DOMAINS else ""
+
+    @staticmethod
+    def is_catalogue_url(url):
+        return is_valid_catalogue_url((url or "").strip())
+
+    def _user_agent(self):
+        return self.user_agent or self.core.DEFAULT_USER_AGENT
+
+    def _cookie_for(self, domain, cookie=None):
+        if cookie is not None:
+            return (cookie or "").strip()
+        return (self.cookies.get(domain) or "").strip()
+
+    def analyze(self, url, cookie=None, progress_callback=None, record_state=True):
+        """Analyse un catalogue et retourne un `MangaAnalysis`.
+
+        Avec `record_state`, l'état du catalogue est mémorisé pour le calcul
+        des nouveautés lors de l'analyse suivante.
+        """
+        safe_url = (url or "").strip()
+        domain = self.classify_url(safe_url)
+        if not domain:
+            raise ValueError("URL non supportee.")
+        analysis = self.core.fetch_manga_analysis(
+            safe_url,
+            self._cookie_for(domain, cookie),
+            self._user_agent(),
+            progress_callback=progress_callback,
+            emit_logs=False,
+        )
+        if record_state:
+            self.core.update_catalog_state(
+                safe_url,
+                analysis.title,
+                analysis.pairs,
+                domain=domain,
+                volume_metadata=analysis.volume_metadata,
+            )
+        return analysis
+
+    def get_images(self, url, cookie=None, cancel_event=None, extraction_progress=None):
+        """Retourne la liste des URLs d'images d'un volume ou chapitre."""
+        safe_url = (url or "").strip()
+        return self.core.get_images(
+            safe_url,
+            self._cookie_for(self.classify_url(safe_url), cookie),
+            self._user_agent(),
+            cancel_event=cancel_event,
+            emit_logs=False,
+            extraction_progress=extraction_progress,
+        )
+
+    def prefetch_images(self, urls, cookie=None, cancel_event=None, current_url=""):
+        """Prépare en arrière-plan l'extraction des prochains volumes quand le site le permet.
+
+        Seuls les lecteurs navigateur (CrunchyScan, Scan-Hentai) en profitent;
+        `current_url`, le volume sur le point d'être extrait, passe en premier.
+        Retourne le nombre de volumes planifiés.
+        """
+        safe_urls = [(url or "").strip() for url in (urls or []) if (url or "").strip()]
+        if not safe_urls:
+            return 0
+        return self.core.prefetch_crunchy_reader_chapters(
+            safe_urls,
+            self._cookie_for(self.classify_url(safe_urls[0]), cookie),
+            self._user_agent(),
+            cancel_event=cancel_event,
+            current_link=(current_url or "").strip(),
+        )
+
+    def download(
+        self,
+        label,
+        url,
+        image_urls,
+        title,
+        output_dir,
+        cancel_event,
+        cookie=None,
+        options=None,
+        logger=None,
+        update_progress=None,
+        error_callback=None,
+        image_callback=None,
+        total_count=None,
+        series_metadata=None,
+        volume_metadata=None,
+    ):
+        """Télécharge un volume déjà extrait ; retourne le statut de `download_volume`."""
+        core = self.core
+        safe_url = (url or "").strip()
+        opts = options or DownloadOptions()
+        series_metadata = series_metadata if isinstance(series_metadata, dict) else None
+        return core.download_volume(
+            label,
+            list(image_urls or []),
+            title,
+            self._cookie_for(self.classify_url(safe_url), cookie),
+            self._user_agent(),
+            logger or (lambda *_args, **_kwargs: None),
+            cancel_event,
+            cbz_enabled=bool(opts.cbz_enabled),
+            update_progress=update_progress,
+            webp2jpg_enabled=bool(opts.webp2jpg_enabled),
+            comicinfo_enabled=bool(opts.comicinfo_enabled),
+            chapter_cover_enabled=bool(opts.chapter_cover_enabled),
+            referer_url=safe_url,
+            smart_resume_enabled=bool(opts.smart_resume_enabled),
+            error_callback=error_callback,
+            output_root=output_dir,
+            prompt_cookie_retry=False,
+            total_count=total_count,
+            series_metadata=series_metadata,
+            cover_url=(series_metadata or {}).get("cover_url", ""),
+            download_threads=opts.download_threads,
+            archive_label=core.get_archive_label_for_link(label, safe_url, volume_metadata or {}),
+            image_callback=image_callback,
+        )
+
+    def recent_changes(self, days=7, url="", domain=""):
+        """Nouveautés et retraits des catalogues analysés sur les `days` derniers jours.
+
+        Retourne une liste de dicts (`ts`, `url`, `title`, `domain`, `change`,
+        `label`, `item_url`), du plus récent au plus ancien.
+        """
+        return self.core.get_catalog_changes(days=days, url=(url or "").strip(), domain=(domain or "").strip())
+
+    def test_cookie(self, domain, cookie=None):
+        """Teste un cookie : True/False, ou None si le domaine n'a pas de sonde."""
+        safe_domain = (domain or "").strip().lower()
+        safe_cookie = self._cookie_for(safe_domain, cookie)
+        if not safe_cookie:
+            return False
+        core = self.core
+        probe_url = core.STARTUP_COOKIE_LISTING_PROBE_URLS.get(safe_domain)
+        adapter = get_site_adapter(safe_domain)
+        auth = adapter.auth if adapter is not None else ""
+        # `clearance` : page listing + détection Cloudflare ; `status` : pas de
+        # challenge dédié, un simple HTTP 200 sur la page listing suffit.
+        if auth == "clearance":
+            return core.test_cookie_validity(safe_domain, safe_cookie, self._user_agent(), probe_url=probe_url)
+        if auth == "status":
+            try:
+                response = core.make_request(probe_url, safe_cookie, self._user_agent())
+                return int(getattr(response, "status_code", 0) or 0) == 200
+            except Exception:
+                return False
+        return None
@@ -0,0 +1,129 @@
+"""Exceptions et classification des échecs réseau/téléchargement."""
+
+import unicodedata
+
+
+class DownloadCancelled(Exception):
+    """Erreur levée lorsqu'une annulation utilisateur est demandée."""
+
+
+class SushiDLError(Exception):
+    """Erreur de base contrôlée par SushiDL."""
+
+
+class AuthError(SushiDLError):
+    """Erreur liée à l'authentification ou à une protection serveur."""
+
+
+class ParseError(SushiDLError):
+    """Erreur liée au parsing d'une page source."""
+
+
+class ArchiveError(SushiDLError):
+    """Erreur liée à la création ou validation d'une archive."""
+
+
+class ImageDownloadError(Exception):
+    """Erreur de téléchargement enrichie avec type et code HTTP."""
+
+    def __init__(self, message, status_code=None, kind="retryable", phase="direct"):
+        super().__init__(message)
+        self.status_code = status_code
+        self.kind = kind
+        self.phase = phase
+
+
+def get_status_code_from_exception(exc):
+    """Extrait un code HTTP depuis une exception réseau si disponible."""
+    status_code = getattr(exc, "status_code", None)
+    if status_code is None:
+        response = getattr(exc, "response", None)
+        status_code = getattr(response, "status_code", None)
+    return status_code
+
+
+def classify_download_failure(status_code=None, message=""):
+    """Classe les échecs de téléchargement pour piloter la stratégie de retry."""
+    if status_code in (404, 410):
+        return "missing"
+    if status_code in (401, 403, 429, 500, 502, 503, 504):
+        return "blocked_or_retryable"
+
+    lower = (message or "").lower()
+    if any(marker in lower for marker in ("cloudflare", "just a moment", "attention required", "captcha")):
+        return "blocked_or_retryable"
+    return "retryable"
+
+
+def recommend_action_for_failure(status_code=None, reason=""):
+    """Suggère une action utilisateur adaptée à une cause d'échec."""
+    lower = (reason or "").lower()
+    normalized = "".join(
+        ch for ch in unicodedata.normalize("NFKD", lower) if unicodedata.category(ch) != "Mn"
+    )
+    if "echec de creation cbz" in normalized or "archive_cbz" in normalized or "zip" in normalized:
+        return "Vérifier l'espace disque, les droits d'écriture et le nom du fichier, puis relancer."
+    if "dossier de tome introuvable" in normalized or "erreur creation dossier" in normalized:
+        return "Vérifier le dossier de destination (chemin/droits), puis relancer."
+    if "aucune image telechargee" in normalized:
+        return "Vérifier l'URL, le cookie cf_clearance et le User-Agent, puis relancer l'analyse."
+    if "recuperation images impossible" in normalized:
+        return "Vérifier l'accès au chapitre (URL/cookie/User-Agent), puis relancer."
+    if "tome non finalise" in normalized or "retry non finalise" in normalized:
+        return "Corriger d'abord la cause technique indiquée, puis relancer."
+    if status_code in (401, 403) or "cloudflare" in normalized or "forbidden" in normalized:
+        return "Protection Cloudflare détectée : chapitre arrêté pour cette session. Relancer plus tard après validation normale de l'accès."
+    if status_code == 429:
+        return "Limiter la cadence; attendre avant de relancer."
+    if status_code in (500, 502, 503, 504):
+        return "Erreur serveur temporaire; relancer plus tard."
+    if status_code in (404, 410) or "not found" in normalized:
+        return "Page absente côté serveur; ignorer cette page."
+    if "timeout" in normalized or "dns" in normalized or "connexion" in normalized or "connection" in normalized:
+        return "Vérifier la connexion réseau et relancer."
+    return "Relancer le tome; si l'échec persiste, vérifier cookie et User-Agent."
+
+
+def should_offer_cookie_refresh(status_code=None, reason=""):
+    """Indique si l'échec justifie de demander un renouvellement de cookie."""
+    lower = (reason or "").lower()
+    normalized = "".join(
+        ch for ch in unicodedata.normalize("NFKD", lower) if unicodedata.category(ch) != "Mn"
+    )
+    if status_code in (401, 403):
+        return True
+    markers = (
+        "http error 401",
+        "http error 403",
+        "forbidden",
+        "acces refuse",
+        "cloudflare",
+        "just a moment",
+        "challenge",
+        "cookie",
+        "unauthorized",
+        "validation chrome",
+        "lecteur crunchyscan",
+        "lecteur scan-hentai",
+        "lecteur crunchy",
+    )
+    return any(marker in normalized for marker in markers)
+
+
+def is_reader_cloudflare_challenge(reason=""):
+    """Distingue un challenge lecteur confirmé d'un simple refus d'accès/cookie."""
+    normalized = "".join(
+        ch for ch in unicodedata.normalize("NFKD", (reason or "").lower())
+        if unicodedata.category(ch) != "Mn"
+    )
+    markers = (
+        "detection cloudflare dans le lecteur",
+        "cloudflare detecte dans le lecteur",
+        "formulaire turnstile remplace les images",
+    )
+    return any(marker in normalized for marker in markers)
+
+
+def is_manual_cloudflare_fallback(reason=""):
+    """Compatibilité : challenge lecteur confirmé, sans redemande de cookie."""
+    return is_reader_cloudflare_challenge(reason)
@@ -0,0 +1,53 @@
+"""Requêtes HTTP du moteur : une session curl_cffi par thread, empreinte Chrome.
+
+`curl_cffi` n'est importé qu'à la première requête, de sorte que `import
+engine` reste possible sans la dépendance réseau.
+"""
+
+import importlib
+import threading
+
+
+class _LazyRequests:
+    """Accès différé à `curl_cffi.requests`."""
+
+    _module = None
+
+    def __getattr__(self, attr):
+        module = _LazyRequests._module
+        if module is None:
+            module = importlib.import_module("curl_cffi.requests")
+            _LazyRequests._module = module
+        return getattr(module, attr)
+
+
+requests = _LazyRequests()
+
+_HTTP_THREAD_LOCAL = threading.local()
+
+
+def _get_http_session():
+    """Retourne une session HTTP par thread pour reutiliser les connexions."""
+    session = getattr(_HTTP_THREAD_LOCAL, "session", None)
+    if session is None:
+        session = requests.Session()
+        _HTTP_THREAD_LOCAL.session = session
+    return session
+
+
+def _http_get(url, headers=None, timeout=10):
+    """Requete GET avec session keep-alive et fallback direct."""
+    session = _get_http_session()
+    try:
+        return session.get(url, headers=headers, impersonate="chrome", timeout=timeout)
+    except Exception:
+        return requests.get(url, headers=headers, impersonate="chrome", timeout=timeout)
+
+
+def _http_post(url, headers=None, data=None, timeout=15):
+    """Requete POST avec session keep-alive et fallback direct."""
+    session = _get_http_session()
+    try:
+        return session.post(url, headers=headers, data=data or {}, impersonate="chrome", timeout=timeout)
+    except Exception:
+        return requests.post(url, headers=headers, data=data or {}, impersonate="chrome", timeout=timeout)
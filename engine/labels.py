@@ -0,0 +1,89 @@
+"""Normalisation des libellés de tomes et chapitres.
+
+Les motifs sont compilés une fois au chargement et les résultats mémorisés
+par libellé brut : une analyse de plusieurs milliers de chapitres normalise
+chaque libellé à de nombreuses reprises (tri, filtres, nommage, file).
+"""
+
+import re
+from functools import lru_cache
+
+from .text import repair_mojibake_text
+
+LABEL_CACHE_MAX_ITEMS = 8192
+
+_WHITESPACE_RE = re.compile(r"\s+")
+_LEADING_DOTS_RE = re.compile(r"^[._]+\s*")
+_CHAPTER_TITLE_RE = re.compile(
+    r"(?i)^(?:ep|episode|chapitre|chapter|chap)\s*[-._:# ]*(extra(?:\s*[-._ ]*\s*\d+)?|[0-9]+(?:[-.,][0-9]+)*(?:\s*[A-Za-z])?)\b\s*(?::\s*(.+))?$"
+)
+_EXTRA_NUMBER_RE = re.compile(r"(?i)^extra\s*[-._ ]*\s*(\d+)$")
+_NUMBER_PATTERN = r"([0-9]+(?:[.,][0-9]+)?(?:\s*[A-Za-z])?)"
+_TOME_COMPOSITE_RE = re.compile(
+    rf"(?i)^(?:tome|volume)\s*[-._:# ]*{_NUMBER_PATTERN}(?:\s*\([^)]*\))?\s*[-–—:]\s*(.+)$"
+)
+_CHAPTER_RE = re.compile(rf"(?i)^(?:ep|episode|chapitre|chapter)\s*[-._:# ]*\s*{_NUMBER_PATTERN}\b")
+_TOME_RE = re.compile(rf"(?i)^(?:tome|volume)\s*[-._:# ]*\s*{_NUMBER_PATTERN}\b")
+_VOLUME_WORD_RE = re.compile(r"(?i)\bvolume\b")
+
+
+def normalize_chapter_label_preserve_title(label):
+    """Normalise un label chapitre en conservant son titre après deux-points."""
+    return _normalize_chapter_label_preserve_title(label or "")
+
+
+@lru_cache(maxsize=LABEL_CACHE_MAX_ITEMS)
+def _normalize_chapter_label_preserve_title(label):
+    cleaned = repair_mojibake_text(label.strip())
+    if not cleaned:
+        return ""
+    cleaned = _WHITESPACE_RE.sub(" ", cleaned).strip(" -–—|:")
+    match = _CHAPTER_TITLE_RE.match(cleaned)
+    if not match:
+        return ""
+    raw_number = _WHITESPACE_RE.sub(" ", match.group(1).strip())
+    if raw_number.lower().startswith("extra"):
+        number = _EXTRA_NUMBER_RE.sub(r"Extra \1", raw_number).strip()
+    else:
+        number = raw_number.replace(",", ".").strip()
+    suffix = (match.group(2) or "").strip()
+    chapter_label = f"Chap {number}".strip()
+    return f"{chapter_label} : {suffix}" if suffix else chapter_label
+
+
+def normalize_tome_label(label):
+    """Normalise les labels en standardisant épisode/chapitre/tome et en retirant les titres redondants."""
+    return _normalize_tome_label(label or "")
+
+
+@lru_cache(maxsize=LABEL_CACHE_MAX_ITEMS)
+def _normalize_tome_label(label):
+    cleaned = repair_mojibake_text(label.strip())
+    if not cleaned:
+        return ""
+    cleaned = _WHITESPACE_RE.sub(" ", cleaned).strip(" -–—|:")
+    # Certains catalogues CrunchyScan/Scan-Hentai préfixent les volumes d'un point.
+    cleaned = _LEADING_DOTS_RE.sub("", cleaned)
+
+    tome_composite_match = _TOME_COMPOSITE_RE.match(cleaned)
+    if tome_composite_match:
+        tome_number = tome_composite_match.group(1).replace(",", ".").strip()
+        child_raw = tome_composite_match.group(2).strip()
+        child_label = normalize_chapter_label_preserve_title(child_raw) or normalize_tome_label(child_raw)
+        return f"Tome {tome_number} - {child_label or tome_composite_match.group(2).strip()}".strip()
+
+    chapter_match = _CHAPTER_RE.match(cleaned)
+    if chapter_match:
+        return f"Chapitre {chapter_match.group(1).replace(',', '.')}".strip()
+
+    tome_match = _TOME_RE.match(cleaned)
+    if tome_match:
+        return f"Tome {tome_match.group(1).replace(',', '.')}".strip()
+
+    return _VOLUME_WORD_RE.sub("Tome", cleaned)
+
+
+def clear_label_caches():
+    """Vide les caches de normalisation (tests, changement de règles)."""
+    _normalize_chapter_label_preserve_title.cache_clear()
+    _normalize_tome_label.cache_clear()
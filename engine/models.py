@@ -0,0 +1,29 @@
+"""Structures de données échangées par le moteur."""
+
+from dataclasses import dataclass, field
+
+
+@dataclass(frozen=True)
+class MangaAnalysis:
+    """Résultat structuré d'une analyse catalogue."""
+
+    title: str = ""
+    pairs: list[tuple[str, str]] = field(default_factory=list)
+    volume_metadata: dict = field(default_factory=dict)
+    series_metadata: dict = field(default_factory=dict)
+    html_content: str = ""
+    # Validateurs HTTP (`etag`, `last_modified`) et empreinte de la liste des
+    # chapitres (`content_hash`), conservés pour la prochaine actualisation.
+    validators: dict = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class DownloadOptions:
+    """Options de post-traitement appliquées à un volume téléchargé."""
+
+    cbz_enabled: bool = True
+    comicinfo_enabled: bool = True
+    chapter_cover_enabled: bool = True
+    webp2jpg_enabled: bool = True
+    smart_resume_enabled: bool = True
+    download_threads: int | None = None
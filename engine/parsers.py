@@ -0,0 +1,195 @@
+"""Parseurs purs : délimiteurs, JSON embarqué, pages AJAX Madara, lecteurs.
+
+Ils ne font aucune requête : la page (ou le JSON déjà décodé) leur est
+fournie par l'appelant. BeautifulSoup n'est importé qu'au premier parseur
+HTML utilisé.
+"""
+
+import datetime
+import html
+import json
+import re
+from functools import lru_cache
+from urllib.parse import urljoin, urlparse
+
+from .labels import normalize_tome_label
+from .sites import get_supported_site_from_url
+
+
+@lru_cache(maxsize=64)
+def _parse_lr_pattern(left, right):
+    return re.compile(re.escape(left) + "(.*?)" + re.escape(right))
+
+
+def parse_lr(text, left, right, recursive, unescape=True):
+    """
+    Parse le texte entre deux délimiteurs (left et right)
+    
+    Args:
+        text (str): Texte à parser
+        left (str): Délimiteur gauche
+        right (str): Délimiteur droit
+        recursive (bool): Récupère toutes les occurrences si True
+        unescape (bool): Décode les entités HTML si True
+    
+    Returns:
+        str/list: Résultat du parsing selon le mode
+    """
+    matches = _parse_lr_pattern(left, right).findall(text)
+    if unescape:
+        matches = [html.unescape(match) for match in matches]
+    return matches if recursive else matches[0] if matches else None
+
+
+EMBEDDED_JSON_DECODER = json.JSONDecoder()
+# Flux RSC Next.js : le JSON est porté par une chaîne JS ; sa fin est le premier
+# guillemet précédé d'un nombre pair de barres obliques inverses.
+EMBEDDED_JSON_STRING_END_RE = re.compile(r'(?<!\\)(?:\\\\)*"')
+
+
+def iter_embedded_json(text, marker, escaped=False, openers="{"):
+    """Décode chaque valeur JSON embarquée qui suit `marker` dans une page.
+
+    La fin de la valeur est trouvée par `json.JSONDecoder.raw_decode` (en C)
+    plutôt qu'en équilibrant les accolades caractère par caractère. Avec
+    `escaped`, la valeur est lue dans une chaîne JS (flux RSC) : la fin de
+    la chaîne est localisée par regex puis déséchappée en un seul `json.loads`.
+    Les occurrences non décodables sont ignorées.
+    """
+    raw_text = str(text or "")
+    if not raw_text or not marker:
+        return
+    search_from = 0
+    while True:
+        marker_index = raw_text.find(marker, search_from)
+        if marker_index < 0:
+            return
+        search_from = marker_index + len(marker)
+        start_index = search_from
+        while start_index < len(raw_text) and raw_text[start_index] in " \t\r\n":
+            start_index += 1
+        if start_index >= len(raw_text) or raw_text[start_index] not in openers:
+            continue
+        try:
+            if escaped:
+                string_end = EMBEDDED_JSON_STRING_END_RE.search(raw_text, start_index)
+                if not string_end:
+                    continue
+                segment = json.loads('"' + raw_text[start_index : string_end.end() - 1] + '"')
+                value, _end = EMBEDDED_JSON_DECODER.raw_decode(segment)
+            else:
+                value, _end = EMBEDDED_JSON_DECODER.raw_decode(raw_text, start_index)
+        except ValueError:
+            continue
+        yield value
+
+
+def extract_embedded_json(text, marker, escaped=False, openers="{", accept=None):
+    """Retourne la première valeur JSON embarquée après `marker` acceptée par `accept`."""
+    for value in iter_embedded_json(text, marker, escaped=escaped, openers=openers):
+        if accept is None or accept(value):
+            return value
+    return None
+
+
+def parse_ortega_initial_data(html_content):
+    """Décode initialData embarqué dans le flux Next.js OrtegaScans."""
+    raw_text = str(html_content or "")
+    if not raw_text:
+        return {}
+
+    def has_manga(value):
+        return isinstance(value, dict) and isinstance(value.get("manga"), dict)
+
+    candidates = (
+        ('initialData\\":', True),
+        ('"initialData":', False),
+    )
+    for marker, escaped in candidates:
+        parsed = extract_embedded_json(raw_text, marker, escaped=escaped, accept=has_manga)
+        if parsed is not None:
+            return parsed
+    return {}
+
+
+def is_ortega_premium_chapter_locked(chapter):
+    """Retourne True si le chapitre Ortega est réellement verrouillé premium."""
+    if not bool((chapter or {}).get("isPremium")):
+        return False
+    premium_until = str((chapter or {}).get("premiumUntil") or "").strip()
+    if premium_until.startswith("$D"):
+        premium_until = premium_until[2:]
+    if not premium_until:
+        return True
+    try:
+        expiry = datetime.datetime.fromisoformat(premium_until.replace("Z", "+00:00"))
+    except Exception:
+        return True
+    if expiry.tzinfo is None:
+        expiry = expiry.replace(tzinfo=datetime.timezone.utc)
+    now_utc = datetime.datetime.now(datetime.timezone.utc)
+    return expiry > now_utc
+
+
+def build_scanmanga_image_urls(data):
+    """Transforme le JSON lecteur Scan-Manga en URLs d'images réelles."""
+    if not isinstance(data, dict):
+        return []
+    host = (data.get("dN") or "").strip()
+    serie = (data.get("s") or "").strip("/")
+    volume = str(data.get("v") or "").strip("/")
+    chapter = str(data.get("c") or "").strip("/")
+    pages = data.get("p") or {}
+    if not host or not serie or not volume or not chapter or not isinstance(pages, dict):
+        return []
+
+    def page_sort_key(item):
+        key, _value = item
+        try:
+            return int(key)
+        except (TypeError, ValueError):
+            return str(key)
+
+    images = []
+    for _page, page_data in sorted(pages.items(), key=page_sort_key):
+        if not isinstance(page_data, dict):
+            continue
+        filename = (page_data.get("f") or "").strip()
+        ext = (page_data.get("e") or "").strip().lstrip(".")
+        if not filename or not ext:
+            continue
+        images.append(f"https://{host}/{serie}/{volume}/{chapter}/{filename}.{ext}")
+    return images
+
+
+def _parse_madara_ajax_chapter_page(html_part, base_url, site, path_prefix, source_slug):
+    """Extrait les paires (label, lien) d'une page AJAX Madara et son nombre de pages."""
+    import bs4
+
+    soup = bs4.BeautifulSoup(html_part, "html.parser")
+
+    # Détecte les pages disponibles (si pagination côté site).
+    max_page = 1
+    for a in soup.select(".listing-chapters_wrap .pagination .page a[data-page]"):
+        raw_page = (a.get("data-page") or "").strip()
+        if raw_page.isdigit():
+            max_page = max(max_page, int(raw_page))
+
+    pairs = []
+    for a in soup.select("li.wp-manga-chapter a[href], .listing-chapters_wrap a[href]"):
+        href = (a.get("href") or "").strip()
+        if not href:
+            continue
+        full_link = urljoin(base_url, href)
+        if get_supported_site_from_url(full_link) != site:
+            continue
+        link_path = (urlparse(full_link).path or "").lower()
+        if f"/{path_prefix}/{source_slug}/" not in link_path:
+            continue
+        label = normalize_tome_label(a.get_text(" ", strip=True))
+        if not label:
+            chapter_slug = link_path.strip("/").split("/")[-1]
+            label = normalize_tome_label(chapter_slug.replace("-", " ").strip().title())
+        if label:
+            pairs.append((label, full_link))
+    return pairs, max_page
@@ -0,0 +1,336 @@
+"""Reconnaissance des sites supportés et validation des URLs catalogue."""
+
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
+from urllib.parse import unquote, urlparse
+
+from .text import repair_mojibake_text
+
+CATALOGUE_URL_CACHE_MAX_ITEMS = 4096
+_BAD_PERCENT_RE = re.compile(r"%(?![0-9a-fA-F]{2})")
+_PASTED_URL_RE = re.compile(r"https?://[^\s<>'\"\\)\]]+", re.IGNORECASE)
+
+
+def normalize_image_url(url):
+    """Normalise les URLs d'images (https forcé, schéma manquant géré)."""
+    raw = (url or "").strip()
+    if not raw:
+        return ""
+    if raw.startswith("//"):
+        return f"https:{raw}"
+    try:
+        parsed = urlparse(raw)
+        if parsed.scheme == "http" and (parsed.hostname or "").lower() in {"127.0.0.1", "localhost"}:
+            return raw
+    except Exception:
+        pass
+    return raw.replace("http://", "https://")
+
+
+def normalize_hostname(host):
+    """Normalise un hostname en minuscule sans préfixe www."""
+    value = (host or "").strip().lower()
+    if value.startswith("www."):
+        value = value[4:]
+    return value
+
+
+@dataclass(frozen=True)
+class SiteAdapter:
+    """Déclaration d'un site supporté.
+
+    `site` est le host canonique et `domain` la clé interne (cookies,
+    config, journaux). `hosts` liste les miroirs reconnus en plus de `site`.
+    `catalogue_path` capture le slug de l'œuvre (groupe 1) ; par défaut il
+    est dérivé de `path_prefix`. `catalogue` et `reader` nomment les familles
+    de parseurs catalogue et d'extracteurs d'images, `auth` la sonde du
+    cookie (`clearance` ou `status`) et `fragile` les réglages de
+    concurrence par défaut, figés en paires (clé, valeur) pour que
+    l'adaptateur reste immuable et hachable (`dict(adapter.fragile)`).
+    """
+
+    site: str
+    domain: str
+    path_prefix: str = ""
+    catalogue_path: str = ""
+    hosts: tuple = ()
+    catalogue: str = "html"
+    reader: str = "http"
+    auth: str = "clearance"
+    fragile: tuple = ()
+    catalogue_re: re.Pattern = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        pattern = self.catalogue_path or rf"^/{re.escape(self.path_prefix)}/([^/?#]+)/?$"
+        object.__setattr__(self, "catalogue_path", pattern)
+        object.__setattr__(self, "catalogue_re", re.compile(pattern, re.IGNORECASE))
+        object.__setattr__(self, "hosts", tuple(dict.fromkeys((self.site, *self.hosts))))
+        object.__setattr__(self, "fragile", tuple(dict(self.fragile).items()))
+
+    def catalogue_slug(self, path):
+        """Retourne le slug d'un chemin catalogue de ce site (ou chaîne vide)."""
+        match = self.catalogue_re.match(path or "")
+        return (match.group(1) or "").strip() if match else ""
+
+
+SITE_ADAPTERS = {}  # clé domaine -> SiteAdapter, dans l'ordre d'enregistrement
+_SITE_HOST_INDEX = {}  # host (sans www) -> SiteAdapter
+
+
+def _index_site_adapter(adapter):
+    previous = SITE_ADAPTERS.get(adapter.domain)
+    if previous is not None:
+        for host in previous.hosts:
+            _SITE_HOST_INDEX.pop(host, None)
+    SITE_ADAPTERS[adapter.domain] = adapter
+    for host in adapter.hosts:
+        _SITE_HOST_INDEX[normalize_hostname(host)] = adapter
+    return adapter
+
+
+def register_site_adapter(adapter):
+    """Enregistre (ou remplace) un site ; ses hosts deviennent reconnus partout."""
+    _index_site_adapter(adapter)
+    _is_valid_catalogue_url.cache_clear()
+    return adapter
+
+
+def get_site_adapter(domain):
+    """Retourne l'adaptateur d'une clé domaine (`fr`, `scanmanga`...) ou None."""
+    return SITE_ADAPTERS.get(domain or "")
+
+
+def get_site_adapter_from_host(host):
+    """Retourne l'adaptateur du host (racine ou sous-domaine), sinon None.
+
+    Une recherche par suffixe de labels dans l'index : le coût dépend de la
+    profondeur du host, pas du nombre de sites.
+    """
+    value = normalize_hostname(host)
+    while value:
+        adapter = _SITE_HOST_INDEX.get(value)
+        if adapter is not None:
+            return adapter
+        value = value.partition(".")[2]
+    return None
+
+
+def get_site_adapter_from_url(url):
+    """Retourne l'adaptateur correspondant à une URL, sinon None."""
+    try:
+        host = urlparse(url).hostname if url else ""
+    except Exception:
+        host = ""
+    return get_site_adapter_from_host(host)
+
+
+def get_site_reader(domain):
+    """Famille d'extracteur d'images d'une clé domaine (`http`, `madara`, `browser`...)."""
+    adapter = SITE_ADAPTERS.get(domain or "")
+    return adapter.reader if adapter is not None else ""
+
+
+def get_site_catalogue_family(url):
+    """Famille de parseur catalogue d'une URL supportée (`html`, `madara_ajax`...)."""
+    adapter = get_site_adapter_from_url(url)
+    return adapter.catalogue if adapter is not None else ""
+
+
+def build_catalogue_url_regex():
+    """Regex unique des URLs catalogue de tous les sites enregistrés."""
+    alternatives = []
+    for adapter in SITE_ADAPTERS.values():
+        hosts = "|".join(re.escape(host) for host in adapter.hosts)
+        path = adapter.catalogue_path.lstrip("^").rstrip("$")
+        alternatives.append(rf"^https://(?:www\.)?(?:{hosts}){path}$")
+    return "|".join(alternatives)
+
+
+for _adapter in (
+    SiteAdapter("sushiscan.fr", "fr", "catalogue"),
+    SiteAdapter("sushiscan.net", "net", "catalogue"),
+    SiteAdapter("mangas-origines.fr", "origines", "oeuvre", catalogue="madara_ajax", reader="madara", auth="status"),
+    SiteAdapter("hentai-origines.fr", "hentai", "manga", catalogue="madara_ajax", reader="madara", auth="status"),
+    SiteAdapter(
+        "toonfr.com",
+        "toonfr",
+        "webtoon",
+        catalogue="madara_ajax",
+        fragile={"enabled": True, "max_threads": 1, "delay_between_volumes": 0.4},
+    ),
+    SiteAdapter(
+        "ortegascans.fr",
+        "ortega",
+        "serie",
+        catalogue="ortega",
+        reader="ortega",
+        fragile={"enabled": True, "max_threads": 1, "delay_between_volumes": 0.4},
+    ),
+    SiteAdapter(
+        "hentaizone.xyz",
+        "hentaizone",
+        "manga",
+        fragile={"enabled": True, "max_threads": 2, "delay_between_volumes": 0.25},
+    ),
+    SiteAdapter(
+        "scan-manga.com",
+        "scanmanga",
+        catalogue_path=r"^/\d+(?:-\d+)?/([^/?#]+)\.html$",
+        catalogue="scanmanga",
+        reader="scanmanga",
+        fragile={"enabled": True, "max_threads": 2, "delay_between_volumes": 0.5, "browser_contexts": 2},
+    ),
+    SiteAdapter(
+        "crunchyscan.fr",
+        "crunchyscan",
+        "lecture-en-ligne",
+        catalogue="crunchy",
+        reader="browser",
+        fragile={"enabled": True, "max_threads": 1, "delay_between_volumes": 0.4, "reader_sessions": 2},
+    ),
+    SiteAdapter(
+        "scan-hentai.net",
+        "scanhentai",
+        "lecture-en-ligne",
+        catalogue="crunchy",
+        reader="browser",
+        fragile={"enabled": True, "max_threads": 1, "delay_between_volumes": 0.4, "reader_sessions": 2},
+    ),
+):
+    _index_site_adapter(_adapter)
+del _adapter
+
+COOKIE_DOMAINS = tuple(SITE_ADAPTERS)
+
+
+def get_supported_site_from_host(host):
+    """Retourne le site supporté correspondant au host (ou chaîne vide)."""
+    adapter = get_site_adapter_from_host(host)
+    return adapter.site if adapter is not None else ""
+
+
+def get_supported_site_from_url(url):
+    """Retourne le site supporté correspondant à une URL (ou chaîne vide)."""
+    adapter = get_site_adapter_from_url(url)
+    return adapter.site if adapter is not None else ""
+
+
+def get_site_root_url(url):
+    """Retourne l'URL racine d'un site à partir d'une URL complète."""
+    try:
+        parsed = urlparse(url)
+        host = normalize_hostname(parsed.hostname)
+    except Exception:
+        return ""
+    if not host:
+        return ""
+    scheme = (parsed.scheme or "https").lower()
+    return f"{scheme}://{host}/"
+
+
+def get_sushiscan_domain_from_host(host):
+    """Retourne 'fr' ou 'net' pour un host SushiScan (racine ou sous-domaine)."""
+    adapter = get_site_adapter_from_host(host)
+    return adapter.domain if adapter is not None and adapter.domain in ("fr", "net") else ""
+
+
+def get_sushiscan_domain_from_url(url):
+    """Retourne 'fr' ou 'net' depuis une URL SushiScan (racine ou sous-domaine)."""
+    return get_sushiscan_domain_from_host((urlparse(url).hostname or "").strip().lower() if url else "")
+
+
+def get_cookie_domain_from_host(host):
+    """Retourne le domaine cookie interne: fr/net/origines (ou chaîne vide)."""
+    adapter = get_site_adapter_from_host(host)
+    return adapter.domain if adapter is not None else ""
+
+
+def get_cookie_domain_from_url(url):
+    """Retourne le domaine cookie interne depuis une URL supportée."""
+    return get_cookie_domain_from_host((urlparse(url).hostname or "").strip().lower() if url else "")
+
+
+def get_site_domain_key(url):
+    """Retourne la clé de domaine interne utilisée par les parseurs et téléchargements."""
+    adapter = get_site_adapter_from_url(url)
+    if adapter is not None:
+        return adapter.domain
+    return normalize_hostname(urlparse(url).hostname) or "-"
+
+
+def get_catalogue_slug_from_url(url):
+    """Retourne le slug de l'œuvre d'une URL catalogue supportée (ou chaîne vide)."""
+    try:
+        parsed = urlparse((url or "").strip())
+    except Exception:
+        return ""
+    adapter = get_site_adapter_from_host(parsed.hostname)
+    return adapter.catalogue_slug((parsed.path or "").strip()) if adapter is not None else ""
+
+
+def is_valid_catalogue_url(url):
+    """Valide une URL d'œuvre supportée avec slash final optionnel.
+
+    Le résultat est mémorisé par URL : la validation revient à chaque
+    filtrage de la file et de l'historique.
+    """
+    return _is_valid_catalogue_url((url or "").strip())
+
+
+@lru_cache(maxsize=CATALOGUE_URL_CACHE_MAX_ITEMS)
+def _is_valid_catalogue_url(value):
+    if not value:
+        return False
+    try:
+        parsed = urlparse(value)
+    except Exception:
+        return False
+    if parsed.scheme.lower() != "https":
+        return False
+
+    adapter = get_site_adapter_from_host(parsed.hostname)
+    if adapter is None:
+        return False
+
+    match = adapter.catalogue_re.match((parsed.path or "").strip())
+    if not match:
+        return False
+    return is_valid_catalogue_slug(match.group(1))
+
+
+def is_valid_catalogue_slug(slug):
+    """Valide un segment de slug, y compris les caractères percent-encodés."""
+    value = (slug or "").strip()
+    if not value:
+        return False
+    if any(ord(ch) < 32 or ord(ch) == 127 or ch.isspace() for ch in value):
+        return False
+    if any(ch in value for ch in "/\\?#"):
+        return False
+    if _BAD_PERCENT_RE.search(value):
+        return False
+
+    decoded = unquote(value)
+    if any(ord(ch) < 32 or ord(ch) == 127 or ch.isspace() for ch in decoded):
+        return False
+    return not any(ch in decoded for ch in "/\\?#")
+
+
+def extract_supported_catalogue_url(text):
+    """Extrait la première URL catalogue supportée depuis un collage bruité."""
+    value = repair_mojibake_text(text or "")
+    if not value:
+        return ""
+
+    candidates = []
+    if len(value) <= 2048 and is_valid_catalogue_url(value.strip()):
+        candidates.append(value.strip())
+    candidates.extend(_PASTED_URL_RE.findall(value))
+
+    for candidate in candidates:
+        cleaned = repair_mojibake_text(candidate).strip()
+        cleaned = cleaned.rstrip(".,;:)]}\"'")
+        if is_valid_catalogue_url(cleaned):
+            return cleaned
+    return ""
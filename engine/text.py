@@ -0,0 +1,36 @@
+"""Utilitaires texte partagés par les parseurs et l'interface."""
+
+
+def repair_mojibake_text(text):
+    """
+    Tente de reparer un texte mojibake courant (UTF-8 lu en latin-1/cp1252).
+    Applique plusieurs passes pour couvrir les doubles/triples decodages.
+    """
+    value = str(text or "")
+    if not value:
+        return value
+
+    suspicious_markers = (
+        "\u00C3",
+        "\u00C2",
+        "\u00E2\u20AC",
+        "\u00F0\u0178",
+        "\u00EF\u00BB\u00BF",
+    )
+    current = value
+    for _ in range(4):
+        if not any(marker in current for marker in suspicious_markers):
+            break
+        fixed = None
+        for codec in ("latin-1", "cp1252"):
+            try:
+                candidate = current.encode(codec, errors="strict").decode("utf-8", errors="strict")
+            except Exception:
+                continue
+            if candidate and candidate != current:
+                fixed = candidate
+                break
+        if not fixed:
+            break
+        current = fixed
+    return current